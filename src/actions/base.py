@@ -1,7 +1,7 @@
-import time
 import typing as T
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from enum import IntEnum
 
 IT = T.TypeVar("IT")
 OT = T.TypeVar("OT")
@@ -43,7 +43,37 @@ class Interface(T.Generic[IT, OT]):
     output: OT
 
 
+class ActionPriority(IntEnum):
+    """
+    Priority of a dispatched action. Higher priorities run first, and
+    EMERGENCY preempts the lower priority actions in flight of the same
+    action, and of the actions that are emergency preemptible.
+    """
+
+    LOW = -1
+    NORMAL = 0
+    HIGH = 1
+    EMERGENCY = 2
+
+
 class ActionConnector(ABC, T.Generic[OT]):
+    # Seconds between two calls to tick by the connector scheduler. None
+    # calls tick back to back on a dedicated thread, for connectors that pace
+    # themselves. Connectors that do not override tick are never ticked.
+    tick_interval: T.Optional[float] = None
+
+    # How the action executor runs connect. At most max_concurrency calls
+    # run at once, None for no limit. With coalesce, a new command drops the
+    # queued commands of this action it supersedes. Actions run at priority,
+    # except for the urgent_actions values which run at EMERGENCY priority.
+    # EMERGENCY actions of other connectors cancel this connector's actions
+    # only if emergency_preemptible is set.
+    max_concurrency: T.Optional[int] = None
+    coalesce: bool = False
+    priority: int = ActionPriority.NORMAL
+    urgent_actions: T.FrozenSet[str] = frozenset()
+    emergency_preemptible: bool = False
+
     def __init__(self, config: ActionConfig):
         self.config = config
 
@@ -52,7 +82,7 @@ class ActionConnector(ABC, T.Generic[OT]):
         pass
 
     def tick(self) -> None:
-        time.sleep(60)
+        pass
 
 
 @dataclass
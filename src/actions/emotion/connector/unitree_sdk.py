@@ -1,5 +1,4 @@
 import logging
-import time
 
 from actions.base import ActionConfig, ActionConnector
 from actions.emotion.interface import EmotionInput
@@ -52,7 +51,3 @@ class EmotionUnitreeConnector(ActionConnector[EmotionInput]):
             logging.info(f"Unknown emotion: {output_interface.action}")
 
         logging.info(f"SendThisToUTClient: {output_interface.action}")
-
-    def tick(self) -> None:
-        time.sleep(5)
-        # logging.info("MoveUnitreeSDKConnector Tick")
@@ -0,0 +1,270 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import typing as T
+from dataclasses import dataclass, field, replace
+
+from actions.base import ActionPriority
+
+
+@dataclass
+class ActionExecutorStats:
+    """
+    Counters of the ActionExecutor.
+
+    Parameters
+    ----------
+    submitted : int
+        Number of submitted actions.
+    queued : int
+        Number of actions that waited for a free slot.
+    coalesced : int
+        Number of queued actions dropped for a newer action of the same type.
+    preempted : int
+        Number of queued or running actions cancelled by a higher priority
+        action.
+    """
+
+    submitted: int = 0
+    queued: int = 0
+    coalesced: int = 0
+    preempted: int = 0
+
+
+@dataclass(eq=False)
+class _Request:
+    """
+    An action submitted to the executor.
+    """
+
+    label: str
+    priority: int
+    sequence: int
+    granted: asyncio.Future
+    state: str = "waiting"
+    task: T.Optional[asyncio.Task] = None
+
+
+@dataclass(eq=False)
+class _Lane:
+    """
+    The running and queued actions of one action type.
+    """
+
+    max_concurrency: T.Optional[int]
+    coalesce: bool
+    emergency_preemptible: bool = False
+    running: T.List[_Request] = field(default_factory=list)
+    waiting: T.List[T.Tuple[int, int, _Request]] = field(default_factory=list)
+
+    def has_slot(self) -> bool:
+        """
+        Check whether another action can start now.
+        """
+        return self.max_concurrency is None or len(self.running) < self.max_concurrency
+
+
+class ActionExecutor:
+    """
+    Runs dispatched actions with per-type concurrency limits and priorities.
+
+    Each action type, keyed by its label, gets a lane. An action starts at
+    once if its lane has a free slot and waits otherwise; waiting actions
+    start by priority, then in submission order. On top of that:
+
+    - In a coalescing lane, a new action drops the actions still queued in
+      it, as only the latest command matters.
+    - An action that finds its lane full cancels the lowest priority
+      running action of the lane, if that one has a lower priority.
+    - An EMERGENCY action cancels every queued and running action of a
+      lower priority in its own lane, and in the lanes that opt in with
+      emergency_preemptible. Other lanes, e.g. speech next to an urgent
+      stop, keep running.
+
+    Every action runs in its own task. Dropped and preempted actions end
+    cancelled.
+    """
+
+    def __init__(self):
+        """
+        Initialize the executor without any lanes.
+        """
+        self._lanes: T.Dict[str, _Lane] = {}
+        self._counter = itertools.count()
+        self._stats = ActionExecutorStats()
+
+    @property
+    def stats(self) -> ActionExecutorStats:
+        """
+        Get a copy of the executor counters.
+        """
+        return replace(self._stats)
+
+    def submit(
+        self,
+        label: str,
+        run: T.Callable[[], T.Awaitable[T.Any]],
+        priority: int = ActionPriority.NORMAL,
+        max_concurrency: T.Optional[int] = None,
+        coalesce: bool = False,
+        emergency_preemptible: bool = False,
+    ) -> asyncio.Task:
+        """
+        Schedule an action. Must be called from the event loop.
+
+        Parameters
+        ----------
+        label : str
+            The action type.
+        run : Callable[[], Awaitable[Any]]
+            Starts the action once it gets a slot.
+        priority : int
+            The action priority, see ActionPriority.
+        max_concurrency : int, optional
+            Maximum number of running actions of this type, None for no
+            limit. Only read when the lane is created.
+        coalesce : bool
+            Whether a new action of this type drops the queued ones. Only
+            read when the lane is created.
+        emergency_preemptible : bool
+            Whether EMERGENCY actions of other types cancel the actions of
+            this type. Only read when the lane is created.
+
+        Returns
+        -------
+        asyncio.Task
+            The task running the action, cancelled if the action is dropped
+            or preempted.
+        """
+        loop = asyncio.get_running_loop()
+        lane = self._lanes.get(label)
+        if lane is None:
+            if max_concurrency is not None:
+                max_concurrency = max(1, max_concurrency)
+            lane = _Lane(
+                max_concurrency=max_concurrency,
+                coalesce=coalesce,
+                emergency_preemptible=emergency_preemptible,
+            )
+            self._lanes[label] = lane
+
+        request = _Request(
+            label=label,
+            priority=priority,
+            sequence=next(self._counter),
+            granted=loop.create_future(),
+        )
+        self._stats.submitted += 1
+
+        if lane.coalesce:
+            for _, _, queued in lane.waiting:
+                if queued.state == "waiting":
+                    self._stats.coalesced += 1
+                    self._cancel(queued, f"superseded by {label} action")
+            lane.waiting.clear()
+
+        if priority >= ActionPriority.EMERGENCY:
+            self._preempt_below(lane, priority)
+        elif not lane.has_slot():
+            victim = min(lane.running, key=lambda r: (r.priority, r.sequence))
+            if victim.priority < priority:
+                self._stats.preempted += 1
+                self._cancel(victim, f"preempted by {label} action")
+
+        if lane.has_slot():
+            self._grant(lane, request)
+        else:
+            self._stats.queued += 1
+            heapq.heappush(lane.waiting, (-priority, request.sequence, request))
+
+        # Slots freed by preemption go to the new action first
+        for other in self._lanes.values():
+            self._fill(other)
+
+        request.task = loop.create_task(self._run(request, run))
+        request.task.add_done_callback(lambda _: self._release(request))
+        return request.task
+
+    async def _run(
+        self, request: _Request, run: T.Callable[[], T.Awaitable[T.Any]]
+    ) -> T.Any:
+        """
+        Wait for a slot, then run the action.
+        """
+        await request.granted
+        return await run()
+
+    def _preempt_below(self, own_lane: _Lane, priority: int) -> None:
+        """
+        Cancel the queued and running actions with a lower priority, in the
+        lane of the emergency action and in the emergency preemptible lanes.
+        """
+        for lane in self._lanes.values():
+            if lane is not own_lane and not lane.emergency_preemptible:
+                continue
+            for request in self._requests(lane):
+                if request.priority < priority:
+                    self._stats.preempted += 1
+                    self._cancel(request, "preempted by an emergency action")
+
+    @staticmethod
+    def _requests(lane: _Lane) -> T.List[_Request]:
+        """
+        List the running and queued actions of a lane.
+        """
+        queued = [r for _, _, r in lane.waiting if r.state == "waiting"]
+        return list(lane.running) + queued
+
+    def _cancel(self, request: _Request, reason: str) -> None:
+        """
+        Free the slot of an action and cancel its task.
+        """
+        logging.debug(f"Cancelling {request.label} action: {reason}")
+        self._release(request, fill=False)
+        if request.task is not None:
+            request.task.cancel()
+        elif not request.granted.done():
+            request.granted.cancel()
+
+    def _grant(self, lane: _Lane, request: _Request) -> None:
+        """
+        Give a slot of the lane to an action.
+        """
+        request.state = "running"
+        lane.running.append(request)
+        if not request.granted.done():
+            request.granted.set_result(None)
+
+    def _release(self, request: _Request, fill: bool = True) -> None:
+        """
+        Remove a finished or cancelled action.
+
+        Parameters
+        ----------
+        request : _Request
+            The action to remove.
+        fill : bool
+            Start the next queued actions if a slot was freed.
+        """
+        if request.state == "done":
+            return
+        lane = self._lanes[request.label]
+        was_running = request.state == "running"
+        request.state = "done"
+        if not was_running:
+            # Dropped from the heap lazily
+            return
+
+        lane.running.remove(request)
+        if fill:
+            self._fill(lane)
+
+    def _fill(self, lane: _Lane) -> None:
+        """
+        Start queued actions by priority while the lane has free slots.
+        """
+        while lane.waiting and lane.has_slot():
+            _, _, queued = heapq.heappop(lane.waiting)
+            if queued.state == "waiting":
+                self._grant(lane, queued)
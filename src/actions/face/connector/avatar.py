@@ -1,5 +1,4 @@
 import logging
-import time
 
 from actions.base import ActionConfig, ActionConnector
 from actions.face.interface import FaceInput
@@ -47,6 +46,3 @@ class FaceAvatarConnector(ActionConnector[FaceInput]):
             logging.info(f"Unknown emotion: {output_interface.action}")
 
         logging.info(f"SendThisToUTClient: {output_interface.action}")
-
-    def tick(self) -> None:
-        time.sleep(60)
@@ -1,5 +1,4 @@
 import logging
-import time
 
 from actions.base import ActionConfig, ActionConnector
 from actions.move.interface import MoveInput
@@ -38,7 +37,3 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             # raise ValueError(f"Unknown move type: {output_interface.action}")
 
         logging.info(f"SendThisToROS2: {new_msg}")
-
-    def tick(self) -> None:
-        time.sleep(0.1)
-        # logging.info("MoveUnitreeSDKConnector Tick")
@@ -16,6 +16,12 @@ class ActionUnitreeSDKConnector(ActionConnector[ActionInput]):
     This connector allows you to do the actions supported by the Unitree Go2 SDK.
     """
 
+    # SDK actions run one at a time; "stand still" is dispatched urgently
+    # and halts the robot
+    max_concurrency = 1
+    coalesce = True
+    urgent_actions = frozenset({"stand still"})
+
     def __init__(self, config: ActionConfig):
         super().__init__(config)
 
@@ -53,9 +59,15 @@ class ActionUnitreeSDKConnector(ActionConnector[ActionInput]):
         action = input_protocol.action
         logging.info(f"ActionUnitreeSDKConnector received action: {action}")
 
-        if action == "stand still" or action == "do nothing":
+        if action == "stand still":
             logging.info("ActionUnitreeSDKConnector: Standing still")
-            pass
+            try:
+                if self.sport_client is not None:
+                    self.sport_client.StopMove()
+            except Exception as e:
+                logging.error(f"Error sending StopMove command: {e}")
+        elif action == "do nothing":
+            logging.info("ActionUnitreeSDKConnector: Doing nothing")
         elif action == "shake paw":
             if self.unitree_go2_state.go2_action_progress == 0:
                 logging.info("ActionUnitreeSDKConnector: Shaking paw")
@@ -2,7 +2,7 @@ import logging
 import math
 import random
 import time
-from queue import Queue
+from queue import Empty, Queue
 from typing import List, Optional
 
 from actions.base import ActionConfig, ActionConnector, MoveCommand
@@ -15,6 +15,12 @@ from unitree.unitree_sdk2py.go2.sport.sport_client import SportClient
 
 class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
 
+    # One command at a time, keeping only the latest queued one; "stand
+    # still" jumps the queue and stops the robot
+    max_concurrency = 1
+    coalesce = True
+    urgent_actions = frozenset({"stand still"})
+
     def __init__(self, config: ActionConfig):
         super().__init__(config)
 
@@ -53,6 +59,11 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         # this is used only by the LLM
         logging.info(f"AI command.connect: {output_interface.action}")
 
+        if output_interface.action == "stand still":
+            logging.info("AI movement command: stand still")
+            self._stand_still()
+            return
+
         if self.unitree_go2_state.state_code == 1002:
             if self.sport_client:
                 logging.info("Robot is in jointLock state - issuing BalanceStand()")
@@ -89,7 +100,6 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
             "turn right": self._process_turn_right,
             "move forwards": self._process_move_forward,
             "move back": self._process_move_back,
-            "stand still": lambda: logging.info("AI movement command: stand still"),
         }
 
         handler = movement_map.get(output_interface.action)
@@ -119,6 +129,26 @@ class MoveUnitreeSDKConnector(ActionConnector[MoveInput]):
         #     logging.info("Unitree AI command: dance")
         #     await self._execute_sport_command("Dance1")
 
+    def _stand_still(self) -> None:
+        """
+        Stop the robot now: drop the queued movements that tick would keep
+        executing and halt the current motion.
+        """
+        try:
+            while True:
+                self.pending_movements.get_nowait()
+        except Empty:
+            pass
+        self.movement_attempts = 0
+        self.gap_previous = 0
+
+        if self.sport_client is None:
+            return
+        try:
+            self.sport_client.StopMove()
+        except Exception as e:
+            logging.error(f"Error stopping robot: {e}")
+
     def _move_robot(self, vx: float, vy: float, vturn=0.0) -> None:
         """
         Move the robot with specified velocities.
@@ -2,7 +2,7 @@ import logging
 import math
 import random
 import time
-from queue import Queue
+from queue import Empty, Queue
 from typing import List, Optional
 
 import zenoh
@@ -25,6 +25,12 @@ from zenoh_msgs import (
 
 class MoveUnitreeSDKAdvanceConnector(ActionConnector[MoveInput]):
 
+    # Same dispatch as the basic autonomy connector: latest command wins and
+    # an urgent "stand still" clears the movement queue
+    max_concurrency = 1
+    coalesce = True
+    urgent_actions = frozenset({"stand still"})
+
     def __init__(self, config: ActionConfig):
         super().__init__(config)
 
@@ -101,6 +107,11 @@ class MoveUnitreeSDKAdvanceConnector(ActionConnector[MoveInput]):
             logging.info("AI Control is disabled - disregarding AI command")
             return
 
+        if output_interface.action == "stand still":
+            logging.info("AI movement command: stand still")
+            self._stand_still()
+            return
+
         if self.unitree_go2_state.state_code == 1002:
             if self.sport_client:
                 logging.info("Robot is in jointLock state - issuing BalanceStand()")
@@ -137,7 +148,6 @@ class MoveUnitreeSDKAdvanceConnector(ActionConnector[MoveInput]):
             "turn right": self._process_turn_right,
             "move forwards": self._process_move_forward,
             "move back": self._process_move_back,
-            "stand still": lambda: logging.info("AI movement command: stand still"),
         }
 
         handler = movement_map.get(output_interface.action)
@@ -167,6 +177,26 @@ class MoveUnitreeSDKAdvanceConnector(ActionConnector[MoveInput]):
         #     logging.info("Unitree AI command: dance")
         #     await self._execute_sport_command("Dance1")
 
+    def _stand_still(self) -> None:
+        """
+        Halt the robot for an urgent "stand still", including the turns and
+        advances still queued for tick.
+        """
+        try:
+            while True:
+                self.pending_movements.get_nowait()
+        except Empty:
+            pass
+        self.movement_attempts = 0
+        self.gap_previous = 0
+
+        if self.sport_client is None:
+            return
+        try:
+            self.sport_client.StopMove()
+        except Exception as e:
+            logging.error(f"Error stopping robot: {e}")
+
     def _move_robot(self, vx: float, vy: float, vturn=0.0) -> None:
         """
         Move the robot with specified velocities.
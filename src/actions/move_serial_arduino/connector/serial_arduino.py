@@ -1,5 +1,4 @@
 import logging
-import time
 
 import serial
 
@@ -49,7 +48,3 @@ class MoveSerialConnector(ActionConnector[MoveInput]):
             self.ser.write(byte_data)
         else:
             logging.info(f"SerialNotOpen - Simulating transmit: {message}")
-
-    def tick(self) -> None:
-        time.sleep(0.1)
-        # logging.info("Connector Tick")
@@ -1,6 +1,5 @@
 import logging
 import subprocess
-import time
 from dataclasses import dataclass
 
 from actions.base import ActionConfig, ActionConnector
@@ -117,6 +116,3 @@ class GazeboConnector(ActionConnector[MoveInput]):
             logging.info(f"Velocity command sent: {velocity}")
         except subprocess.CalledProcessError as e:
             logging.error(f"Error sending velocity command: {e}")
-
-    def tick(self) -> None:
-        time.sleep(0.1)
@@ -1,8 +1,8 @@
 import logging
-import time
 
 from actions.base import ActionConfig, ActionConnector
 from actions.move.interface import MoveInput
+from providers.outbound_publisher import DeliveryPolicy
 from providers.ros2_publisher_provider import ROS2PublisherProvider
 
 
@@ -25,7 +25,10 @@ class ROS2Connector(ActionConnector[MoveInput]):
             logging.info(f"Move topic not provided. Using default topic: {move_topic}")
 
         # Initialize the ROS2 publisher provider (using a topic of your choice)
-        self.publisher = ROS2PublisherProvider(topic=move_topic)
+        # Only the newest pending move command is worth publishing
+        self.publisher = ROS2PublisherProvider(
+            topic=move_topic, policy=DeliveryPolicy.LATEST
+        )
         self.publisher.start()
 
     async def connect(self, output_interface: MoveInput) -> None:
@@ -61,6 +64,3 @@ class ROS2Connector(ActionConnector[MoveInput]):
 
         # Publish the Move message using ROS2PublisherProvider.
         self.publisher.add_pending_message(new_msg)  # type: ignore
-
-    def tick(self) -> None:
-        time.sleep(0.1)
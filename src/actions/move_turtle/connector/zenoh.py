@@ -10,12 +10,19 @@ import zenoh
 from actions.base import ActionConfig, ActionConnector, MoveCommand
 from actions.move_turtle.interface import MoveInput
 from providers.odom_provider import OdomProvider
+from providers.outbound_publisher import (
+    DeliveryPolicy,
+    OutboundPublisher,
+    ZenohPublisherCache,
+)
 from providers.rplidar_provider import RPLidarProvider
 from zenoh_msgs import geometry_msgs, open_zenoh_session, sensor_msgs
 
 
 class MoveZenohConnector(ActionConnector[MoveInput]):
 
+    tick_interval = 0.1
+
     def __init__(self, config: ActionConfig):
 
         super().__init__(config)
@@ -30,6 +37,7 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         self.emergency = None
 
         self.session = None
+        self.outbound: Optional[OutboundPublisher] = None
 
         URID = getattr(self.config, "URID", None)
 
@@ -51,6 +59,18 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         except Exception as e:
             logging.error(f"Error opening Zenoh client: {e}")
 
+        if self.session is not None:
+            # A velocity command is obsolete once a newer one is queued
+            self.outbound = OutboundPublisher(
+                ZenohPublisherCache(self.session).put, name="TurtleBot4 cmd_vel"
+            )
+            self.outbound.configure(
+                self.cmd_vel,
+                DeliveryPolicy.LATEST,
+                encode=geometry_msgs.Twist.serialize,
+            )
+            self.outbound.start()
+
         self.lidar = RPLidarProvider()
         self.odom = OdomProvider(URID=URID, use_zenoh=True)
 
@@ -94,7 +114,7 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
         """
         logging.debug("move: {} - {}".format(vx, vyaw))
 
-        if self.session is None:
+        if self.outbound is None:
             logging.info("No open Zenoh session, returning")
             return
 
@@ -103,7 +123,7 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
             linear=geometry_msgs.Vector3(x=float(vx), y=0.0, z=0.0),
             angular=geometry_msgs.Vector3(x=0.0, y=0.0, z=float(vyaw)),
         )
-        self.session.put(self.cmd_vel, t.serialize())
+        self.outbound.publish(self.cmd_vel, t)
 
     async def connect(self, output_interface: MoveInput) -> None:
 
@@ -209,9 +229,6 @@ class MoveZenohConnector(ActionConnector[MoveInput]):
             self.pending_movements.get()
 
     def tick(self) -> None:
-
-        time.sleep(0.1)
-
         logging.debug("Move tick")
 
         if self.odom.x == 0.0:
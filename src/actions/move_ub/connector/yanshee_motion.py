@@ -1,7 +1,6 @@
 import concurrent.futures
 import logging
 import threading
-import time
 from dataclasses import asdict, dataclass, field
 from typing import Optional
 
@@ -241,7 +240,3 @@ class MoveRos2Connector(ActionConnector[MoveInput]):
             logging.info(f"Unknown move type: {output_interface.action}")
 
         logging.info(f"SendThisToUB: {output_interface.action}")
-
-    def tick(self) -> None:
-
-        time.sleep(0.1)
@@ -1,14 +1,87 @@
 import asyncio
 import logging
-import threading
-import time
 import typing as T
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 
-from actions.base import AgentAction
+from actions.base import ActionConnector, ActionPriority, AgentAction
+from actions.executor import ActionExecutor, ActionExecutorStats
+from actions.scheduler import ConnectorScheduler, TickStats
 from llm.output_model import Action
 from runtime.single_mode.config import RuntimeConfig
 
+# Threads shared by the connectors that declare a tick_interval
+CONNECTOR_TICK_WORKERS = 4
+
+# Bare movement commands that a model sometimes emits as the action type when
+# there is only one output, typically only during testing. They are rewritten
+# to a "move" action with the command as value.
+MOVE_COMMAND_ALIASES: T.Dict[str, T.Tuple[str, str]] = {
+    command: ("move", command)
+    for command in (
+        "stand still",
+        "turn left",
+        "turn right",
+        "move forwards",
+        "move back",
+    )
+}
+
+
+@dataclass
+class _ActionDispatch:
+    """
+    A prepared dispatch target for one action label.
+
+    Parameters
+    ----------
+    agent_action : AgentAction
+        The action to dispatch to.
+    input_type : type, optional
+        The input interface type of the action, resolved on first dispatch.
+    """
+
+    agent_action: AgentAction
+    input_type: T.Optional[T.Callable[..., T.Any]] = None
+
+    def build_input(self, value: str) -> T.Any:
+        """
+        Build the input interface of the action.
+
+        Parameters
+        ----------
+        value : str
+            The action argument.
+
+        Returns
+        -------
+        Any
+            The input interface instance.
+        """
+        if self.input_type is None:
+            self.input_type = T.get_type_hints(self.agent_action.interface)["input"]
+        return self.input_type(action=value)
+
+    def priority(self, value: str) -> int:
+        """
+        Get the priority of an action command.
+
+        Parameters
+        ----------
+        value : str
+            The action argument.
+
+        Returns
+        -------
+        int
+            EMERGENCY for the connector's urgent actions, otherwise the
+            connector priority.
+        """
+        connector = self.agent_action.connector
+        if value in connector.urgent_actions:
+            return ActionPriority.EMERGENCY
+        return connector.priority
+
 
 class ActionOrchestrator:
     """
@@ -19,26 +92,48 @@ class ActionOrchestrator:
 
     promise_queue: T.List[asyncio.Task[T.Any]]
     _config: RuntimeConfig
-    _connector_workers: int
-    _connector_executor: ThreadPoolExecutor
+    _scheduler: ConnectorScheduler
     _submitted_connectors: T.Set[str]
-    _stop_event: threading.Event
+    _dispatch_table: T.Dict[str, _ActionDispatch]
+    _executor: ActionExecutor
 
     def __init__(self, config: RuntimeConfig):
         self._config = config
         self.promise_queue = []
-        self._connector_workers = (
-            min(12, len(config.agent_actions)) if config.agent_actions else 1
-        )
-        self._connector_executor = ThreadPoolExecutor(
-            max_workers=self._connector_workers,
-        )
+        self._scheduler = ConnectorScheduler(max_workers=CONNECTOR_TICK_WORKERS)
         self._submitted_connectors = set()
-        self._stop_event = threading.Event()
+        self._dispatch_table = self._build_dispatch_table(config.agent_actions)
+        self._executor = ActionExecutor()
+
+    @staticmethod
+    def _build_dispatch_table(
+        agent_actions: T.List[AgentAction],
+    ) -> T.Dict[str, _ActionDispatch]:
+        """
+        Map each action label to its dispatch target.
+
+        Parameters
+        ----------
+        agent_actions : List[AgentAction]
+            The configured actions. If two share a label, the first one wins.
+
+        Returns
+        -------
+        Dict[str, _ActionDispatch]
+            The dispatch targets keyed by action label.
+        """
+        table: T.Dict[str, _ActionDispatch] = {}
+        for agent_action in agent_actions:
+            table.setdefault(agent_action.llm_label, _ActionDispatch(agent_action))
+        return table
 
     def start(self):
         """
-        Start actions and connectors in separate threads
+        Start ticking the connectors.
+
+        Connectors with a tick_interval share a small pool of threads;
+        self-paced connectors get a thread each; connectors without a tick
+        are not scheduled.
         """
         for agent_action in self._config.agent_actions:
             if agent_action.llm_label in self._submitted_connectors:
@@ -46,32 +141,60 @@ class ActionOrchestrator:
                     f"Connector {agent_action.llm_label} already submitted, skipping."
                 )
                 continue
-            self._connector_executor.submit(self._run_connector_loop, agent_action)
             self._submitted_connectors.add(agent_action.llm_label)
 
+            connector = agent_action.connector
+            if type(connector).tick is ActionConnector.tick:
+                logging.debug(f"Connector {agent_action.llm_label} has no tick")
+                continue
+            self._scheduler.add(
+                agent_action.llm_label, connector.tick, connector.tick_interval
+            )
+
+        self._scheduler.start()
+
         return asyncio.Future()  # Return future for compatibility
 
-    def _run_connector_loop(self, action: AgentAction):
+    def connector_stats(self) -> T.Dict[str, TickStats]:
         """
-        Thread-based connector loop
+        Get the tick timing counters of each scheduled connector.
+
+        Returns
+        -------
+        Dict[str, TickStats]
+            Tick counts, overruns and jitter keyed by action label.
         """
-        while not self._stop_event.is_set():
-            try:
-                action.connector.tick()
-            except Exception as e:
-                logging.error(f"Error in connector {action.llm_label}: {e}")
-                time.sleep(0.1)
+        return self._scheduler.stats()
+
+    def executor_stats(self) -> ActionExecutorStats:
+        """
+        Get the counters of queued, coalesced and preempted actions.
+
+        Returns
+        -------
+        ActionExecutorStats
+            The action executor counters.
+        """
+        return self._executor.stats
 
     async def flush_promises(self) -> tuple[list[T.Any], list[asyncio.Task[T.Any]]]:
         """
         Flushes the promise queue and returns the completed promises and the pending promises.
+
+        Promises of actions superseded or preempted by another action are
+        dropped.
         """
         done_promises = []
+        pending_promises = []
         for promise in self.promise_queue:
+            if promise.cancelled():
+                continue
             if promise.done():
                 await promise
                 done_promises.append(promise)
-        self.promise_queue = [p for p in self.promise_queue if p not in done_promises]
+            else:
+                pending_promises.append(promise)
+        self.promise_queue = pending_promises
         return done_promises, self.promise_queue
 
     async def promise(self, actions: list[Action]) -> None:
@@ -86,60 +209,40 @@ class ActionOrchestrator:
         for action in actions:
             logging.debug(f"Sending command: {action}")
 
-            # fix corrupted commands when there is only one output
-            # typically only happens during testing
-            at = action.type.lower()
-            av = action.value
-            if at == "stand still" and av == "":
-                action.type = "move"
-                action.value = "stand still"
-            elif at == "turn left" and av == "":
-                action.type = "move"
-                action.value = "turn left"
-            elif at == "turn right" and av == "":
-                action.type = "move"
-                action.value = "turn right"
-            elif at == "move forwards" and av == "":
-                action.type = "move"
-                action.value = "move forwards"
-            elif at == "move back" and av == "":
-                action.type = "move"
-                action.value = "move back"
-
-            agent_action = next(
-                (
-                    m
-                    for m in self._config.agent_actions
-                    if m.llm_label == action.type.lower()
-                ),
-                None,
-            )
-            if agent_action is None:
-                logging.warning(
-                    f"Attempted to call non-existent action: {action.type.lower()}."
-                )
+            label = action.type.lower()
+            if action.value == "" and label in MOVE_COMMAND_ALIASES:
+                action.type, action.value = MOVE_COMMAND_ALIASES[label]
+                label = action.type
+
+            dispatch = self._dispatch_table.get(label)
+            if dispatch is None:
+                logging.warning(f"Attempted to call non-existent action: {label}.")
                 continue
-            action_response = asyncio.create_task(
-                self._promise_action(agent_action, action)
+            connector = dispatch.agent_action.connector
+            action_response = self._executor.submit(
+                label,
+                partial(self._promise_action, dispatch, action),
+                priority=dispatch.priority(action.value),
+                max_concurrency=connector.max_concurrency,
+                coalesce=connector.coalesce,
+                emergency_preemptible=connector.emergency_preemptible,
             )
             self.promise_queue.append(action_response)
 
-    async def _promise_action(self, agent_action: AgentAction, action: Action) -> T.Any:
+    async def _promise_action(self, dispatch: _ActionDispatch, action: Action) -> T.Any:
+        agent_action = dispatch.agent_action
         logging.debug(
             f"Calling action {agent_action.llm_label} with type {action.type.lower()} and argument {action.value}"
         )
-        input_interface = T.get_type_hints(agent_action.interface)["input"](
-            **{"action": action.value}
-        )
+        input_interface = dispatch.build_input(action.value)
         await agent_action.connector.connect(input_interface)
         return input_interface
 
     def stop(self):
         """
-        Stop the action executor and wait for all tasks to complete.
+        Stop ticking the connectors and wait for running ticks to complete.
         """
-        self._stop_event.set()
-        self._connector_executor.shutdown(wait=True)
+        self._scheduler.stop(wait=True)
 
     def __del__(self):
         """
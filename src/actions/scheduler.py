@@ -0,0 +1,352 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+import typing as T
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+
+
+@dataclass
+class TickStats:
+    """
+    Timing counters of a scheduled tick function.
+
+    Parameters
+    ----------
+    interval : float, optional
+        The tick period in seconds, None for self-paced ticks.
+    ticks : int
+        Number of completed ticks.
+    errors : int
+        Number of ticks that raised.
+    overruns : int
+        Number of ticks that took longer than the tick period.
+    skipped : int
+        Number of tick periods skipped because a tick overran.
+    total_seconds : float
+        Total time spent in tick in seconds.
+    max_seconds : float
+        Longest tick in seconds.
+    total_jitter : float
+        Total delay in seconds between the scheduled and actual tick starts.
+    max_jitter : float
+        Longest delay in seconds between a scheduled and actual tick start.
+    """
+
+    interval: T.Optional[float] = None
+    ticks: int = 0
+    errors: int = 0
+    overruns: int = 0
+    skipped: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    total_jitter: float = 0.0
+    max_jitter: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """
+        Get the mean tick duration in seconds, 0 if nothing ran.
+        """
+        return self.total_seconds / self.ticks if self.ticks else 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        """
+        Get the mean start delay in seconds, 0 if nothing ran.
+        """
+        return self.total_jitter / self.ticks if self.ticks else 0.0
+
+
+@dataclass(eq=False)
+class _Entry:
+    """
+    A tick function registered with the scheduler.
+    """
+
+    name: str
+    tick: T.Callable[[], None]
+    interval: T.Optional[float]
+    stats: TickStats = field(default_factory=TickStats)
+    thread: T.Optional[threading.Thread] = None
+
+
+class ConnectorScheduler:
+    """
+    Runs periodic tick functions on a small shared thread pool.
+
+    Periodic ticks are kept in a deadline heap. One scheduler thread sleeps
+    until the earliest deadline and hands due ticks to the pool, so idle
+    connectors hold no thread. A tick never runs concurrently with itself:
+    its next deadline is set once it completes, one period after the
+    previous deadline. A tick that overruns its period is counted, and the
+    periods it missed are skipped instead of run back to back.
+
+    Ticks without a period pace themselves, e.g. by sleeping or blocking on
+    I/O, and each get a dedicated thread calling them back to back.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of threads running periodic ticks.
+    error_backoff : float
+        Seconds to wait after a self-paced tick raised.
+    """
+
+    def __init__(self, max_workers: int = 4, error_backoff: float = 0.1):
+        """
+        Initialize the scheduler without any ticks.
+        """
+        self.max_workers = max(1, max_workers)
+        self.error_backoff = error_backoff
+
+        self._entries: T.Dict[str, _Entry] = {}
+        self._heap: T.List[T.Tuple[float, int, _Entry]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._executor: T.Optional[ThreadPoolExecutor] = None
+        self._thread: T.Optional[threading.Thread] = None
+
+    def add(
+        self, name: str, tick: T.Callable[[], None], interval: T.Optional[float]
+    ) -> None:
+        """
+        Register a tick function. It runs once the scheduler is started.
+
+        Parameters
+        ----------
+        name : str
+            Unique name of the tick, used in logs and stats.
+        tick : Callable[[], None]
+            The tick function.
+        interval : float, optional
+            Seconds between two tick starts, or None for a self-paced tick.
+
+        Raises
+        ------
+        ValueError
+            If a tick with the same name is already registered, or the
+            interval is not positive.
+        """
+        if name in self._entries:
+            raise ValueError(f"Tick {name} already scheduled")
+        if interval is not None and interval <= 0:
+            raise ValueError(f"Tick interval of {name} must be positive")
+
+        entry = _Entry(name=name, tick=tick, interval=interval)
+        entry.stats.interval = interval
+        self._entries[name] = entry
+
+        if self._thread is not None:
+            self._start_entry(entry, time.monotonic())
+
+    def start(self) -> None:
+        """
+        Start running the registered ticks.
+        """
+        if self._thread is not None:
+            return
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="connector-tick"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="connector-scheduler", daemon=True
+        )
+        self._thread.start()
+
+        now = time.monotonic()
+        for entry in self._entries.values():
+            self._start_entry(entry, now)
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop scheduling ticks.
+
+        Parameters
+        ----------
+        wait : bool
+            Wait for running periodic ticks to complete.
+        """
+        self._stop_event.set()
+        with self._condition:
+            self._heap.clear()
+            self._condition.notify_all()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def stats(self) -> T.Dict[str, TickStats]:
+        """
+        Get a copy of the timing counters of each tick.
+
+        Returns
+        -------
+        Dict[str, TickStats]
+            The counters keyed by tick name.
+        """
+        with self._condition:
+            return {name: replace(entry.stats) for name, entry in self._entries.items()}
+
+    def _start_entry(self, entry: _Entry, now: float) -> None:
+        """
+        Schedule the first run of a tick.
+
+        Parameters
+        ----------
+        entry : _Entry
+            The tick to start.
+        now : float
+            The current monotonic time.
+        """
+        if entry.interval is None:
+            entry.thread = threading.Thread(
+                target=self._run_self_paced,
+                args=(entry,),
+                name=f"connector-{entry.name}",
+                daemon=True,
+            )
+            entry.thread.start()
+        else:
+            self._schedule(entry, now)
+
+    def _schedule(self, entry: _Entry, deadline: float) -> None:
+        """
+        Push the next run of a periodic tick on the heap.
+
+        Parameters
+        ----------
+        entry : _Entry
+            The tick to schedule.
+        deadline : float
+            The monotonic time at which it is due.
+        """
+        with self._condition:
+            if self._stop_event.is_set():
+                return
+            heapq.heappush(self._heap, (deadline, next(self._counter), entry))
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """
+        Hand periodic ticks to the pool as they become due.
+        """
+        while not self._stop_event.is_set():
+            with self._condition:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                deadline, _, entry = self._heap[0]
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                heapq.heappop(self._heap)
+
+            try:
+                self._executor.submit(self._run_periodic, entry, deadline)  # type: ignore
+            except RuntimeError:
+                # The pool was shut down
+                return
+
+    def _run_periodic(self, entry: _Entry, deadline: float) -> None:
+        """
+        Run a periodic tick and schedule its next run.
+
+        Parameters
+        ----------
+        entry : _Entry
+            The tick to run.
+        deadline : float
+            The monotonic time at which it was due.
+        """
+        started = time.monotonic()
+        failed = self._call(entry)
+        finished = time.monotonic()
+
+        interval = T.cast(float, entry.interval)
+        next_deadline = deadline + interval
+        skipped = 0
+        if next_deadline < finished:
+            skipped = int((finished - next_deadline) // interval) + 1
+            next_deadline += skipped * interval
+
+        with self._condition:
+            stats = entry.stats
+            self._record(stats, finished - started, started - deadline, failed)
+            if finished - started > interval:
+                stats.overruns += 1
+            stats.skipped += skipped
+
+        if skipped:
+            logging.debug(
+                f"Connector {entry.name} tick overran, skipped {skipped} period(s)"
+            )
+
+        self._schedule(entry, next_deadline)
+
+    def _run_self_paced(self, entry: _Entry) -> None:
+        """
+        Call a self-paced tick back to back until the scheduler stops.
+
+        Parameters
+        ----------
+        entry : _Entry
+            The tick to run.
+        """
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            failed = self._call(entry)
+            with self._condition:
+                self._record(entry.stats, time.monotonic() - started, 0.0, failed)
+            if failed:
+                self._stop_event.wait(self.error_backoff)
+
+    def _call(self, entry: _Entry) -> bool:
+        """
+        Call a tick function, logging errors.
+
+        Parameters
+        ----------
+        entry : _Entry
+            The tick to call.
+
+        Returns
+        -------
+        bool
+            True if the tick raised.
+        """
+        try:
+            entry.tick()
+            return False
+        except Exception as e:
+            logging.error(f"Error in connector {entry.name}: {e}")
+            return True
+
+    @staticmethod
+    def _record(stats: TickStats, duration: float, jitter: float, failed: bool):
+        """
+        Record the timing of one tick.
+
+        Parameters
+        ----------
+        stats : TickStats
+            The counters to update.
+        duration : float
+            The tick duration in seconds.
+        jitter : float
+            The delay between the scheduled and actual start in seconds.
+        failed : bool
+            Whether the tick raised.
+        """
+        stats.ticks += 1
+        stats.errors += int(failed)
+        stats.total_seconds += duration
+        stats.max_seconds = max(stats.max_seconds, duration)
+        stats.total_jitter += jitter
+        stats.max_jitter = max(stats.max_jitter, jitter)
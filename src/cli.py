@@ -6,6 +6,7 @@ import dotenv
 import json5
 import typer
 
+from providers.sensor_recorder import convert_jsonl_to_lidar
 from runtime.multi_mode.config import load_mode_config
 
 app = typer.Typer()
@@ -127,6 +128,36 @@ def list_configs() -> None:
             print(f"• {config_name} - {display_name}")
 
 
+@app.command()
+def convert_lidar(
+    source: str,
+    filename_base: str = "dump/lidar",
+    sensor_mounting_angle: float = 180.0,
+) -> None:
+    """
+    Convert a JSON lines lidar dump to a binary columnar lidar recording.
+
+    Parameters
+    ----------
+    source : str
+        The JSON lines dump, e.g. dump/lidar_1700000000_0Z.jsonl.
+    filename_base : str
+        Path prefix of the recording.
+    sensor_mounting_angle : float
+        Mounting angle in degrees the dump was recorded with.
+    """
+    try:
+        path = convert_jsonl_to_lidar(source, filename_base, sensor_mounting_angle)
+    except FileNotFoundError:
+        logging.error(f"Lidar dump not found: {source}")
+        raise typer.Exit(1)
+
+    if path is None:
+        logging.error(f"No lidar scans found in {source}")
+        raise typer.Exit(1)
+    print(f"Lidar recording written to {path}")
+
+
 if __name__ == "__main__":
 
     # Fix for Linux multiprocessing
@@ -1,6 +1,7 @@
 import logging
 import time
 import typing as T
+from dataclasses import dataclass
 
 from actions import describe_action
 from inputs.base import Sensor
@@ -8,6 +9,29 @@ from providers.io_provider import IOProvider
 from runtime.single_mode.config import RuntimeConfig
 
 
+@dataclass
+class PromptFragments:
+    """
+    Static sections of the fused prompt, built once per configuration.
+
+    Parameters
+    ----------
+    system_prompt : str
+        System prompt including the local laws.
+    system_prompt_without_laws : str
+        System prompt used when the laws arrive as an input.
+    actions_fused : str
+        Descriptions of all the available actions.
+    question_prompt : str
+        Final prompt requesting commands to be generated.
+    """
+
+    system_prompt: str
+    system_prompt_without_laws: str
+    actions_fused: str
+    question_prompt: str
+
+
 class Fuser:
     """
     Combines multiple agent inputs into a single formatted prompt.
@@ -40,6 +64,72 @@ class Fuser:
         self.config = config
         self.io_provider = IOProvider()
 
+        self._prompt_fragments: T.Optional[PromptFragments] = None
+        self._prompt_fragments_config: T.Optional[RuntimeConfig] = None
+
+    def invalidate_prompt_cache(self) -> None:
+        """
+        Drop the cached static prompt sections.
+
+        The cache is keyed on the identity of the configuration, so a new
+        configuration from a hot reload or mode transition rebuilds it
+        automatically. This forces a rebuild for the current one.
+        """
+        self._prompt_fragments = None
+        self._prompt_fragments_config = None
+
+    def _get_prompt_fragments(self) -> PromptFragments:
+        """
+        Get the static prompt sections, rebuilding them if the configuration changed.
+
+        Returns
+        -------
+        PromptFragments
+            The static prompt sections for the current configuration.
+        """
+        if (
+            self._prompt_fragments is not None
+            and self._prompt_fragments_config is self.config
+        ):
+            self.io_provider.record_fuser_prompt_cache_hit()
+            return self._prompt_fragments
+
+        build_start = time.perf_counter()
+
+        # Combine all inputs, memories, and configurations into a single prompt
+        system_prompt = "\nBASIC CONTEXT:\n" + self.config.system_prompt_base + "\n"
+        system_prompt_without_laws = system_prompt
+        system_prompt += "\nLAWS:\n" + self.config.system_governance
+
+        if self.config.system_prompt_examples:
+            examples = "\n\nEXAMPLES:\n" + self.config.system_prompt_examples
+            system_prompt += examples
+            system_prompt_without_laws += examples
+
+        # descriptions of possible actions
+        actions_fused = ""
+
+        for action in self.config.agent_actions:
+            desc = describe_action(
+                action.name, action.llm_label, action.exclude_from_prompt
+            )
+            if desc:
+                actions_fused += desc + "\n\n"
+
+        self._prompt_fragments = PromptFragments(
+            system_prompt=system_prompt,
+            system_prompt_without_laws=system_prompt_without_laws,
+            actions_fused=actions_fused,
+            question_prompt="What will you do? Actions:",
+        )
+        self._prompt_fragments_config = self.config
+
+        self.io_provider.record_fuser_prompt_cache_miss(
+            time.perf_counter() - build_start
+        )
+
+        return self._prompt_fragments
+
     def fuse(self, inputs: list[Sensor], finished_promises: list[T.Any]) -> str:
         """
         Combine all inputs into a single formatted prompt string.
@@ -65,31 +155,21 @@ class Fuser:
         input_strings = [input.formatted_latest_buffer() for input in inputs]
         logging.debug(f"InputMessageArray: {input_strings}")
 
-        # Combine all inputs, memories, and configurations into a single prompt
-        system_prompt = "\nBASIC CONTEXT:\n" + self.config.system_prompt_base + "\n"
-
         inputs_fused = " ".join([s for s in input_strings if s is not None])
 
+        # system prompt, laws, examples and actions only change with the config
+        fragments = self._get_prompt_fragments()
+
         # if we provide laws from blockchain, these override the locally stored rules
         # the rules are not provided in the system prompt, but as a separate INPUT,
         # since they are flowing from the outside world
         if "Universal Laws" not in inputs_fused:
-            system_prompt += "\nLAWS:\n" + self.config.system_governance
-
-        if self.config.system_prompt_examples:
-            system_prompt += "\n\nEXAMPLES:\n" + self.config.system_prompt_examples
-
-        # descriptions of possible actions
-        actions_fused = ""
-
-        for action in self.config.agent_actions:
-            desc = describe_action(
-                action.name, action.llm_label, action.exclude_from_prompt
-            )
-            if desc:
-                actions_fused += desc + "\n\n"
+            system_prompt = fragments.system_prompt
+        else:
+            system_prompt = fragments.system_prompt_without_laws
 
-        question_prompt = "What will you do? Actions:"
+        actions_fused = fragments.actions_fused
+        question_prompt = fragments.question_prompt
 
         # this is the final prompt:
         # (1) a (typically) fixed overall system prompt with the agents, name, rules, and examples
@@ -1,6 +1,8 @@
 import asyncio
+from typing import Dict, Optional, Tuple
 
 from inputs.base import Sensor
+from providers.io_provider import IOProvider
 
 
 class InputOrchestrator:
@@ -23,17 +25,90 @@ class InputOrchestrator:
         Initialize InputOrchestrator instance with input sources.
         """
         self.inputs = inputs
+        self.io_provider = IOProvider()
+
+        self._listeners: Dict[int, asyncio.Task] = {}
+        self._inputs_changed: Optional[asyncio.Event] = None
 
     async def listen(self) -> None:
         """
         Start listening to all input sources concurrently.
 
-        Creates and manages async tasks for each input source.
+        Creates and manages async tasks for each input source. Returns once
+        every input is exhausted, and raises the first error of an input.
+        Inputs replaced with update_inputs are picked up without restarting.
+        """
+        self._inputs_changed = asyncio.Event()
+        self._start_listeners(self.inputs)
+
+        try:
+            while self._listeners:
+                changed = asyncio.create_task(self._inputs_changed.wait())
+                done, _ = await asyncio.wait(
+                    [changed, *self._listeners.values()],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                changed.cancel()
+                self._inputs_changed.clear()
+
+                for key, task in list(self._listeners.items()):
+                    if task in done:
+                        del self._listeners[key]
+                        task.result()
+        except asyncio.CancelledError:
+            for task in self._listeners.values():
+                task.cancel()
+            raise
+        finally:
+            self._inputs_changed = None
+
+    def update_inputs(self, inputs: list[Sensor]) -> Tuple[int, int]:
+        """
+        Replace the input sources while listening.
+
+        Inputs present before and after the update keep their listener, so
+        their streams are not interrupted; listeners of removed inputs are
+        cancelled and new inputs start listening.
+
+        Parameters
+        ----------
+        inputs : list[Sensor]
+            The new input sources.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The number of inputs added and removed.
+        """
+        previous = {id(input) for input in self.inputs}
+        current = {id(input) for input in inputs}
+        added = [input for input in inputs if id(input) not in previous]
+        self.inputs = inputs
+
+        if self._inputs_changed is not None:
+            for key in previous - current:
+                task = self._listeners.pop(key, None)
+                if task is not None:
+                    task.cancel()
+            self._start_listeners(added)
+            self._inputs_changed.set()
+
+        return len(added), len(previous - current)
+
+    def _start_listeners(self, inputs: list[Sensor]) -> None:
+        """
+        Start a listener task for each input without one.
+
+        Parameters
+        ----------
+        inputs : list[Sensor]
+            Input sources to listen to
         """
-        input_tasks = [
-            asyncio.create_task(self._listen_to_input(input)) for input in self.inputs
-        ]
-        await asyncio.gather(*input_tasks)
+        for input in inputs:
+            if id(input) not in self._listeners:
+                self._listeners[id(input)] = asyncio.create_task(
+                    self._listen_to_input(input)
+                )
 
     async def _listen_to_input(self, input: Sensor) -> None:
         """
@@ -46,3 +121,6 @@ class InputOrchestrator:
         """
         async for event in input.listen():
             await input.raw_to_text(event)
+            if event is not None:
+                # wake event-driven cortex loops
+                self.io_provider.notify_input_changed(type(input).__name__)
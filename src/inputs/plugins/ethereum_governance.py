@@ -4,10 +4,9 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
-import requests
-
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.http_client_pool import HTTPClientPool, HTTPResponse
 from providers.io_provider import IOProvider
 
 """
@@ -51,11 +50,11 @@ class GovernanceEthereum(FuserInput[float]):
         If connection to Ethereum network fails
     """
 
-    def load_rules_from_blockchain(self):
-        logging.info("Loading rules from Ethereum blockchain")
-
-        # Construct JSON-RPC request
-        payload = {
+    def rules_request(self) -> dict:
+        """
+        Build the JSON-RPC eth_call reading the rule set.
+        """
+        return {
             "jsonrpc": "2.0",
             "id": 636815446436324,
             "method": "eth_call",
@@ -69,29 +68,57 @@ class GovernanceEthereum(FuserInput[float]):
             ],
         }
 
+    def parse_rules_response(self, response: HTTPResponse) -> Optional[str]:
+        """
+        Decode the rule set from the eth_call response, None on errors.
+        """
+        logging.debug(f"Blockchain response status: {response.status}")
+
+        if response.status == 200:
+            result = response.json()
+            if "result" in result and result["result"]:
+                hex_response = result["result"]
+                logging.debug(f"Raw blockchain response: {hex_response}")
+
+                # Decode the response using Web3.py
+                decoded_data = self.decode_eth_response(hex_response)
+                logging.debug(f"Decoded blockchain data: {decoded_data}")
+                return decoded_data
+            else:
+                logging.error("Error: No valid result in blockchain response")
+        else:
+            logging.error(
+                f"Error: Blockchain request failed with status {response.status}"
+            )
+
+        return None
+
+    def load_rules_from_blockchain(self) -> Optional[str]:
+        """
+        Load the rule set, blocking the calling thread.
+        """
+        logging.info("Loading rules from Ethereum blockchain")
+
         try:
-            response = requests.post(
-                self.rpc_url, json=payload, headers={"Content-Type": "application/json"}
+            response = self.http.request_sync(
+                "POST", self.rpc_url, json=self.rules_request(), coalesce=True
             )
-            logging.debug(f"Blockchain response status: {response.status_code}")
-
-            if response.status_code == 200:
-                result = response.json()
-                if "result" in result and result["result"]:
-                    hex_response = result["result"]
-                    logging.debug(f"Raw blockchain response: {hex_response}")
-
-                    # Decode the response using Web3.py
-                    decoded_data = self.decode_eth_response(hex_response)
-                    logging.debug(f"Decoded blockchain data: {decoded_data}")
-                    return decoded_data
-                else:
-                    logging.error("Error: No valid result in blockchain response")
-            else:
-                logging.error(
-                    f"Error: Blockchain request failed with status {response.status_code}"
-                )
+            return self.parse_rules_response(response)
+        except Exception as e:
+            logging.error(f"Error loading rules from blockchain: {e}")
+
+        return None
 
+    async def fetch_rules_from_blockchain(self) -> Optional[str]:
+        """
+        Load the rule set without blocking the event loop.
+        """
+        try:
+            # eth_call is a read, so identical requests in flight are shared
+            response = await self.http.post(
+                self.rpc_url, json=self.rules_request(), coalesce=True
+            )
+            return self.parse_rules_response(response)
         except Exception as e:
             logging.error(f"Error loading rules from blockchain: {e}")
 
@@ -135,6 +162,7 @@ class GovernanceEthereum(FuserInput[float]):
         self.descriptor_for_LLM = "Universal Laws"
 
         self.io_provider = IOProvider()
+        self.http = HTTPClientPool()
         self.POLL_INTERVAL = 5  # seconds
         self.rpc_url = "https://holesky.gateway.tenderly.co"  # Ethereum RPC URL
 
@@ -160,12 +188,9 @@ class GovernanceEthereum(FuserInput[float]):
         """
         await asyncio.sleep(self.POLL_INTERVAL)
 
-        try:
-            rules = self.load_rules_from_blockchain()
-            logging.debug(f"7777 rules: {rules}")
-            return rules
-        except Exception as e:
-            logging.error(f"Error fetching blockchain data: {e}")
+        rules = await self.fetch_rules_from_blockchain()
+        logging.debug(f"7777 rules: {rules}")
+        return rules
 
     async def _raw_to_text(self, raw_input: str) -> Message:
         """
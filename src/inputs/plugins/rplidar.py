@@ -160,6 +160,8 @@ class RPLidar(FuserInput[str]):
             "multicast_address": getattr(config, "multicast_address", ""),
             "machine_type": getattr(config, "machine_type", "go2"),
             "log_file": getattr(config, "log_file", False),
+            "log_format": getattr(config, "log_format", "jsonl"),
+            "log_compression": getattr(config, "log_compression", None),
         }
 
         return lidar_config
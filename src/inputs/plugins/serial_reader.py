@@ -1,14 +1,16 @@
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import Deque, Optional
 
 import serial
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
+from providers.serial_reactor import SerialReactor, SerialRecord, SerialSubscription
 
 """
 
@@ -62,14 +64,18 @@ class SerialReader(FuserInput[str]):
         # Configure the serial port
         port = "/dev/cu.usbmodem1101"  # Replace with your serial port
         baudrate = 9600
-        timeout = 1  # Optional: set a timeout for reading
 
-        self.ser = None
+        # Lines read by the serial reactor, waiting to be polled
+        self._lines: Deque[str] = deque(maxlen=100)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._line_event: Optional[asyncio.Event] = None
+
+        self.subscription: Optional[SerialSubscription] = None
 
         try:
-            # Open the serial port
-            self.ser = serial.Serial(port, baudrate, timeout=timeout)
-            logging.info(f"Connected to {port} at {baudrate} baud")
+            self.subscription = SerialReactor().subscribe(
+                port, self._on_record, baudrate=baudrate
+            )
         except serial.SerialException as e:
             logging.error(f"Error: {e}")
 
@@ -81,29 +87,52 @@ class SerialReader(FuserInput[str]):
 
         self.descriptor_for_LLM = "Heart Rate and Grip Strength"
 
+    def _on_record(self, record: SerialRecord):
+        """
+        Queue a line read by the serial reactor and wake the poll.
+
+        Parameters
+        ----------
+        record : SerialRecord
+            The line read.
+        """
+        self._lines.append(record.line)
+
+        loop = self._loop
+        event = self._line_event
+        if loop is None or event is None or loop.is_closed():
+            return
+
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # the loop closed between the check and the call
+            pass
+
     async def _poll(self) -> str | None:
         """
-        Poll for serial data.
+        Wait for the next line of serial data.
 
         Returns
         -------
         str
             message on serial bus
         """
-
-        await asyncio.sleep(0.5)
-
-        if self.ser is None:
+        if self.subscription is None:
+            await asyncio.sleep(0.5)
             return None
 
-        data = self.ser.readline().decode("utf-8").strip()
-        # Read a line, decode, and remove whitespace
+        if self._line_event is None:
+            self._loop = asyncio.get_running_loop()
+            self._line_event = asyncio.Event()
 
-        if data:
-            logging.info(f"Serial: {data}")
-            return data
-        else:
-            return None
+        while not self._lines:
+            self._line_event.clear()
+            await self._line_event.wait()
+
+        data = self._lines.popleft()
+        logging.info(f"Serial: {data}")
+        return data
 
     async def _raw_to_text(self, raw_input: str) -> Message:
         """
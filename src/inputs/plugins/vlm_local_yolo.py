@@ -1,9 +1,8 @@
 import asyncio
-import json
 import logging
-import os
 import time
 from dataclasses import dataclass
+from functools import partial
 from typing import List, Optional
 
 import cv2
@@ -11,8 +10,12 @@ from ultralytics import YOLO
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.inference_worker import InferenceWorker
 from providers.io_provider import IOProvider
 from providers.odom_provider import OdomProvider
+from providers.sensor_recorder import SensorRecorder
+
+YOLO_MODEL = "yolov8n_aug.pt"
 
 # Common resolutions to test (width, height), ordered high to low
 RESOLUTIONS = [
@@ -81,6 +84,44 @@ def check_webcam(index_to_check):
     return width, height
 
 
+def detect_objects(model, frames: List) -> List[List[dict]]:
+    """
+    Run YOLO on a batch of frames.
+
+    Parameters
+    ----------
+    model : YOLO
+        The YOLO model.
+    frames : List
+        The frames, possibly from several cameras.
+
+    Returns
+    -------
+    List[List[dict]]
+        For each frame, the detections with their class, confidence and bbox.
+    """
+    results = model.predict(source=frames, save=False, verbose=False)
+
+    batch = []
+    for r in results:
+        detections = []
+        if r.boxes is not None:
+            for box in r.boxes:
+                x1, y1, x2, y2 = map(float, box.xyxy[0])
+                cls = int(box.cls[0])
+                conf = float(box.conf[0])
+                label = model.names[cls]
+                detections.append(
+                    {
+                        "class": label,
+                        "confidence": round(conf, 4),
+                        "bbox": [round(x1), round(y1), round(x2), round(y2)],
+                    }
+                )
+        batch.append(detections)
+    return batch
+
+
 class VLM_Local_YOLO(FuserInput[str]):
     """ """
 
@@ -101,20 +142,28 @@ class VLM_Local_YOLO(FuserInput[str]):
         # Simple description of sensor output to help LLM understand its importance and utility
         self.descriptor_for_LLM = "Eyes"
 
-        # Load model
-        self.model = YOLO("yolov8n_aug.pt")
+        # Capture and inference run on worker threads, off the event loop. The
+        # model is loaded once and batches frames of all cameras.
+        self.worker = InferenceWorker()
+        if not self.worker.has_model(YOLO_MODEL):
+            self.worker.register_model(
+                YOLO_MODEL,
+                partial(detect_objects, YOLO(YOLO_MODEL)),
+                max_batch_size=getattr(self.config, "inference_batch_size", 4),
+            )
+        self.source = f"yolo_camera_{self.camera_index}"
+        self.last_sequence = 0
 
         self.write_to_local_file = False
         if getattr(self.config, "log_file", None):
             self.write_to_local_file = getattr(self.config, "log_file", False)
 
-        self.filename_current = None
-        self.max_file_size_bytes = 1024 * 1024
-
-        # Create timestamped log filename
+        # Detections are written to timestamped, rotating files in the background
+        self.recorder: Optional[SensorRecorder] = None
         if self.write_to_local_file:
-            self.filename_current = self.update_filename()
-            logging.info(f"YOLO Logging to {self.filename_current}")
+            self.recorder = SensorRecorder(
+                "dump/yolo", compression=getattr(self.config, "log_compression", None)
+            )
 
         self.width, self.height = check_webcam(self.camera_index)
 
@@ -135,6 +184,12 @@ class VLM_Local_YOLO(FuserInput[str]):
             logging.info(
                 f"Webcam pixel dimensions for YOLO: {self.width}, {self.height}"
             )
+            self.worker.add_source(
+                self.source,
+                YOLO_MODEL,
+                capture=self._capture,
+                interval=getattr(self.config, "capture_interval", 0.25),
+            )
 
         self.odom = OdomProvider()
         logging.info(f"YOLO Odom Provider: {self.odom}")
@@ -145,13 +200,6 @@ class VLM_Local_YOLO(FuserInput[str]):
         self.odom_yaw_0_360 = 0.0
         self.odom_yaw_m180_p180 = 0.0
 
-    def update_filename(self):
-        unix_ts = round(time.time(), 6)
-        logging.info(f"YOLO time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"dump/yolo_{unix_ts}Z.jsonl"
-        return filename
-
     def get_top_detection(self, detections):
         """
         Returns the class label and bbox of the detection with the highest confidence.
@@ -168,106 +216,79 @@ class VLM_Local_YOLO(FuserInput[str]):
         top = max(detections, key=lambda d: d["confidence"])
         return top["class"], top["bbox"]
 
-    async def _poll(self) -> Optional[List]:
+    def _capture(self):
         """
-        Poll for new image input.
+        Read a frame from the webcam. Called on the capture thread.
 
         Returns
         -------
-        np.ndarray
-            Generated or captured image as a numpy array
+        np.ndarray or None
+            The frame, or None if it could not be read.
         """
-        await asyncio.sleep(0.25)
-
-        if self.have_cam and self.cap is not None:
-
-            ret, frame = self.cap.read()
-            self.frame_index += 1
-            timestamp = time.time()
-
-            try:
-                o = self.odom.position
-                logging.debug(f"Odom data: {o}")
-                if o:
-                    self.odom_x = o["odom_x"]
-                    self.odom_y = o["odom_y"]
-                    self.odom_rockchip_ts = o["odom_rockchip_ts"]
-                    self.odom_subscriber_ts = o["odom_subscriber_ts"]
-                    self.odom_yaw_0_360 = o["odom_yaw_0_360"]
-                    self.odom_yaw_m180_p180 = o["odom_yaw_m180_p180"]
-            except Exception as e:
-                logging.error(f"Error parsing Odom: {e}")
-
-            results = self.model.predict(
-                source=frame, save=False, stream=True, verbose=False
-            )
+        ret, frame = self.cap.read()  # type: ignore
+        return frame if ret else None
 
-            detections = []
-            for r in results:
-                if r.boxes is not None:
-                    for box in r.boxes:
-                        x1, y1, x2, y2 = map(float, box.xyxy[0])
-                        cls = int(box.cls[0])
-                        conf = float(box.conf[0])
-                        label = self.model.names[cls]
-                        detections.append(
-                            {
-                                "class": label,
-                                "confidence": round(conf, 4),
-                                "bbox": [round(x1), round(y1), round(x2), round(y2)],
-                            }
-                        )
-
-            logging.debug(
-                f"\nFrame {self.frame_index} @ {timestamp} — {len(detections)} objects:"
-            )
-
-            if self.write_to_local_file:
-                try:
-                    json_line = json.dumps(
-                        {
-                            "frame": self.frame_index,
-                            "timestamp": timestamp,
-                            "detections": detections,
-                            "odom_rockchip_ts": self.odom_rockchip_ts,
-                            "odom_subscriber_ts": self.odom_subscriber_ts,
-                            "odom_x": self.odom_x,
-                            "odom_y": self.odom_y,
-                            "odom_yaw_0_360": self.odom_yaw_0_360,
-                            "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
-                        }
-                    )
-                    self.write_str_to_file(json_line)
-                    logging.info(f"YOLO wrote to {self.filename_current}")
-                except Exception as e:
-                    logging.error(f"Error saving YOLO: {str(e)}")
-
-            return detections
-
-    def write_str_to_file(self, json_line: str):
+    async def _poll(self) -> Optional[List]:
         """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
+        Poll for new detections.
 
-        Parameters:
-        - data: Dictionary to write
+        Waits for the inference worker to detect objects in a new frame,
+        without blocking the event loop.
+
+        Returns
+        -------
+        List or None
+            The detections of the latest frame, or None if there is none.
         """
+        if not (self.have_cam and self.cap is not None):
+            await asyncio.sleep(0.25)
+            return None
+
+        result = await self.worker.next_result(
+            self.source, after=self.last_sequence, timeout=1.0
+        )
+        if result is None or result.error is not None:
+            return None
+
+        self.last_sequence = result.sequence
+        self.frame_index = result.sequence
+        timestamp = result.captured_at
+
+        try:
+            o = self.odom.position
+            logging.debug(f"Odom data: {o}")
+            if o:
+                self.odom_x = o["odom_x"]
+                self.odom_y = o["odom_y"]
+                self.odom_rockchip_ts = o["odom_rockchip_ts"]
+                self.odom_subscriber_ts = o["odom_subscriber_ts"]
+                self.odom_yaw_0_360 = o["odom_yaw_0_360"]
+                self.odom_yaw_m180_p180 = o["odom_yaw_m180_p180"]
+        except Exception as e:
+            logging.error(f"Error parsing Odom: {e}")
+
+        detections = result.value
+
+        logging.debug(
+            f"\nFrame {self.frame_index} @ {timestamp} — {len(detections)} objects:"
+        )
+
+        if self.recorder is not None:
+            self.recorder.record(
+                {
+                    "frame": self.frame_index,
+                    "timestamp": timestamp,
+                    "detections": detections,
+                    "odom_rockchip_ts": self.odom_rockchip_ts,
+                    "odom_subscriber_ts": self.odom_subscriber_ts,
+                    "odom_x": self.odom_x,
+                    "odom_y": self.odom_y,
+                    "odom_yaw_0_360": self.odom_yaw_0_360,
+                    "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
+                }
+            )
 
-        if not isinstance(json_line, str):
-            raise ValueError("Provided json_line must be a json string.")
-
-        if (
-            self.filename_current is not None
-            and os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"New yolo file name: {self.filename_current}")
-
-        if self.filename_current is not None:
-            with open(self.filename_current, "a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-                f.flush()
+        return detections
 
     async def _raw_to_text(self, raw_input: Optional[List]) -> Optional[Message]:
         """
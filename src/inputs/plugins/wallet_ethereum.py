@@ -4,7 +4,7 @@ import os
 import random
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from web3 import Web3
 
@@ -73,6 +73,22 @@ class WalletEthereum(FuserInput[float]):
         if not self.web3.is_connected():
             raise Exception("Failed to connect to Ethereum")
 
+    def _read_balance(self) -> Tuple[int, float]:
+        """
+        Read the latest block number and the account balance.
+
+        Returns
+        -------
+        Tuple[int, float]
+            The block number and the balance in ETH
+        """
+        # Get latest block data
+        block_number = self.web3.eth.block_number
+
+        # Get account data
+        balance_wei = self.web3.eth.get_balance(self.ACCOUNT_ADDRESS)  # type: ignore
+        return block_number, float(self.web3.from_wei(balance_wei, "ether"))
+
     async def _poll(self) -> List[float]:
         """
         Poll for Ethereum balance updates.
@@ -85,12 +101,8 @@ class WalletEthereum(FuserInput[float]):
         await asyncio.sleep(self.POLL_INTERVAL)
 
         try:
-            # Get latest block data
-            block_number = self.web3.eth.block_number
-
-            # Get account data
-            balance_wei = self.web3.eth.get_balance(self.ACCOUNT_ADDRESS)  # type: ignore
-            self.balance_eth = float(self.web3.from_wei(balance_wei, "ether"))
+            # web3 calls block on HTTP, so they run off the event loop
+            block_number, self.balance_eth = await asyncio.to_thread(self._read_balance)
 
             self.eth_info = {
                 "block_number": int(block_number),
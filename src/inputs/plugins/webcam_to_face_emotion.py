@@ -3,15 +3,18 @@ import logging
 import random
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 import cv2
 from deepface import DeepFace
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
+from providers.inference_worker import InferenceWorker
 from providers.io_provider import IOProvider
 
+FACE_EMOTION_MODEL = "face_emotion"
+
 
 @dataclass
 class Message:
@@ -78,6 +81,13 @@ class FaceEmotionCapture(FuserInput[cv2.typing.MatLike]):
         if self.have_cam:
             self.cap = cv2.VideoCapture(0)
 
+        # Face detection and emotion analysis run on an inference worker
+        # thread, off the event loop
+        self.worker = InferenceWorker()
+        self.worker.register_model(FACE_EMOTION_MODEL, self._detect_emotions)
+        self.source = f"{FACE_EMOTION_MODEL}_camera_0"
+        self.worker.add_source(self.source, FACE_EMOTION_MODEL)
+
         # Initialize emotion label
         self.emotion = ""
 
@@ -95,9 +105,9 @@ class FaceEmotionCapture(FuserInput[cv2.typing.MatLike]):
         """
         await asyncio.sleep(0.5)
 
-        # Capture a frame every 500 ms
+        # Capture a frame every 500 ms, reading the camera off the event loop
         if self.have_cam and self.cap is not None:
-            ret, frame = self.cap.read()
+            ret, frame = await asyncio.to_thread(self.cap.read)
             return frame
 
     async def _raw_to_text(self, raw_input: cv2.typing.MatLike) -> Message:
@@ -121,39 +131,62 @@ class FaceEmotionCapture(FuserInput[cv2.typing.MatLike]):
             message = f"I see a person. Their emotion is {random_emotion}."
             return Message(timestamp=time.time(), message=message)
 
-        frame = raw_input
+        result = await self.worker.infer(self.source, raw_input)
+        if result is not None and result.value:
+            self.emotion = result.value
+
+        if self.emotion == "":
+            message = "I do not see anyone, so I can't estimate their emotion."
+        else:
+            message = f"I see a person. Their emotion is {self.emotion}."
+
+        logging.info(f"EmotionCapture: {message}")
 
-        # Convert frame to grayscale
-        gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return Message(timestamp=time.time(), message=message)
 
-        # Convert grayscale frame to RGB format
-        rgb_frame = cv2.cvtColor(gray_frame, cv2.COLOR_GRAY2RGB)
+    def _detect_emotions(self, frames: List[cv2.typing.MatLike]) -> List[str]:
+        """
+        Detect faces and their dominant emotion. Called on the inference thread.
 
-        # Detect faces in the frame
-        faces = self.face_cascade.detectMultiScale(
-            gray_frame, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-        )
+        Parameters
+        ----------
+        frames : List[cv2.typing.MatLike]
+            Input video frames
+
+        Returns
+        -------
+        List[str]
+            For each frame, the dominant emotion of the last detected face, or
+            an empty string if no face was detected.
+        """
+        emotions = []
+        for frame in frames:
+            # Convert frame to grayscale
+            gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
-        for x, y, w, h in faces:
-            # Extract the face ROI (Region of Interest)
-            face_roi = rgb_frame[y : y + h, x : x + w]
+            # Convert grayscale frame to RGB format
+            rgb_frame = cv2.cvtColor(gray_frame, cv2.COLOR_GRAY2RGB)
 
-            # Perform emotion analysis on the face ROI
-            result = DeepFace.analyze(
-                face_roi, actions=["emotion"], enforce_detection=False
+            # Detect faces in the frame
+            faces = self.face_cascade.detectMultiScale(
+                gray_frame, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
             )
 
-            # Determine the dominant emotion
-            self.emotion = result[0]["dominant_emotion"]
+            emotion = ""
+            for x, y, w, h in faces:
+                # Extract the face ROI (Region of Interest)
+                face_roi = rgb_frame[y : y + h, x : x + w]
 
-        if self.emotion == "":
-            message = "I do not see anyone, so I can't estimate their emotion."
-        else:
-            message = f"I see a person. Their emotion is {self.emotion}."
+                # Perform emotion analysis on the face ROI
+                result = DeepFace.analyze(
+                    face_roi, actions=["emotion"], enforce_detection=False
+                )
 
-        logging.info(f"EmotionCapture: {message}")
+                # Determine the dominant emotion
+                emotion = result[0]["dominant_emotion"]
 
-        return Message(timestamp=time.time(), message=message)
+            emotions.append(emotion)
+        return emotions
 
     async def raw_to_text(self, raw_input: cv2.typing.MatLike):
         """
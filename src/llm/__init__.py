@@ -2,13 +2,15 @@ import importlib
 import inspect
 import logging
 import os
-import re
 import typing as T
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from llm.function_schemas import generate_function_schemas_from_actions
+from llm.response_cache import LLMResponseCache
+from llm.streaming import ActionCallback
 from providers.io_provider import IOProvider
+from runtime.plugin_index import PluginIndex
 
 R = T.TypeVar("R")
 
@@ -27,6 +29,23 @@ class LLMConfig(BaseModel):
         Name of the LLM model to use
     history_length : int, optional
         Number of interactions to store in the history buffer
+    history_token_budget : int, optional
+        Maximum number of estimated tokens of history sent with a request,
+        unlimited if unset
+    stream : bool, optional
+        Whether to stream responses, so that each action is dispatched as
+        soon as it is complete, if the LLM plugin supports it
+    response_cache : bool, optional
+        Whether to answer repeated requests from a response cache
+    response_cache_ttl_seconds : float, optional
+        Time in seconds a cached response stays valid
+    response_cache_max_entries : int, optional
+        Maximum number of cached responses
+    response_cache_path : str, optional
+        SQLite database persisting the cached responses, memory only if unset
+    response_cache_exclude : list of str, optional
+        Regular expressions of volatile prompt sections, e.g. timestamps, left
+        out of the cache key
     extra_params : dict, optional
         Additional parameters for the LLM API request
     """
@@ -39,6 +58,13 @@ class LLMConfig(BaseModel):
     timeout: T.Optional[int] = 10
     agent_name: T.Optional[str] = "IRIS"
     history_length: T.Optional[int] = 0
+    history_token_budget: T.Optional[int] = None
+    stream: bool = False
+    response_cache: bool = False
+    response_cache_ttl_seconds: float = 60.0
+    response_cache_max_entries: int = 256
+    response_cache_path: T.Optional[str] = None
+    response_cache_exclude: T.List[str] = Field(default_factory=list)
     extra_params: T.Dict[str, T.Any] = Field(default_factory=dict)
 
     def __getitem__(self, item: str) -> T.Any:
@@ -93,6 +119,9 @@ class LLM(T.Generic[R]):
         List of available actions for function calling
     """
 
+    # Whether ask accepts an on_action callback for streamed actions
+    supports_streaming: bool = False
+
     def __init__(
         self,
         config: LLMConfig = LLMConfig(),
@@ -115,7 +144,23 @@ class LLM(T.Generic[R]):
         # Set up the IO provider
         self.io_provider = IOProvider()
 
-    async def ask(self, prompt: str, messages: T.List[T.Dict[str, str]] = []) -> R:
+        # Set up the optional response cache
+        self.response_cache = LLMResponseCache.from_config(self._config)
+
+    @property
+    def streams_actions(self) -> bool:
+        """
+        Whether ask streams the response and hands each action to its
+        on_action callback as soon as it is complete.
+        """
+        return self.supports_streaming and bool(self._config.stream)
+
+    async def ask(
+        self,
+        prompt: str,
+        messages: T.List[T.Dict[str, str]] = [],
+        on_action: T.Optional[ActionCallback] = None,
+    ) -> R:
         """
         Send a prompt to the LLM and receive a typed response.
 
@@ -125,6 +170,9 @@ class LLM(T.Generic[R]):
             Input text to send to the model
         messages : List[Dict[str, str]]
             List of message dictionaries to send to the model.
+        on_action : ActionCallback, optional
+            Called with each action as soon as it is complete, if the LLM
+            streams actions.
 
         Returns
         -------
@@ -139,6 +187,9 @@ class LLM(T.Generic[R]):
         raise NotImplementedError
 
 
+_plugin_index = PluginIndex(os.path.join(os.path.dirname(__file__), "plugins"), "LLM")
+
+
 def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
     Find which module file contains the specified class name.
@@ -153,30 +204,7 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     str or None
         The module name (without .py) that contains the class, or None if not found
     """
-    plugins_dir = os.path.join(os.path.dirname(__file__), "plugins")
-
-    if not os.path.exists(plugins_dir):
-        return None
-
-    plugin_files = [f for f in os.listdir(plugins_dir) if f.endswith(".py")]
-
-    for plugin_file in plugin_files:
-        file_path = os.path.join(plugins_dir, plugin_file)
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            pattern = rf"^class\s+{re.escape(class_name)}\s*\([^)]*LLM[^)]*\)\s*:"
-
-            if re.search(pattern, content, re.MULTILINE):
-                return plugin_file[:-3]
-
-        except Exception as e:
-            logging.warning(f"Could not read {plugin_file}: {e}")
-            continue
-
-    return None
+    return _plugin_index.find(class_name)
 
 
 def load_llm(class_name: str) -> T.Type[LLM]:
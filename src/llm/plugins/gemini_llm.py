@@ -8,6 +8,8 @@ from pydantic import BaseModel
 from llm import LLM, LLMConfig
 from llm.function_schemas import convert_function_calls_to_actions
 from llm.output_model import CortexOutputModel
+from llm.response_cache import LLMResponseCache
+from llm.streaming import ActionCallback, stream_actions
 from providers.llm_history_manager import LLMHistoryManager
 
 R = T.TypeVar("R", bound=BaseModel)
@@ -28,6 +30,8 @@ class GeminiLLM(LLM[R]):
         List of available actions for function call generation. If provided.
     """
 
+    supports_streaming = True
+
     def __init__(
         self,
         config: LLMConfig = LLMConfig(),
@@ -52,7 +56,13 @@ class GeminiLLM(LLM[R]):
         self.history_manager = LLMHistoryManager(self._config, self._client)
 
     @LLMHistoryManager.update_history()
-    async def ask(self, prompt: str, messages: T.List[T.Dict[str, str]]) -> R | None:
+    @LLMResponseCache.cached()
+    async def ask(
+        self,
+        prompt: str,
+        messages: T.List[T.Dict[str, str]],
+        on_action: T.Optional[ActionCallback] = None,
+    ) -> R | None:
         """
         Execute LLM query and parse response
 
@@ -62,6 +72,8 @@ class GeminiLLM(LLM[R]):
             The input prompt to send to the model.
         messages : List[Dict[str, str]]
             List of message dictionaries to send to the model.
+        on_action : ActionCallback, optional
+            Called with each action as soon as it is complete when streaming.
 
         Returns
         -------
@@ -88,8 +100,19 @@ class GeminiLLM(LLM[R]):
                 tools=T.cast(T.Any, self.function_schemas),
                 tool_choice="auto",
                 timeout=self._config.timeout,
+                stream=self.streams_actions,
             )
 
+            if self.streams_actions:
+                actions = await stream_actions(T.cast(T.Any, response), on_action)
+                self.io_provider.llm_end_time = time.time()
+                if not actions:
+                    return None
+
+                result = CortexOutputModel(actions=actions)
+                logging.info(f"Gemini LLM streamed function call output: {result}")
+                return T.cast(R, result)
+
             message = response.choices[0].message
             self.io_provider.llm_end_time = time.time()
 
@@ -8,6 +8,8 @@ from pydantic import BaseModel
 from llm import LLM, LLMConfig
 from llm.function_schemas import convert_function_calls_to_actions
 from llm.output_model import CortexOutputModel
+from llm.response_cache import LLMResponseCache
+from llm.streaming import ActionCallback, stream_actions
 from providers.llm_history_manager import LLMHistoryManager
 
 R = T.TypeVar("R", bound=BaseModel)
@@ -31,6 +33,8 @@ class OpenRouter(LLM[R]):
         the LLM will use function calls instead of structured JSON output.
     """
 
+    supports_streaming = True
+
     def __init__(
         self,
         config: LLMConfig = LLMConfig(),
@@ -62,8 +66,12 @@ class OpenRouter(LLM[R]):
         self.history_manager = LLMHistoryManager(self._config, self._client)
 
     @LLMHistoryManager.update_history()
+    @LLMResponseCache.cached()
     async def ask(
-        self, prompt: str, messages: T.List[T.Dict[str, T.Any]] = []
+        self,
+        prompt: str,
+        messages: T.List[T.Dict[str, T.Any]] = [],
+        on_action: T.Optional[ActionCallback] = None,
     ) -> R | None:
         """
         Send a prompt to the OpenRouter API and get a structured response.
@@ -74,6 +82,8 @@ class OpenRouter(LLM[R]):
             The input prompt to send to the model.
         messages : List[Dict[str, str]]
             List of message dictionaries to send to the model.
+        on_action : ActionCallback, optional
+            Called with each action as soon as it is complete when streaming.
 
         Returns
         -------
@@ -100,8 +110,19 @@ class OpenRouter(LLM[R]):
                 tools=T.cast(T.Any, self.function_schemas),
                 tool_choice="auto",
                 timeout=self._config.timeout,
+                stream=self.streams_actions,
             )
 
+            if self.streams_actions:
+                actions = await stream_actions(T.cast(T.Any, response), on_action)
+                self.io_provider.llm_end_time = time.time()
+                if not actions:
+                    return None
+
+                result = CortexOutputModel(actions=actions)
+                logging.info(f"OpenRouter LLM streamed function call output: {result}")
+                return T.cast(R, result)
+
             message = response.choices[0].message
             self.io_provider.llm_end_time = time.time()
 
@@ -0,0 +1,350 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import typing as T
+from collections import OrderedDict
+
+from llm.output_model import CortexOutputModel
+
+R = T.TypeVar("R")
+
+VOLATILE_PLACEHOLDER = "<volatile>"
+
+
+class LLMResponseCache:
+    """
+    An in-memory and optionally on-disk cache of LLM responses.
+
+    Responses are keyed on the model, the prompt and the message history,
+    normalized by collapsing whitespace and replacing the sections matching
+    the exclude patterns, e.g. timestamps, with a placeholder. Entries expire
+    ttl_seconds after they were stored, and the least recently used entries
+    are evicted beyond max_entries.
+
+    The on-disk tier is a SQLite database, so responses survive restarts and
+    can be shared by several agents on the same machine.
+
+    Parameters
+    ----------
+    ttl_seconds : float
+        Time in seconds a response stays valid.
+    max_entries : int
+        Maximum number of responses kept in memory, and on disk.
+    path : str, optional
+        Path of the SQLite database. If None, responses are only cached in
+        memory.
+    exclude : Sequence[str]
+        Regular expressions of volatile prompt sections to leave out of the
+        key.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 256,
+        path: T.Optional[str] = None,
+        exclude: T.Sequence[str] = (),
+    ):
+        """
+        Initialize the cache, creating the database if needed.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.path = path
+        self.exclude = [re.compile(pattern) for pattern in exclude]
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, T.Tuple[float, str]]" = OrderedDict()
+        self._db: T.Optional[sqlite3.Connection] = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, created_at REAL, accessed_at REAL, "
+                "response TEXT)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+            self._db.commit()
+
+    @classmethod
+    def from_config(cls, config: T.Any) -> T.Optional["LLMResponseCache"]:
+        """
+        Create the cache configured for an LLM.
+
+        Parameters
+        ----------
+        config : LLMConfig
+            The LLM configuration.
+
+        Returns
+        -------
+        LLMResponseCache, optional
+            The cache, or None if response_cache is not enabled.
+        """
+        if not config.response_cache:
+            return None
+
+        return cls(
+            ttl_seconds=config.response_cache_ttl_seconds,
+            max_entries=config.response_cache_max_entries,
+            path=config.response_cache_path,
+            exclude=config.response_cache_exclude,
+        )
+
+    def normalize(self, text: str) -> str:
+        """
+        Normalize a prompt section for use in a key.
+
+        Parameters
+        ----------
+        text : str
+            The prompt section.
+
+        Returns
+        -------
+        str
+            The text with volatile sections replaced and whitespace collapsed.
+        """
+        for pattern in self.exclude:
+            text = pattern.sub(VOLATILE_PLACEHOLDER, text)
+        return " ".join(text.split())
+
+    def key(
+        self,
+        model: T.Optional[str],
+        prompt: str,
+        messages: T.Sequence[T.Dict[str, T.Any]] = (),
+    ) -> str:
+        """
+        Compute the cache key of a request.
+
+        Parameters
+        ----------
+        model : str, optional
+            The model name.
+        prompt : str
+            The prompt.
+        messages : Sequence[Dict[str, Any]]
+            The message history sent with the prompt.
+
+        Returns
+        -------
+        str
+            The hex digest of the normalized request.
+        """
+        request = [
+            model or "",
+            self.normalize(prompt),
+            [
+                [
+                    message.get("role", "user"),
+                    self.normalize(str(message.get("content", ""))),
+                ]
+                for message in messages
+            ],
+        ]
+        return hashlib.sha256(
+            json.dumps(request, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> T.Optional[CortexOutputModel]:
+        """
+        Get a cached response.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        CortexOutputModel, optional
+            A fresh copy of the response, or None if it is not cached or
+            expired.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    response = entry[1]
+                else:
+                    del self._entries[key]
+                    entry = None
+
+            if entry is None:
+                response = self._load(key, now)
+                if response is None:
+                    return None
+                self._remember(key, response[0], response[1])
+                response = response[1]
+
+        try:
+            return CortexOutputModel.model_validate_json(response)
+        except ValueError as e:
+            logging.warning(f"Dropping invalid cached LLM response: {e}")
+            self.invalidate(key)
+            return None
+
+    def put(self, key: str, response: CortexOutputModel) -> None:
+        """
+        Cache a response.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        response : CortexOutputModel
+            The response.
+        """
+        now = time.time()
+        data = response.model_dump_json()
+        with self._lock:
+            self._remember(key, now, data)
+            if self._db is None:
+                return
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, now, now, data),
+                )
+                self._db.execute(
+                    "DELETE FROM responses WHERE created_at <= ? OR key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (now - self.ttl_seconds, self.max_entries),
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Error storing LLM response in {self.path}: {e}")
+
+    def invalidate(self, key: T.Optional[str] = None) -> None:
+        """
+        Drop one or all cached responses.
+
+        Parameters
+        ----------
+        key : str, optional
+            The cache key to drop. If None, the whole cache is cleared.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            if self._db is None:
+                return
+            try:
+                if key is None:
+                    self._db.execute("DELETE FROM responses")
+                else:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logging.warning(f"Error invalidating LLM responses in {self.path}: {e}")
+
+    def close(self) -> None:
+        """
+        Close the database, keeping the in-memory entries.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        """
+        Get the number of responses cached in memory.
+        """
+        return len(self._entries)
+
+    def _remember(self, key: str, created_at: float, response: str) -> None:
+        """
+        Store a response in memory, evicting the least recently used ones.
+        """
+        self._entries[key] = (created_at, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str, now: float) -> T.Optional[T.Tuple[float, str]]:
+        """
+        Load a fresh response from disk, refreshing its access time.
+        """
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT created_at, response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[0] >= self.ttl_seconds:
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+            return row[0], row[1]
+        except sqlite3.Error as e:
+            logging.warning(f"Error loading LLM response from {self.path}: {e}")
+            return None
+
+    @staticmethod
+    def cached():
+        """
+        Decorate an LLM ask method to answer repeated requests from the cache.
+
+        The decorated method must take the prompt and the message history, and
+        the LLM must have a response_cache attribute, None to disable caching.
+        Apply it below LLMHistoryManager.update_history, so that cached
+        responses are still added to the history.
+        """
+
+        def decorator(func: T.Callable[..., T.Awaitable[R]]):
+            @functools.wraps(func)
+            async def wrapper(
+                self: T.Any,
+                prompt: str,
+                messages: T.List[T.Dict[str, T.Any]] = [],
+                *args,
+                **kwargs,
+            ) -> R:
+                cache: T.Optional[LLMResponseCache] = getattr(
+                    self, "response_cache", None
+                )
+                if cache is None:
+                    return await func(self, prompt, messages, *args, **kwargs)
+
+                key = cache.key(self._config.model, prompt, messages)
+                response = cache.get(key)
+                if response is not None:
+                    now = time.time()
+                    self.io_provider.llm_start_time = now
+                    self.io_provider.set_llm_prompt(prompt)
+                    self.io_provider.llm_end_time = now
+                    self.io_provider.record_llm_response_cache_hit()
+                    logging.info(f"LLM response cache hit: {response}")
+                    return T.cast(R, response)
+
+                self.io_provider.record_llm_response_cache_miss()
+                response = await func(self, prompt, messages, *args, **kwargs)
+                if isinstance(response, CortexOutputModel):
+                    cache.put(key, response)
+                return response
+
+            return wrapper
+
+        return decorator
@@ -0,0 +1,137 @@
+import json
+import logging
+import typing as T
+
+from llm.function_schemas import convert_function_calls_to_actions
+from llm.output_model import Action
+
+ActionCallback = T.Callable[[Action], T.Awaitable[None]]
+
+
+class ToolCallStreamParser:
+    """
+    Assembles the tool calls of a streamed chat completion.
+
+    OpenAI-compatible APIs stream each tool call as a name followed by
+    argument fragments, tagged with the index of the call. A call is complete
+    once its arguments form a JSON object, or when a later call or the end of
+    the stream arrives.
+    """
+
+    def __init__(self):
+        """
+        Initialize the parser with no tool calls.
+        """
+        self._calls: T.Dict[int, T.Dict[str, str]] = {}
+        self._open: T.List[int] = []
+
+    def feed(self, tool_calls: T.Sequence[T.Any]) -> T.List[T.Dict[str, T.Any]]:
+        """
+        Add the tool call fragments of a stream chunk.
+
+        Parameters
+        ----------
+        tool_calls : Sequence[Any]
+            The tool_calls of a chunk delta, with index and function name and
+            argument fragments.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The tool calls completed by the chunk, in the format of
+            convert_function_calls_to_actions.
+        """
+        completed = []
+        for fragment in tool_calls:
+            index = fragment.index
+            call = self._calls.get(index)
+            if call is None:
+                # A new call starts, so the previous calls are complete
+                completed.extend(self._close(i) for i in list(self._open))
+                call = self._calls[index] = {"name": "", "arguments": ""}
+                self._open.append(index)
+            elif index not in self._open:
+                logging.warning(f"Ignoring fragment of completed tool call {index}")
+                continue
+
+            function = fragment.function
+            if function is not None:
+                call["name"] += function.name or ""
+                call["arguments"] += function.arguments or ""
+
+            if call["name"] and self._is_complete(call["arguments"]):
+                completed.append(self._close(index))
+        return completed
+
+    def finish(self) -> T.List[T.Dict[str, T.Any]]:
+        """
+        Complete the calls still open at the end of the stream.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The remaining tool calls.
+        """
+        return [self._close(i) for i in list(self._open)]
+
+    def _close(self, index: int) -> T.Dict[str, T.Any]:
+        """
+        Mark a tool call as complete.
+        """
+        self._open.remove(index)
+        call = self._calls[index]
+        return {"function": {"name": call["name"], "arguments": call["arguments"]}}
+
+    @staticmethod
+    def _is_complete(arguments: str) -> bool:
+        """
+        Check whether the arguments of a tool call are a complete JSON object.
+        """
+        if not arguments.rstrip().endswith("}"):
+            return False
+        try:
+            return isinstance(json.loads(arguments), dict)
+        except json.JSONDecodeError:
+            return False
+
+
+async def stream_actions(
+    stream: T.AsyncIterable[T.Any], on_action: T.Optional[ActionCallback] = None
+) -> T.List[Action]:
+    """
+    Convert a streamed chat completion to actions as its tool calls complete.
+
+    Parameters
+    ----------
+    stream : AsyncIterable[Any]
+        The chunks of a chat completion requested with stream=True.
+    on_action : ActionCallback, optional
+        Called with each action as soon as its tool call is complete. Errors
+        are logged and do not interrupt the stream.
+
+    Returns
+    -------
+    List[Action]
+        All the actions, in the order of their tool calls.
+    """
+    parser = ToolCallStreamParser()
+    actions: T.List[Action] = []
+
+    async def emit(calls: T.List[T.Dict[str, T.Any]]) -> None:
+        for action in convert_function_calls_to_actions(calls):
+            actions.append(action)
+            if on_action is None:
+                continue
+            try:
+                await on_action(action)
+            except Exception as e:
+                logging.error(f"Error dispatching streamed action {action}: {e}")
+
+    async for chunk in stream:
+        for choice in chunk.choices or []:
+            delta = choice.delta
+            if delta is not None and delta.tool_calls:
+                await emit(parser.feed(delta.tool_calls))
+    await emit(parser.finish())
+
+    return actions
@@ -1,6 +1,7 @@
 import logging
 import math
 
+import numpy as np
 import zenoh
 
 from zenoh_msgs import open_zenoh_session, sensor_msgs
@@ -16,6 +17,8 @@ class D435Provider:
 
     def __init__(self):
         self.obstacle = []
+        # The same points as (x, y, angle, distance) rows
+        self.obstacle_array = np.empty((0, 4))
         self.running = False
         self.session = None
 
@@ -66,16 +69,25 @@ class D435Provider:
         try:
             points = sensor_msgs.PointCloud.deserialize(sample.payload.to_bytes())
 
-            obstacles = []
-            for pt in points.points:  # type: ignore
-                x = pt.x
-                y = pt.y
-                z = pt.z
-                angle, distance = self.calculate_angle_and_distance(x, y)
-                obstacles.append(
-                    {"x": x, "y": y, "z": z, "angle": angle, "distance": distance}
+            xyz = np.array(
+                [(pt.x, pt.y, pt.z) for pt in points.points],  # type: ignore
+                dtype=np.float64,
+            ).reshape(-1, 3)
+            x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+            angle = np.degrees(np.arctan2(y, x))
+            distance = np.hypot(x, y)
+
+            self.obstacle = [
+                {"x": px, "y": py, "z": pz, "angle": pa, "distance": pd}
+                for px, py, pz, pa, pd in zip(
+                    x.tolist(),
+                    y.tolist(),
+                    z.tolist(),
+                    angle.tolist(),
+                    distance.tolist(),
                 )
-            self.obstacle = obstacles
+            ]
+            self.obstacle_array = np.column_stack((x, y, angle, distance))
         except Exception as e:
             logging.error(f"Error processing obstacle info: {e}")
 
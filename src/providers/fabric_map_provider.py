@@ -1,13 +1,11 @@
-import json
 import logging
-import os
-import time
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
 
 import requests
 
+from .sensor_recorder import SensorRecorder
 from .singleton import singleton
 
 
@@ -190,21 +188,15 @@ class FabricDataSubmitter:
         self.base_url = base_url
         self.write_to_local_file = write_to_local_file
         self.filename_base = "dump/fabric"
-        self.filename_current = self.update_filename()
-        self.max_file_size_bytes = 1024 * 1024
+        self.recorder: Optional[SensorRecorder] = (
+            SensorRecorder(self.filename_base) if write_to_local_file else None
+        )
         self.executor = ThreadPoolExecutor(max_workers=1)
 
-    def update_filename(self):
-        unix_ts = time.time()
-        logging.info(f"fabric time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"{self.filename_base}_{unix_ts}Z.jsonl"
-        return filename
-
     def write_dict_to_file(self, data: dict):
         """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
+        Queues a dictionary for writing in JSON lines format. Files are rotated
+        by the background recorder once they exceed its maximum size.
 
         Parameters:
         - data: Dictionary to write
@@ -213,17 +205,8 @@ class FabricDataSubmitter:
         if not isinstance(data, dict):
             raise ValueError("Provided data must be a dictionary.")
 
-        if (
-            os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"new file name: {self.filename_current}")
-
-        with open(self.filename_current, "a", encoding="utf-8") as f:
-            json_line = json.dumps(data)
-            f.write(json_line + "\n")
-            f.flush()
+        if self.recorder is not None:
+            self.recorder.record(data)
 
     def _share_data_worker(self, data: FabricData):
         """
@@ -244,7 +227,6 @@ class FabricDataSubmitter:
 
         if self.write_to_local_file:
             self.write_dict_to_file(json_dict)
-            logging.info(f"FDS wrote to {self.filename_current}")
 
         if self.api_key is None or self.api_key == "":
             logging.error("API key missing. Cannot share data to FABRIC.")
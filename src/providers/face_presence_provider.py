@@ -3,8 +3,7 @@ import time
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional
 
-import requests
-
+from .http_client_pool import HTTPClientPool
 from .singleton import singleton
 
 
@@ -132,7 +131,7 @@ class FacePresenceProvider:
         self._thread: Optional[threading.Thread] = None
         self._callbacks: List = []
         self._cb_lock = threading.Lock()
-        self._session = requests.Session()
+        self._http = HTTPClientPool()
 
         self._unknown_faces = 0
 
@@ -234,7 +233,9 @@ class FacePresenceProvider:
         """
         sec = float(self.recent_sec if recent_sec is None else recent_sec)
         url = f"{self.base_url}/who"
-        r = self._session.post(url, json={"recent_sec": sec}, timeout=self.timeout_s)
+        r = self._http.request_sync(
+            "POST", url, json={"recent_sec": sec}, timeout=self.timeout_s
+        )
         r.raise_for_status()
         data = r.json() or {}
 
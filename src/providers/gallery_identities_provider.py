@@ -5,8 +5,7 @@ import time
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional
 
-import requests
-
+from .http_client_pool import HTTPClientPool
 from .singleton import singleton
 
 
@@ -88,7 +87,7 @@ class GalleryIdentitiesProvider:
         self._callbacks: List[Callable[[str], None]] = []
         self._cb_lock = threading.Lock()
 
-        self._session = requests.Session()
+        self._http = HTTPClientPool()
 
     def register_message_callback(self, fn: Callable[[str], None]) -> None:
         """
@@ -191,7 +190,7 @@ class GalleryIdentitiesProvider:
             Structured view of the current gallery (e.g., `total`, `names`, raw JSON).
         """
         url = f"{self.base_url}/gallery/identities"
-        r = self._session.post(url, json={}, timeout=self.timeout_s)  # type: ignore
+        r = self._http.request_sync("POST", url, json={}, timeout=self.timeout_s)
         r.raise_for_status()
         data = r.json() or {}
 
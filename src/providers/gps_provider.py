@@ -1,6 +1,5 @@
 import logging
 import re
-import threading
 import time
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -9,8 +8,11 @@ import serial
 
 from providers.fabric_map_provider import RFDataRaw
 
+from .serial_reactor import SerialReactor, SerialRecord, SerialSubscription
 from .singleton import singleton
 
+GPS_RECORD_KINDS = ("HDG", "YPR", "SAT", "GPS", "BLE")
+
 
 @singleton
 class GpsProvider:
@@ -33,18 +35,9 @@ class GpsProvider:
 
         logging.info(f"GPS_Provider booting GPS Provider at serial: {serial_port}")
 
-        baudrate = 115200
-        timeout = 1
-
-        self.serial_connection = None
-        try:
-            self.serial_connection = serial.Serial(
-                serial_port, baudrate, timeout=timeout
-            )
-            self.serial_connection.reset_input_buffer()
-            logging.info(f"Connected to {serial_port} at {baudrate} baud")
-        except serial.SerialException as e:
-            logging.error(f"Error: {e}")
+        self.serial_port = serial_port
+        self.baudrate = 115200
+        self._subscription: Optional[SerialSubscription] = None
 
         self._gps: Optional[dict] = None
 
@@ -61,8 +54,6 @@ class GpsProvider:
 
         self.ble_scan: List[RFDataRaw] = []
 
-        self.running = False
-        self._thread: Optional[threading.Thread] = None
         self.start()
 
     def string_to_unix_timestamp(self, time_str):
@@ -200,38 +191,69 @@ class GpsProvider:
 
     def start(self):
         """
-        Starts the GPS Provider and processing thread
-        if not already running.
+        Starts receiving the GPS, heading and BLE records of the serial port
+        if not already receiving them.
         """
-        if self._thread and self._thread.is_alive():
+        if self._subscription is not None:
             return
 
-        self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        try:
+            self._subscription = SerialReactor().subscribe(
+                self.serial_port,
+                self._on_record,
+                baudrate=self.baudrate,
+                kinds=GPS_RECORD_KINDS,
+                on_close=self._on_close,
+            )
+        except serial.SerialException as e:
+            logging.error(f"Error: {e}")
+
+    def _on_record(self, record: SerialRecord):
+        """
+        Process a record as soon as the serial reactor reads it.
 
-    def _run(self):
+        Parameters
+        ----------
+        record : SerialRecord
+            A GPS, heading, orientation, satellite or BLE record.
         """
-        Main loop for the GPS provider.
-        WARNING: this assumes that the data from the Arduino are arriving
-        relatively slowly.
+        logging.debug(f"Serial GPS/MAG: {record.line}")
+        self.magGPSProcessor(record.line)
+
+    def _on_close(self, subscription: SerialSubscription):
+        """
+        Forget a subscription ended by the serial reactor, e.g. when the
+        port disconnects, so that start() can open the port again.
+
+        Parameters
+        ----------
+        subscription : SerialSubscription
+            The ended subscription.
         """
-        while self.running:
-            if self.serial_connection:
-                # Read a line, decode, and remove whitespace
-                data = self.serial_connection.readline().decode("utf-8").strip()
-                logging.debug(f"Serial GPS/MAG: {data}")
-                self.magGPSProcessor(data)
-            time.sleep(0.1)
+        if self._subscription is subscription:
+            logging.warning(f"GPS serial port {subscription.port} closed")
+            self._subscription = None
 
     def stop(self):
         """
         Stop the GPS provider.
         """
-        self.running = False
-        if self._thread:
+        if self._subscription is not None:
             logging.info("Stopping GPS provider")
-            self._thread.join(timeout=5)
+            SerialReactor().unsubscribe(self._subscription)
+            self._subscription = None
+
+    @property
+    def running(self) -> bool:
+        """
+        Check whether the provider receives the records of its serial port.
+
+        Returns
+        -------
+        bool
+            True if subscribed to the serial port
+        """
+        return self._subscription is not None
 
     @property
     def data(self) -> Optional[dict]:
@@ -0,0 +1,491 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+import aiohttp
+
+from .singleton import singleton
+
+RequestKey = Tuple[str, str, bytes, Tuple[Tuple[str, str], ...]]
+
+
+class HTTPStatusError(Exception):
+    """
+    Raised by HTTPResponse.raise_for_status for non-2xx responses.
+
+    Parameters
+    ----------
+    response : HTTPResponse
+        The failed response.
+    """
+
+    def __init__(self, response: "HTTPResponse"):
+        super().__init__(f"HTTP {response.status} for {response.url}")
+        self.response = response
+
+
+@dataclass(frozen=True)
+class HTTPResponse:
+    """
+    A fully read HTTP response.
+
+    Parameters
+    ----------
+    status : int
+        The HTTP status code. For revalidated responses, the status of the
+        cached response.
+    url : str
+        The requested URL.
+    headers : Mapping[str, str]
+        The response headers, with lower-case names.
+    body : bytes
+        The response body.
+    not_modified : bool
+        True if the server answered 304 Not Modified and the body is the
+        cached one.
+    """
+
+    status: int
+    url: str
+    headers: Mapping[str, str]
+    body: bytes
+    not_modified: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """
+        Check whether the status code is 2xx.
+        """
+        return 200 <= self.status < 300
+
+    def text(self) -> str:
+        """
+        Decode the body as UTF-8.
+        """
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Parse the body as JSON, None if it is empty.
+        """
+        return json.loads(self.body) if self.body else None
+
+    def raise_for_status(self) -> None:
+        """
+        Raise HTTPStatusError if the status code is not 2xx.
+        """
+        if not self.ok:
+            raise HTTPStatusError(self)
+
+
+@dataclass
+class HTTPClientStats:
+    """
+    Counters of the HTTPClientPool.
+
+    Parameters
+    ----------
+    requests : int
+        Number of requests made by callers.
+    sent : int
+        Number of requests sent over the network.
+    coalesced : int
+        Number of requests answered by an identical request already in
+        flight.
+    not_modified : int
+        Number of conditional requests answered with 304 Not Modified.
+    errors : int
+        Number of requests that failed with a network error or timeout.
+    """
+
+    requests: int = 0
+    sent: int = 0
+    coalesced: int = 0
+    not_modified: int = 0
+    errors: int = 0
+
+
+@singleton
+class HTTPClientPool:
+    """
+    Singleton asyncio HTTP client shared by polling inputs and providers.
+
+    All requests run on one aiohttp session, on an event loop owned by a
+    background thread, so that:
+
+    - connections are kept alive and pooled across callers, with a global
+      and a per-host concurrency limit,
+    - identical requests in flight at the same time are sent once and share
+      the response,
+    - GET responses carrying an ETag or Last-Modified header are cached and
+      revalidated with If-None-Match / If-Modified-Since; a 304 answer returns
+      the cached response with not_modified set, so callers can skip parsing
+      unchanged payloads.
+
+    Coroutines on any event loop await request(), get() and post() without
+    blocking. Threads use request_sync(), and fire-and-forget callers use
+    submit().
+
+    Parameters
+    ----------
+    limit : int
+        Maximum number of open connections.
+    limit_per_host : int
+        Maximum number of open connections per host.
+    timeout : float
+        Default total timeout of a request in seconds.
+    cache_size : int
+        Maximum number of responses kept for conditional requests.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 4,
+        timeout: float = 10.0,
+        cache_size: int = 256,
+    ):
+        """
+        Configure the pool. The event loop thread starts on the first request.
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.cache_size = cache_size
+
+        self._start_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Only accessed from the pool event loop
+        self._in_flight: Dict[RequestKey, asyncio.Task] = {}
+        self._cache: "OrderedDict[RequestKey, HTTPResponse]" = OrderedDict()
+
+        self._stats_lock = threading.Lock()
+        self._stats = HTTPClientStats()
+
+    @property
+    def stats(self) -> HTTPClientStats:
+        """
+        Get a copy of the pool counters.
+        """
+        with self._stats_lock:
+            return replace(self._stats)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        data: Union[bytes, str, None] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        coalesce: Optional[bool] = None,
+        conditional: Optional[bool] = None,
+    ) -> HTTPResponse:
+        """
+        Send a request without blocking the calling event loop.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL.
+        json : Any, optional
+            Body serialized as JSON, with a JSON content type.
+        data : bytes or str, optional
+            Raw body, if json is not given.
+        headers : Mapping[str, str], optional
+            Request headers.
+        timeout : float, optional
+            Total timeout in seconds, defaults to the pool timeout.
+        coalesce : bool, optional
+            Share the response of an identical request in flight. Defaults
+            to True for GET and HEAD; set it for idempotent POSTs, e.g.
+            JSON-RPC reads.
+        conditional : bool, optional
+            Revalidate cached responses with conditional headers. Defaults to
+            True for GET.
+
+        Returns
+        -------
+        HTTPResponse
+            The response.
+
+        Raises
+        ------
+        aiohttp.ClientError
+            On connection errors.
+        asyncio.TimeoutError
+            If the request timed out.
+        """
+        future = self.submit(
+            method,
+            url,
+            json=json,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+            coalesce=coalesce,
+            conditional=conditional,
+        )
+        return await asyncio.wrap_future(future)
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        """
+        Send a GET request. See request for the parameters.
+        """
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HTTPResponse:
+        """
+        Send a POST request. See request for the parameters.
+        """
+        return await self.request("POST", url, **kwargs)
+
+    def request_sync(self, method: str, url: str, **kwargs) -> HTTPResponse:
+        """
+        Send a request from a thread and wait for the response.
+
+        Must not be called from a coroutine, as it blocks the calling thread.
+        See request for the parameters.
+
+        Returns
+        -------
+        HTTPResponse
+            The response.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("request_sync called from the HTTP client pool loop")
+        return self.submit(method, url, **kwargs).result()
+
+    def submit(
+        self,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        data: Union[bytes, str, None] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        coalesce: Optional[bool] = None,
+        conditional: Optional[bool] = None,
+    ) -> "Future[HTTPResponse]":
+        """
+        Schedule a request and return immediately. See request for the
+        parameters.
+
+        Returns
+        -------
+        concurrent.futures.Future[HTTPResponse]
+            Future of the response, usable from any thread.
+        """
+        method = method.upper()
+        request_headers = dict(headers or {})
+        if json is not None:
+            body = _dumps(json)
+            request_headers.setdefault("Content-Type", "application/json")
+        elif isinstance(data, str):
+            body = data.encode("utf-8")
+        else:
+            body = data or b""
+
+        if coalesce is None:
+            coalesce = method in ("GET", "HEAD")
+        if conditional is None:
+            conditional = method == "GET"
+
+        with self._stats_lock:
+            self._stats.requests += 1
+
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._request(
+                method,
+                url,
+                body,
+                request_headers,
+                timeout if timeout is not None else self.timeout,
+                coalesce,
+                conditional,
+            ),
+            loop,
+        )
+
+    def close(self) -> None:
+        """
+        Close all connections and stop the event loop thread.
+        """
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None:
+            return
+
+        async def shutdown():
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=5)
+        except Exception as e:
+            logging.warning(f"Error closing HTTP client session: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the event loop thread if it is not running.
+
+        Returns
+        -------
+        asyncio.AbstractEventLoop
+            The pool event loop.
+        """
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop,),
+                    name="http-client-pool",
+                    daemon=True,
+                )
+                self._loop = loop
+                self._thread.start()
+            return self._loop
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Run the pool event loop until the pool is closed.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop to run.
+        """
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            self._in_flight.clear()
+            loop.close()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: float,
+        coalesce: bool,
+        conditional: bool,
+    ) -> HTTPResponse:
+        """
+        Send a request, sharing an identical request in flight if allowed.
+        Runs on the pool event loop.
+        """
+        key: RequestKey = (method, url, body, tuple(sorted(headers.items())))
+
+        if not coalesce:
+            return await self._send(key, body, headers, timeout, conditional)
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            with self._stats_lock:
+                self._stats.coalesced += 1
+        else:
+            task = asyncio.get_running_loop().create_task(
+                self._send(key, body, headers, timeout, conditional)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # A cancelled caller must not cancel the request shared with others
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        key: RequestKey,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: float,
+        conditional: bool,
+    ) -> HTTPResponse:
+        """
+        Send a request over the network. Runs on the pool event loop.
+        """
+        method, url = key[0], key[1]
+
+        cached = self._cache.get(key) if conditional else None
+        if cached is not None:
+            headers = dict(headers)
+            if "etag" in cached.headers:
+                headers.setdefault("If-None-Match", cached.headers["etag"])
+            if "last-modified" in cached.headers:
+                headers.setdefault("If-Modified-Since", cached.headers["last-modified"])
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                )
+            )
+
+        with self._stats_lock:
+            self._stats.sent += 1
+        try:
+            async with self._session.request(
+                method,
+                url,
+                data=body or None,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as resp:
+                payload = await resp.read()
+                response = HTTPResponse(
+                    status=resp.status,
+                    url=url,
+                    headers={k.lower(): v for k, v in resp.headers.items()},
+                    body=payload,
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            with self._stats_lock:
+                self._stats.errors += 1
+            raise
+
+        if response.status == 304 and cached is not None:
+            with self._stats_lock:
+                self._stats.not_modified += 1
+            self._cache.move_to_end(key)
+            return replace(cached, not_modified=True)
+
+        if conditional and response.ok:
+            if "etag" in response.headers or "last-modified" in response.headers:
+                self._cache[key] = response
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            else:
+                self._cache.pop(key, None)
+
+        return response
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    Serialize a JSON request body.
+    """
+    return json.dumps(value).encode("utf-8")
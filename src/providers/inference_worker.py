@@ -0,0 +1,557 @@
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .latency_histogram import LatencyHistogram
+from .singleton import singleton
+
+INFERENCE_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+@dataclass(frozen=True)
+class InferenceResult:
+    """
+    The result of running a model on one frame of a source.
+
+    Parameters
+    ----------
+    source : str
+        The name of the source the frame came from.
+    sequence : int
+        The sequence number of the frame in its source, starting at 1.
+    captured_at : float
+        Unix timestamp at which the frame was captured or submitted.
+    value : Any
+        The model output for the frame, None if inference failed.
+    latency : float
+        Seconds from capture to result, including time spent waiting for the
+        model.
+    error : str, optional
+        The error message if inference failed.
+    """
+
+    source: str
+    sequence: int
+    captured_at: float
+    value: Any
+    latency: float
+    error: Optional[str] = None
+
+
+@dataclass
+class InferenceStats:
+    """
+    Counters of a model registered with the InferenceWorker.
+
+    Parameters
+    ----------
+    submitted : int
+        Number of frames submitted to the model.
+    dropped : int
+        Number of frames replaced by a newer frame of the same source before
+        the model got to them.
+    inferred : int
+        Number of frames the model produced a result for.
+    failed : int
+        Number of frames for which inference raised.
+    batches : int
+        Number of calls to the model.
+    """
+
+    submitted: int = 0
+    dropped: int = 0
+    inferred: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+@dataclass(eq=False)
+class _Model:
+    """
+    A registered model, its pending frames and its worker thread.
+    """
+
+    name: str
+    infer: Callable[[List[Any]], Sequence[Any]]
+    max_batch_size: int
+    ready: threading.Condition
+    pending: Dict[str, Tuple[int, float, Any]] = field(default_factory=dict)
+    latency: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(buckets=INFERENCE_LATENCY_BUCKETS)
+    )
+    stats: InferenceStats = field(default_factory=InferenceStats)
+    stopped: bool = False
+    thread: Optional[threading.Thread] = None
+
+
+@dataclass(eq=False)
+class _Source:
+    """
+    A frame source feeding a model, with its optional capture thread.
+    """
+
+    name: str
+    model: str
+    capture: Optional[Callable[[], Any]]
+    interval: float
+    stop: threading.Event = field(default_factory=threading.Event)
+    sequence: int = 0
+    latest: Optional[InferenceResult] = None
+    waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = field(
+        default_factory=list
+    )
+    thread: Optional[threading.Thread] = None
+
+
+def _resolve(future: asyncio.Future, result: InferenceResult) -> None:
+    """
+    Set the result of a future unless it was cancelled or timed out.
+    """
+    if not future.done():
+        future.set_result(result)
+
+
+@singleton
+class InferenceWorker:
+    """
+    Singleton provider running frame capture and model inference off the
+    asyncio event loop.
+
+    Models are registered with a batched inference function, and sources
+    feed frames to a model, either from a capture function polled on a
+    dedicated thread, or pushed with submit(). Each model runs on its own
+    thread:
+
+    - only the latest frame of each source waits for the model; a newer frame
+      replaces it and the older one is counted as dropped, so a slow model
+      processes fresh frames instead of building a backlog,
+    - pending frames of several sources sharing a model, e.g. several
+      cameras, are passed to the model as one batch of up to max_batch_size
+      frames,
+    - the duration of each model call is recorded in a per-model latency
+      histogram.
+
+    Inputs read results with latest(), or await next_result() and infer(),
+    which never block the event loop.
+    """
+
+    def __init__(self):
+        """
+        Initialize the worker without models or sources.
+        """
+        self._lock = threading.Lock()
+        self._models: Dict[str, _Model] = {}
+        self._sources: Dict[str, _Source] = {}
+
+    def has_model(self, name: str) -> bool:
+        """
+        Check whether a model is registered.
+
+        Parameters
+        ----------
+        name : str
+            The name of the model.
+
+        Returns
+        -------
+        bool
+            True if the model is registered.
+        """
+        with self._lock:
+            return name in self._models
+
+    def register_model(
+        self,
+        name: str,
+        infer: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 1,
+    ) -> None:
+        """
+        Register a model, or replace the inference function of a registered one.
+
+        Parameters
+        ----------
+        name : str
+            The name of the model.
+        infer : Callable[[List[Any]], Sequence[Any]]
+            Function called on the model thread with a batch of frames,
+            returning one output per frame, in order.
+        max_batch_size : int
+            Maximum number of frames passed to infer at once.
+        """
+        with self._lock:
+            model = self._models.get(name)
+            if model is not None:
+                model.infer = infer
+                model.max_batch_size = max(1, max_batch_size)
+                return
+
+            model = _Model(
+                name=name,
+                infer=infer,
+                max_batch_size=max(1, max_batch_size),
+                ready=threading.Condition(self._lock),
+            )
+            model.thread = threading.Thread(
+                target=self._run_model,
+                args=(model,),
+                name=f"inference-{name}",
+                daemon=True,
+            )
+            self._models[name] = model
+        model.thread.start()
+
+    def add_source(
+        self,
+        name: str,
+        model: str,
+        capture: Optional[Callable[[], Any]] = None,
+        interval: float = 0.0,
+    ) -> None:
+        """
+        Add a frame source for a model, replacing any source with the same name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the source.
+        model : str
+            The name of the registered model to run on the frames.
+        capture : Callable[[], Any], optional
+            Blocking function returning the next frame, or None if there is
+            none. It is called in a loop on a dedicated thread. If None,
+            frames are pushed with submit().
+        interval : float
+            Minimum seconds between two calls to capture.
+
+        Raises
+        ------
+        ValueError
+            If the model is not registered.
+        """
+        with self._lock:
+            if model not in self._models:
+                raise ValueError(f"Unknown inference model: {model}")
+
+        self.remove_source(name)
+
+        source = _Source(name=name, model=model, capture=capture, interval=interval)
+        if capture is not None:
+            source.thread = threading.Thread(
+                target=self._run_capture,
+                args=(source,),
+                name=f"capture-{name}",
+                daemon=True,
+            )
+        with self._lock:
+            self._sources[name] = source
+        if source.thread is not None:
+            source.thread.start()
+
+    def remove_source(self, name: str) -> None:
+        """
+        Remove a source and stop its capture thread.
+
+        Parameters
+        ----------
+        name : str
+            The name of the source.
+        """
+        with self._lock:
+            source = self._sources.pop(name, None)
+            if source is None:
+                return
+            model = self._models.get(source.model)
+            if model is not None:
+                model.pending.pop(name, None)
+        source.stop.set()
+
+    def submit(
+        self, source: str, frame: Any, captured_at: Optional[float] = None
+    ) -> int:
+        """
+        Submit a frame of a source to its model, without blocking.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source.
+        frame : Any
+            The frame passed to the model.
+        captured_at : float, optional
+            Unix timestamp of the frame, defaults to now.
+
+        Returns
+        -------
+        int
+            The sequence number of the frame in its source.
+
+        Raises
+        ------
+        KeyError
+            If the source does not exist.
+        """
+        if captured_at is None:
+            captured_at = time.time()
+
+        with self._lock:
+            state = self._sources[source]
+            model = self._models[state.model]
+
+            state.sequence += 1
+            model.stats.submitted += 1
+            # Re-inserting moves the source to the back of the batch order
+            if model.pending.pop(source, None) is not None:
+                model.stats.dropped += 1
+            model.pending[source] = (state.sequence, captured_at, frame)
+            model.ready.notify()
+
+            return state.sequence
+
+    def latest(self, source: str) -> Optional[InferenceResult]:
+        """
+        Get the latest result of a source, without blocking.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source.
+
+        Returns
+        -------
+        InferenceResult or None
+            The latest result, or None if there is none yet.
+        """
+        with self._lock:
+            state = self._sources.get(source)
+            return state.latest if state is not None else None
+
+    async def next_result(
+        self, source: str, after: int = 0, timeout: Optional[float] = None
+    ) -> Optional[InferenceResult]:
+        """
+        Wait for a result of a source newer than a given sequence number.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source.
+        after : int
+            The sequence number of the last result seen, 0 for any result.
+        timeout : float, optional
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        InferenceResult or None
+            The latest result if it is newer than after, or the next one, or
+            None on timeout or if the source does not exist.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._sources.get(source)
+            if state is None:
+                return None
+            if state.latest is not None and state.latest.sequence > after:
+                return state.latest
+            future = loop.create_future()
+            waiter = (loop, future)
+            state.waiters.append(waiter)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self._lock:
+                if waiter in state.waiters:
+                    state.waiters.remove(waiter)
+
+    async def infer(
+        self, source: str, frame: Any, timeout: Optional[float] = None
+    ) -> Optional[InferenceResult]:
+        """
+        Submit a frame and wait for its result without blocking the event loop.
+
+        If the frame is replaced by a newer one of the same source before the
+        model gets to it, the result of the newer frame is returned.
+
+        Parameters
+        ----------
+        source : str
+            The name of the source.
+        frame : Any
+            The frame passed to the model.
+        timeout : float, optional
+            Maximum seconds to wait.
+
+        Returns
+        -------
+        InferenceResult or None
+            The result, or None on timeout.
+        """
+        sequence = self.submit(source, frame)
+        return await self.next_result(source, sequence - 1, timeout)
+
+    def stats(self) -> Dict[str, InferenceStats]:
+        """
+        Get a copy of the counters of each model.
+
+        Returns
+        -------
+        Dict[str, InferenceStats]
+            The counters keyed by model name.
+        """
+        with self._lock:
+            return {name: replace(model.stats) for name, model in self._models.items()}
+
+    def latency_summary(self) -> Dict[str, Dict[str, object]]:
+        """
+        Get the inference latency histogram of each model.
+
+        Returns
+        -------
+        Dict[str, Dict[str, object]]
+            The histograms keyed by model name.
+        """
+        with self._lock:
+            return {
+                name: model.latency.to_dict() for name, model in self._models.items()
+            }
+
+    def stop(self) -> None:
+        """
+        Stop all capture and model threads and forget models and sources.
+        """
+        with self._lock:
+            sources = list(self._sources.values())
+            models = list(self._models.values())
+            self._sources.clear()
+            self._models.clear()
+            for model in models:
+                model.stopped = True
+                model.ready.notify_all()
+
+        for source in sources:
+            source.stop.set()
+
+    def _run_capture(self, source: _Source) -> None:
+        """
+        Capture frames of a source until it is removed.
+
+        Parameters
+        ----------
+        source : _Source
+            The source to capture frames of.
+        """
+        while not source.stop.is_set():
+            started = time.time()
+            frame = None
+            try:
+                frame = source.capture()  # type: ignore
+            except Exception as e:
+                logging.error(f"Error capturing frame from {source.name}: {e}")
+
+            if frame is not None and not source.stop.is_set():
+                try:
+                    self.submit(source.name, frame)
+                except KeyError:
+                    # The source was removed or replaced meanwhile
+                    return
+
+            remaining = source.interval - (time.time() - started)
+            if remaining > 0:
+                source.stop.wait(remaining)
+            elif frame is None:
+                # Avoid spinning on a capture that has nothing to return
+                source.stop.wait(0.01)
+
+    def _run_model(self, model: _Model) -> None:
+        """
+        Run a model on pending frames until the worker is stopped.
+
+        Parameters
+        ----------
+        model : _Model
+            The model to run.
+        """
+        while True:
+            with model.ready:
+                while not model.pending and not model.stopped:
+                    model.ready.wait()
+                if model.stopped:
+                    return
+                names = list(model.pending)[: model.max_batch_size]
+                batch = [(name, *model.pending.pop(name)) for name in names]
+                infer = model.infer
+
+            frames = [frame for _, _, _, frame in batch]
+            started = time.time()
+            error = None
+            try:
+                values = list(infer(frames))
+                if len(values) != len(frames):
+                    raise ValueError(
+                        f"expected {len(frames)} outputs, got {len(values)}"
+                    )
+            except Exception as e:
+                logging.error(f"Error running inference model {model.name}: {e}")
+                values = [None] * len(frames)
+                error = str(e)
+            finished = time.time()
+
+            with self._lock:
+                model.stats.batches += 1
+                if error is None:
+                    model.stats.inferred += len(frames)
+                    model.latency.observe(finished - started)
+                else:
+                    model.stats.failed += len(frames)
+
+            for (name, sequence, captured_at, _), value in zip(batch, values):
+                self._publish(
+                    InferenceResult(
+                        source=name,
+                        sequence=sequence,
+                        captured_at=captured_at,
+                        value=value,
+                        latency=finished - captured_at,
+                        error=error,
+                    )
+                )
+
+    def _publish(self, result: InferenceResult) -> None:
+        """
+        Store the latest result of a source and wake up its waiters.
+
+        Parameters
+        ----------
+        result : InferenceResult
+            The result to publish.
+        """
+        with self._lock:
+            state = self._sources.get(result.source)
+            if state is None:
+                return
+            if state.latest is not None and state.latest.sequence > result.sequence:
+                return
+            state.latest = result
+            waiters, state.waiters = state.waiters, []
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future, result)
+            except RuntimeError:
+                # The waiting event loop is closed
+                pass
@@ -1,13 +1,15 @@
+import logging
 import threading
 import time
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 from .singleton import singleton
 
 
-@dataclass
+@dataclass(frozen=True)
 class Input:
     """
     A dataclass representing an input with an optional timestamp.
@@ -24,13 +26,63 @@ class Input:
     timestamp: Optional[float] = None
 
 
+@dataclass(frozen=True)
+class InputSnapshot:
+    """
+    An immutable, versioned view of all inputs.
+
+    IOProvider publishes a new snapshot on every input write, so a snapshot
+    can be read from any thread without locking and never changes afterwards.
+
+    Parameters
+    ----------
+    version : int
+        The version of the snapshot, increased by one on every input write.
+    inputs : Mapping[str, Input]
+        Read-only mapping of input keys to Input objects.
+    key_versions : Mapping[str, int]
+        Read-only mapping of input keys, including removed ones, to the
+        version of their last write.
+    """
+
+    version: int = 0
+    inputs: Mapping[str, Input] = field(default_factory=lambda: MappingProxyType({}))
+    key_versions: Mapping[str, int] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def changed_since(self, version: int) -> Dict[str, Optional[Input]]:
+        """
+        Get the inputs written after a given version.
+
+        Parameters
+        ----------
+        version : int
+            A version of a previous snapshot.
+
+        Returns
+        -------
+        Dict[str, Optional[Input]]
+            The changed inputs keyed by input key, with None for removed inputs.
+        """
+        if version >= self.version:
+            return {}
+
+        return {
+            key: self.inputs.get(key)
+            for key, key_version in self.key_versions.items()
+            if key_version > version
+        }
+
+
 @singleton
 class IOProvider:
     """
     A thread-safe singleton class for managing inputs, timestamps, and LLM-related data.
 
     This class provides synchronized access to input storage and various timing metrics
-    using thread locks for safe concurrent access.
+    using thread locks for safe concurrent access. Inputs are published as
+    copy-on-write InputSnapshot objects, so reading them does not take the lock.
     """
 
     def __init__(self):
@@ -39,18 +91,28 @@ class IOProvider:
         """
         self._lock: threading.Lock = threading.Lock()
 
-        self._inputs: Dict[str, str] = {}
-        self._input_timestamps: Dict[str, float] = {}
+        self._input_snapshot: InputSnapshot = InputSnapshot()
+
+        self._input_version: int = 0
+        self._input_change_callbacks: List[Callable[[str], None]] = []
 
         self._fuser_system_prompt: Optional[str] = None
         self._fuser_inputs: Optional[str] = None
         self._fuser_available_actions: Optional[str] = None
         self._fuser_start_time: Optional[float] = None
         self._fuser_end_time: Optional[float] = None
+        self._fuser_prompt_cache_hits: int = 0
+        self._fuser_prompt_cache_misses: int = 0
+        self._fuser_prompt_build_time: Optional[float] = None
 
         self._llm_prompt: Optional[str] = None
         self._llm_start_time: Optional[float] = None
         self._llm_end_time: Optional[float] = None
+        self._llm_first_action_time: Optional[float] = None
+        self._llm_time_to_first_action: Optional[float] = None
+        self._skipped_ticks: int = 0
+        self._llm_response_cache_hits: int = 0
+        self._llm_response_cache_misses: int = 0
 
         self._mode_transition_input: Optional[str] = None
 
@@ -67,15 +129,69 @@ class IOProvider:
         Dict[str, Input]
             Dictionary mapping input keys to Input objects.
         """
-        with self._lock:
-            result = {}
-            for name, value in self._inputs.items():
-                timestamp = self._input_timestamps.get(name)
-                if timestamp is not None:
-                    result[name] = Input(input=value, timestamp=timestamp)
-                else:
-                    result[name] = Input(input=value)
-            return result
+        return dict(self._input_snapshot.inputs)
+
+    @property
+    def input_snapshot(self) -> InputSnapshot:
+        """
+        Get the latest input snapshot without locking.
+
+        Returns
+        -------
+        InputSnapshot
+            The immutable snapshot published by the last input write.
+        """
+        return self._input_snapshot
+
+    def changed_since(self, version: int) -> Dict[str, Optional[Input]]:
+        """
+        Get the inputs written after a given snapshot version.
+
+        Use input_snapshot.changed_since to also know the version the result
+        is relative to.
+
+        Parameters
+        ----------
+        version : int
+            A version of a previous snapshot.
+
+        Returns
+        -------
+        Dict[str, Optional[Input]]
+            The changed inputs keyed by input key, with None for removed inputs.
+        """
+        return self._input_snapshot.changed_since(version)
+
+    def _publish_input(self, key: str, entry: Optional[Input]) -> None:
+        """
+        Publish a new input snapshot with one input written or removed.
+
+        Must be called with the lock held.
+
+        Parameters
+        ----------
+        key : str
+            The input identifier.
+        entry : Input, optional
+            The new input, or None to remove it.
+        """
+        snapshot = self._input_snapshot
+        version = snapshot.version + 1
+
+        inputs = dict(snapshot.inputs)
+        if entry is None:
+            inputs.pop(key, None)
+        else:
+            inputs[key] = entry
+
+        key_versions = dict(snapshot.key_versions)
+        key_versions[key] = version
+
+        self._input_snapshot = InputSnapshot(
+            version=version,
+            inputs=MappingProxyType(inputs),
+            key_versions=MappingProxyType(key_versions),
+        )
 
     def add_input(self, key: str, value: str, timestamp: Optional[float]) -> None:
         """
@@ -90,12 +206,11 @@ class IOProvider:
         timestamp : float, optional
             The timestamp for the input.
         """
+        if timestamp is None:
+            timestamp = time.time()
+
         with self._lock:
-            self._inputs[key] = value
-            if timestamp is not None:
-                self._input_timestamps[key] = timestamp
-            else:
-                self._input_timestamps[key] = time.time()
+            self._publish_input(key, Input(input=value, timestamp=timestamp))
 
     def remove_input(self, key: str) -> None:
         """
@@ -107,8 +222,8 @@ class IOProvider:
             The input identifier to remove.
         """
         with self._lock:
-            self._inputs.pop(key, None)
-            self._input_timestamps.pop(key, None)
+            if key in self._input_snapshot.inputs:
+                self._publish_input(key, None)
 
     def add_input_timestamp(self, key: str, timestamp: float) -> None:
         """
@@ -122,7 +237,11 @@ class IOProvider:
             The timestamp to add.
         """
         with self._lock:
-            self._input_timestamps[key] = timestamp
+            entry = self._input_snapshot.inputs.get(key)
+            if entry is None:
+                logging.debug(f"Ignoring timestamp for unknown input: {key}")
+                return
+            self._publish_input(key, Input(input=entry.input, timestamp=timestamp))
 
     def get_input_timestamp(self, key: str) -> Optional[float]:
         """
@@ -138,8 +257,68 @@ class IOProvider:
         float or None
             The timestamp if it exists, None otherwise.
         """
+        entry = self._input_snapshot.inputs.get(key)
+        return entry.timestamp if entry is not None else None
+
+    @property
+    def input_version(self) -> int:
+        """
+        Get the number of input buffer changes signalled so far.
+
+        Returns
+        -------
+        int
+            A counter that increases on every notify_input_changed call.
+        """
+        with self._lock:
+            return self._input_version
+
+    def notify_input_changed(self, key: str) -> None:
+        """
+        Signal that the buffer of an input changed.
+
+        Registered callbacks are invoked on the calling thread, outside the lock.
+
+        Parameters
+        ----------
+        key : str
+            The identifier of the input that changed.
+        """
+        with self._lock:
+            self._input_version += 1
+            callbacks = list(self._input_change_callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(key)
+            except Exception as e:
+                logging.error(f"Error in input change callback: {e}")
+
+    def register_input_change_callback(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback invoked whenever an input buffer changes.
+
+        Parameters
+        ----------
+        callback : Callable[[str], None]
+            The callback, called with the identifier of the changed input.
+        """
+        with self._lock:
+            if callback not in self._input_change_callbacks:
+                self._input_change_callbacks.append(callback)
+
+    def unregister_input_change_callback(self, callback: Callable[[str], None]) -> None:
+        """
+        Unregister a callback registered with register_input_change_callback.
+
+        Parameters
+        ----------
+        callback : Callable[[str], None]
+            The callback to remove.
+        """
         with self._lock:
-            return self._input_timestamps.get(key)
+            if callback in self._input_change_callbacks:
+                self._input_change_callbacks.remove(callback)
 
     @property
     def fuser_system_prompt(self) -> Optional[str]:
@@ -256,6 +435,50 @@ class IOProvider:
         with self._lock:
             self._fuser_end_time = value
 
+    @property
+    def fuser_prompt_cache_hits(self) -> int:
+        """
+        Get the number of fuses that reused the cached static prompt sections.
+        """
+        with self._lock:
+            return self._fuser_prompt_cache_hits
+
+    @property
+    def fuser_prompt_cache_misses(self) -> int:
+        """
+        Get the number of fuses that rebuilt the static prompt sections.
+        """
+        with self._lock:
+            return self._fuser_prompt_cache_misses
+
+    @property
+    def fuser_prompt_build_time(self) -> Optional[float]:
+        """
+        Get the duration in seconds of the last static prompt sections rebuild.
+        """
+        with self._lock:
+            return self._fuser_prompt_build_time
+
+    def record_fuser_prompt_cache_hit(self) -> None:
+        """
+        Record a fuse that reused the cached static prompt sections.
+        """
+        with self._lock:
+            self._fuser_prompt_cache_hits += 1
+
+    def record_fuser_prompt_cache_miss(self, build_time: float) -> None:
+        """
+        Record a fuse that rebuilt the static prompt sections.
+
+        Parameters
+        ----------
+        build_time : float
+            The time in seconds spent rebuilding the static prompt sections.
+        """
+        with self._lock:
+            self._fuser_prompt_cache_misses += 1
+            self._fuser_prompt_build_time = build_time
+
     @property
     def llm_prompt(self) -> Optional[str]:
         """
@@ -325,6 +548,99 @@ class IOProvider:
         with self._lock:
             self._llm_end_time = value
 
+    @property
+    def llm_first_action_time(self) -> Optional[float]:
+        """
+        Get the time the first action of the last LLM response was dispatched.
+        """
+        with self._lock:
+            return self._llm_first_action_time
+
+    @property
+    def llm_time_to_first_action(self) -> Optional[float]:
+        """
+        Get the time in seconds from the start of the last LLM request to the
+        dispatch of its first action.
+        """
+        with self._lock:
+            return self._llm_time_to_first_action
+
+    def record_llm_first_action(self, timestamp: float) -> None:
+        """
+        Record the dispatch of the first action of an LLM response.
+
+        Parameters
+        ----------
+        timestamp : float
+            The time the action was dispatched.
+        """
+        with self._lock:
+            self._llm_first_action_time = timestamp
+            self._llm_time_to_first_action = (
+                timestamp - self._llm_start_time
+                if self._llm_start_time is not None
+                else None
+            )
+
+    @property
+    def skipped_ticks(self) -> int:
+        """
+        Get the number of ticks that skipped the LLM call because their inputs did not change.
+        """
+        with self._lock:
+            return self._skipped_ticks
+
+    def record_skipped_tick(self) -> None:
+        """
+        Record a tick that skipped the LLM call because its inputs did not change.
+        """
+        with self._lock:
+            self._skipped_ticks += 1
+
+    @property
+    def llm_response_cache_hits(self) -> int:
+        """
+        Get the number of LLM requests answered from the response cache.
+        """
+        with self._lock:
+            return self._llm_response_cache_hits
+
+    @property
+    def llm_response_cache_misses(self) -> int:
+        """
+        Get the number of LLM requests sent because no cached response matched.
+        """
+        with self._lock:
+            return self._llm_response_cache_misses
+
+    @property
+    def llm_response_cache_hit_rate(self) -> Optional[float]:
+        """
+        Get the fraction of LLM requests answered from the response cache.
+
+        Returns
+        -------
+        Optional[float]
+            The hit rate, or None if no request went through the cache yet.
+        """
+        with self._lock:
+            total = self._llm_response_cache_hits + self._llm_response_cache_misses
+            return self._llm_response_cache_hits / total if total else None
+
+    def record_llm_response_cache_hit(self) -> None:
+        """
+        Record an LLM request answered from the response cache.
+        """
+        with self._lock:
+            self._llm_response_cache_hits += 1
+
+    def record_llm_response_cache_miss(self) -> None:
+        """
+        Record an LLM request sent because no cached response matched.
+        """
+        with self._lock:
+            self._llm_response_cache_misses += 1
+
     def add_dynamic_variable(self, key: str, value: Any) -> None:
         """
         Add a dynamic variable to the provider.
@@ -0,0 +1,67 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram of latencies, e.g. of LLM requests or message
+    publishing.
+
+    Parameters
+    ----------
+    buckets : Tuple[float, ...]
+        Upper bounds in seconds of the buckets, in increasing order. Latencies
+        above the last bound go to an overflow bucket.
+    """
+
+    buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    sum_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record a latency.
+
+        Parameters
+        ----------
+        seconds : float
+            The latency in seconds.
+        """
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    @property
+    def mean_seconds(self) -> float:
+        """
+        Get the mean latency in seconds, 0 if nothing was recorded.
+        """
+        return self.sum_seconds / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the histogram to a dictionary, e.g. for logging.
+
+        Returns
+        -------
+        Dict[str, object]
+            The bucket counts keyed by upper bound, plus count, mean and max.
+        """
+        labels = [f"<={bound}" for bound in self.buckets] + [f">{self.buckets[-1]}"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean_seconds": self.mean_seconds,
+            "max_seconds": self.max_seconds,
+        }
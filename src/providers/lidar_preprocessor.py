@@ -0,0 +1,358 @@
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+@dataclass
+class ScanGeometry:
+    """
+    Lookup tables of one scan geometry, i.e. one sequence of sensor angles.
+
+    Every table is in the robot frame and ordered by increasing centered
+    angle, the order in which path planning consumes the points.
+
+    Parameters
+    ----------
+    sensor_angles : NDArray
+        The sensor angles in degrees, in the order the sensor reports them.
+    key : NDArray
+        The sensor angles quantized to LidarPreprocessor.ANGLE_QUANTUM, the
+        cache key of the geometry.
+    order : NDArray
+        Permutation from sensor order to increasing centered angle.
+    raw_angles : NDArray
+        Robot frame angles in degrees in [0, 360), rounded to 0.01, in
+        sensor order, as recorded in sensor dumps.
+    neg_sin : NDArray
+        Minus the sine of the robot frame angles.
+    neg_cos : NDArray
+        Minus the cosine of the robot frame angles.
+    visible : NDArray
+        False for the angles blanked out by robot reflections.
+    points : NDArray
+        Work buffer of (x, y, centered angle, distance) rows, with the angle
+        column filled in.
+    keep : NDArray
+        Work buffer of the points kept after filtering.
+    """
+
+    sensor_angles: NDArray
+    key: NDArray
+    order: NDArray
+    raw_angles: NDArray
+    neg_sin: NDArray
+    neg_cos: NDArray
+    visible: NDArray
+    points: NDArray
+    keep: NDArray
+
+
+class LidarPreprocessor:
+    """
+    Converts lidar scans to robot frame Cartesian points with array
+    operations.
+
+    Sine and cosine tables, blanking masks and work buffers are computed
+    once per scan geometry and cached, so processing a scan from a sensor
+    with fixed angles, e.g. a ROS LaserScan, only allocates the output.
+    Geometries are keyed by their angles quantized to ANGLE_QUANTUM, so
+    floating point noise in otherwise fixed angles still hits the cache.
+
+    Serial RPLidar scans have no fixed geometry: each revolution samples
+    new angles, in 1/64 degree steps, and a varying number of returns.
+    Their geometries would miss the cache on every scan and evict the
+    cached ones, so they are processed with cache=False, which builds the
+    tables for the one scan only.
+
+    Parameters
+    ----------
+    sensor_mounting_angle : float
+        Angle in degrees added to the sensor angles to get robot angles.
+    angles_blanked : Sequence[Sequence[float]]
+        [start, end] ranges of centered angles in degrees, in [-180, 180],
+        to ignore, e.g. permanent reflections on the robot body.
+    relevant_distance_min : float
+        Returns closer than this, in meters, are ignored.
+    relevant_distance_max : float
+        Returns further than this, in meters, are ignored.
+    cache_size : int
+        Number of scan geometries cached.
+    """
+
+    DEGREES_TO_RADIANS = math.pi / 180.0
+    # Degrees below which two sensor angles share a cached geometry, the
+    # precision of the angles recorded in sensor dumps
+    ANGLE_QUANTUM = 0.01
+
+    def __init__(
+        self,
+        sensor_mounting_angle: float,
+        angles_blanked: Sequence[Sequence[float]],
+        relevant_distance_min: float,
+        relevant_distance_max: float,
+        cache_size: int = 4,
+    ):
+        """
+        Initialize the preprocessor with an empty geometry cache.
+        """
+        self.sensor_mounting_angle = sensor_mounting_angle
+        self.angles_blanked = [tuple(b) for b in angles_blanked]
+        self.relevant_distance_min = relevant_distance_min
+        self.relevant_distance_max = relevant_distance_max
+        self.cache_size = cache_size
+
+        self._geometries: List[ScanGeometry] = []
+        self._laser_angles: "OrderedDict[Tuple, NDArray]" = OrderedDict()
+
+    def laser_scan_angles(
+        self,
+        angle_min: float,
+        angle_max: float,
+        angle_increment: float,
+        count: Optional[int] = None,
+    ) -> NDArray:
+        """
+        Get the sensor angles of a LaserScan, cached per scan geometry.
+
+        Parameters
+        ----------
+        angle_min : float
+            Start angle of the scan in radians, in [-pi, pi].
+        angle_max : float
+            End angle of the scan in radians.
+        angle_increment : float
+            Angle between two returns in radians.
+        count : int, optional
+            Number of returns of the scan, to drop the angles past the last
+            return.
+
+        Returns
+        -------
+        NDArray
+            The angles in degrees, running from 360 down to 0, matching the
+            order of the LaserScan ranges. The array must not be modified.
+        """
+        key = (angle_min, angle_max, angle_increment, count)
+        angles = self._laser_angles.get(key)
+        if angles is None:
+            radians = np.arange(angle_min, angle_max, angle_increment)
+            angles = np.flip(360.0 * (radians + math.pi) / (2 * math.pi))[:count]
+            angles.flags.writeable = False
+            self._laser_angles[key] = angles
+            while len(self._laser_angles) > self.cache_size:
+                self._laser_angles.popitem(last=False)
+        return angles
+
+    def geometry(self, sensor_angles: NDArray, cache: bool = True) -> ScanGeometry:
+        """
+        Get the lookup tables of a scan geometry, building them on a miss.
+
+        Parameters
+        ----------
+        sensor_angles : NDArray
+            The sensor angles in degrees.
+        cache : bool
+            Look the geometry up in the cache and cache it. If False, the
+            tables are built without touching the cache, e.g. for serial
+            scans whose angles change every revolution.
+
+        Returns
+        -------
+        ScanGeometry
+            The lookup tables.
+        """
+        if not cache:
+            return self._build_geometry(sensor_angles)
+
+        key: Optional[NDArray] = None
+        for i, geometry in enumerate(self._geometries):
+            if geometry.sensor_angles is not sensor_angles:
+                if len(geometry.key) != len(sensor_angles):
+                    continue
+                if key is None:
+                    key = self._quantize(sensor_angles)
+                if not np.array_equal(geometry.key, key):
+                    continue
+            if i:
+                self._geometries.insert(0, self._geometries.pop(i))
+            return geometry
+
+        geometry = self._build_geometry(sensor_angles, key)
+        self._geometries.insert(0, geometry)
+        del self._geometries[self.cache_size :]
+        return geometry
+
+    def process(
+        self,
+        sensor_angles: NDArray,
+        distances: NDArray,
+        obstacles: Optional[NDArray] = None,
+        cache: bool = True,
+    ) -> NDArray:
+        """
+        Convert a scan to robot frame points.
+
+        Parameters
+        ----------
+        sensor_angles : NDArray
+            The sensor angles in degrees.
+        distances : NDArray
+            The distances in meters, one per angle.
+        obstacles : NDArray, optional
+            Extra (x, y, angle, distance) points to merge, e.g. from a depth
+            camera.
+        cache : bool
+            Use the geometry cache, see geometry.
+
+        Returns
+        -------
+        NDArray
+            (x, y, centered angle, distance) rows of the relevant, visible
+            returns and the extra points, sorted by angle. x runs backwards to
+            forwards, y runs left to right, and the angle is in [-180, 180].
+        """
+        geometry = self.geometry(sensor_angles, cache)
+        points = geometry.points
+        keep = geometry.keep
+
+        distance = points[:, 3]
+        np.take(np.asarray(distances, dtype=np.float64), geometry.order, out=distance)
+        np.multiply(distance, geometry.neg_sin, out=points[:, 0])
+        np.multiply(distance, geometry.neg_cos, out=points[:, 1])
+
+        # Written as the negation of the drop conditions, so that NaN
+        # returns are kept as by the per-point implementation
+        np.greater(distance, self.relevant_distance_max, out=keep)
+        keep |= distance < self.relevant_distance_min
+        np.logical_not(keep, out=keep)
+        keep &= geometry.visible
+
+        result = points[keep]
+        if obstacles is not None and len(obstacles):
+            result = np.concatenate((result, obstacles))
+            result = result[np.argsort(result[:, 2], kind="stable")]
+        return result
+
+    def raw_frame(
+        self, sensor_angles: NDArray, distances: NDArray, cache: bool = True
+    ) -> NDArray:
+        """
+        Get a scan with robot frame angles, as recorded in sensor dumps.
+
+        Parameters
+        ----------
+        sensor_angles : NDArray
+            The sensor angles in degrees.
+        distances : NDArray
+            The distances in meters, one per angle.
+        cache : bool
+            Use the geometry cache, see geometry. If False, only the angles
+            are computed.
+
+        Returns
+        -------
+        NDArray
+            (angle, distance) rows in sensor order, with angles rounded to
+            0.01 degree.
+        """
+        if cache:
+            raw_angles = self.geometry(sensor_angles).raw_angles
+        else:
+            raw_angles = np.round(
+                self._robot_angles(np.asarray(sensor_angles, dtype=np.float64)), 2
+            )
+        return np.column_stack((raw_angles, distances))
+
+    def _quantize(self, sensor_angles: NDArray) -> NDArray:
+        """
+        Quantize sensor angles to ANGLE_QUANTUM, the geometry cache key.
+
+        Parameters
+        ----------
+        sensor_angles : NDArray
+            The sensor angles in degrees.
+
+        Returns
+        -------
+        NDArray
+            The angles in multiples of ANGLE_QUANTUM, as integers.
+        """
+        return np.rint(
+            np.asarray(sensor_angles, dtype=np.float64) / self.ANGLE_QUANTUM
+        ).astype(np.int64)
+
+    def _robot_angles(self, sensor_angles: NDArray) -> NDArray:
+        """
+        Orient sensor angles to the robot zero.
+
+        Parameters
+        ----------
+        sensor_angles : NDArray
+            The sensor angles in degrees.
+
+        Returns
+        -------
+        NDArray
+            The robot frame angles in degrees, in [0, 360).
+        """
+        angles = sensor_angles + self.sensor_mounting_angle
+        angles = np.where(angles >= 360.0, angles - 360.0, angles)
+        return np.where(angles < 0.0, angles + 360.0, angles)
+
+    def _build_geometry(
+        self, sensor_angles: NDArray, key: Optional[NDArray] = None
+    ) -> ScanGeometry:
+        """
+        Compute the lookup tables of a scan geometry.
+
+        Parameters
+        ----------
+        sensor_angles : NDArray
+            The sensor angles in degrees.
+        key : NDArray, optional
+            The quantized angles, if already computed.
+
+        Returns
+        -------
+        ScanGeometry
+            The lookup tables.
+        """
+        # Keep read-only arrays, e.g. cached LaserScan angles, so that the
+        # next lookup of the same array is an identity check
+        if not (
+            isinstance(sensor_angles, np.ndarray)
+            and sensor_angles.dtype == np.float64
+            and not sensor_angles.flags.writeable
+        ):
+            sensor_angles = np.array(sensor_angles, dtype=np.float64)
+            sensor_angles.flags.writeable = False
+
+        angles = self._robot_angles(sensor_angles)
+        centered = angles - 180.0
+
+        order = np.argsort(centered, kind="stable")
+        centered_sorted = centered[order]
+        radians = (centered_sorted + 180.0) * self.DEGREES_TO_RADIANS
+
+        visible = np.ones(len(order), dtype=bool)
+        for start, end in self.angles_blanked:
+            visible &= ~((centered_sorted >= start) & (centered_sorted <= end))
+
+        points = np.empty((len(order), 4))
+        points[:, 2] = centered_sorted
+
+        return ScanGeometry(
+            sensor_angles=sensor_angles,
+            key=key if key is not None else self._quantize(sensor_angles),
+            order=order,
+            raw_angles=np.round(angles, 2),
+            neg_sin=-np.sin(radians),
+            neg_cos=-np.cos(radians),
+            visible=visible,
+            points=points,
+            keep=np.empty(len(order), dtype=bool),
+        )
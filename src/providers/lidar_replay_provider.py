@@ -0,0 +1,165 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, List, Optional, Sequence, Union
+
+from numpy.typing import NDArray
+
+from .sensor_recorder import LidarRecording
+
+
+@dataclass
+class ReplayStats:
+    """
+    Counters of a LidarReplayProvider.
+
+    Parameters
+    ----------
+    replayed : int
+        Number of scans fed to the consumer.
+    failed : int
+        Number of scans the consumer raised on.
+    max_lag : float
+        Longest delay in seconds between the scheduled and actual replay of
+        a scan.
+    """
+
+    replayed: int = 0
+    failed: int = 0
+    max_lag: float = 0.0
+
+
+class LidarReplayProvider:
+    """
+    Replays lidar recordings into a scan consumer, e.g. the _path_processor
+    of an RPLidarProvider, in place of the sensor.
+
+    Scans are replayed in the sensor frame, with the mounting angle stored
+    in the recording removed, and paced by their recorded timestamps divided by
+    the replay speed.
+
+    Parameters
+    ----------
+    paths : str or Sequence[str]
+        The LidarColumnarFormat recordings, replayed in order.
+    consumer : Callable[[NDArray], None]
+        Called with the (angle, distance) points of each scan.
+    speed : float
+        Replay speed relative to real time. 0 replays as fast as possible.
+    loop : bool
+        Restart from the first scan after the last one.
+    """
+
+    def __init__(
+        self,
+        paths: Union[str, Sequence[str]],
+        consumer: Callable[[NDArray], None],
+        speed: float = 1.0,
+        loop: bool = False,
+    ):
+        """
+        Open the recordings.
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        self.logs: List[LidarRecording] = [LidarRecording(path) for path in paths]
+        self.consumer = consumer
+        self.speed = speed
+        self.loop = loop
+
+        self._stats = ReplayStats()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def scan_count(self) -> int:
+        """
+        Get the number of scans in all recordings.
+        """
+        return sum(len(log) for log in self.logs)
+
+    @property
+    def stats(self) -> ReplayStats:
+        """
+        Get a copy of the replay counters.
+        """
+        return replace(self._stats)
+
+    @property
+    def running(self) -> bool:
+        """
+        Check whether a replay started with start() is in progress.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Replay the recordings on a background thread.
+        """
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.replay, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop the replay thread.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait for the thread in seconds.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def replay(self) -> None:
+        """
+        Replay the recordings on the calling thread, until done or stopped.
+        """
+        if self.scan_count == 0:
+            return
+
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            first_timestamp: Optional[float] = None
+
+            for log in self.logs:
+                for index in range(len(log)):
+                    if self._stop_event.is_set():
+                        return
+
+                    timestamp = float(log.timestamps[index])
+                    if first_timestamp is None:
+                        first_timestamp = timestamp
+                    if self.speed > 0:
+                        due = started + (timestamp - first_timestamp) / self.speed
+                        self._stop_event.wait(max(0.0, due - time.monotonic()))
+                        self._stats.max_lag = max(
+                            self._stats.max_lag, time.monotonic() - due
+                        )
+
+                    self._feed(log.sensor_frame(index))
+
+            if not self.loop:
+                return
+
+    def _feed(self, frame: NDArray) -> None:
+        """
+        Pass one scan to the consumer.
+
+        Parameters
+        ----------
+        frame : NDArray
+            The (angle, distance) points of the scan.
+        """
+        try:
+            self.consumer(frame)
+            self._stats.replayed += 1
+        except Exception as e:
+            logging.error(f"Error replaying lidar scan: {e}")
+            self._stats.failed += 1
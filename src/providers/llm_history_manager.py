@@ -1,7 +1,10 @@
 import asyncio
 import functools
+import hashlib
 import logging
-from dataclasses import dataclass
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, List, Optional, TypeVar, Union
 
 import openai
@@ -10,13 +13,113 @@ from llm import LLMConfig
 
 from .io_provider import IOProvider
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 R = TypeVar("R")
 
+# Tokens added by the chat format to every message
+MESSAGE_TOKEN_OVERHEAD = 4
+
+TRUNCATION_MARKER = " [...]"
+
 
 @dataclass
 class ChatMessage:
     role: str
     content: str
+    tokens: Optional[int] = field(default=None, compare=False, repr=False)
+
+
+class TokenCounter:
+    """
+    Estimates token counts locally, without calling the LLM API.
+
+    Uses the tiktoken encoding of the model when tiktoken is installed, and
+    otherwise a conservative estimate of one token per 3.5 characters.
+
+    Parameters
+    ----------
+    model : str, optional
+        The model name, used to pick the tiktoken encoding.
+    """
+
+    CHARS_PER_TOKEN = 3.5
+
+    def __init__(self, model: Optional[str] = None):
+        """
+        Initialize the counter, loading the encoding if available.
+        """
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model or "")
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+
+    def count(self, text: str) -> int:
+        """
+        Estimate the number of tokens of a text.
+
+        Parameters
+        ----------
+        text : str
+            The text.
+
+        Returns
+        -------
+        int
+            The estimated number of tokens.
+        """
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return math.ceil(len(text) / self.CHARS_PER_TOKEN)
+
+    def count_message(self, message: ChatMessage) -> int:
+        """
+        Estimate the number of tokens of a message, cached on the message.
+
+        Parameters
+        ----------
+        message : ChatMessage
+            The message.
+
+        Returns
+        -------
+        int
+            The estimated number of tokens, including the chat format overhead.
+        """
+        if message.tokens is None:
+            message.tokens = self.count(message.content) + MESSAGE_TOKEN_OVERHEAD
+        return message.tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """
+        Truncate a text to a number of tokens, keeping its beginning.
+
+        Parameters
+        ----------
+        text : str
+            The text.
+        max_tokens : int
+            The maximum number of tokens.
+
+        Returns
+        -------
+        str
+            The text, or its beginning followed by a truncation marker.
+        """
+        if self.count(text) <= max_tokens:
+            return text
+
+        budget = max(max_tokens - self.count(TRUNCATION_MARKER), 0)
+        if self._encoding is not None:
+            head = self._encoding.decode(self._encoding.encode(text)[:budget])
+        else:
+            head = text[: int(budget * self.CHARS_PER_TOKEN)]
+        return head + TRUNCATION_MARKER
 
 
 ACTION_MAP = {
@@ -27,6 +130,21 @@ ACTION_MAP = {
 
 
 class LLMHistoryManager:
+    """
+    Keeps the conversation history of an LLM and compacts it.
+
+    Once the history exceeds history_length messages, or history_token_budget
+    estimated tokens, its oldest messages are folded into a running summary
+    by a background summarization request. Summaries are cached by their
+    input, so an unchanged history is never summarized twice.
+
+    With a token budget, the messages sent with each request are also capped
+    to the budget: the summary is kept, truncated to half the budget at
+    most, followed by as many of the newest messages as fit.
+    """
+
+    SUMMARY_CACHE_SIZE = 32
+
     def __init__(
         self,
         config: LLMConfig,
@@ -59,6 +177,15 @@ class LLMHistoryManager:
         # history buffer
         self.history: List[ChatMessage] = []
 
+        # token budget
+        self.token_budget: Optional[int] = self.config.history_token_budget
+        self.token_counter = TokenCounter(self.config.model)
+        self.truncated_messages = 0
+
+        # summaries keyed by the digest of their prompt
+        self._summary_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.summary_cache_hits = 0
+
         # io provider
         self.io_provider = IOProvider()
 
@@ -76,7 +203,7 @@ class LLMHistoryManager:
 
             summary_prompt = ""
 
-            if len(messages) == 4:
+            if len(messages) == 4 and messages[0].role == "assistant":
                 # the normal case - previous summary and new data
                 # the previous summary
                 summary_prompt += f"{messages[0].content}\n"
@@ -100,6 +227,18 @@ class LLMHistoryManager:
 
             logging.info(f"Information to summarize:\n{summary_prompt}")
 
+            cache_key = hashlib.sha256(
+                f"{self.config.model}\0{self.system_prompt}\0{summary_prompt}".encode(
+                    "utf-8"
+                )
+            ).hexdigest()
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                self._summary_cache.move_to_end(cache_key)
+                self.summary_cache_hits += 1
+                logging.debug("Reusing cached summary of an unchanged history")
+                return ChatMessage(role="assistant", content=f"Previously, {cached}")
+
             # Set timeout for API call
             timeout = 10.0  # seconds
             response = await asyncio.wait_for(
@@ -120,6 +259,9 @@ class LLMHistoryManager:
                 )
 
             summary = response.choices[0].message.content
+            self._summary_cache[cache_key] = summary
+            while len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
             return ChatMessage(role="assistant", content=f"Previously, {summary}")
 
         except asyncio.TimeoutError:
@@ -134,9 +276,19 @@ class LLMHistoryManager:
             logging.error(f"Error summarizing messages: {type(e).__name__}: {e}")
             return ChatMessage(role="system", content="Error summarizing state")
 
-    async def start_summary_task(self, messages: List[ChatMessage]):
+    async def start_summary_task(
+        self, messages: List[ChatMessage], count: Optional[int] = None
+    ):
         """
         Start a new task to summarize the messages.
+
+        Parameters
+        ----------
+        messages : List[ChatMessage]
+            The history. Its summarized messages are replaced by the summary
+            once it is ready, while messages added in the meantime are kept.
+        count : int, optional
+            Number of oldest messages to summarize, all of them by default.
         """
         if not messages:
             logging.warning("No messages to summarize in start_summary_task")
@@ -147,7 +299,7 @@ class LLMHistoryManager:
                 logging.info("Previous summary task still running")
                 return
 
-            messages_copy = messages.copy()
+            messages_copy = messages[:count]
             self._summary_task = asyncio.create_task(
                 self.summarize_messages(messages_copy)
             )
@@ -160,8 +312,8 @@ class LLMHistoryManager:
 
                     summary_message = task.result()
                     if summary_message.role == "assistant":
-                        messages.clear()
-                        messages.append(summary_message)
+                        del messages[: len(messages_copy)]
+                        messages.insert(0, summary_message)
                         logging.info("Successfully summarized the state")
                     elif (
                         summary_message.role == "system"
@@ -192,11 +344,116 @@ class LLMHistoryManager:
             messages.pop(0) if messages else None
             messages.pop(0) if messages else None
 
+    def history_tokens(self) -> int:
+        """
+        Estimate the number of tokens of the whole history.
+        """
+        return sum(self.token_counter.count_message(msg) for msg in self.history)
+
+    def needs_compaction(self) -> bool:
+        """
+        Check whether the history exceeds its message or token limit.
+        """
+        history_length = self.config.history_length
+        if history_length and len(self.history) > history_length:
+            return True
+        return bool(self.token_budget) and self.history_tokens() > self.token_budget
+
+    def compaction_count(self) -> int:
+        """
+        Get the number of oldest messages to fold into the summary.
+
+        Over the message limit, the whole history is summarized. Over the
+        token budget only, the oldest messages are, until the rest fits in
+        half the budget, always keeping the newest message. With a token
+        budget, the messages summarized at once are also capped to the
+        budget, so that they all reach the summarizer; the others are left
+        for the next compaction.
+
+        Returns
+        -------
+        int
+            The number of messages to summarize.
+        """
+        history_length = self.config.history_length
+        if history_length and len(self.history) > history_length:
+            count = len(self.history)
+        else:
+            remaining = self.history_tokens()
+            count = 0
+            while count < len(self.history) - 1 and remaining > self.token_budget // 2:
+                remaining -= self.token_counter.count_message(self.history[count])
+                count += 1
+
+        if not self.token_budget or count == 0:
+            return count
+
+        # The oldest message is summarized even if it exceeds the budget alone
+        available = self.token_budget
+        fitting = 0
+        for msg in self.history[:count]:
+            available -= self.token_counter.count_message(msg)
+            if fitting and available < 0:
+                break
+            fitting += 1
+        return fitting
+
+    def select_messages(self) -> List[ChatMessage]:
+        """
+        Select the history messages to send within the token budget.
+
+        Returns
+        -------
+        List[ChatMessage]
+            The summary, if any, then the newest messages that fit, oldest
+            first. Messages too long for the budget are truncated.
+        """
+        if not self.token_budget:
+            return list(self.history)
+
+        counter = self.token_counter
+        budget = self.token_budget
+        selected: List[ChatMessage] = []
+
+        history = self.history
+        summary = history[0] if history and history[0].role == "assistant" else None
+        if summary is not None:
+            history = history[1:]
+            if counter.count_message(summary) > budget // 2:
+                summary = self._truncated(summary, budget // 2)
+            budget -= counter.count_message(summary)
+
+        for msg in reversed(history):
+            tokens = counter.count_message(msg)
+            if tokens > budget:
+                if not selected and budget > MESSAGE_TOKEN_OVERHEAD:
+                    selected.append(self._truncated(msg, budget))
+                self.truncated_messages += len(history) - len(selected)
+                break
+            selected.append(msg)
+            budget -= tokens
+
+        if summary is not None:
+            selected.append(summary)
+        selected.reverse()
+        return selected
+
     def get_messages(self) -> List[dict]:
         """
-        Get messages in format required by OpenAI API.
+        Get messages in format required by OpenAI API, within the token budget.
+        """
+        return [
+            {"role": msg.role, "content": msg.content} for msg in self.select_messages()
+        ]
+
+    def _truncated(self, message: ChatMessage, max_tokens: int) -> ChatMessage:
+        """
+        Get a copy of a message truncated to a number of tokens.
         """
-        return [{"role": msg.role, "content": msg.content} for msg in self.history]
+        content = self.token_counter.truncate(
+            message.content, max_tokens - MESSAGE_TOKEN_OVERHEAD
+        )
+        return ChatMessage(role=message.role, content=content)
 
     @staticmethod
     def update_history():
@@ -257,13 +514,10 @@ class LLMHistoryManager:
                         ChatMessage(role="user", content=action_message)
                     )
 
-                    if (
-                        self.history_manager.config.history_length > 0
-                        and len(self.history_manager.history)
-                        > self.history_manager.config.history_length
-                    ):
+                    if self.history_manager.needs_compaction():
                         await self.history_manager.start_summary_task(
-                            self.history_manager.history
+                            self.history_manager.history,
+                            self.history_manager.compaction_count(),
                         )
 
                 self.history_manager.frame_index += 1
@@ -3,8 +3,7 @@ import logging
 import threading
 from typing import Dict, List, Optional, Union
 
-import requests
-
+from .http_client_pool import HTTPClientPool
 from .io_provider import IOProvider
 from .singleton import singleton
 
@@ -42,6 +41,7 @@ class LocationsProvider:
         self._lock = threading.Lock()
 
         self.io_provider = IOProvider()
+        self.http = HTTPClientPool()
 
     def start(self) -> None:
         """
@@ -84,14 +84,18 @@ class LocationsProvider:
             return
 
         try:
-            resp = requests.get(self.base_url, timeout=self.timeout)
+            resp = self.http.request_sync("GET", self.base_url, timeout=self.timeout)
 
-            if resp.status_code < 200 or resp.status_code >= 300:
+            if not resp.ok:
                 logging.error(
-                    f"Location list API returned {resp.status_code}: {resp.text}"
+                    f"Location list API returned {resp.status}: {resp.text()}"
                 )
                 return
 
+            if resp.not_modified:
+                # The server revalidated the locations we already have
+                return
+
             data = resp.json()
 
             raw_message = data.get("message") if isinstance(data, dict) else None
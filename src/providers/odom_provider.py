@@ -30,6 +30,7 @@ from zenoh_msgs import (
     open_zenoh_session,
 )
 
+from .pose_ring_buffer import PoseRingBuffer, PoseSample
 from .singleton import singleton
 
 rad_to_deg = 57.2958
@@ -46,11 +47,15 @@ def odom_processor(
     URID: str = "",
     use_zenoh: bool = False,
     logging_config: Optional[LoggingConfig] = None,
+    pose_ring_name: Optional[str] = None,
+    pose_ring_ready: Optional["mp.synchronize.Condition"] = None,
+    pose_ring_failed: Optional["mp.synchronize.Event"] = None,
 ) -> None:
     """
     Process function for the Odom Provider.
     This function runs in a separate process to periodically retrieve the odometry
-    and pose data from the robot and put it into a multiprocessing queue.
+    and pose data from the robot and write it into a shared-memory pose ring
+    buffer, or put it into a multiprocessing queue if there is no ring buffer.
 
     Parameters
     ----------
@@ -66,9 +71,64 @@ def odom_processor(
         Otherwise, use CycloneDDS (e.g., for Unitree Go2).
     logging_config : LoggingConfig, optional
         Optional logging configuration. If provided, it will override the default logging settings.
+    pose_ring_name : str, optional
+        Name of the shared memory block of the pose ring buffer. If None, or if
+        attaching fails, pose data is sent through the queue.
+    pose_ring_ready : mp.Condition, optional
+        Notified after each sample written to the pose ring buffer.
+    pose_ring_failed : mp.Event, optional
+        Set if attaching to the pose ring buffer fails, so the Odom Provider
+        reads the queue instead.
     """
     setup_logging("odom_processor", logging_config=logging_config)
 
+    pose_ring: Optional[PoseRingBuffer] = None
+    if pose_ring_name:
+        try:
+            pose_ring = PoseRingBuffer(name=pose_ring_name)
+        except Exception as e:
+            logging.warning(f"Could not attach odom pose ring buffer, using queue: {e}")
+            if pose_ring_failed is not None:
+                pose_ring_failed.set()
+            if pose_ring_ready is not None:
+                with pose_ring_ready:
+                    pose_ring_ready.notify_all()
+
+    def publish_pose(pose_data: Union[PoseWithCovarianceStamped, PoseStamped_]):
+        """
+        Send pose data to the Odom Provider.
+
+        Parameters
+        ----------
+        pose_data : PoseWithCovarianceStamped or PoseStamped_
+            The stamped pose to send.
+        """
+        if pose_ring is None:
+            data_queue.put(pose_data)
+            return
+
+        stamp = pose_data.header.stamp
+        position = pose_data.pose.position
+        orientation = pose_data.pose.orientation
+        sample = (
+            stamp.sec + stamp.nanosec * 1e-9,
+            position.x,
+            position.y,
+            position.z,
+            orientation.x,
+            orientation.y,
+            orientation.z,
+            orientation.w,
+        )
+        if pose_ring_ready is None:
+            pose_ring.write(*sample)
+            return
+
+        # Written under the lock, so the Odom Provider cannot miss the wakeup
+        with pose_ring_ready:
+            pose_ring.write(*sample)
+            pose_ring_ready.notify_all()
+
     def zenoh_odom_handler(data: zenoh.Sample):
         """
         Zenoh handler for odometry data.
@@ -81,7 +141,7 @@ def odom_processor(
         odom: Odometry = nav_msgs.Odometry.deserialize(data.payload.to_bytes())
         logging.debug(f"Zenoh odom handler: {odom}")
 
-        data_queue.put(
+        publish_pose(
             PoseWithCovarianceStamped(header=odom.header, pose=odom.pose.pose)  # type: ignore
         )
 
@@ -95,7 +155,7 @@ def odom_processor(
             The PoseStamped message containing the pose data.
         """
         logging.debug(f"Pose message handler: {data}")
-        data_queue.put(data)
+        publish_pose(data)
 
     if use_zenoh:
         # typically, TurtleBot4
@@ -152,10 +212,21 @@ class OdomProvider:
     channel: str = ""
         The channel to connect to the robot, used for CycloneDDS (e.g., Unitree Go2).
         If not specified, it will raise an error when starting the provider.
+    pose_ring_capacity: int = 64
+        Number of pose samples kept in the shared-memory ring buffer. Set to 0
+        to send pose data through a multiprocessing queue instead.
     """
 
+    # Seconds the processor thread waits for a pose sample before checking
+    # again that the odom processor still uses the ring buffer
+    POSE_RING_WAIT_TIMEOUT = 1.0
+
     def __init__(
-        self, URID: str = "", use_zenoh: bool = False, channel: Optional[str] = ""
+        self,
+        URID: str = "",
+        use_zenoh: bool = False,
+        channel: Optional[str] = "",
+        pose_ring_capacity: int = 64,
     ):
         """
         Robot and sensor configuration
@@ -168,6 +239,17 @@ class OdomProvider:
         self.channel = channel
 
         self.data_queue: mp.Queue[PoseStamped] = mp.Queue()
+
+        self.pose_ring: Optional[PoseRingBuffer] = None
+        if pose_ring_capacity > 0:
+            try:
+                self.pose_ring = PoseRingBuffer(capacity=pose_ring_capacity)
+            except Exception as e:
+                logging.warning(f"Could not create odom pose ring buffer: {e}")
+        self._pose_ring_sequence = 0
+        self._pose_ring_ready = mp.Condition()
+        self._pose_ring_failed = mp.Event()
+        self._pose_lock = threading.Lock()
         self._odom_reader_thread: Optional[mp.Process] = None
         self._odom_processor_thread: Optional[threading.Thread] = None
 
@@ -216,6 +298,9 @@ class OdomProvider:
                     self.URID,
                     self.use_zenoh,
                     get_logging_config(),
+                    self.pose_ring.name if self.pose_ring else None,
+                    self._pose_ring_ready,
+                    self._pose_ring_failed,
                 ),
                 daemon=True,
             )
@@ -274,11 +359,13 @@ class OdomProvider:
         """
         Process the odom data and update the internal state.
 
-        Parameters
-        ----------
-        pose : PoseWithCovariance
-            The pose data containing position and orientation.
+        Pose samples are read from the shared-memory ring buffer if there is
+        one, and from the multiprocessing queue otherwise, including when the
+        odom processor reports it could not attach to the ring buffer.
         """
+        if self.pose_ring is not None:
+            self._process_pose_ring()
+
         while True:
             try:
                 pose_data = self.data_queue.get()
@@ -288,74 +375,173 @@ class OdomProvider:
                 continue
 
             pose = pose_data.pose
-            header = pose_data.header
+            stamp = pose_data.header.stamp
+
+            with self._pose_lock:
+                self._update_pose(
+                    stamp.sec + stamp.nanosec * 1e-9,
+                    pose.position.x,
+                    pose.position.y,
+                    pose.position.z,
+                    pose.orientation.x,
+                    pose.orientation.y,
+                    pose.orientation.z,
+                    pose.orientation.w,
+                )
+
+    def _process_pose_ring(self) -> None:
+        """
+        Process pose samples as the odom processor writes them to the ring
+        buffer. Returns when the odom processor falls back to the queue.
+        """
+        while True:
+            with self._pose_ring_ready:
+                self._pose_ring_ready.wait_for(
+                    lambda: self._pose_ring_failed.is_set()
+                    or (
+                        self.pose_ring is not None
+                        and self.pose_ring.sequence != self._pose_ring_sequence
+                    ),
+                    timeout=self.POSE_RING_WAIT_TIMEOUT,
+                )
 
-            # this is the time according to the RockChip. It may be off by several seconds from
-            # UTC
-            self.odom_rockchip_ts = header.stamp.sec + header.stamp.nanosec * 1e-9
+            if self._pose_ring_failed.is_set():
+                logging.warning(
+                    "Odom processor could not attach the pose ring buffer, "
+                    "reading pose data from the queue"
+                )
+                return
 
-            # The local timestamp
-            self.odom_subscriber_ts = time.time()
+            self._drain_pose_ring()
 
-            if self.channel and not self.use_zenoh:
-                # only relevant to Unitree Go2
-                self.body_height_cm = round(pose.position.z * 100.0)
-                if self.body_height_cm > 24:
-                    self.body_attitude = RobotState.STANDING
-                elif self.body_height_cm > 3:
-                    self.body_attitude = RobotState.SITTING
+    def _drain_pose_ring(self) -> bool:
+        """
+        Process the pose samples written to the ring buffer since the last drain.
+        Only called from the processor thread.
 
-            x = pose.orientation.x
-            y = pose.orientation.y
-            z = pose.orientation.z
-            w = pose.orientation.w
+        Returns
+        -------
+        bool
+            True if there were new samples.
+        """
+        if (
+            self.pose_ring is None
+            or self.pose_ring.sequence == self._pose_ring_sequence
+        ):
+            return False
+
+        with self._pose_lock:
+            samples = self.pose_ring.read_since(self._pose_ring_sequence)
+            for sample in samples:
+                self._update_pose_sample(sample)
+            if samples:
+                self._pose_ring_sequence = samples[-1].sequence
+        return bool(samples)
+
+    def _update_pose_sample(self, sample: PoseSample) -> None:
+        """
+        Update the internal state from a pose ring buffer sample.
 
-            dx = (pose.position.x - self.previous_x) ** 2
-            dy = (pose.position.y - self.previous_y) ** 2
-            dz = (pose.position.z - self.previous_z) ** 2
+        Parameters
+        ----------
+        sample : PoseSample
+            The pose sample.
+        """
+        self._update_pose(
+            sample.timestamp,
+            sample.x,
+            sample.y,
+            sample.z,
+            sample.qx,
+            sample.qy,
+            sample.qz,
+            sample.qw,
+        )
 
-            self.previous_x = pose.position.x
-            self.previous_y = pose.position.y
-            self.previous_z = pose.position.z
+    def _update_pose(
+        self,
+        timestamp: float,
+        px: float,
+        py: float,
+        pz: float,
+        x: float,
+        y: float,
+        z: float,
+        w: float,
+    ) -> None:
+        """
+        Update the internal state from a pose.
 
-            delta = math.sqrt(dx + dy + dz)
+        Parameters
+        ----------
+        timestamp : float
+            The publisher timestamp of the pose in seconds.
+        px, py, pz : float
+            The position of the pose.
+        x, y, z, w : float
+            The orientation quaternion of the pose.
+        """
+        # this is the time according to the RockChip. It may be off by several seconds from
+        # UTC
+        self.odom_rockchip_ts = timestamp
 
-            # moving? Use a decay kernel
-            self.move_history = 0.7 * delta + 0.3 * self.move_history
+        # The local timestamp
+        self.odom_subscriber_ts = time.time()
 
-            if delta > 0.01 or self.move_history > 0.01:
-                self.moving = True
-                logging.info(
-                    f"delta moving (m): {round(delta,3)} {round(self.move_history,3)}"
-                )
-            else:
-                # logging.info(
-                #     f"delta moving (m): {round(delta,3)} {round(self.move_history,3)}"
-                # )
-                self.moving = False
-
-            angles = self.euler_from_quaternion(x, y, z, w)
-
-            # this is in the standard robot convention
-            # yaw increases when you turn LEFT
-            # (counter-clockwise rotation about the vertical axis
-            self.odom_yaw_m180_p180 = round(angles[2] * rad_to_deg, 4)
-
-            # we also provide a second data product, where
-            # * yaw increases when you turn RIGHT (CW), and
-            # * the range runs from 0 to 360 Deg
-            flip = -1.0 * self.odom_yaw_m180_p180
-            if flip < 0.0:
-                flip = flip + 360.0
-
-            self.odom_yaw_0_360 = round(flip, 4)
-
-            # current position in world frame
-            self.x = round(pose.position.x, 4)
-            self.y = round(pose.position.y, 4)
-            logging.debug(
-                f"odom: X:{self.x} Y:{self.y} W:{self.odom_yaw_m180_p180} H:{self.odom_yaw_0_360} T:{self.odom_rockchip_ts}"
+        if self.channel and not self.use_zenoh:
+            # only relevant to Unitree Go2
+            self.body_height_cm = round(pz * 100.0)
+            if self.body_height_cm > 24:
+                self.body_attitude = RobotState.STANDING
+            elif self.body_height_cm > 3:
+                self.body_attitude = RobotState.SITTING
+
+        dx = (px - self.previous_x) ** 2
+        dy = (py - self.previous_y) ** 2
+        dz = (pz - self.previous_z) ** 2
+
+        self.previous_x = px
+        self.previous_y = py
+        self.previous_z = pz
+
+        delta = math.sqrt(dx + dy + dz)
+
+        # moving? Use a decay kernel
+        self.move_history = 0.7 * delta + 0.3 * self.move_history
+
+        if delta > 0.01 or self.move_history > 0.01:
+            self.moving = True
+            logging.info(
+                f"delta moving (m): {round(delta,3)} {round(self.move_history,3)}"
             )
+        else:
+            # logging.info(
+            #     f"delta moving (m): {round(delta,3)} {round(self.move_history,3)}"
+            # )
+            self.moving = False
+
+        angles = self.euler_from_quaternion(x, y, z, w)
+
+        # this is in the standard robot convention
+        # yaw increases when you turn LEFT
+        # (counter-clockwise rotation about the vertical axis
+        self.odom_yaw_m180_p180 = round(angles[2] * rad_to_deg, 4)
+
+        # we also provide a second data product, where
+        # * yaw increases when you turn RIGHT (CW), and
+        # * the range runs from 0 to 360 Deg
+        flip = -1.0 * self.odom_yaw_m180_p180
+        if flip < 0.0:
+            flip = flip + 360.0
+
+        self.odom_yaw_0_360 = round(flip, 4)
+
+        # current position in world frame
+        self.x = round(px, 4)
+        self.y = round(py, 4)
+        logging.debug(
+            f"odom: X:{self.x} Y:{self.y} W:{self.odom_yaw_m180_p180} H:{self.odom_yaw_0_360} T:{self.odom_rockchip_ts}"
+        )
 
     @property
     def position(self) -> dict:
@@ -377,14 +563,15 @@ class OdomProvider:
             - odom_rockchip_ts: The unix timestamp of the last odometry update. Provided by the CycloneDDS publisher.
             - odom_subscriber_ts: The unix timestamp of the last odometry update according to the subscriber.
         """
-        return {
-            "odom_x": self.x,
-            "odom_y": self.y,
-            "moving": self.moving,
-            "odom_yaw_0_360": self.odom_yaw_0_360,
-            "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
-            "body_height_cm": self.body_height_cm,
-            "body_attitude": self.body_attitude,
-            "odom_rockchip_ts": self.odom_rockchip_ts,
-            "odom_subscriber_ts": self.odom_subscriber_ts,
-        }
+        with self._pose_lock:
+            return {
+                "odom_x": self.x,
+                "odom_y": self.y,
+                "moving": self.moving,
+                "odom_yaw_0_360": self.odom_yaw_0_360,
+                "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
+                "body_height_cm": self.body_height_cm,
+                "body_attitude": self.body_attitude,
+                "odom_rockchip_ts": self.odom_rockchip_ts,
+                "odom_subscriber_ts": self.odom_subscriber_ts,
+            }
@@ -0,0 +1,411 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .latency_histogram import LatencyHistogram
+
+PUBLISH_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+)
+
+# Shared across publishers, so the encoder is not rebuilt for every message
+_JSON_ENCODER = json.JSONEncoder()
+
+
+def encode_json(message: Any) -> str:
+    """
+    Encode a message as JSON.
+
+    Parameters
+    ----------
+    message : Any
+        The message.
+
+    Returns
+    -------
+    str
+        The JSON document.
+    """
+    return _JSON_ENCODER.encode(message)
+
+
+class DeliveryPolicy(Enum):
+    """
+    How pending messages of a key are delivered.
+
+    ORDERED publishes every message in order, e.g. speech. LATEST publishes
+    only the most recent pending message, e.g. velocity commands and status,
+    where an outdated message is useless once a newer one is queued.
+    """
+
+    ORDERED = "ordered"
+    LATEST = "latest"
+
+
+@dataclass
+class OutboundStats:
+    """
+    Counters of an OutboundPublisher.
+
+    Parameters
+    ----------
+    queued : int
+        Messages queued.
+    published : int
+        Messages published.
+    coalesced : int
+        Messages replaced by a newer message of a LATEST key before being
+        published.
+    dropped : int
+        Messages dropped because an ORDERED key had too many pending.
+    failed : int
+        Messages whose encoding or publishing failed.
+    batches : int
+        Batches of pending messages taken by the worker.
+    max_queue_depth : int
+        Largest number of pending messages seen.
+    latency : LatencyHistogram
+        Seconds from queueing to publishing.
+    """
+
+    queued: int = 0
+    published: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+    max_queue_depth: int = 0
+    latency: LatencyHistogram = field(
+        default_factory=lambda: LatencyHistogram(buckets=PUBLISH_LATENCY_BUCKETS)
+    )
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the stats to a dictionary, e.g. for logging.
+
+        Returns
+        -------
+        Dict[str, object]
+            The counters and the latency histogram.
+        """
+        return {
+            "queued": self.queued,
+            "published": self.published,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "max_queue_depth": self.max_queue_depth,
+            "latency": self.latency.to_dict(),
+        }
+
+
+@dataclass
+class _KeyConfig:
+    """
+    Delivery policy and encoder of a key.
+    """
+
+    policy: DeliveryPolicy = DeliveryPolicy.ORDERED
+    encode: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass
+class _Pending:
+    """
+    A queued message with its queueing time.
+    """
+
+    message: Any
+    queued_at: float
+
+
+class OutboundPublisher:
+    """
+    Batches and coalesces outgoing messages per key, and publishes them from
+    one worker thread.
+
+    Messages are queued per key, e.g. per Zenoh key expression or ROS 2
+    topic. The worker takes every pending message at once and publishes the
+    batch in one pass, instead of waking for each message. Keys with the
+    LATEST policy keep only their most recent pending message, so a slow
+    transport never publishes outdated commands. Messages are encoded just
+    before being published, so coalesced messages are never encoded.
+
+    Parameters
+    ----------
+    send : Callable[[str, Any], None]
+        Publishes an encoded message on a key. Called on the worker thread.
+    name : str
+        Name used in log messages.
+    max_pending : int
+        Pending messages of an ORDERED key beyond which the oldest is dropped.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, Any], None],
+        name: str = "outbound",
+        max_pending: int = 1000,
+    ):
+        """
+        Initialize the publisher with no pending message.
+        """
+        self.send = send
+        self.name = name
+        self.max_pending = max_pending
+        self.stats = OutboundStats()
+
+        self._keys: Dict[str, _KeyConfig] = {}
+        self._pending: Dict[str, Deque[_Pending]] = {}
+        # Keys with pending messages, in the order they were first queued
+        self._ready: "OrderedDict[str, None]" = OrderedDict()
+        self._depth = 0
+        self._in_flight = 0
+
+        self._condition = threading.Condition()
+        self.running: bool = False
+        self._thread: Optional[threading.Thread] = None
+
+    def configure(
+        self,
+        key: str,
+        policy: DeliveryPolicy = DeliveryPolicy.ORDERED,
+        encode: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        """
+        Set how the messages of a key are delivered.
+
+        Parameters
+        ----------
+        key : str
+            The key.
+        policy : DeliveryPolicy
+            The delivery policy. Keys not configured are ORDERED.
+        encode : Optional[Callable[[Any], Any]]
+            Encodes a message before it is sent, None to send it as queued.
+        """
+        with self._condition:
+            self._keys[key] = _KeyConfig(policy=policy, encode=encode)
+
+    def publish(self, key: str, message: Any) -> None:
+        """
+        Queue a message. Safe to call from any thread.
+
+        Parameters
+        ----------
+        key : str
+            The key to publish on.
+        message : Any
+            The message, encoded when published.
+        """
+        pending = _Pending(message=message, queued_at=time.monotonic())
+        with self._condition:
+            config = self._keys.get(key) or _KeyConfig()
+            queue = self._pending.setdefault(key, deque())
+
+            if queue and config.policy == DeliveryPolicy.LATEST:
+                self.stats.coalesced += len(queue)
+                self._depth -= len(queue)
+                queue.clear()
+            elif len(queue) >= self.max_pending:
+                queue.popleft()
+                self._depth -= 1
+                self.stats.dropped += 1
+                logging.warning(
+                    f"{self.name}: too many pending messages on {key}, "
+                    "dropping the oldest"
+                )
+
+            queue.append(pending)
+            self._ready.setdefault(key)
+            self._depth += 1
+            self.stats.queued += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._depth)
+            self._condition.notify()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get the number of messages waiting to be published.
+
+        Returns
+        -------
+        int
+            The pending messages, across all keys.
+        """
+        with self._condition:
+            return self._depth
+
+    def start(self) -> None:
+        """
+        Start the worker thread if not already running.
+        """
+        if self.running:
+            return
+
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker thread after it publishes the pending messages.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the worker thread.
+        """
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued message is published.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Seconds to wait at most, None to wait indefinitely.
+
+        Returns
+        -------
+        bool
+            True if nothing is left to publish.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._depth == 0 and self._in_flight == 0, timeout
+            )
+
+    def _take_batch(self) -> List[Tuple[str, _KeyConfig, List[_Pending]]]:
+        """
+        Take every pending message. Must be called with the lock held.
+
+        Returns
+        -------
+        List[Tuple[str, _KeyConfig, List[_Pending]]]
+            The pending messages of each key, keys in the order they were
+            first queued.
+        """
+        batch = []
+        for key in self._ready:
+            queue = self._pending[key]
+            batch.append((key, self._keys.get(key) or _KeyConfig(), list(queue)))
+            queue.clear()
+        self._ready.clear()
+        self._in_flight = self._depth
+        self._depth = 0
+        self.stats.batches += 1
+        return batch
+
+    def _run(self) -> None:
+        """
+        Worker loop publishing batches of pending messages.
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._ready or not self.running)
+                if not self._ready:
+                    return
+                batch = self._take_batch()
+
+            for key, config, messages in batch:
+                for pending in messages:
+                    self._send(key, config, pending)
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def _send(self, key: str, config: _KeyConfig, pending: _Pending) -> None:
+        """
+        Encode and send one message.
+
+        Parameters
+        ----------
+        key : str
+            The key to publish on.
+        config : _KeyConfig
+            The delivery settings of the key.
+        pending : _Pending
+            The queued message.
+        """
+        try:
+            payload = (
+                config.encode(pending.message) if config.encode else pending.message
+            )
+            self.send(key, payload)
+        except Exception as e:
+            self.stats.failed += 1
+            logging.exception(f"{self.name}: error publishing on {key}: {e}")
+            return
+
+        self.stats.published += 1
+        self.stats.latency.observe(time.monotonic() - pending.queued_at)
+
+
+class ZenohPublisherCache:
+    """
+    Declares a Zenoh publisher per key expression once and reuses it.
+
+    Parameters
+    ----------
+    session : zenoh.Session
+        The Zenoh session to declare publishers on.
+    """
+
+    def __init__(self, session: Any):
+        """
+        Initialize the cache with no declared publisher.
+        """
+        self.session = session
+        self._publishers: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def put(self, key: str, payload: Any) -> None:
+        """
+        Publish a payload on a key expression.
+
+        Parameters
+        ----------
+        key : str
+            The key expression.
+        payload : Any
+            The payload, e.g. bytes or str.
+        """
+        publisher = self._publishers.get(key)
+        if publisher is None:
+            with self._lock:
+                publisher = self._publishers.get(key)
+                if publisher is None:
+                    publisher = self.session.declare_publisher(key)
+                    self._publishers[key] = publisher
+        publisher.put(payload)
+
+    def close(self) -> None:
+        """
+        Undeclare the publishers.
+        """
+        with self._lock:
+            publishers = list(self._publishers.values())
+            self._publishers.clear()
+        for publisher in publishers:
+            try:
+                publisher.undeclare()
+            except Exception as e:
+                logging.warning(f"Error undeclaring Zenoh publisher: {e}")
@@ -0,0 +1,233 @@
+import logging
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+POSE_FIELDS = 8
+HEADER_FIELDS = 2
+
+
+class PoseSample(NamedTuple):
+    """
+    A pose sample read from a PoseRingBuffer.
+
+    Parameters
+    ----------
+    sequence : int
+        The sequence number of the sample, starting at 1.
+    timestamp : float
+        The publisher timestamp of the pose in seconds.
+    x, y, z : float
+        The position of the pose.
+    qx, qy, qz, qw : float
+        The orientation quaternion of the pose.
+    """
+
+    sequence: int
+    timestamp: float
+    x: float
+    y: float
+    z: float
+    qx: float
+    qy: float
+    qz: float
+    qw: float
+
+
+class PoseRingBuffer:
+    """
+    Fixed-layout shared-memory ring buffer of pose samples.
+
+    One process writes samples and others read them without pickling or
+    queues. The shared memory block holds, in this order:
+
+    - the int64 sequence number of the latest sample (0 when empty) and the
+      int64 capacity of the ring,
+    - one int64 sequence number per slot, -1 while the slot is written,
+    - capacity rows of POSE_FIELDS float64 values: timestamp, x, y, z, qx,
+      qy, qz, qw.
+
+    Readers check the slot sequence number before and after copying a row,
+    so a sample overwritten while being read is skipped instead of torn.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of samples kept in the ring. Ignored when attaching, where the
+        capacity of the existing ring is used.
+    name : str, optional
+        Name of an existing shared memory block to attach to. If None, a new
+        block is created.
+    """
+
+    def __init__(self, capacity: int = 64, name: Optional[str] = None):
+        """
+        Create or attach to the shared memory block.
+        """
+        self._owner = name is None
+        if self._owner:
+            size = 8 * (HEADER_FIELDS + capacity) + 8 * capacity * POSE_FIELDS
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            # The creating process owns the block; do not let this process's
+            # resource tracker unlink it on exit.
+            try:
+                resource_tracker.unregister(self._shm._name, "shared_memory")  # type: ignore
+            except Exception as e:
+                logging.debug(f"Could not unregister shared memory: {e}")
+
+        buffer = self._shm.buf
+        self._header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=buffer)
+
+        if self._owner:
+            self._header[0] = 0
+            self._header[1] = capacity
+        self.capacity = int(self._header[1])
+
+        self._slot_sequences = np.ndarray(
+            (self.capacity,), dtype=np.int64, buffer=buffer, offset=8 * HEADER_FIELDS
+        )
+        self._data = np.ndarray(
+            (self.capacity, POSE_FIELDS),
+            dtype=np.float64,
+            buffer=buffer,
+            offset=8 * (HEADER_FIELDS + self.capacity),
+        )
+
+        if self._owner:
+            self._slot_sequences[:] = 0
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the shared memory block, used to attach from another process.
+        """
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """
+        Get the sequence number of the latest sample, 0 if nothing was written.
+        """
+        return int(self._header[0])
+
+    def write(
+        self,
+        timestamp: float,
+        x: float,
+        y: float,
+        z: float,
+        qx: float,
+        qy: float,
+        qz: float,
+        qw: float,
+    ) -> int:
+        """
+        Write a pose sample. Only one process may write to a ring.
+
+        Parameters
+        ----------
+        timestamp : float
+            The publisher timestamp of the pose in seconds.
+        x, y, z : float
+            The position of the pose.
+        qx, qy, qz, qw : float
+            The orientation quaternion of the pose.
+
+        Returns
+        -------
+        int
+            The sequence number of the sample.
+        """
+        sequence = int(self._header[0]) + 1
+        slot = (sequence - 1) % self.capacity
+
+        self._slot_sequences[slot] = -1
+        self._data[slot] = (timestamp, x, y, z, qx, qy, qz, qw)
+        self._slot_sequences[slot] = sequence
+        self._header[0] = sequence
+
+        return sequence
+
+    def latest(self) -> Optional[PoseSample]:
+        """
+        Read the latest pose sample.
+
+        Returns
+        -------
+        PoseSample or None
+            The latest sample, or None if nothing was written yet.
+        """
+        for _ in range(self.capacity):
+            sequence = int(self._header[0])
+            if sequence == 0:
+                return None
+            sample = self._read(sequence)
+            if sample is not None:
+                return sample
+        return None
+
+    def read_since(self, sequence: int) -> List[PoseSample]:
+        """
+        Read the samples written after a given sequence number.
+
+        Samples that were already overwritten are skipped.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number of the last sample read, 0 to read all.
+
+        Returns
+        -------
+        List[PoseSample]
+            The newer samples in order, at most capacity of them.
+        """
+        latest = int(self._header[0])
+        first = max(sequence + 1, latest - self.capacity + 1, 1)
+
+        samples = []
+        for current in range(first, latest + 1):
+            sample = self._read(current)
+            if sample is not None:
+                samples.append(sample)
+        return samples
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory block, and remove it if this ring created it.
+        """
+        del self._header, self._slot_sequences, self._data
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _read(self, sequence: int) -> Optional[PoseSample]:
+        """
+        Read the sample with a given sequence number.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number of the sample.
+
+        Returns
+        -------
+        PoseSample or None
+            The sample, or None if its slot was overwritten.
+        """
+        slot = (sequence - 1) % self.capacity
+        if self._slot_sequences[slot] != sequence:
+            return None
+
+        values = self._data[slot].tolist()
+
+        if self._slot_sequences[slot] != sequence:
+            return None
+
+        return PoseSample(sequence, *values)
@@ -1,24 +1,33 @@
 #!/usr/bin/env python3
 import logging
-import threading
 import time
-from queue import Empty, Queue
-from typing import Optional
 
 import rclpy  # type: ignore
 from rclpy.node import Node  # type: ignore
 from std_msgs.msg import String  # type: ignore
 
+from providers.outbound_publisher import (
+    DeliveryPolicy,
+    OutboundPublisher,
+    OutboundStats,
+)
+
 rclpy.init()
 
 
 class ROS2PublisherProvider(Node):
-    def __init__(self, topic: str = "speak_topic"):
+    def __init__(
+        self,
+        topic: str = "speak_topic",
+        policy: DeliveryPolicy = DeliveryPolicy.ORDERED,
+    ):
         try:
             super().__init__("ROS2_publisher_provider")
         except Exception as e:
             print(f"Node initialization error: {e}")
 
+        self.topic = topic
+
         # Initialize the publisher.
         try:
             self.publisher_ = self.create_publisher(String, topic, 10)
@@ -26,11 +35,21 @@ class ROS2PublisherProvider(Node):
         except Exception as e:
             logging.exception(f"Failed to create publisher on topic '{topic}': {e}")
 
-        # Pending message queue and threading constructs
-        self._pending_messages = Queue()
-        self._lock = threading.Lock()
-        self.running: bool = False
-        self._thread: Optional[threading.Thread] = None
+        # Pending messages, published in batches by the outbound worker thread
+        self._outbound = OutboundPublisher(
+            self._publish_message, name=f"ROS2 publisher {topic}"
+        )
+        self._outbound.configure(topic, policy)
+
+    @property
+    def running(self) -> bool:
+        """Check whether the publisher thread is running."""
+        return self._outbound.running
+
+    @property
+    def stats(self) -> OutboundStats:
+        """Get the queue depth and publish latency counters."""
+        return self._outbound.stats
 
     def add_pending_message(self, text: str):
         """Queue a message to be published."""
@@ -38,19 +57,15 @@ class ROS2PublisherProvider(Node):
             msg = String()
             # Append a timestamp to the message text.
             msg.data = f"{text} - {time.time()}"
-            logging.info(f"Queueing message: {msg.data}")
-            self._pending_messages.put(msg)
+            logging.debug(f"Queueing message: {msg.data}")
+            self._outbound.publish(self.topic, msg)
         except Exception as e:
             logging.exception(f"Error adding pending message: {e}")
 
-    def _publish_message(self, msg: String):
-        """Publish a single message and log the result."""
-        try:
-            self.publisher_.publish(msg)
-            logging.info(f"Published message: {msg.data}")
-        except Exception as e:
-            logging.exception(f"Error publishing message: {e}")
-        return None
+    def _publish_message(self, topic: str, msg: String):
+        """Publish a single message, errors are counted by the outbound worker."""
+        self.publisher_.publish(msg)
+        logging.debug(f"Published message: {msg.data}")
 
     def start(self):
         """
@@ -59,31 +74,15 @@ class ROS2PublisherProvider(Node):
         if self.running:
             return
 
-        self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._outbound.start()
         logging.info("ROS2 Publisher Provider started")
 
-    def _run(self):
-        """
-        Internal loop that processes and publishes pending messages.
-        """
-        while self.running:
-            try:
-                # Wait up to 0.5 seconds for a message.
-                msg = self._pending_messages.get(timeout=0.5)
-                self._publish_message(msg)
-            except Empty:
-                continue
-            except Exception as e:
-                logging.exception("Exception in publisher thread: %s", e)
-
     def stop(self):
         """
         Stop the publisher provider and clean up resources.
         """
-        self.running = False
-        if self._thread:
-            self._thread.join(timeout=5)
-        self._publisher.Close()
-        logging.info("ROS2 Publisher Provider stopped")
+        self._outbound.stop()
+        self.destroy_publisher(self.publisher_)
+        logging.info(
+            f"ROS2 Publisher Provider stopped, stats: {self._outbound.stats.to_dict()}"
+        )
@@ -1,8 +1,6 @@
-import json
 import logging
 import math
 import multiprocessing as mp
-import os
 import threading
 import time
 from dataclasses import dataclass
@@ -18,7 +16,9 @@ from runtime.logging import LoggingConfig, get_logging_config, setup_logging
 from zenoh_msgs import LaserScan, open_zenoh_session, sensor_msgs
 
 from .d435_provider import D435Provider
+from .lidar_preprocessor import LidarPreprocessor
 from .rplidar_driver import RPDriver
+from .sensor_recorder import LidarColumnarFormat, RecordFormat, SensorRecorder
 from .singleton import singleton
 
 
@@ -157,6 +157,10 @@ class RPLidarProvider:
         Configuration for the RPLidar sensor
     log_file: bool = False
         Whether to log data to a local file
+    log_format: str = "jsonl"
+        Format of the local file, "jsonl" or "columnar"
+    log_compression: Optional[str] = None
+        Compression of the local file, "gzip", "zstd" or None
     """
 
     # Constants
@@ -183,6 +187,8 @@ class RPLidarProvider:
         simple_paths: bool = False,
         rplidar_config: RPLidarConfig = RPLidarConfig(),
         log_file: bool = False,
+        log_format: str = "jsonl",
+        log_compression: Optional[str] = None,
     ):
         """
         Robot and sensor configuration
@@ -212,8 +218,13 @@ class RPLidarProvider:
         self._valid_paths: Optional[list] = None
         self._lidar_string: Optional[str] = None
 
-        self.angles = None
-        self.angles_final = None
+        # Trig tables, blanking masks and buffers cached per scan geometry
+        self._preprocessor = LidarPreprocessor(
+            sensor_mounting_angle=self.sensor_mounting_angle,
+            angles_blanked=self.angles_blanked,
+            relevant_distance_min=self.relevant_distance_min,
+            relevant_distance_max=self.relevant_distance_max,
+        )
 
         self.odom_rockchip_ts = 0.0
         self.odom_subscriber_ts = 0.0
@@ -228,13 +239,19 @@ class RPLidarProvider:
         if log_file:
             self.write_to_local_file = log_file
 
-        self.filename_current = None
-        self.max_file_size_bytes = 1024 * 1024
-
-        # Create timestamped log filename
+        # Scans are written to timestamped, rotating files in the background
+        self.recorder: Optional[SensorRecorder] = None
         if self.write_to_local_file:
-            self.filename_current = self.update_filename()
-            logging.info(f"RPSCAN Logging to {self.filename_current}")
+            record_format: Optional[RecordFormat] = None
+            if log_format == "columnar":
+                record_format = LidarColumnarFormat(
+                    sensor_mounting_angle=self.sensor_mounting_angle
+                )
+            self.recorder = SensorRecorder(
+                "dump/lidar",
+                record_format=record_format,
+                compression=log_compression,
+            )
 
         # Initialize paths for path planning
         # Define 9 straight line paths separated by 15 degrees
@@ -242,6 +259,11 @@ class RPLidarProvider:
         self.path_angles = [-60, -45, -30, -15, 0, 15, 30, 45, 60, 180]
         self.paths = self._initialize_paths()
 
+        # Segment endpoints of every path, shape (num_paths, 2), used by the
+        # batched point-to-segment collision check
+        self._path_starts = np.array([[path[0][0], path[1][0]] for path in self.paths])
+        self._path_ends = np.array([[path[0][-1], path[1][-1]] for path in self.paths])
+
         self.pp = []
         for path in self.paths:
             pairs = list(zip(path[0], path[1]))
@@ -287,38 +309,6 @@ class RPLidarProvider:
         # D435 Provider
         self.d435_provider = D435Provider()
 
-    def update_filename(self):
-        unix_ts = time.time()
-        logging.info(f"RPSCAN time: {unix_ts}")
-        unix_ts = str(unix_ts).replace(".", "_")
-        filename = f"dump/lidar_{unix_ts}Z.jsonl"
-        return filename
-
-    def write_str_to_file(self, json_line: str):
-        """
-        Writes a dictionary to a file in JSON lines format. If the file exceeds max_file_size_bytes,
-        creates a new file with a timestamp.
-
-        Parameters:
-        - data: Dictionary to write
-        """
-
-        if not isinstance(json_line, str):
-            raise ValueError("Provided json_line must be a json string.")
-
-        if (
-            self.filename_current is not None
-            and os.path.exists(self.filename_current)
-            and os.path.getsize(self.filename_current) > self.max_file_size_bytes
-        ):
-            self.filename_current = self.update_filename()
-            logging.info(f"New rpscan file name: {self.filename_current}")
-
-        if self.filename_current is not None:
-            with open(self.filename_current, "a", encoding="utf-8") as f:
-                f.write(json_line + "\n")
-                f.flush()
-
     def listen_scan(self, data: zenoh.Sample):
         """
         Zenoh scan handler.
@@ -390,22 +380,12 @@ class RPLidarProvider:
             # logging.debug(f"_preprocess_zenoh: {scan}")
             # angle_min=-3.1241390705108643, angle_max=3.1415927410125732
 
-            if not self.angles:
-                self.angles = list(
-                    map(
-                        lambda x: 360.0 * (x + math.pi) / (2 * math.pi),
-                        np.arange(scan.angle_min, scan.angle_max, scan.angle_increment),
-                    )
-                )
-                self.angles_final = np.flip(self.angles)
-
-            # angles now run from 360.0 to 0 degress
-            if self.angles_final is not None:
-                data = list(zip(self.angles_final, scan.ranges))
-            else:
-                data = []
-            array_ready = np.array(data)
-            self._path_processor(array_ready)
+            # angles run from 360.0 to 0 degrees
+            angles = self._preprocessor.laser_scan_angles(
+                scan.angle_min, scan.angle_max, scan.angle_increment, len(scan.ranges)
+            )
+            distances = np.asarray(scan.ranges, dtype=np.float64)[: len(angles)]
+            self._process_scan(angles, distances)
 
     def _path_processor(self, data: NDArray):
         """
@@ -420,93 +400,55 @@ class RPLidarProvider:
             The raw data from the RPLidar, expected to be a 2D array
             with angles and distances.
         """
-        complexes = []
-        raw = []
-
-        for angle, distance in data:
+        data = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+        # Serial scans sample new angles every revolution, see LidarPreprocessor
+        self._process_scan(data[:, 0], data[:, 1], cache=False)
 
-            d_m = distance
-
-            # first, correctly orient the sensor zero to the robot zero
-            angle = angle + self.sensor_mounting_angle
-            if angle >= 360.0:
-                angle = angle - 360.0
-            elif angle < 0.0:
-                angle = 360.0 + angle
-
-            raw.append([round(angle, 2), d_m])
-
-            # don't worry about distant objects
-            if d_m > self.relevant_distance_max:
-                continue
-
-            # don't worry about too close objects
-            if d_m < self.relevant_distance_min:
-                continue
-
-            # convert the angle from [0 to 360] to [-180 to +180] range
-            angle = angle - 180.0
-
-            for b in self.angles_blanked:
-                if angle >= b[0] and angle <= b[1]:
-                    # this is a permanent robot reflection
-                    # disregard
-                    continue
-
-            # Convert angle to radians for trigonometric calculations
-            # Note: angle is adjusted back to [0, 360] range
-            a_rad = (angle + 180.0) * self.DEGREES_TO_RADIANS
-
-            v1 = d_m * math.cos(a_rad)
-            v2 = d_m * math.sin(a_rad)
-
-            # convert to x and y
-            # x runs backwards to forwards, y runs left to right
-            x = -1 * v2
-            y = -1 * v1
-
-            # the final data ready to use for path planning
-            complexes.append([x, y, angle, d_m])
+    def _process_scan(self, angles: NDArray, distances: NDArray, cache: bool = True):
+        """
+        Find the possible paths given a lidar scan.
 
+        Parameters
+        ----------
+        angles : NDArray
+            The sensor angles in degrees.
+        distances : NDArray
+            The distances in meters, one per angle.
+        cache : bool
+            Cache the scan geometry, False for scans without fixed angles.
+        """
         # Append the D435 provider's obstacle data if available
+        obstacles = None
         if self.d435_provider.running and len(self.d435_provider.obstacle) > 50:
             logging.debug("Appending D435 provider obstacle data to RPLidar data")
-            for obstacle in self.d435_provider.obstacle:
-                complexes.append(
-                    [
-                        obstacle["x"],
-                        obstacle["y"],
-                        obstacle["angle"],
-                        obstacle["distance"],
-                    ]
-                )
+            obstacles = self.d435_provider.obstacle_array
 
-        array = np.array(complexes)
-        raw_array = np.array(raw)
+        # Relevant, non-blanked returns as (x, y, angle, distance) rows
+        # sorted by angle, with x running backwards to forwards and y left
+        # to right
+        array = self._preprocessor.process(angles, distances, obstacles, cache)
 
         # save_timestamp = time.time()
-        if self.write_to_local_file:
-            try:
-                json_line = json.dumps(
-                    {
-                        "odom_rockchip_ts": self.odom_rockchip_ts,
-                        "odom_subscriber_ts": self.odom_subscriber_ts,
-                        "odom_x": self.odom_x,
-                        "odom_y": self.odom_y,
-                        "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
-                        "odom_yaw_0_360": self.odom_yaw_0_360,
-                        "frame": raw_array.tolist(),
-                    }
-                )
-                self.write_str_to_file(json_line)
-                logging.debug(f"rplidar wrote to: {self.filename_current}")
-            except Exception as e:
-                logging.error(f"Error saving rplidar to file: {str(e)}")
+        if self.recorder is not None:
+            self.recorder.record(
+                {
+                    "timestamp": time.time(),
+                    "odom_rockchip_ts": self.odom_rockchip_ts,
+                    "odom_subscriber_ts": self.odom_subscriber_ts,
+                    "odom_x": self.odom_x,
+                    "odom_y": self.odom_y,
+                    "odom_yaw_m180_p180": self.odom_yaw_m180_p180,
+                    "odom_yaw_0_360": self.odom_yaw_0_360,
+                    "frame": self._preprocessor.raw_frame(
+                        angles, distances, cache
+                    ).tolist(),
+                }
+            )
 
-        # sort data into strictly increasing angles to deal with sensor issues
-        # the sensor sometimes reports part of the previous scan and part of the next scan
-        # so you end up with multiple slightly different values for some angles at the
-        # junction
+        # the preprocessor sorts data into strictly increasing angles to deal with
+        # sensor issues: the sensor sometimes reports part of the previous scan and
+        # part of the next scan so you end up with multiple slightly different values
+        # for some angles at the junction
 
         """
         Determine set of possible paths
@@ -517,50 +459,19 @@ class RPLidarProvider:
             # only question is whether it can advance
             possible_paths = np.array([4])
 
-        if array.ndim > 1:
-            # we have valid LIDAR returns
-
-            sorted_indices = array[:, 2].argsort()
-            array = array[sorted_indices]
+        if len(array):
+            # we have valid LIDAR returns, already sorted by angle
 
             # logging.debug(f"_process array: {array}")
 
             X = array[:, 0]
             Y = array[:, 1]
             # A = array[:, 2]
-            D = array[:, 3]
-
-            # all the possible conflicting points
-            for x, y, d in list(zip(X, Y, D)):
-                for apath in possible_paths:
-                    path_points = self.paths[apath]
-                    start_x, start_y = (
-                        path_points[0][0],
-                        path_points[1][0],
-                    )
-                    end_x, end_y = path_points[0][-1], path_points[1][-1]
+            # D = array[:, 3]
 
-                    if apath == 9:
-                        # For going back, only consider obstacles that are:
-                        # 1. Behind the robot (negative y in robot frame)
-                        # 2. Within a certain distance threshold
-
-                        # Assuming robot faces positive y direction
-                        # Only check obstacles behind the robot
-                        if y >= 0:  # Skip obstacles in front of or beside the robot
-                            continue
-
-                    dist_to_line = self.distance_point_to_line_segment(
-                        x, y, start_x, start_y, end_x, end_y
-                    )
-
-                    if dist_to_line < self.half_width_robot:
-                        # too close - this path will not work
-                        # logging.info(f"removing path: {apath}")
-                        path_to_remove = np.array([apath])
-                        possible_paths = np.setdiff1d(possible_paths, path_to_remove)
-                        logging.debug(f"remaining paths: {possible_paths}")
-                        break  # no need to check other paths
+            # all the possible conflicting points, evaluated against
+            # every candidate path in one batch
+            possible_paths = self._filter_blocked_paths(X, Y, possible_paths)
 
         logging.info(f"possible_paths RP Lidar: {possible_paths}")
 
@@ -614,11 +525,8 @@ class RPLidarProvider:
                 # distances are in millimeters
                 distances_m = scan_array[:, 1] / 1000
 
-                data = list(zip(angles, distances_m))
-
-                logging.debug(f"_serial_processor: {data}")
-                array_ready = np.array(data)
-                self._path_processor(array_ready)
+                # Serial scans sample new angles every revolution, see LidarPreprocessor
+                self._process_scan(angles, distances_m, cache=False)
 
                 try:
                     o = self.odom.position
@@ -804,6 +712,110 @@ class RPLidarProvider:
 
         return math.sqrt((px - closest_x) ** 2 + (py - closest_y) ** 2)
 
+    def distance_points_to_line_segments(
+        self, px: NDArray, py: NDArray, starts: NDArray, ends: NDArray
+    ) -> NDArray:
+        """
+        Calculate the distances from many points to many line segments at once.
+        This is the batched equivalent of distance_point_to_line_segment and
+        evaluates every (point, segment) pair in a single NumPy pass.
+
+        Parameters
+        ----------
+        px : NDArray
+            The x-coordinates of the points, shape (N,).
+        py : NDArray
+            The y-coordinates of the points, shape (N,).
+        starts : NDArray
+            The first endpoints of the line segments, shape (M, 2).
+        ends : NDArray
+            The second endpoints of the line segments, shape (M, 2).
+
+        Returns
+        -------
+        NDArray
+            The shortest distances, shape (N, M), where entry [i, j] is the
+            distance from point i to segment j. Zero length segments return
+            the distance to their endpoint.
+        """
+        x1 = starts[:, 0]
+        y1 = starts[:, 1]
+        dx = ends[:, 0] - x1
+        dy = ends[:, 1] - y1
+
+        length_sq = dx * dx + dy * dy
+        degenerate = length_sq == 0
+
+        rel_x = px[:, np.newaxis] - x1
+        rel_y = py[:, np.newaxis] - y1
+
+        # Projection parameter, clamped to [0, 1] to stay within the segment
+        t = (rel_x * dx + rel_y * dy) / np.where(degenerate, 1.0, length_sq)
+        t = np.clip(t, 0.0, 1.0)
+        t[:, degenerate] = 0.0
+
+        closest_x = x1 + t * dx
+        closest_y = y1 + t * dy
+
+        return np.sqrt(
+            (px[:, np.newaxis] - closest_x) ** 2 + (py[:, np.newaxis] - closest_y) ** 2
+        )
+
+    def _filter_blocked_paths(
+        self, X: NDArray, Y: NDArray, possible_paths: NDArray
+    ) -> NDArray:
+        """
+        Remove the paths blocked by lidar returns.
+
+        Each return, in order, removes the first still possible path that
+        passes closer to it than half_width_robot. Path 9 (going back) only
+        considers returns behind the robot (negative y). Only returns that
+        block at least one path are visited in Python.
+
+        Parameters
+        ----------
+        X : NDArray
+            The x-coordinates of the returns, sorted by angle.
+        Y : NDArray
+            The y-coordinates of the returns, sorted by angle.
+        possible_paths : NDArray
+            The candidate path indices, in increasing order.
+
+        Returns
+        -------
+        NDArray
+            The path indices that remain possible.
+        """
+        if X.size == 0 or possible_paths.size == 0:
+            return possible_paths
+
+        distances = self.distance_points_to_line_segments(
+            X, Y, self._path_starts[possible_paths], self._path_ends[possible_paths]
+        )
+        blocked = distances < self.half_width_robot
+
+        # For going back, skip obstacles in front of or beside the robot
+        retreat = possible_paths == 9
+        if retreat.any():
+            blocked[:, retreat] &= (Y < 0)[:, np.newaxis]
+
+        # Encode each return's blocked paths as a bitmask (bit j -> possible_paths[j])
+        # and walk only the returns that block something, in angle order
+        weights = 1 << np.arange(possible_paths.size, dtype=np.int64)
+        row_masks = blocked.astype(np.int64) @ weights
+
+        available = (1 << possible_paths.size) - 1
+        for row_mask in row_masks[row_masks != 0].tolist():
+            hit = row_mask & available
+            if hit:
+                # too close - the first such path will not work
+                available &= ~(hit & -hit)
+                if not available:
+                    break
+
+        keep = (available & weights) != 0
+        return possible_paths[keep]
+
     def _generate_movement_string(self, valid_paths: list) -> str:
         """
         Generate movement direction string based on valid paths.
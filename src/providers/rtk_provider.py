@@ -1,15 +1,15 @@
 import datetime as datetime
 import logging
-import re
-import threading
-import time
 from typing import Optional
 
 import serial
 from pynmeagps import NMEAReader
 
+from .serial_reactor import SerialReactor, SerialRecord, SerialSubscription
 from .singleton import singleton
 
+RTK_RECORD_KINDS = ("GNGGA",)
+
 
 @singleton
 class RtkProvider:
@@ -31,18 +31,9 @@ class RtkProvider:
 
         logging.info("Booting RTK Provider")
 
-        baudrate = 115200
-        timeout = 0.2  # seconds
-
-        self.serial_connection = None
-        try:
-            self.serial_connection = serial.Serial(
-                serial_port, baudrate, timeout=timeout
-            )
-            self.serial_connection.reset_input_buffer()
-            logging.info(f"Connected to {serial_port} at {baudrate} baud")
-        except serial.SerialException as e:
-            logging.error(f"Error: {e}")
+        self.serial_port = serial_port
+        self.baudrate = 115200
+        self._subscription: Optional[SerialSubscription] = None
 
         self._rtk: Optional[dict] = None
 
@@ -53,8 +44,6 @@ class RtkProvider:
         self.qua = 0
         self.unix_ts = 0.0
 
-        self.running = False
-        self._thread: Optional[threading.Thread] = None
         self.start()
 
     def utc_time_obj_to_unix(self, utc_time_obj):
@@ -76,33 +65,6 @@ class RtkProvider:
         # Convert to Unix timestamp
         return dt.timestamp()
 
-    def get_latest_gngga_message(self, nmea_data):
-
-        pattern = re.compile(
-            r"(\$GNGGA,(?P<time>\d{6}(?:\.\d+)?),[^*]*\*[0-9A-Fa-f]{2})", re.MULTILINE
-        )
-
-        gngga_entries = []
-
-        matches = pattern.finditer(nmea_data)
-
-        for match in matches:
-            # logging.info(f"matches: {match}")
-            full_msg = match.group(1)
-            time_str = match.group("time")
-            try:
-                time_val = float(time_str)
-                gngga_entries.append((time_val, full_msg))
-            except ValueError:
-                continue  # Skip if time field is malformed
-
-        # Sort by time and return the latest message
-        if gngga_entries:
-            most_recent = max(gngga_entries, key=lambda x: x[0])
-            # "most_recent" is a time and the message,
-            # the [1] just returns the message
-            return most_recent[1]
-
     def magRTKProcessor(self, msg):
 
         try:
@@ -151,44 +113,73 @@ class RtkProvider:
 
     def start(self):
         """
-        Starts the RTK Provider and processing thread
-        if not already running.
+        Starts receiving the GNGGA sentences of the serial port
+        if not already receiving them.
         """
-        if self._thread and self._thread.is_alive():
+        if self._subscription is not None:
             return
 
-        self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        try:
+            self._subscription = SerialReactor().subscribe(
+                self.serial_port,
+                self._on_record,
+                baudrate=self.baudrate,
+                kinds=RTK_RECORD_KINDS,
+                on_close=self._on_close,
+            )
+        except serial.SerialException as e:
+            logging.error(f"Error: {e}")
 
-    def _run(self):
+    def _on_record(self, record: SerialRecord):
         """
-        Main loop for the RTK provider.
+        Process a sentence as soon as the serial reactor reads it.
+
+        Parameters
+        ----------
+        record : SerialRecord
+            A GNGGA sentence with a valid checksum.
         """
-        while self.running:
+        try:
+            parsed_nema = NMEAReader.parse(record.line)
+        except Exception as e:
+            logging.warning(f"Failed to parse NMEA sentence: {record.line} ({e})")
+            return
+        self.magRTKProcessor(parsed_nema)
 
-            if self.serial_connection:
-                bytes_waiting = self.serial_connection.in_waiting
-                while bytes_waiting > 0:
-                    data = self.serial_connection.read(size=bytes_waiting)
-                    if data:
-                        data = data.decode("utf-8", errors="ignore")
-                        latest_GNGGA = self.get_latest_gngga_message(data)
-                        if latest_GNGGA:
-                            parsed_nema = NMEAReader.parse(latest_GNGGA)
-                            self.magRTKProcessor(parsed_nema)
-                    bytes_waiting = self.serial_connection.in_waiting
+    def _on_close(self, subscription: SerialSubscription):
+        """
+        Forget a subscription ended by the serial reactor, e.g. when the
+        port disconnects, so that start() can open the port again.
 
-            time.sleep(0.1)
+        Parameters
+        ----------
+        subscription : SerialSubscription
+            The ended subscription.
+        """
+        if self._subscription is subscription:
+            logging.warning(f"RTK serial port {subscription.port} closed")
+            self._subscription = None
 
     def stop(self):
         """
         Stop the RTK provider.
         """
-        self.running = False
-        if self._thread:
+        if self._subscription is not None:
             logging.info("Stopping RTK provider")
-            self._thread.join(timeout=5)
+            SerialReactor().unsubscribe(self._subscription)
+            self._subscription = None
+
+    @property
+    def running(self) -> bool:
+        """
+        Check whether the provider receives the sentences of its serial port.
+
+        Returns
+        -------
+        bool
+            True if subscribed to the serial port
+        """
+        return self._subscription is not None
 
     @property
     def data(self) -> Optional[dict]:
@@ -0,0 +1,882 @@
+import gzip
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, replace
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class RecordFormat:
+    """
+    Encodes batches of records for a SensorRecorder.
+    """
+
+    extension: str = ""
+
+    def header(self) -> bytes:
+        """
+        Get the bytes written at the start of every recording file.
+
+        Returns
+        -------
+        bytes
+            The file header, empty by default.
+        """
+        return b""
+
+    def encode_batch(self, records: Sequence[Any]) -> bytes:
+        """
+        Encode a batch of records.
+
+        Parameters
+        ----------
+        records : Sequence[Any]
+            The records to encode.
+
+        Returns
+        -------
+        bytes
+            The encoded batch, appended as-is to the recording.
+        """
+        raise NotImplementedError
+
+
+class JsonLinesFormat(RecordFormat):
+    """
+    One JSON document per line. Records are dictionaries, or strings that are
+    already JSON encoded.
+    """
+
+    extension = ".jsonl"
+
+    def encode_batch(self, records: Sequence[Any]) -> bytes:
+        """
+        Encode a batch of records as JSON lines.
+
+        Parameters
+        ----------
+        records : Sequence[Any]
+            Dictionaries or JSON strings.
+
+        Returns
+        -------
+        bytes
+            The UTF-8 encoded JSON lines.
+        """
+        lines = [
+            record if isinstance(record, str) else json.dumps(record)
+            for record in records
+        ]
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+@dataclass
+class LidarBlock:
+    """
+    A block of a LidarColumnarFormat recording.
+
+    Parameters
+    ----------
+    offset : int
+        Byte offset of the block in the recording.
+    sensor_mounting_angle : float
+        Mounting angle in degrees applied to the angles of the block.
+    scalars : NDArray
+        The scalar columns, one row per scan.
+    lengths : NDArray
+        The number of frame points per scan.
+    points : NDArray
+        The frame points of all scans, concatenated.
+    """
+
+    offset: int
+    sensor_mounting_angle: float
+    scalars: NDArray
+    lengths: NDArray
+    points: NDArray
+
+
+class LidarColumnarFormat(RecordFormat):
+    """
+    Binary columnar blocks of lidar scans, readable with LidarRecording.
+
+    Each batch of scans is one block:
+
+    - header: magic b"OMLC", then uint32 version, scan count and frame
+      columns, then float64 sensor mounting angle,
+    - float64 scalar columns, one row per scan, in SCALAR_FIELDS order,
+    - uint32 number of frame points per scan,
+    - float32 frame points of all scans, concatenated.
+
+    All values are little endian. Records are dictionaries with the
+    SCALAR_FIELDS and a "frame" array of points, e.g. angle and distance.
+    Scans are recorded in time order, so the timestamp column is a sorted
+    index for seeking by time.
+
+    Parameters
+    ----------
+    sensor_mounting_angle : float
+        Mounting angle in degrees already applied to the recorded angles,
+        stored so that replays can recover the sensor angles.
+    """
+
+    extension = ".lidar"
+
+    MAGIC = b"OMLC"
+    VERSION = 2
+    HEADER = struct.Struct("<4sIIId")
+    SCALAR_FIELDS = (
+        "timestamp",
+        "odom_rockchip_ts",
+        "odom_subscriber_ts",
+        "odom_x",
+        "odom_y",
+        "odom_yaw_m180_p180",
+        "odom_yaw_0_360",
+    )
+
+    def __init__(self, sensor_mounting_angle: float = 0.0):
+        """
+        Initialize the format.
+        """
+        self.sensor_mounting_angle = sensor_mounting_angle
+
+    def encode_batch(self, records: Sequence[Dict[str, Any]]) -> bytes:
+        """
+        Encode a batch of lidar scans as one columnar block.
+
+        Parameters
+        ----------
+        records : Sequence[Dict[str, Any]]
+            The lidar scans.
+
+        Returns
+        -------
+        bytes
+            The encoded block.
+        """
+        frames = [
+            np.asarray(record.get("frame", []), dtype="<f4") for record in records
+        ]
+        columns = next((f.shape[1] for f in frames if f.ndim == 2 and f.size), 2)
+        frames = [f.reshape(-1, columns) for f in frames]
+
+        scalars = np.array(
+            [
+                [float(record.get(name, 0.0)) for name in self.SCALAR_FIELDS]
+                for record in records
+            ],
+            dtype="<f8",
+        ).reshape(len(records), len(self.SCALAR_FIELDS))
+        lengths = np.array([len(f) for f in frames], dtype="<u4")
+        points = (
+            np.concatenate(frames) if frames else np.empty((0, columns), dtype="<f4")
+        )
+
+        return b"".join(
+            [
+                self.HEADER.pack(
+                    self.MAGIC,
+                    self.VERSION,
+                    len(records),
+                    columns,
+                    self.sensor_mounting_angle,
+                ),
+                scalars.tobytes(),
+                lengths.tobytes(),
+                points.tobytes(),
+            ]
+        )
+
+    @classmethod
+    def blocks(cls, data: Any) -> Iterator[LidarBlock]:
+        """
+        Iterate over the blocks of a recording without copying them.
+
+        A trailing partial block, e.g. of a recording still being written,
+        is ignored.
+
+        Parameters
+        ----------
+        data : bytes-like
+            The uncompressed recording, e.g. bytes or a memory map.
+
+        Yields
+        ------
+        LidarBlock
+            The blocks, as views into data.
+
+        Raises
+        ------
+        ValueError
+            If a block does not start with the magic and version.
+        """
+        size = len(data)
+        offset = 0
+
+        while offset + cls.HEADER.size <= size:
+            magic, version, count, columns, sensor_mounting_angle = (
+                cls.HEADER.unpack_from(data, offset)
+            )
+            if magic != cls.MAGIC or version != cls.VERSION:
+                raise ValueError(f"Invalid lidar block at offset {offset}")
+            start = offset
+            offset += cls.HEADER.size
+
+            scalars_size = 8 * count * len(cls.SCALAR_FIELDS)
+            if offset + scalars_size + 4 * count > size:
+                break
+            scalars = np.frombuffer(
+                data, dtype="<f8", count=count * len(cls.SCALAR_FIELDS), offset=offset
+            ).reshape(count, len(cls.SCALAR_FIELDS))
+            offset += scalars_size
+
+            lengths = np.frombuffer(data, dtype="<u4", count=count, offset=offset)
+            offset += lengths.nbytes
+
+            total = int(lengths.sum())
+            if offset + 4 * total * columns > size:
+                break
+            points = np.frombuffer(
+                data, dtype="<f4", count=total * columns, offset=offset
+            ).reshape(total, columns)
+            offset += points.nbytes
+
+            yield LidarBlock(
+                offset=start,
+                sensor_mounting_angle=sensor_mounting_angle,
+                scalars=scalars,
+                lengths=lengths,
+                points=points,
+            )
+
+        if offset < size:
+            logging.debug(f"Ignoring partial lidar block at offset {offset}")
+
+    @classmethod
+    def decode(cls, data: bytes) -> List[Dict[str, Any]]:
+        """
+        Decode a recording made of columnar blocks.
+
+        Parameters
+        ----------
+        data : bytes
+            The uncompressed recording.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The lidar scans, with the frame as an array of float32 points.
+        """
+        records: List[Dict[str, Any]] = []
+
+        for block in cls.blocks(data):
+            start = 0
+            for row, length in zip(block.scalars, block.lengths):
+                record: Dict[str, Any] = dict(zip(cls.SCALAR_FIELDS, row.tolist()))
+                record["frame"] = block.points[start : start + length]
+                records.append(record)
+                start += int(length)
+
+        return records
+
+
+def read_recording(path: str) -> bytes:
+    """
+    Read a recording made by a SensorRecorder, decompressing it if needed.
+
+    Recordings still being written, or left unterminated by a crash, are read
+    up to their last flushed batch.
+
+    Parameters
+    ----------
+    path : str
+        The path of the recording.
+
+    Returns
+    -------
+    bytes
+        The uncompressed contents.
+    """
+    if path.endswith(".gz"):
+        with open(path, "rb") as f:
+            data = f.read()
+        chunks = []
+        while data:
+            decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+            chunks.append(decompressor.decompress(data))
+            data = decompressor.unused_data
+        return b"".join(chunks)
+
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ValueError("zstandard is required to read .zst recordings")
+        with open(path, "rb") as f:
+            return zstandard.ZstdDecompressor().stream_reader(f).read()
+
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class LidarRecording:
+    """
+    Reader of a LidarColumnarFormat recording.
+
+    Uncompressed recordings are memory-mapped, so opening one only reads the
+    block headers and scalar columns, and frame points are loaded as scans
+    are read. Compressed recordings are decompressed in memory. A trailing
+    partial block, e.g. of a recording still being written, is ignored.
+
+    Parameters
+    ----------
+    path : str
+        The path of the recording.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open the recording and index its scans.
+        """
+        self.path = path
+
+        if path.endswith((".gz", ".zst")):
+            self.data: Any = read_recording(path)
+        elif os.path.getsize(path):
+            self.data = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            self.data = b""
+
+        self._blocks = list(LidarColumnarFormat.blocks(self.data))
+        if not self._blocks and len(self.data):
+            raise ValueError(f"No lidar scans in {path}")
+
+        self.sensor_mounting_angle = (
+            self._blocks[0].sensor_mounting_angle if self._blocks else 0.0
+        )
+        fields = LidarColumnarFormat.SCALAR_FIELDS
+        self.scalars: NDArray = (
+            np.concatenate([block.scalars for block in self._blocks])
+            if self._blocks
+            else np.empty((0, len(fields)))
+        )
+
+        # Block and position of the frame points of each scan
+        counts = [len(block.lengths) for block in self._blocks]
+        self._block_index = np.repeat(np.arange(len(counts)), counts)
+        self._lengths = np.concatenate(
+            [block.lengths for block in self._blocks] or [np.empty(0, "<u4")]
+        ).astype(np.int64)
+        self._starts = np.concatenate(
+            [
+                np.cumsum(block.lengths, dtype=np.int64) - block.lengths
+                for block in self._blocks
+            ]
+            or [np.empty(0, np.int64)]
+        )
+
+    def __len__(self) -> int:
+        """
+        Get the number of scans.
+        """
+        return len(self.scalars)
+
+    @property
+    def timestamps(self) -> NDArray:
+        """
+        Get the timestamps of all scans, a sorted index of the recording.
+        """
+        return self.scalars[:, 0]
+
+    def index_at(self, timestamp: float) -> int:
+        """
+        Find the last scan recorded at or before a time.
+
+        Parameters
+        ----------
+        timestamp : float
+            The time in seconds since the epoch.
+
+        Returns
+        -------
+        int
+            The scan index, 0 if the time is before the first scan.
+        """
+        index = int(np.searchsorted(self.timestamps, timestamp, side="right")) - 1
+        return max(index, 0)
+
+    def frame(self, index: int) -> NDArray:
+        """
+        Get the recorded points of a scan.
+
+        Parameters
+        ----------
+        index : int
+            The scan index.
+
+        Returns
+        -------
+        NDArray
+            The points, e.g. (angle, distance) with the mounting angle
+            applied.
+        """
+        block = self._blocks[self._block_index[index]]
+        start = self._starts[index]
+        return block.points[start : start + self._lengths[index]]
+
+    def sensor_frame(self, index: int) -> NDArray:
+        """
+        Get the points of a scan as reported by the sensor, e.g. to feed
+        RPLidarProvider._path_processor, which applies the mounting angle.
+
+        Parameters
+        ----------
+        index : int
+            The scan index.
+
+        Returns
+        -------
+        NDArray
+            The (angle, distance) points in the sensor frame.
+        """
+        block = self._blocks[self._block_index[index]]
+        frame = self.frame(index).astype(np.float64)
+        frame[:, 0] = (frame[:, 0] - block.sensor_mounting_angle) % 360.0
+        return frame
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """
+        Get a scan in the record form written by the recorder.
+
+        Parameters
+        ----------
+        index : int
+            The scan index.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The scalar fields and frame of the scan.
+        """
+        record: Dict[str, Any] = dict(
+            zip(LidarColumnarFormat.SCALAR_FIELDS, self.scalars[index].tolist())
+        )
+        record["frame"] = self.frame(index)
+        return record
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the scans in record form.
+        """
+        for index in range(len(self)):
+            yield self.record(index)
+
+
+@dataclass
+class RecorderStats:
+    """
+    Counters of a SensorRecorder.
+
+    Parameters
+    ----------
+    enqueued : int
+        Records accepted by record.
+    dropped : int
+        Records dropped because the queue was full.
+    written : int
+        Records written to disk.
+    failed : int
+        Records lost because writing their batch failed.
+    batches : int
+        Batches written to disk.
+    bytes_written : int
+        Encoded bytes written, before compression.
+    rotations : int
+        Number of files opened.
+    max_queue_depth : int
+        Largest number of queued records seen.
+    """
+
+    enqueued: int = 0
+    dropped: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    bytes_written: int = 0
+    rotations: int = 0
+    max_queue_depth: int = 0
+
+
+class _FlushRequest:
+    """
+    Queue marker asking the writer thread to signal once earlier records are written.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class SensorRecorder:
+    """
+    Background recorder for sensor dumps.
+
+    Records are queued without blocking and written by a background thread in
+    batches, to files named {filename_base}_{unix_ts}Z{extension}. A new file
+    is started when the current one exceeds max_file_size_bytes on disk or is
+    older than max_file_age_seconds. When the queue is full, new records are
+    dropped and counted, so recording never blocks sensor processing.
+
+    Parameters
+    ----------
+    filename_base : str
+        Path prefix of the recording files, e.g. "dump/lidar".
+    record_format : RecordFormat, optional
+        How records are encoded. Defaults to JSON lines.
+    max_file_size_bytes : int
+        Size on disk after which a new file is started.
+    max_file_age_seconds : float, optional
+        Age after which a new file is started. If None, files are only
+        rotated by size.
+    compression : str, optional
+        "gzip", "zstd" or None. zstd needs the zstandard package and falls
+        back to gzip without it.
+    max_queue_size : int
+        Maximum number of records waiting to be written.
+    batch_size : int
+        Maximum number of records written at once.
+    flush_interval : float
+        Maximum time in seconds the writer thread waits for more records
+        before checking for time-based rotation.
+    """
+
+    COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(
+        self,
+        filename_base: str,
+        record_format: Optional[RecordFormat] = None,
+        max_file_size_bytes: int = 1024 * 1024,
+        max_file_age_seconds: Optional[float] = None,
+        compression: Optional[str] = None,
+        max_queue_size: int = 1024,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+    ):
+        """
+        Initialize the SensorRecorder and start its writer thread.
+        """
+        if compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            logging.warning("zstandard not installed, compressing recordings with gzip")
+            compression = "gzip"
+
+        self.filename_base = filename_base
+        self.record_format = record_format or JsonLinesFormat()
+        self.max_file_size_bytes = max_file_size_bytes
+        self.max_file_age_seconds = max_file_age_seconds
+        self.compression = compression
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.filename_current: Optional[str] = None
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._stats = RecorderStats()
+        self._stats_lock = threading.Lock()
+
+        self._raw: Optional[IO[bytes]] = None
+        self._stream: Any = None
+        self._file_opened_at = 0.0
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self) -> RecorderStats:
+        """
+        Get a copy of the recorder counters.
+        """
+        with self._stats_lock:
+            return replace(self._stats)
+
+    def record(self, record: Any) -> bool:
+        """
+        Queue a record for writing, without blocking.
+
+        Parameters
+        ----------
+        record : Any
+            The record, in a form accepted by the record format.
+
+        Returns
+        -------
+        bool
+            True if the record was queued, False if it was dropped.
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._stats_lock:
+                self._stats.dropped += 1
+            return False
+
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._stats.enqueued += 1
+            self._stats.max_queue_depth = max(self._stats.max_queue_depth, depth)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all records queued so far are written.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait in seconds.
+
+        Returns
+        -------
+        bool
+            True if the records were written within the timeout.
+        """
+        request = _FlushRequest()
+        try:
+            self._queue.put(request, timeout=timeout)
+        except queue.Full:
+            return False
+        return request.done.wait(timeout)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Write the queued records, close the current file and stop the writer thread.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait in seconds.
+        """
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logging.warning("Sensor recorder queue full, stopping without flushing")
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """
+        Writer thread: write queued records in batches until stopped.
+        """
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._rotate_if_needed()
+                continue
+
+            batch: List[Any] = []
+            flush_requests: List[_FlushRequest] = []
+
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _FlushRequest):
+                    flush_requests.append(item)
+                else:
+                    batch.append(item)
+
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+            for request in flush_requests:
+                request.done.set()
+
+        self._close_file()
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        """
+        Encode and write a batch of records.
+
+        Parameters
+        ----------
+        batch : List[Any]
+            The records.
+        """
+        try:
+            data = self.record_format.encode_batch(batch)
+            self._rotate_if_needed()
+            if self._stream is None:
+                self._open_file()
+            self._stream.write(data)
+            self._flush_stream()
+        except Exception as e:
+            logging.error(
+                f"Error writing sensor recording {self.filename_current}: {e}"
+            )
+            with self._stats_lock:
+                self._stats.failed += len(batch)
+            return
+
+        with self._stats_lock:
+            self._stats.written += len(batch)
+            self._stats.batches += 1
+            self._stats.bytes_written += len(data)
+
+    def _rotate_if_needed(self) -> None:
+        """
+        Close the current file if it is too large or too old.
+        """
+        if self._raw is None:
+            return
+
+        too_large = self._raw.tell() > self.max_file_size_bytes
+        too_old = (
+            self.max_file_age_seconds is not None
+            and time.time() - self._file_opened_at > self.max_file_age_seconds
+        )
+        if too_large or too_old:
+            self._close_file()
+
+    def _new_filename(self) -> str:
+        """
+        Create a timestamped filename for a new recording file.
+        """
+        unix_ts = str(time.time()).replace(".", "_")
+        suffix = self.COMPRESSION_SUFFIXES[self.compression]
+        return f"{self.filename_base}_{unix_ts}Z{self.record_format.extension}{suffix}"
+
+    def _open_file(self) -> None:
+        """
+        Open a new recording file.
+        """
+        self.filename_current = self._new_filename()
+        directory = os.path.dirname(self.filename_current)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._raw = open(self.filename_current, "ab")
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="ab")
+        elif self.compression == "zstd":
+            self._stream = zstandard.ZstdCompressor().stream_writer(
+                self._raw, closefd=False
+            )
+        else:
+            self._stream = self._raw
+        self._file_opened_at = time.time()
+
+        header = self.record_format.header()
+        if header:
+            self._stream.write(header)
+
+        with self._stats_lock:
+            self._stats.rotations += 1
+        logging.info(f"Sensor recording to {self.filename_current}")
+
+    def _flush_stream(self) -> None:
+        """
+        Flush the written data to disk, so a partial file stays readable.
+        """
+        if self.compression == "gzip":
+            self._stream.flush(zlib.Z_SYNC_FLUSH)
+        elif self.compression == "zstd":
+            self._stream.flush(zstandard.FLUSH_FRAME)
+        self._raw.flush()
+
+    def _close_file(self) -> None:
+        """
+        Close the current recording file.
+        """
+        try:
+            if self._stream is not None and self._stream is not self._raw:
+                self._stream.close()
+            if self._raw is not None:
+                self._raw.close()
+        except Exception as e:
+            logging.error(
+                f"Error closing sensor recording {self.filename_current}: {e}"
+            )
+        finally:
+            self._stream = None
+            self._raw = None
+
+
+def convert_jsonl_to_lidar(
+    source: str,
+    filename_base: str,
+    sensor_mounting_angle: float = 180.0,
+) -> Optional[str]:
+    """
+    Convert a JSON lines lidar dump to a LidarColumnarFormat recording.
+
+    Dumps made before scans were timestamped fall back to the odometry
+    subscriber timestamp.
+
+    Parameters
+    ----------
+    source : str
+        The JSON lines dump, optionally gzip or zstd compressed.
+    filename_base : str
+        Path prefix of the recording, e.g. "dump/lidar".
+    sensor_mounting_angle : float
+        Mounting angle in degrees the dump was recorded with.
+
+    Returns
+    -------
+    str, optional
+        The path of the recording, None if the dump has no scans.
+    """
+    recorder = SensorRecorder(
+        filename_base,
+        record_format=LidarColumnarFormat(sensor_mounting_angle),
+        max_file_size_bytes=2**62,
+        max_queue_size=0,
+    )
+
+    skipped = 0
+    for line in read_recording(source).decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            skipped += 1
+            continue
+        record.setdefault("timestamp", record.get("odom_subscriber_ts", 0.0))
+        recorder.record(record)
+
+    recorder.stop(timeout=None)
+    if skipped:
+        logging.warning(f"Skipped {skipped} invalid lines in {source}")
+
+    stats = recorder.stats
+    logging.info(
+        f"Converted {stats.written} lidar scans from {source} to "
+        f"{recorder.filename_current}"
+    )
+    return recorder.filename_current
@@ -0,0 +1,497 @@
+import logging
+import os
+import selectors
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+import serial
+
+from .singleton import singleton
+
+# Line prefixes of the records written by the navigation Arduino
+RECORD_PREFIXES = frozenset({"HDG", "GPS", "YPR", "SAT", "BLE"})
+
+READ_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class SerialRecord:
+    """
+    A line read from a serial port.
+
+    Parameters
+    ----------
+    port : str
+        The serial port the line was read from.
+    kind : str
+        The sentence type for NMEA sentences, e.g. "GNGGA", the prefix for
+        the records of RECORD_PREFIXES, e.g. "HDG", and "" for other lines.
+    line : str
+        The decoded line, without surrounding whitespace.
+    timestamp : float
+        Unix timestamp at which the line was read.
+    """
+
+    port: str
+    kind: str
+    line: str
+    timestamp: float
+
+
+def nmea_checksum_valid(sentence: str) -> bool:
+    """
+    Check the checksum of an NMEA sentence.
+
+    Parameters
+    ----------
+    sentence : str
+        The sentence, starting with "$" or "!".
+
+    Returns
+    -------
+    bool
+        True if the sentence ends with a "*" and the checksum of its body.
+    """
+    body, star, checksum = sentence[1:].rpartition("*")
+    if not star or len(checksum) != 2:
+        return False
+
+    computed = 0
+    for char in body.encode("ascii", errors="replace"):
+        computed ^= char
+    try:
+        return computed == int(checksum, 16)
+    except ValueError:
+        return False
+
+
+def parse_line(port: str, line: bytes, timestamp: float) -> Optional[SerialRecord]:
+    """
+    Classify a line read from a serial port.
+
+    Parameters
+    ----------
+    port : str
+        The serial port.
+    line : bytes
+        The line, without its terminator.
+    timestamp : float
+        Unix timestamp at which the line was read.
+
+    Returns
+    -------
+    Optional[SerialRecord]
+        The record, None for blank lines and corrupted NMEA sentences.
+    """
+    text = line.decode("utf-8", errors="ignore").strip()
+    if not text:
+        return None
+
+    if text[0] in "$!":
+        if not nmea_checksum_valid(text):
+            logging.debug(f"Dropping corrupted NMEA sentence on {port}: {text}")
+            return None
+        kind = text[1:].split(",", 1)[0]
+    else:
+        prefix = text.split(":", 1)[0]
+        kind = prefix if prefix in RECORD_PREFIXES else ""
+
+    return SerialRecord(port=port, kind=kind, line=text, timestamp=timestamp)
+
+
+class LineFramer:
+    """
+    Incrementally splits a byte stream into lines.
+
+    Bytes are accumulated in one buffer that is reused across reads, and
+    complete lines are cut from its front as their terminator arrives.
+
+    Parameters
+    ----------
+    max_line_length : int
+        Pending bytes without a terminator beyond which the partial line is
+        dropped, so a stream without newlines does not grow the buffer.
+    """
+
+    def __init__(self, max_line_length: int = 4096):
+        """
+        Initialize the framer with an empty buffer.
+        """
+        self.max_line_length = max_line_length
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add bytes to the stream.
+
+        Parameters
+        ----------
+        data : bytes
+            The bytes read.
+
+        Returns
+        -------
+        List[bytes]
+            The lines completed by the bytes, without "\\n" or "\\r\\n".
+        """
+        buffer = self._buffer
+        buffer += data
+
+        lines = []
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end
+            lines.append(bytes(buffer[start:line_end]))
+            start = end + 1
+        del buffer[:start]
+
+        if len(buffer) > self.max_line_length:
+            logging.debug(f"Dropping {len(buffer)} bytes without a line terminator")
+            buffer.clear()
+
+        return lines
+
+    def __len__(self) -> int:
+        """
+        Get the number of pending bytes.
+        """
+        return len(self._buffer)
+
+
+@dataclass
+class SerialSubscription:
+    """
+    A callback receiving the records of a serial port.
+
+    Parameters
+    ----------
+    port : str
+        The serial port.
+    callback : Callable[[SerialRecord], None]
+        Called on the reactor thread with each record.
+    kinds : Optional[FrozenSet[str]]
+        The record kinds to receive, None for all.
+    on_close : Optional[Callable[["SerialSubscription"], None]]
+        Called with the subscription when the reactor closes its port, e.g.
+        on disconnection, ending the subscription.
+    """
+
+    port: str
+    callback: Callable[[SerialRecord], None]
+    kinds: Optional[FrozenSet[str]] = None
+    on_close: Optional[Callable[["SerialSubscription"], None]] = None
+
+    def wants(self, record: SerialRecord) -> bool:
+        """
+        Check whether the subscription receives a record.
+
+        Parameters
+        ----------
+        record : SerialRecord
+            The record.
+
+        Returns
+        -------
+        bool
+            True if the record is of one of the subscribed kinds.
+        """
+        return self.kinds is None or record.kind in self.kinds
+
+
+@dataclass
+class _SerialPort:
+    """
+    An open serial port with its framer and subscriptions.
+    """
+
+    name: str
+    device: Any
+    framer: LineFramer = field(default_factory=LineFramer)
+    subscriptions: List[SerialSubscription] = field(default_factory=list)
+
+
+@singleton
+class SerialReactor:
+    """
+    Reads all serial ports from one thread and dispatches their records.
+
+    The thread waits on the ports with a selector, so bytes are read as soon
+    as they arrive instead of on a fixed polling period, and a burst of
+    lines is read and dispatched at once. Each port is opened once, however
+    many providers subscribe to it, and closed with its last subscription.
+
+    Subscription callbacks run on the reactor thread and must not block.
+    """
+
+    def __init__(self):
+        """
+        Initialize the reactor with no open port.
+        """
+        self._lock = threading.Lock()
+        self._ports: Dict[str, _SerialPort] = {}
+        self._selector = selectors.DefaultSelector()
+
+        # Written to wake the selector when it must stop
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        port: str,
+        callback: Callable[[SerialRecord], None],
+        baudrate: int = 115200,
+        kinds: Optional[Iterable[str]] = None,
+        on_close: Optional[Callable[[SerialSubscription], None]] = None,
+    ) -> SerialSubscription:
+        """
+        Receive the records of a serial port, opening it if needed.
+
+        Parameters
+        ----------
+        port : str
+            The serial port.
+        callback : Callable[[SerialRecord], None]
+            Called on the reactor thread with each record.
+        baudrate : int
+            The baud rate to open the port with. Ignored if the port is
+            already open.
+        kinds : Optional[Iterable[str]]
+            The record kinds to receive, None for all.
+        on_close : Optional[Callable[[SerialSubscription], None]]
+            Called with the subscription if the reactor closes the port, e.g.
+            on disconnection, but not on unsubscribe.
+
+        Returns
+        -------
+        SerialSubscription
+            The subscription, to pass to unsubscribe.
+
+        Raises
+        ------
+        serial.SerialException
+            If the port cannot be opened.
+        """
+        subscription = SerialSubscription(
+            port=port,
+            callback=callback,
+            kinds=frozenset(kinds) if kinds is not None else None,
+            on_close=on_close,
+        )
+
+        with self._lock:
+            serial_port = self._ports.get(port)
+            if serial_port is None:
+                serial_port = _SerialPort(name=port, device=self._open(port, baudrate))
+                self._ports[port] = serial_port
+                self._selector.register(
+                    serial_port.device.fileno(), selectors.EVENT_READ, serial_port
+                )
+                logging.info(f"Connected to {port} at {baudrate} baud")
+            elif serial_port.device.baudrate != baudrate:
+                logging.warning(
+                    f"Serial port {port} is open at {serial_port.device.baudrate} "
+                    f"baud, ignoring the requested {baudrate} baud"
+                )
+            serial_port.subscriptions.append(subscription)
+
+        self.start()
+        return subscription
+
+    def unsubscribe(self, subscription: SerialSubscription) -> None:
+        """
+        Stop receiving records, closing the port after its last subscription.
+
+        Parameters
+        ----------
+        subscription : SerialSubscription
+            The subscription returned by subscribe.
+        """
+        with self._lock:
+            serial_port = self._ports.get(subscription.port)
+            if serial_port is None or subscription not in serial_port.subscriptions:
+                return
+
+            serial_port.subscriptions.remove(subscription)
+            if not serial_port.subscriptions:
+                self._close(serial_port)
+
+    def start(self) -> None:
+        """
+        Start the reactor thread if not already running.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the reactor thread and close all ports.
+        """
+        self.running = False
+        os.write(self._wakeup_write, b"\0")
+        if self._thread:
+            logging.info("Stopping serial reactor")
+            self._thread.join(timeout=5)
+
+        closed: List[SerialSubscription] = []
+        with self._lock:
+            for serial_port in list(self._ports.values()):
+                closed += self._close(serial_port)
+        self._notify_closed(closed)
+
+    @property
+    def ports(self) -> List[str]:
+        """
+        Get the open serial ports.
+
+        Returns
+        -------
+        List[str]
+            The ports with at least one subscription.
+        """
+        with self._lock:
+            return list(self._ports)
+
+    def _open(self, port: str, baudrate: int) -> Any:
+        """
+        Open a serial port without a read timeout.
+
+        Parameters
+        ----------
+        port : str
+            The serial port.
+        baudrate : int
+            The baud rate.
+
+        Returns
+        -------
+        serial.Serial
+            The open port.
+        """
+        device = serial.Serial(port, baudrate, timeout=0)
+        device.reset_input_buffer()
+        return device
+
+    def _close(self, serial_port: _SerialPort) -> List[SerialSubscription]:
+        """
+        Close a port. Must be called with the lock held.
+
+        Parameters
+        ----------
+        serial_port : _SerialPort
+            The port to close.
+
+        Returns
+        -------
+        List[SerialSubscription]
+            The subscriptions ended by the closing, to pass to _notify_closed
+            once the lock is released.
+        """
+        self._ports.pop(serial_port.name, None)
+        closed = serial_port.subscriptions
+        serial_port.subscriptions = []
+        try:
+            self._selector.unregister(serial_port.device.fileno())
+        except (KeyError, ValueError):
+            pass
+        try:
+            serial_port.device.close()
+        except Exception as e:
+            logging.warning(f"Error closing serial port {serial_port.name}: {e}")
+        logging.info(f"Closed serial port {serial_port.name}")
+        return closed
+
+    def _notify_closed(self, subscriptions: List[SerialSubscription]) -> None:
+        """
+        Tell subscribers that the reactor ended their subscriptions.
+
+        Parameters
+        ----------
+        subscriptions : List[SerialSubscription]
+            The subscriptions whose port was closed.
+        """
+        for subscription in subscriptions:
+            if subscription.on_close is None:
+                continue
+            try:
+                subscription.on_close(subscription)
+            except Exception as e:
+                logging.warning(
+                    f"Error handling the closing of serial port {subscription.port}: "
+                    f"{e}"
+                )
+
+    def _run(self) -> None:
+        """
+        Main loop of the reactor.
+        """
+        while self.running:
+            for key, _ in self._selector.select(timeout=1.0):
+                if key.fd == self._wakeup_read:
+                    try:
+                        os.read(self._wakeup_read, READ_SIZE)
+                    except BlockingIOError:
+                        pass
+                    continue
+                self._read(key.data)
+
+    def _read(self, serial_port: _SerialPort) -> None:
+        """
+        Read the bytes waiting on a port and dispatch its complete lines.
+
+        Parameters
+        ----------
+        serial_port : _SerialPort
+            The readable port.
+        """
+        with self._lock:
+            if self._ports.get(serial_port.name) is not serial_port:
+                # Closed while the selector was waiting
+                return
+
+            try:
+                data = os.read(serial_port.device.fileno(), READ_SIZE)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                data = b""
+                logging.error(f"Error reading serial port {serial_port.name}: {e}")
+
+            if not data:
+                logging.error(f"Serial port {serial_port.name} disconnected")
+                closed = self._close(serial_port)
+            else:
+                timestamp = time.time()
+                lines = serial_port.framer.feed(data)
+                subscriptions = list(serial_port.subscriptions)
+
+        if not data:
+            self._notify_closed(closed)
+            return
+
+        for line in lines:
+            record = parse_line(serial_port.name, line, timestamp)
+            if record is None:
+                continue
+            for subscription in subscriptions:
+                if not subscription.wants(record):
+                    continue
+                try:
+                    subscription.callback(record)
+                except Exception as e:
+                    logging.warning(
+                        f"Error handling serial record from {record.port}: "
+                        f"{record.line} ({e})"
+                    )
@@ -1,7 +1,10 @@
 import asyncio
+import logging
 import threading
+import time
 from typing import Optional
 
+from .io_provider import IOProvider
 from .singleton import singleton
 
 
@@ -13,6 +16,11 @@ class SleepTickerProvider:
     This class provides a thread-safe way to manage sleep operations that can be
     skipped/cancelled. It uses a lock mechanism to ensure thread safety when
     modifying the skip state.
+
+    Besides the fixed-rate sleep, it supports event-driven scheduling: inputs
+    notify the IOProvider when their buffer changes, and
+    wait_for_input_change wakes the caller on the next change instead of
+    after a fixed period.
     """
 
     def __init__(self):
@@ -26,6 +34,13 @@ class SleepTickerProvider:
         self._skip_sleep: bool = False
         self._current_sleep_task: Optional[asyncio.Task] = None
 
+        self._input_changed: bool = False
+        self._input_changed_event: Optional[asyncio.Event] = None
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._last_wake_time: Optional[float] = None
+
+        IOProvider().register_input_change_callback(self.notify_input_changed)
+
     @property
     def skip_sleep(self) -> bool:
         """
@@ -83,3 +98,106 @@ class SleepTickerProvider:
             pass
         finally:
             self._current_sleep_task = None
+
+    def notify_input_changed(self, key: Optional[str] = None) -> None:
+        """
+        Signal that an input buffer changed. Safe to call from any thread.
+
+        Parameters
+        ----------
+        key : Optional[str]
+            The identifier of the input that changed.
+        """
+        with self._lock:
+            self._input_changed = True
+            loop = self._event_loop
+            event = self._input_changed_event
+
+        if loop is None or event is None or loop.is_closed():
+            return
+
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # the loop closed between the check and the call
+            pass
+
+    async def wait_for_input_change(
+        self,
+        min_interval: float,
+        max_idle: float,
+        debounce: float = 0.0,
+    ) -> bool:
+        """
+        Wait until an input buffer changes, instead of sleeping a fixed period.
+
+        The wait ends on the first input change, followed by a debounce window
+        to coalesce bursts of changes, and never earlier than min_interval
+        after the previous wake. Without any change, it ends after max_idle
+        as a heartbeat. Like sleep, the wait is cancelled when skip_sleep is
+        set to True.
+
+        Parameters
+        ----------
+        min_interval : float
+            Minimum time in seconds between two consecutive wakes.
+        max_idle : float
+            Maximum time in seconds to wait without any input change.
+        debounce : float
+            Time in seconds to wait after a change for further changes.
+
+        Returns
+        -------
+        bool
+            True if an input changed, False on a heartbeat or skipped wait.
+        """
+        changed = False
+        try:
+            self._current_sleep_task = asyncio.create_task(
+                self._wait_for_input_change(min_interval, max_idle, debounce)
+            )
+            changed = await self._current_sleep_task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._current_sleep_task = None
+            self._last_wake_time = time.monotonic()
+
+        return changed
+
+    async def _wait_for_input_change(
+        self, min_interval: float, max_idle: float, debounce: float
+    ) -> bool:
+        """
+        Wait for an input change, see wait_for_input_change.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._event_loop is not loop or self._input_changed_event is None:
+                self._event_loop = loop
+                self._input_changed_event = asyncio.Event()
+            event = self._input_changed_event
+            if self._input_changed:
+                event.set()
+
+        last_wake = self._last_wake_time or time.monotonic()
+        idle_remaining = max(0.0, last_wake + max_idle - time.monotonic())
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout=idle_remaining)
+        except asyncio.TimeoutError:
+            logging.debug("No input change, heartbeat tick")
+            return False
+
+        if debounce > 0:
+            await asyncio.sleep(debounce)
+
+        interval_remaining = last_wake + min_interval - time.monotonic()
+        if interval_remaining > 0:
+            await asyncio.sleep(interval_remaining)
+
+        with self._lock:
+            self._input_changed = False
+            event.clear()
+
+        return True
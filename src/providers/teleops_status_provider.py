@@ -1,12 +1,11 @@
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
-import requests
-
+from .http_client_pool import HTTPClientPool, HTTPResponse
 from .singleton import singleton
 
 
@@ -226,7 +225,7 @@ class TeleopsStatusProvider:
         """
         self.api_key = api_key
         self.base_url = base_url
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.http = HTTPClientPool()
 
     def get_status(self) -> dict:
         """
@@ -237,44 +236,34 @@ class TeleopsStatusProvider:
             return {}
 
         api_key_id = self.api_key[9:25] if len(self.api_key) > 25 else self.api_key
-        request = requests.get(
+        request = self.http.request_sync(
+            "GET",
             f"{self.base_url}/{api_key_id}",
             headers={"Authorization": f"Bearer {self.api_key}"},
         )
-        if request.status_code == 200:
+        if request.status == 200:
             return request.json()
         else:
-            logging.error(
-                f"Failed to get status: {request.status_code} - {request.text}"
-            )
+            logging.error(f"Failed to get status: {request.status} - {request.text()}")
             return {}
 
-    def _share_status_worker(self, status: TeleopsStatus):
+    def _share_status_done(self, future: "Future[HTTPResponse]"):
         """
-        Worker function to share the status of the machine.
-        This function runs in a separate thread to avoid blocking the main thread.
+        Log the outcome of sharing the status of the machine.
 
         Parameters
         ----------
-        status : TeleopsStatus
-            The status of the machine to be shared.
+        future : Future[HTTPResponse]
+            The future of the status request.
         """
-        if self.api_key is None or self.api_key == "":
-            logging.error("API key is missing. Cannot share status.")
-            return
-
         try:
-            request = requests.post(
-                self.base_url,
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json=status.to_dict(),
-            )
+            request = future.result()
 
-            if request.status_code == 200:
+            if request.status == 200:
                 logging.debug(f"Status shared successfully: {request.json()}")
             else:
                 logging.error(
-                    f"Failed to share status: {request.status_code} - {request.text}"
+                    f"Failed to share status: {request.status} - {request.text()}"
                 )
         except Exception as e:
             logging.error(f"Error sharing status: {str(e)}")
@@ -282,12 +271,22 @@ class TeleopsStatusProvider:
     def share_status(self, status: TeleopsStatus):
         """
         Share the status of the machine.
-        This function submits the status sharing task to a thread pool executor
-        to run in a separate thread.
+        The request is sent by the shared HTTP client pool in the background,
+        so this function does not block.
 
         Parameters
         ----------
         status : TeleopsStatus
             The status of the machine to be shared.
         """
-        self.executor.submit(self._share_status_worker, status)
+        if self.api_key is None or self.api_key == "":
+            logging.error("API key is missing. Cannot share status.")
+            return
+
+        future = self.http.submit(
+            "POST",
+            self.base_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json=status.to_dict(),
+        )
+        future.add_done_callback(self._share_status_done)
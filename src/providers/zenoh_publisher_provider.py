@@ -1,13 +1,17 @@
-import json
 import logging
-import threading
 import time
-from queue import Empty, Queue
 from typing import Optional
 
 import zenoh
 from zenoh import ZBytes
 
+from providers.outbound_publisher import (
+    DeliveryPolicy,
+    OutboundPublisher,
+    OutboundStats,
+    ZenohPublisherCache,
+    encode_json,
+)
 from zenoh_msgs import open_zenoh_session
 
 
@@ -15,11 +19,16 @@ class ZenohPublisherProvider:
     """
     Publisher provider for sending messages using a Zenoh session.
 
-    This class manages a Zenoh session, a message queue, and a worker thread that
-    continuously publishes queued messages to a specified topic.
+    This class manages a Zenoh session and an OutboundPublisher whose worker
+    thread publishes queued messages in batches, in order, to a specified
+    topic through a declared publisher.
     """
 
-    def __init__(self, topic: str = "speech"):
+    def __init__(
+        self,
+        topic: str = "speech",
+        policy: DeliveryPolicy = DeliveryPolicy.ORDERED,
+    ):
         """
         Initialize the Zenoh publisher provider and create a Zenoh session.
 
@@ -27,6 +36,9 @@ class ZenohPublisherProvider:
         ----------
         topic : str, optional
             The topic on which to publish messages (default is "speech").
+        policy : DeliveryPolicy, optional
+            How pending messages are delivered (default is ORDERED). Use
+            LATEST for status topics where only the newest message matters.
         """
         self.session: Optional[zenoh.Session] = None
 
@@ -39,11 +51,50 @@ class ZenohPublisherProvider:
 
         self.pub_topic = topic
 
-        # Pending message queue and threading constructs
-        self._pending_messages = Queue()
-        self._lock = threading.Lock()
-        self.running: bool = False
-        self._thread: Optional[threading.Thread] = None
+        self._publishers: Optional[ZenohPublisherCache] = None
+        if self.session is not None:
+            self._publishers = ZenohPublisherCache(self.session)
+
+        self._outbound = OutboundPublisher(
+            self._publish_message, name=f"Zenoh publisher {topic}"
+        )
+        self._outbound.configure(topic, policy, encode=encode_json)
+
+    @property
+    def running(self) -> bool:
+        """
+        Check whether the publisher thread is running.
+
+        Returns
+        -------
+        bool
+            True if the provider is started
+        """
+        return self._outbound.running
+
+    @property
+    def stats(self) -> OutboundStats:
+        """
+        Get the queue depth and publish latency counters.
+
+        Returns
+        -------
+        OutboundStats
+            The counters of the outbound publisher
+        """
+        return self._outbound.stats
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get the number of messages waiting to be published.
+
+        Returns
+        -------
+        int
+            The pending messages
+        """
+        return self._outbound.queue_depth
 
     def add_pending_message(self, text: str):
         """
@@ -55,25 +106,25 @@ class ZenohPublisherProvider:
             The textual content to be published as a message.
         """
         msg = {"time_stamp": time.time(), "message": text}
-        logging.info(f"Queueing message: {msg}")
-        self._pending_messages.put(msg)
+        logging.debug(f"Queueing message: {msg}")
+        self._outbound.publish(self.pub_topic, msg)
 
-    def _publish_message(self, msg: dict):
+    def _publish_message(self, topic: str, payload: str):
         """
-        Publish a single message using the Zenoh session.
+        Publish a single encoded message using the Zenoh session.
 
         Parameters
         ----------
-        msg : The message to be published.
+        topic : str
+            The topic to publish on.
+        payload : str
+            The JSON encoded message.
         """
-        # Attempt to write the message with a timeout of 0.5 seconds
-
-        if self.session is None:
+        if self._publishers is None:
             logging.info("No open Zenoh session, returning")
             return
-        logging.info("Publishing message: {} ".format(msg))
-        payload = ZBytes(json.dumps(msg))
-        self.session.put(self.pub_topic, payload)
+        logging.debug(f"Publishing message: {payload}")
+        self._publishers.put(topic, ZBytes(payload))
 
     def start(self):
         """
@@ -82,32 +133,34 @@ class ZenohPublisherProvider:
         if self.running:
             return
 
-        self.running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._outbound.start()
         logging.info("Zenoh Publisher Provider started")
 
-    def _run(self):
+    def flush(self, timeout: Optional[float] = None) -> bool:
         """
-        Internal loop that processes and publishes pending messages.
+        Wait until every queued message is published.
+
+        Parameters
+        ----------
+        timeout : Optional[float]
+            Seconds to wait at most, None to wait indefinitely.
+
+        Returns
+        -------
+        bool
+            True if nothing is left to publish
         """
-        while self.running:
-            try:
-                # Wait up to 0.5 seconds for a message.
-                msg = self._pending_messages.get(timeout=0.5)
-                self._publish_message(msg)
-            except Empty:
-                continue
-            except Exception as e:
-                logging.exception("Exception in publisher thread: %s", e)
+        return self._outbound.flush(timeout)
 
     def stop(self):
         """
         Stop the publisher provider and clean up resources.
         """
-        self.running = False
-        if self._thread:
-            self._thread.join(timeout=5)
+        self._outbound.stop()
+        if self._publishers is not None:
+            self._publishers.close()
         if self.session is not None:
             self.session.close()
-        logging.info("Zenoh Publisher Provider stopped")
+        logging.info(
+            f"Zenoh Publisher Provider stopped, stats: {self._outbound.stats.to_dict()}"
+        )
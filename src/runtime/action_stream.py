@@ -0,0 +1,93 @@
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from llm.output_model import Action, CortexOutputModel
+from providers.io_provider import IOProvider
+
+
+class ActionStream:
+    """
+    Dispatches the actions of one LLM request exactly once, whether they
+    are streamed one by one or arrive with the complete output.
+
+    Streamed actions are dispatched as soon as the LLM plugin completes them.
+    When the complete output arrives, only the actions not streamed yet, e.g.
+    all of them for a non-streaming LLM or a cached response, are dispatched.
+    A stream bound to an LLMRequestPipeline request drops its streamed
+    actions once a newer request has dispatched.
+
+    Parameters
+    ----------
+    dispatch : Callable[[List[Action]], Awaitable[None]]
+        Hands actions to the simulators and action connectors.
+    """
+
+    def __init__(self, dispatch: Callable[[List[Action]], Awaitable[None]]):
+        """
+        Initialize the stream with no dispatched actions.
+        """
+        self._dispatch = dispatch
+        self._dispatched: List[Action] = []
+        self._admit: Optional[Callable[[], bool]] = None
+        self.io_provider = IOProvider()
+
+    def bind(self, admit: Callable[[], bool]) -> None:
+        """
+        Check streamed actions with the staleness check of their request.
+
+        Parameters
+        ----------
+        admit : Callable[[], bool]
+            Called before dispatching a streamed action, returns False if
+            the request is stale.
+        """
+        self._admit = admit
+
+    @property
+    def dispatched(self) -> int:
+        """
+        Get the number of actions dispatched so far.
+        """
+        return len(self._dispatched)
+
+    async def on_action(self, action: Action) -> None:
+        """
+        Dispatch a streamed action.
+
+        Parameters
+        ----------
+        action : Action
+            The action, complete as soon as the LLM produced it.
+        """
+        if self._admit is not None and not self._admit():
+            logging.debug(f"Dropping streamed action of a stale request: {action}")
+            return
+        logging.debug(f"Dispatching streamed action: {action}")
+        await self._send([action])
+
+    async def finish(self, output: CortexOutputModel) -> None:
+        """
+        Dispatch the actions of the complete output that were not streamed.
+
+        Parameters
+        ----------
+        output : CortexOutputModel
+            The complete LLM output.
+        """
+        remaining = [
+            action
+            for action in output.actions
+            if not any(action is sent for sent in self._dispatched)
+        ]
+        if remaining:
+            await self._send(remaining)
+
+    async def _send(self, actions: List[Action]) -> None:
+        """
+        Dispatch actions, recording the time to the first one.
+        """
+        if not self._dispatched:
+            self.io_provider.record_llm_first_action(time.time())
+        self._dispatched.extend(actions)
+        await self._dispatch(actions)
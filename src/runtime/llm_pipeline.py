@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Awaitable, Callable, Dict, Optional
+
+from llm.output_model import CortexOutputModel
+from providers.latency_histogram import LatencyHistogram
+from runtime.action_stream import ActionStream
+
+
+class LLMRequestPipeline:
+    """
+    Runs cortex LLM requests, optionally several at a time.
+
+    With max_in_flight set to 1, each request is awaited before the tick
+    completes, which is the classic serial behavior. With a larger value,
+    requests run in the background so one slow response does not stall the
+    cortex loop:
+
+    - at most max_in_flight requests run at once; submitting beyond that
+      cancels the oldest one, which is superseded by the newer input snapshot,
+    - once a response is dispatched, older requests still in flight are
+      cancelled, and any older response that completes anyway is dropped as
+      stale,
+    - actions streamed before the response completes go through the same
+      check: the first one dispatched counts as the dispatch of its
+      request, and those of a stale request are dropped.
+
+    Note that concurrent requests share the LLM conversation history.
+
+    Parameters
+    ----------
+    max_in_flight : int
+        Maximum number of concurrent LLM requests.
+    """
+
+    OUTCOMES = ("dispatched", "empty", "stale", "failed")
+
+    def __init__(self, max_in_flight: int = 1):
+        """
+        Initialize the LLMRequestPipeline.
+        """
+        self.max_in_flight = max_in_flight
+
+        self._next_sequence = 0
+        self._last_dispatched_sequence = -1
+        self._in_flight: Dict[int, asyncio.Task] = {}
+
+        self.latency_histograms: Dict[str, LatencyHistogram] = {
+            outcome: LatencyHistogram() for outcome in self.OUTCOMES
+        }
+        self.cancelled_requests = 0
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Get the number of requests currently running in the background.
+        """
+        return len(self._in_flight)
+
+    async def submit(
+        self,
+        request: Callable[[], Awaitable[Optional[CortexOutputModel]]],
+        dispatch: Callable[[CortexOutputModel], Awaitable[None]],
+        stream: Optional[ActionStream] = None,
+    ) -> None:
+        """
+        Submit an LLM request for the latest input snapshot.
+
+        Parameters
+        ----------
+        request : Callable[[], Awaitable[Optional[CortexOutputModel]]]
+            Starts the LLM request and returns its output.
+        dispatch : Callable[[CortexOutputModel], Awaitable[None]]
+            Hands a fresh, non-empty output to the simulators and actions.
+        stream : ActionStream, optional
+            The stream the request dispatches its streamed actions to, bound
+            to the staleness check of the request.
+        """
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        if stream is not None:
+            stream.bind(partial(self._admit, sequence))
+
+        if self.max_in_flight <= 1:
+            start_time = time.perf_counter()
+            output = await request()
+            if output is None:
+                self._observe("empty", start_time)
+                logging.debug("No output from LLM")
+                return
+            self._observe("dispatched", start_time)
+            await dispatch(output)
+            return
+
+        while len(self._in_flight) >= self.max_in_flight:
+            oldest = next(iter(self._in_flight))
+            logging.debug(f"Cancelling superseded LLM request {oldest}")
+            self._cancel(oldest)
+
+        task = asyncio.create_task(self._run(sequence, request, dispatch))
+        self._in_flight[sequence] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(sequence, None))
+
+    def cancel_all(self) -> None:
+        """
+        Cancel all requests running in the background, e.g. on reload or mode change.
+        """
+        for sequence in list(self._in_flight):
+            self._cancel(sequence)
+
+    def latency_summary(self) -> Dict[str, Dict[str, object]]:
+        """
+        Get the latency histograms of all request outcomes.
+
+        Returns
+        -------
+        Dict[str, Dict[str, object]]
+            The histograms keyed by outcome: dispatched, empty, stale, failed.
+        """
+        return {
+            outcome: histogram.to_dict()
+            for outcome, histogram in self.latency_histograms.items()
+        }
+
+    async def _run(
+        self,
+        sequence: int,
+        request: Callable[[], Awaitable[Optional[CortexOutputModel]]],
+        dispatch: Callable[[CortexOutputModel], Awaitable[None]],
+    ) -> None:
+        """
+        Run a background request and dispatch its output unless it is stale.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number of the request, increasing with each submit.
+        request : Callable[[], Awaitable[Optional[CortexOutputModel]]]
+            Starts the LLM request and returns its output.
+        dispatch : Callable[[CortexOutputModel], Awaitable[None]]
+            Hands a fresh, non-empty output to the simulators and actions.
+        """
+        start_time = time.perf_counter()
+        try:
+            output = await request()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._observe("failed", start_time)
+            logging.error(f"Error in LLM request {sequence}: {e}")
+            return
+
+        if sequence < self._last_dispatched_sequence:
+            self._observe("stale", start_time)
+            logging.debug(f"Dropping stale LLM response {sequence}")
+            return
+
+        if output is None:
+            self._observe("empty", start_time)
+            logging.debug("No output from LLM")
+            return
+
+        self._observe("dispatched", start_time)
+        self._admit(sequence)
+
+        try:
+            await dispatch(output)
+        except Exception as e:
+            logging.error(f"Error dispatching LLM response {sequence}: {e}")
+
+    def _admit(self, sequence: int) -> bool:
+        """
+        Check that a request is not stale before dispatching its output or
+        a streamed action, and record the dispatch.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number of the request.
+
+        Returns
+        -------
+        bool
+            False if a newer request has already dispatched.
+        """
+        if sequence < self._last_dispatched_sequence:
+            return False
+        if sequence > self._last_dispatched_sequence:
+            self._last_dispatched_sequence = sequence
+            # older requests can only produce stale responses from now on
+            for older in [s for s in self._in_flight if s < sequence]:
+                self._cancel(older)
+        return True
+
+    def _cancel(self, sequence: int) -> None:
+        """
+        Cancel a background request.
+
+        Parameters
+        ----------
+        sequence : int
+            The sequence number of the request.
+        """
+        task = self._in_flight.pop(sequence, None)
+        if task is not None and not task.done():
+            task.cancel()
+            self.cancelled_requests += 1
+
+    def _observe(self, outcome: str, start_time: float) -> None:
+        """
+        Record the latency of a completed request.
+
+        Parameters
+        ----------
+        outcome : str
+            The outcome of the request.
+        start_time : float
+            The perf_counter value when the request started.
+        """
+        self.latency_histograms[outcome].observe(time.perf_counter() - start_time)
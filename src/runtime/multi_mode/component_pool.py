@@ -0,0 +1,189 @@
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+# Components that can be shared by several modes. Actions and LLMs read the
+# mode they belong to and carry per-mode state, and simulators and
+# backgrounds are run by the orchestrators of one mode, so they stay per mode.
+SHARED_KINDS = frozenset({"input"})
+
+ComponentKey = Tuple[Any, ...]
+
+
+class ComponentPool:
+    """
+    Reference-counted pool of the components of loaded modes.
+
+    A component is identified by its kind, type and configuration, without
+    the name of the mode that loaded it. Components of a shared kind with the
+    same identity in several modes are created once and kept until the last
+    mode owning them is released; the others are scoped to their mode.
+
+    Parameters
+    ----------
+    shared_kinds : Set[str]
+        Kinds of components shared across modes.
+    """
+
+    def __init__(self, shared_kinds: Set[str] = SHARED_KINDS):
+        """
+        Initialize an empty pool.
+        """
+        self.shared_kinds = shared_kinds
+
+        self._lock = threading.Lock()
+        self._components: Dict[ComponentKey, Any] = {}
+        self._owners: Dict[ComponentKey, Set[str]] = {}
+        self._owned: Dict[str, List[ComponentKey]] = {}
+        # Held while a component is created, so concurrent modes create it once
+        self._creating: Dict[ComponentKey, threading.Lock] = {}
+
+    def key(
+        self, kind: str, type_name: str, config: Dict[str, Any], owner: str
+    ) -> ComponentKey:
+        """
+        Get the identity of a component.
+
+        Parameters
+        ----------
+        kind : str
+            The component kind, e.g. "input" or "action".
+        type_name : str
+            The component type.
+        config : Dict[str, Any]
+            The component configuration.
+        owner : str
+            The mode loading the component.
+
+        Returns
+        -------
+        ComponentKey
+            The identity, scoped to the owner unless the kind is shared.
+        """
+        identity = {k: v for k, v in config.items() if k != "mode"}
+        scope = "*" if kind in self.shared_kinds else owner
+        return (
+            kind,
+            scope,
+            type_name,
+            json.dumps(identity, sort_keys=True, default=repr),
+        )
+
+    def acquire(
+        self,
+        kind: str,
+        type_name: str,
+        config: Dict[str, Any],
+        factory: Callable[[], Any],
+        owner: str,
+    ) -> Any:
+        """
+        Get a component for a mode, creating it if no mode holds it yet.
+
+        Parameters
+        ----------
+        kind : str
+            The component kind.
+        type_name : str
+            The component type.
+        config : Dict[str, Any]
+            The component configuration.
+        factory : Callable[[], Any]
+            Creates the component.
+        owner : str
+            The mode loading the component.
+
+        Returns
+        -------
+        Any
+            The pooled component.
+        """
+        base = self.key(kind, type_name, config, owner)
+        with self._lock:
+            owned = self._owned.setdefault(owner, [])
+            # Identical entries of one mode are distinct components
+            key = base + (sum(1 for k in owned if k[:-1] == base),)
+            owned.append(key)
+            owners = self._owners.setdefault(key, set())
+            owners.add(owner)
+            if key in self._components:
+                logging.debug(f"Reusing {kind} {type_name} for mode {owner}")
+                return self._components[key]
+            creating = self._creating.setdefault(key, threading.Lock())
+
+        with creating:
+            with self._lock:
+                if key in self._components:
+                    logging.debug(f"Reusing {kind} {type_name} for mode {owner}")
+                    return self._components[key]
+
+            try:
+                component = factory()
+            except Exception:
+                with self._lock:
+                    owned.remove(key)
+                    owners.discard(owner)
+                    if not owners:
+                        del self._owners[key]
+                        self._creating.pop(key, None)
+                raise
+
+            with self._lock:
+                self._components[key] = component
+                return component
+
+    def release(self, owner: str) -> List[Any]:
+        """
+        Release the components held by a mode.
+
+        Parameters
+        ----------
+        owner : str
+            The mode to release.
+
+        Returns
+        -------
+        List[Any]
+            The components no other mode holds, now dropped from the pool.
+        """
+        dropped = []
+        with self._lock:
+            for key in self._owned.pop(owner, []):
+                owners = self._owners.get(key)
+                if owners is None:
+                    continue
+                owners.discard(owner)
+                if not owners:
+                    del self._owners[key]
+                    self._creating.pop(key, None)
+                    component = self._components.pop(key, None)
+                    if component is not None:
+                        dropped.append(component)
+        return dropped
+
+    def refcount(self, component: Any) -> int:
+        """
+        Get the number of modes holding a component.
+
+        Parameters
+        ----------
+        component : Any
+            The component.
+
+        Returns
+        -------
+        int
+            The number of modes, 0 if the component is not pooled.
+        """
+        with self._lock:
+            for key, pooled in self._components.items():
+                if pooled is component:
+                    return len(self._owners.get(key, ()))
+        return 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of pooled components.
+        """
+        return len(self._components)
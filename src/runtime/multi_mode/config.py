@@ -2,7 +2,7 @@ import logging
 import os
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import AbstractSet, Any, Callable, Dict, List, Optional
 
 import json5
 
@@ -13,6 +13,7 @@ from backgrounds.base import Background, BackgroundConfig
 from inputs import load_input
 from inputs.base import Sensor, SensorConfig
 from llm import LLM, LLMConfig, load_llm
+from runtime.multi_mode.component_pool import ComponentPool
 from runtime.multi_mode.hook import (
     LifecycleHook,
     LifecycleHookType,
@@ -92,6 +93,17 @@ class ModeConfig:
     remember_locations: bool = False
     save_interactions: bool = False
 
+    event_driven: bool = False
+    event_debounce_seconds: float = 0.05
+    event_min_interval_seconds: Optional[float] = None
+    event_max_idle_seconds: float = 10.0
+
+    dedupe_ticks: bool = False
+    dedupe_ttl_seconds: float = 30.0
+    dedupe_reuse_output: bool = False
+
+    llm_max_in_flight: int = 1
+
     lifecycle_hooks: List[LifecycleHook] = field(default_factory=list)
     _raw_lifecycle_hooks: List[Dict] = field(default_factory=list)
 
@@ -140,6 +152,14 @@ class ModeConfig:
             api_key=global_config.api_key,
             URID=global_config.URID,
             unitree_ethernet=global_config.unitree_ethernet,
+            event_driven=self.event_driven,
+            event_debounce_seconds=self.event_debounce_seconds,
+            event_min_interval_seconds=self.event_min_interval_seconds,
+            event_max_idle_seconds=self.event_max_idle_seconds,
+            dedupe_ticks=self.dedupe_ticks,
+            dedupe_ttl_seconds=self.dedupe_ttl_seconds,
+            dedupe_reuse_output=self.dedupe_reuse_output,
+            llm_max_in_flight=self.llm_max_in_flight,
         )
 
     def load_components(self, system_config: "ModeSystemConfig"):
@@ -174,7 +194,10 @@ class ModeConfig:
         )
 
     async def execute_lifecycle_hooks(
-        self, hook_type: LifecycleHookType, context: Optional[Dict[str, Any]] = None
+        self,
+        hook_type: LifecycleHookType,
+        context: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> bool:
         """
         Execute all lifecycle hooks of the specified type for this mode.
@@ -185,6 +208,8 @@ class ModeConfig:
             The type of lifecycle hooks to execute
         context : Optional[Dict[str, Any]]
             Context information to pass to the hooks
+        deadline : Optional[float]
+            time.monotonic() time by which the hooks must be done
 
         Returns
         -------
@@ -202,7 +227,9 @@ class ModeConfig:
             }
         )
 
-        return await execute_lifecycle_hooks(self.lifecycle_hooks, hook_type, context)
+        return await execute_lifecycle_hooks(
+            self.lifecycle_hooks, hook_type, context, deadline
+        )
 
 
 @dataclass
@@ -217,6 +244,8 @@ class ModeSystemConfig:
     config_name: str = ""
     allow_manual_switching: bool = True
     mode_memory_enabled: bool = True
+    warm_mode_switching: bool = False
+    transition_deadline_seconds: Optional[float] = None
 
     # Global parameters
     api_key: Optional[str] = None
@@ -238,7 +267,10 @@ class ModeSystemConfig:
     transition_rules: List[TransitionRule] = field(default_factory=list)
 
     async def execute_global_lifecycle_hooks(
-        self, hook_type: LifecycleHookType, context: Optional[Dict[str, Any]] = None
+        self,
+        hook_type: LifecycleHookType,
+        context: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> bool:
         """
         Execute all global lifecycle hooks of the specified type.
@@ -249,6 +281,8 @@ class ModeSystemConfig:
             The type of lifecycle hooks to execute
         context : Optional[Dict[str, Any]]
             Context information to pass to the hooks
+        deadline : Optional[float]
+            time.monotonic() time by which the hooks must be done
 
         Returns
         -------
@@ -261,7 +295,7 @@ class ModeSystemConfig:
         context.update({"system_name": self.name, "is_global_hook": True})
 
         return await execute_lifecycle_hooks(
-            self.global_lifecycle_hooks, hook_type, context
+            self.global_lifecycle_hooks, hook_type, context, deadline
         )
 
 
@@ -329,6 +363,8 @@ def load_mode_config(
         config_name=config_name,
         allow_manual_switching=raw_config.get("allow_manual_switching", True),
         mode_memory_enabled=raw_config.get("mode_memory_enabled", True),
+        warm_mode_switching=raw_config.get("warm_mode_switching", False),
+        transition_deadline_seconds=raw_config.get("transition_deadline_seconds"),
         api_key=g_api_key,
         robot_ip=g_robot_ip,
         URID=g_URID,
@@ -353,6 +389,14 @@ def load_mode_config(
             timeout_seconds=mode_data.get("timeout_seconds"),
             remember_locations=mode_data.get("remember_locations", False),
             save_interactions=mode_data.get("save_interactions", False),
+            event_driven=mode_data.get("event_driven", False),
+            event_debounce_seconds=mode_data.get("event_debounce_seconds", 0.05),
+            event_min_interval_seconds=mode_data.get("event_min_interval_seconds"),
+            event_max_idle_seconds=mode_data.get("event_max_idle_seconds", 10.0),
+            dedupe_ticks=mode_data.get("dedupe_ticks", False),
+            dedupe_ttl_seconds=mode_data.get("dedupe_ttl_seconds", 30.0),
+            dedupe_reuse_output=mode_data.get("dedupe_reuse_output", False),
+            llm_max_in_flight=mode_data.get("llm_max_in_flight", 1),
             _raw_inputs=mode_data.get("agent_inputs", []),
             _raw_llm=mode_data.get("cortex_llm"),
             _raw_simulators=mode_data.get("simulators", []),
@@ -379,7 +423,16 @@ def load_mode_config(
     return mode_system_config
 
 
-def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConfig):
+# Kinds of the components of a mode
+COMPONENT_KINDS = frozenset({"input", "simulator", "action", "background", "llm"})
+
+
+def _load_mode_components(
+    mode_config: ModeConfig,
+    system_config: ModeSystemConfig,
+    pool: Optional[ComponentPool] = None,
+    kinds: AbstractSet[str] = COMPONENT_KINDS,
+):
     """
     Load the actual component instances for a mode.
 
@@ -389,6 +442,13 @@ def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConf
         The mode configuration to load components for.
     system_config : ModeSystemConfig
         The global system configuration containing shared settings
+    pool : ComponentPool, optional
+        Pool to take the components from, so that modes can share them. If
+        None, fresh instances are created.
+    kinds : AbstractSet[str]
+        The kinds of components to load, among COMPONENT_KINDS. The
+        components of the other kinds are left as they are. The LLM is
+        created with the actions, so "llm" requires "action".
     """
     g_api_key = system_config.api_key
     g_ut_eth = system_config.unitree_ethernet
@@ -396,95 +456,85 @@ def _load_mode_components(mode_config: ModeConfig, system_config: ModeSystemConf
     g_robot_ip = system_config.robot_ip
     g_mode = mode_config.name
 
+    def load(kind: str, raw: Dict, factory: Callable[[Dict, Dict], Any]) -> Any:
+        config = add_meta(
+            raw.get("config", {}),
+            g_api_key,
+            g_ut_eth,
+            g_URID,
+            g_robot_ip,
+            g_mode,
+        )
+        if pool is None:
+            return factory(raw, config)
+        return pool.acquire(
+            kind, raw["type"], config, lambda: factory(raw, config), g_mode
+        )
+
     # Load inputs
-    mode_config.agent_inputs = [
-        load_input(inp["type"])(
-            config=SensorConfig(
-                **add_meta(
-                    inp.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
-                )
+    if "input" in kinds:
+        mode_config.agent_inputs = [
+            load(
+                "input",
+                inp,
+                lambda inp, config: load_input(inp["type"])(
+                    config=SensorConfig(**config)
+                ),
             )
-        )
-        for inp in mode_config._raw_inputs
-    ]
+            for inp in mode_config._raw_inputs
+        ]
 
     # Load simulators
-    mode_config.simulators = [
-        load_simulator(sim["type"])(
-            config=SimulatorConfig(
-                name=sim["type"],
-                **add_meta(
-                    sim.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
+    if "simulator" in kinds:
+        mode_config.simulators = [
+            load(
+                "simulator",
+                sim,
+                lambda sim, config: load_simulator(sim["type"])(
+                    config=SimulatorConfig(name=sim["type"], **config)
                 ),
             )
-        )
-        for sim in mode_config._raw_simulators
-    ]
+            for sim in mode_config._raw_simulators
+        ]
 
     # Load actions
-    mode_config.agent_actions = [
-        load_action(
-            {
-                **action,
-                "config": add_meta(
-                    action.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
-                ),
-            }
-        )
-        for action in mode_config._raw_actions
-    ]
+    if "action" in kinds:
+        mode_config.agent_actions = [
+            load(
+                "action",
+                action,
+                lambda action, config: load_action({**action, "config": config}),
+            )
+            for action in mode_config._raw_actions
+        ]
 
     # Load backgrounds
-    mode_config.backgrounds = [
-        load_background(bg["type"])(
-            config=BackgroundConfig(
-                **add_meta(
-                    bg.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
-                )
+    if "background" in kinds:
+        mode_config.backgrounds = [
+            load(
+                "background",
+                bg,
+                lambda bg, config: load_background(bg["type"])(
+                    config=BackgroundConfig(**config)
+                ),
             )
-        )
-        for bg in mode_config._raw_backgrounds
-    ]
+            for bg in mode_config._raw_backgrounds
+        ]
 
     # Load LLM
-    llm_config = mode_config._raw_llm or system_config.global_cortex_llm
-    if llm_config:
-        llm_class = load_llm(llm_config["type"])
-        mode_config.cortex_llm = llm_class(
-            config=LLMConfig(
-                **add_meta(  # type: ignore
-                    llm_config.get("config", {}),
-                    g_api_key,
-                    g_ut_eth,
-                    g_URID,
-                    g_robot_ip,
-                    g_mode,
-                )
-            ),
-            available_actions=mode_config.agent_actions,
-        )
-    else:
-        raise ValueError(f"No LLM configuration found for mode {mode_config.name}")
+    if "llm" in kinds:
+        llm_config = mode_config._raw_llm or system_config.global_cortex_llm
+        if llm_config:
+            mode_config.cortex_llm = load(
+                "llm",
+                llm_config,
+                lambda llm, config: load_llm(llm["type"])(
+                    config=LLMConfig(**config),  # type: ignore
+                    available_actions=mode_config.agent_actions,
+                ),
+            )
+        else:
+            raise ValueError(f"No LLM configuration found for mode {mode_config.name}")
 
 
 def mode_config_to_dict(config: ModeSystemConfig) -> Dict[str, Any]:
@@ -513,6 +563,14 @@ def mode_config_to_dict(config: ModeSystemConfig) -> Dict[str, Any]:
                 "timeout_seconds": mode_config.timeout_seconds,
                 "remember_locations": mode_config.remember_locations,
                 "save_interactions": mode_config.save_interactions,
+                "event_driven": mode_config.event_driven,
+                "event_debounce_seconds": mode_config.event_debounce_seconds,
+                "event_min_interval_seconds": mode_config.event_min_interval_seconds,
+                "event_max_idle_seconds": mode_config.event_max_idle_seconds,
+                "dedupe_ticks": mode_config.dedupe_ticks,
+                "dedupe_ttl_seconds": mode_config.dedupe_ttl_seconds,
+                "dedupe_reuse_output": mode_config.dedupe_reuse_output,
+                "llm_max_in_flight": mode_config.llm_max_in_flight,
                 "agent_inputs": mode_config._raw_inputs,
                 "cortex_llm": mode_config._raw_llm,
                 "simulators": mode_config._raw_simulators,
@@ -541,6 +599,8 @@ def mode_config_to_dict(config: ModeSystemConfig) -> Dict[str, Any]:
             "default_mode": config.default_mode,
             "allow_manual_switching": config.allow_manual_switching,
             "mode_memory_enabled": config.mode_memory_enabled,
+            "warm_mode_switching": config.warm_mode_switching,
+            "transition_deadline_seconds": config.transition_deadline_seconds,
             "api_key": config.api_key,
             "robot_ip": config.robot_ip,
             "URID": config.URID,
@@ -2,14 +2,19 @@ import asyncio
 import logging
 import os
 import time
-from typing import List, Optional, Union
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
 
 from actions.orchestrator import ActionOrchestrator
 from backgrounds.orchestrator import BackgroundOrchestrator
 from fuser import Fuser
 from inputs.orchestrator import InputOrchestrator
+from llm.output_model import Action, CortexOutputModel
 from providers.io_provider import IOProvider
+from providers.latency_histogram import LatencyHistogram
 from providers.sleep_ticker_provider import SleepTickerProvider
+from runtime.action_stream import ActionStream
+from runtime.llm_pipeline import LLMRequestPipeline
 from runtime.multi_mode.config import (
     LifecycleHookType,
     ModeSystemConfig,
@@ -17,6 +22,8 @@ from runtime.multi_mode.config import (
     load_mode_config,
 )
 from runtime.multi_mode.manager import ModeManager
+from runtime.multi_mode.warm_switch import WarmModeSwitcher
+from runtime.tick_dedupe import TickDeduplicator
 from simulators.orchestrator import SimulatorOrchestrator
 
 
@@ -38,6 +45,12 @@ class ModeCortexRuntime:
     simulator_orchestrator: Optional[SimulatorOrchestrator]
     background_orchestrator: Optional[BackgroundOrchestrator]
     input_orchestrator: Optional[InputOrchestrator]
+    tick_deduplicator: TickDeduplicator
+    llm_pipeline: LLMRequestPipeline
+    warm_switcher: Optional[WarmModeSwitcher]
+    # Keyed by source mode, target mode and how the target was loaded:
+    # "preloaded", "on demand" or "cold" without warm mode switching
+    transition_latency: Dict[Tuple[str, str, str], LatencyHistogram]
 
     def __init__(
         self,
@@ -87,6 +100,14 @@ class ModeCortexRuntime:
         self.simulator_orchestrator: Optional[SimulatorOrchestrator] = None
         self.background_orchestrator: Optional[BackgroundOrchestrator] = None
         self.input_orchestrator: Optional[InputOrchestrator] = None
+        self.tick_deduplicator = TickDeduplicator()
+        self.llm_pipeline = LLMRequestPipeline()
+
+        # Preloaded components of the modes reachable from the current mode
+        self.warm_switcher = (
+            WarmModeSwitcher(mode_config) if mode_config.warm_mode_switching else None
+        )
+        self.transition_latency = {}
 
         # Tasks for orchestrators
         self.input_listener_task: Optional[asyncio.Task] = None
@@ -115,7 +136,10 @@ class ModeCortexRuntime:
         """
         mode_config = self.mode_config.modes[mode_name]
 
-        mode_config.load_components(self.mode_config)
+        if self.warm_switcher is not None:
+            self.warm_switcher.activate(mode_name)
+        else:
+            mode_config.load_components(self.mode_config)
 
         self.current_config = mode_config.to_runtime_config(self.mode_config)
 
@@ -125,6 +149,12 @@ class ModeCortexRuntime:
         self.action_orchestrator = ActionOrchestrator(self.current_config)
         self.simulator_orchestrator = SimulatorOrchestrator(self.current_config)
         self.background_orchestrator = BackgroundOrchestrator(self.current_config)
+        self.tick_deduplicator = TickDeduplicator(
+            enabled=self.current_config.dedupe_ticks,
+            ttl_seconds=self.current_config.dedupe_ttl_seconds,
+            reuse_output=self.current_config.dedupe_reuse_output,
+        )
+        self.llm_pipeline = LLMRequestPipeline(self.current_config.llm_max_in_flight)
 
         logging.info(f"Mode '{mode_name}' initialized successfully")
 
@@ -142,20 +172,33 @@ class ModeCortexRuntime:
         """
         logging.info(f"Handling mode transition: {from_mode} -> {to_mode}")
 
+        start_time = time.perf_counter()
         try:
             # Set reloading flag
             self._is_reloading = True
 
-            # Stop current orchestrators
-            await self._stop_current_orchestrators()
+            load = "cold"
+            if self.warm_switcher is not None:
+                preloaded = await self._warm_transition(self.warm_switcher, to_mode)
+                load = "preloaded" if preloaded else "on demand"
+            else:
+                # Stop current orchestrators
+                await self._stop_current_orchestrators()
 
-            # Load new mode configuration
-            await self._initialize_mode(to_mode)
+                # Load new mode configuration
+                await self._initialize_mode(to_mode)
 
-            # Start new orchestrators
-            await self._start_orchestrators()
+                # Start new orchestrators
+                await self._start_orchestrators()
 
-            logging.info(f"Successfully transitioned to mode: {to_mode}")
+            latency = time.perf_counter() - start_time
+            self.transition_latency.setdefault(
+                (from_mode, to_mode, load), LatencyHistogram()
+            ).observe(latency)
+            logging.info(
+                f"Successfully transitioned to mode: {to_mode} in {latency:.3f}s "
+                f"({load})"
+            )
 
         except Exception as e:
             logging.error(f"Error during mode transition {from_mode} -> {to_mode}: {e}")
@@ -164,6 +207,78 @@ class ModeCortexRuntime:
         finally:
             self._is_reloading = False
 
+    async def _warm_transition(
+        self, warm_switcher: WarmModeSwitcher, to_mode: str
+    ) -> bool:
+        """
+        Switch to a mode with preloaded inputs, keeping the listeners of the
+        inputs both modes share.
+
+        The background preload is cancelled rather than awaited, so the switch
+        only loads its own target, while the current mode still runs.
+
+        Parameters
+        ----------
+        warm_switcher : WarmModeSwitcher
+            The switcher holding the preloaded components
+        to_mode : str
+            The name of the mode being transitioned to
+
+        Returns
+        -------
+        bool
+            Whether the inputs of the mode were preloaded.
+        """
+        warm_switcher.cancel_preload()
+        preloaded = warm_switcher.is_loaded(to_mode)
+        if not preloaded:
+            logging.info(f"Mode {to_mode} was not preloaded, loading it now")
+            await asyncio.to_thread(warm_switcher.load, to_mode, True)
+
+        # Keep the input listener out of the stopped tasks
+        input_orchestrator = self.input_orchestrator
+        input_listener_task = self.input_listener_task
+        self.input_listener_task = None
+
+        await self._stop_current_orchestrators()
+        await self._initialize_mode(to_mode)
+
+        if (
+            input_orchestrator is not None
+            and input_listener_task is not None
+            and not input_listener_task.done()
+            and self.current_config is not None
+        ):
+            added, removed = input_orchestrator.update_inputs(
+                self.current_config.agent_inputs
+            )
+            logging.info(f"Swapped inputs: {added} added, {removed} removed")
+            self.input_orchestrator = input_orchestrator
+            self.input_listener_task = input_listener_task
+            await self._start_orchestrators(start_inputs=False)
+        else:
+            await self._start_orchestrators()
+
+        warm_switcher.schedule_preload(to_mode)
+        return preloaded
+
+    def transition_latency_summary(self) -> Dict[str, Dict[str, object]]:
+        """
+        Get the mode transition latencies, per pair of modes and by how the
+        target mode was loaded.
+
+        Returns
+        -------
+        Dict[str, Dict[str, object]]
+            The latency histograms keyed by "from_mode->to_mode (load)".
+        """
+        return {
+            f"{from_mode}->{to_mode} ({load})": histogram.to_dict()
+            for (from_mode, to_mode, load), histogram in sorted(
+                self.transition_latency.items()
+            )
+        }
+
     async def _stop_current_orchestrators(self) -> None:
         """
         Stop all current orchestrator tasks gracefully.
@@ -171,6 +286,7 @@ class ModeCortexRuntime:
         logging.debug("Stopping current orchestrators...")
 
         self.sleep_ticker_provider.skip_sleep = True
+        self.llm_pipeline.cancel_all()
 
         tasks_to_cancel = {}
 
@@ -249,16 +365,27 @@ class ModeCortexRuntime:
         self.action_task = None
         self.background_task = None
 
-    async def _start_orchestrators(self):
+    async def _start_orchestrators(self, start_inputs: bool = True):
         """
         Start orchestrators for the current mode.
+
+        Parameters
+        ----------
+        start_inputs : bool, optional
+            Start a new input listener (default: True). False when the
+            listener of the previous mode was updated with the new inputs.
         """
         if not self.current_config:
             raise RuntimeError("No current config available")
 
         # Start input listener
-        self.input_orchestrator = InputOrchestrator(self.current_config.agent_inputs)
-        self.input_listener_task = asyncio.create_task(self.input_orchestrator.listen())
+        if start_inputs:
+            self.input_orchestrator = InputOrchestrator(
+                self.current_config.agent_inputs
+            )
+            self.input_listener_task = asyncio.create_task(
+                self.input_orchestrator.listen()
+            )
 
         # Start other orchestrators
         if self.simulator_orchestrator:
@@ -339,6 +466,9 @@ class ModeCortexRuntime:
 
             await self._start_orchestrators()
 
+            if self.warm_switcher is not None:
+                self.warm_switcher.schedule_preload(self.mode_manager.current_mode_name)
+
             if self.hot_reload and self.config_path:
                 self.config_watcher_task = asyncio.create_task(
                     self._check_config_changes()
@@ -407,9 +537,7 @@ class ModeCortexRuntime:
         try:
             while True:
                 if not self.sleep_ticker_provider.skip_sleep and self.current_config:
-                    await self.sleep_ticker_provider.sleep(
-                        1 / self.current_config.hertz
-                    )
+                    await self._wait_for_next_tick(self.current_config)
 
                 # Helper to yield control to event loop
                 await asyncio.sleep(0)
@@ -423,6 +551,33 @@ class ModeCortexRuntime:
             logging.error(f"Unexpected error in cortex loop: {e}")
             raise
 
+    async def _wait_for_next_tick(self, config: RuntimeConfig) -> None:
+        """
+        Wait until the next tick is due.
+
+        In the default fixed-rate mode, sleeps 1 / hertz. In event-driven mode,
+        waits until an input changes, bounded by the configured minimum
+        interval and maximum idle heartbeat.
+
+        Parameters
+        ----------
+        config : RuntimeConfig
+            The runtime configuration of the current mode.
+        """
+        if not config.event_driven:
+            await self.sleep_ticker_provider.sleep(1 / config.hertz)
+            return
+
+        min_interval = config.event_min_interval_seconds
+        if min_interval is None:
+            min_interval = 1 / config.hertz
+
+        await self.sleep_ticker_provider.wait_for_input_change(
+            min_interval=min_interval,
+            max_idle=config.event_max_idle_seconds,
+            debounce=config.event_debounce_seconds,
+        )
+
     async def _tick(self) -> None:
         """
         Execute a single tick of the mode-aware cortex processing cycle.
@@ -449,15 +604,52 @@ class ModeCortexRuntime:
             logging.info(f"Mode switched to: {new_mode}")
             return
 
-        output = await self.current_config.cortex_llm.ask(prompt)
-        if output is None:
-            logging.debug("No output from LLM")
+        llm = self.current_config.cortex_llm
+        stream = ActionStream(self._dispatch_actions)
+        await self.llm_pipeline.submit(
+            partial(
+                self.tick_deduplicator.ask,
+                llm,
+                prompt,
+                self.io_provider.fuser_inputs,
+                on_action=stream.on_action if llm.streams_actions else None,
+            ),
+            partial(self._dispatch_output, stream),
+            stream,
+        )
+
+    async def _dispatch_output(
+        self, stream: ActionStream, output: CortexOutputModel
+    ) -> None:
+        """
+        Trigger the simulators and actions for an LLM output.
+
+        Parameters
+        ----------
+        stream : ActionStream
+            The actions of the request dispatched so far.
+        output : CortexOutputModel
+            The LLM output.
+        """
+        await stream.finish(output)
+
+    async def _dispatch_actions(self, actions: List[Action]) -> None:
+        """
+        Trigger the simulators and actions for some actions of an LLM output.
+
+        Parameters
+        ----------
+        actions : List[Action]
+            The actions, all of an output or those streamed so far.
+        """
+        if self._is_reloading or not self.action_orchestrator:
+            logging.debug("Dropping LLM output, cortex is reloading")
             return
 
         if self.simulator_orchestrator:
-            await self.simulator_orchestrator.promise(output.actions)
+            await self.simulator_orchestrator.promise(actions)
 
-        await self.action_orchestrator.promise(output.actions)
+        await self.action_orchestrator.promise(actions)
 
     def get_mode_info(self) -> dict:
         """
@@ -565,6 +757,15 @@ class ModeCortexRuntime:
 
             self.mode_config = new_mode_config
             self.mode_manager.config = new_mode_config
+            if self.warm_switcher is not None:
+                self.warm_switcher.cancel_preload()
+                await self.warm_switcher.wait_for_preload()
+                await asyncio.to_thread(self.warm_switcher.close)
+            self.warm_switcher = (
+                WarmModeSwitcher(new_mode_config)
+                if new_mode_config.warm_mode_switching
+                else None
+            )
 
             self.mode_manager.update_runtime_config()
 
@@ -585,6 +786,9 @@ class ModeCortexRuntime:
 
             await self._start_orchestrators()
 
+            if self.warm_switcher is not None:
+                self.warm_switcher.schedule_preload(current_mode)
+
             logging.info(
                 f"Mode configuration reloaded successfully, active mode: {current_mode}"
             )
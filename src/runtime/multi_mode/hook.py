@@ -3,9 +3,10 @@ import importlib
 import logging
 import os
 import re
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from providers.elevenlabs_tts_provider import ElevenLabsTTSProvider
 
@@ -49,6 +50,18 @@ class LifecycleHook:
         Action to take on failure ('ignore', 'abort') (default: 'ignore')
     priority : int
         Execution priority for multiple hooks of same type (higher = first) (default: 0)
+    name : Optional[str]
+        Name other hooks can depend on (default: None)
+    group : Optional[str]
+        Hooks of the same priority and group run concurrently (default: None,
+        the hook runs alone)
+    depends_on : List[str]
+        Names of the hooks that must complete successfully before this hook
+        starts (default: none)
+    last_duration_seconds : Optional[float]
+        Duration of the last execution, None if the hook has not run
+    last_success : Optional[bool]
+        Outcome of the last execution, None if the hook has not run
     """
 
     hook_type: LifecycleHookType
@@ -58,6 +71,18 @@ class LifecycleHook:
     timeout_seconds: Optional[float] = 5.0
     on_failure: str = "ignore"
     priority: int = 0
+    name: Optional[str] = None
+    group: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
+    last_duration_seconds: Optional[float] = field(default=None, compare=False)
+    last_success: Optional[bool] = field(default=None, compare=False)
+
+    @property
+    def label(self) -> str:
+        """
+        Get the name of the hook for logging, its handler type if unnamed.
+        """
+        return self.name or self.handler_type
 
 
 class LifecycleHookHandler:
@@ -337,6 +362,9 @@ def parse_lifecycle_hooks(raw_hooks: List[Dict]) -> List[LifecycleHook]:
     hooks = []
     for hook_data in raw_hooks:
         try:
+            depends_on = hook_data.get("depends_on", [])
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
             hook = LifecycleHook(
                 hook_type=LifecycleHookType(hook_data["hook_type"]),
                 handler_type=hook_data["handler_type"],
@@ -345,6 +373,9 @@ def parse_lifecycle_hooks(raw_hooks: List[Dict]) -> List[LifecycleHook]:
                 timeout_seconds=hook_data.get("timeout_seconds", 5.0),
                 on_failure=hook_data.get("on_failure", "ignore"),
                 priority=hook_data.get("priority", 0),
+                name=hook_data.get("name"),
+                group=hook_data.get("group"),
+                depends_on=list(depends_on),
             )
             hooks.append(hook)
         except (KeyError, ValueError) as e:
@@ -357,10 +388,16 @@ async def execute_lifecycle_hooks(
     hooks: List[LifecycleHook],
     hook_type: LifecycleHookType,
     context: Optional[Dict[str, Any]] = None,
+    deadline: Optional[float] = None,
 ) -> bool:
     """
     Execute all lifecycle hooks of the specified type.
 
+    Hooks run by decreasing priority. Hooks of the same priority and group
+    run concurrently, each starting once the hooks it depends on completed,
+    so a group costs its critical path rather than the sum of its hooks.
+    Other hooks run one at a time.
+
     Parameters
     ----------
     hooks : List[LifecycleHook]
@@ -369,6 +406,9 @@ async def execute_lifecycle_hooks(
         The type of lifecycle hooks to execute
     context : Optional[Dict[str, Any]]
         Context information to pass to the hooks
+    deadline : Optional[float]
+        time.monotonic() time by which all hooks must be done. Hooks still
+        running then time out, and hooks not started yet are skipped.
 
     Returns
     -------
@@ -388,48 +428,235 @@ async def execute_lifecycle_hooks(
 
     logging.info(f"Executing {len(relevant_hooks)} {hook_type.value} hooks")
 
+    steps = _group_hooks(relevant_hooks)
+    results: Dict[str, bool] = {}
     all_successful = True
 
-    for hook in relevant_hooks:
-        try:
-            handler = create_hook_handler(hook)
-            if handler:
-                if hook.async_execution:
-                    if hook.timeout_seconds:
-                        success = await asyncio.wait_for(
-                            handler.execute(context), timeout=hook.timeout_seconds
-                        )
-                    else:
-                        success = await handler.execute(context)
-                else:
-                    success = await handler.execute(context)
+    for step in steps:
+        failed = await _execute_hook_step(step, context, deadline, results)
+        if failed:
+            all_successful = False
+            if any(hook.on_failure == "abort" for hook in failed):
+                logging.error(
+                    "Lifecycle hook failed with abort policy, stopping execution"
+                )
+                return False
 
-                if not success:
-                    all_successful = False
-                    if hook.on_failure == "abort":
-                        logging.error(
-                            "Lifecycle hook failed with abort policy, stopping execution"
-                        )
-                        return False
-                    if hook.on_failure == "ignore":
-                        pass
-            else:
+    return all_successful
+
+
+def _group_hooks(hooks: List[LifecycleHook]) -> List[List[LifecycleHook]]:
+    """
+    Split hooks sorted by priority into steps run one after the other.
+
+    Parameters
+    ----------
+    hooks : List[LifecycleHook]
+        The hooks, sorted by decreasing priority
+
+    Returns
+    -------
+    List[List[LifecycleHook]]
+        The steps: each group of a priority level, and each ungrouped hook
+    """
+    steps: List[List[LifecycleHook]] = []
+    groups: Dict[Tuple[int, str], List[LifecycleHook]] = {}
+    step_of: Dict[str, int] = {}
+
+    for hook in hooks:
+        if hook.group is None:
+            steps.append([hook])
+        elif (hook.priority, hook.group) in groups:
+            groups[(hook.priority, hook.group)].append(hook)
+        else:
+            groups[(hook.priority, hook.group)] = [hook]
+            steps.append(groups[(hook.priority, hook.group)])
+        if hook.name:
+            step_of[hook.name] = len(steps) - 1
+
+    for index, step in enumerate(steps):
+        for hook in step:
+            for dependency in hook.depends_on:
+                if dependency not in step_of:
+                    logging.warning(
+                        f"Lifecycle hook {hook.label} depends on unknown hook {dependency}"
+                    )
+                elif step_of[dependency] > index:
+                    logging.warning(
+                        f"Lifecycle hook {hook.label} depends on {dependency}, "
+                        "which runs later, ignoring the dependency"
+                    )
+    return steps
+
+
+async def _execute_hook_step(
+    hooks: List[LifecycleHook],
+    context: Dict[str, Any],
+    deadline: Optional[float],
+    results: Dict[str, bool],
+) -> List[LifecycleHook]:
+    """
+    Execute hooks concurrently, in the order of their dependencies.
+
+    Parameters
+    ----------
+    hooks : List[LifecycleHook]
+        The hooks to execute
+    context : Dict[str, Any]
+        Context information to pass to the hooks
+    deadline : Optional[float]
+        time.monotonic() time by which the hooks must be done
+    results : Dict[str, bool]
+        Outcome of the named hooks executed so far, updated with these hooks
+
+    Returns
+    -------
+    List[LifecycleHook]
+        The hooks that failed. If one of them has the abort policy, the
+        hooks still running are cancelled.
+    """
+    done_events = {hook.name: asyncio.Event() for hook in hooks if hook.name}
+    cyclic = _find_dependency_cycle(hooks)
+    failed = []
+
+    for hook in cyclic:
+        logging.error(f"Lifecycle hook {hook.label} is part of a dependency cycle")
+        hook.last_success = False
+        failed.append(hook)
+        if hook.name:
+            results[hook.name] = False
+            done_events[hook.name].set()
+
+    async def run(hook: LifecycleHook) -> bool:
+        for dependency in hook.depends_on:
+            if dependency in done_events:
+                await done_events[dependency].wait()
+
+        if any(results.get(dependency) is False for dependency in hook.depends_on):
+            logging.error(f"Skipping lifecycle hook {hook.label}, a dependency failed")
+            hook.last_success = False
+            success = False
+        else:
+            success = await _execute_hook(hook, context, deadline)
+
+        if hook.name:
+            results[hook.name] = success
+            done_events[hook.name].set()
+        return success
+
+    tasks = {
+        asyncio.create_task(run(hook)): hook for hook in hooks if hook not in cyclic
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.result():
+                    continue
+                failed.append(tasks[task])
+                if tasks[task].on_failure == "abort":
+                    return failed
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return failed
+
+
+def _find_dependency_cycle(hooks: List[LifecycleHook]) -> List[LifecycleHook]:
+    """
+    Find the hooks that can never start because their dependencies within
+    the hooks form a cycle.
+
+    Parameters
+    ----------
+    hooks : List[LifecycleHook]
+        The hooks run concurrently
+
+    Returns
+    -------
+    List[LifecycleHook]
+        The hooks in, or waiting on, a dependency cycle
+    """
+    names = {hook.name for hook in hooks if hook.name}
+    remaining = list(hooks)
+    started: set = set()
+
+    progress = True
+    while remaining and progress:
+        progress = False
+        for hook in list(remaining):
+            if all(
+                dependency not in names or dependency in started
+                for dependency in hook.depends_on
+            ):
+                remaining.remove(hook)
+                if hook.name:
+                    started.add(hook.name)
+                progress = True
+    return remaining
+
+
+async def _execute_hook(
+    hook: LifecycleHook, context: Dict[str, Any], deadline: Optional[float]
+) -> bool:
+    """
+    Execute a single hook within its timeout and the deadline, recording its
+    duration and outcome.
+
+    Parameters
+    ----------
+    hook : LifecycleHook
+        The hook to execute
+    context : Dict[str, Any]
+        Context information to pass to the hook
+    deadline : Optional[float]
+        time.monotonic() time by which the hook must be done
+
+    Returns
+    -------
+    bool
+        True if the hook executed successfully
+    """
+    start_time = time.monotonic()
+    success = False
+    timeout = hook.timeout_seconds if hook.async_execution else None
+
+    try:
+        if deadline is not None:
+            remaining = deadline - start_time
+            if remaining <= 0:
                 logging.error(
-                    f"Failed to create handler for lifecycle hook: {hook.handler_type}"
+                    f"Skipping lifecycle hook {hook.label}, transition deadline exceeded"
                 )
-                all_successful = False
+                return False
+            timeout = remaining if not timeout else min(timeout, remaining)
 
-        except asyncio.TimeoutError:
+        handler = create_hook_handler(hook)
+        if handler:
+            if timeout:
+                success = await asyncio.wait_for(
+                    handler.execute(context), timeout=timeout
+                )
+            else:
+                success = await handler.execute(context)
+        else:
             logging.error(
-                f"Lifecycle hook timed out after {hook.timeout_seconds} seconds"
+                f"Failed to create handler for lifecycle hook: {hook.handler_type}"
             )
-            all_successful = False
-            if hook.on_failure == "abort":
-                return False
-        except Exception as e:
-            logging.error(f"Error executing lifecycle hook: {e}")
-            all_successful = False
-            if hook.on_failure == "abort":
-                return False
 
-    return all_successful
+    except asyncio.TimeoutError:
+        logging.error(f"Lifecycle hook timed out after {timeout} seconds")
+    except Exception as e:
+        logging.error(f"Error executing lifecycle hook: {e}")
+    finally:
+        hook.last_duration_seconds = time.monotonic() - start_time
+        hook.last_success = bool(success)
+        logging.debug(
+            f"Lifecycle hook {hook.label} took {hook.last_duration_seconds:.3f}s"
+        )
+
+    return bool(success)
@@ -17,6 +17,7 @@ from runtime.multi_mode.config import (
     TransitionType,
     mode_config_to_dict,
 )
+from runtime.multi_mode.transition_index import TransitionIndex
 from zenoh_msgs import (
     ModeStatusRequest,
     ModeStatusResponse,
@@ -60,6 +61,9 @@ class ModeManager:
     Manages mode transitions and state for the OM1 system.
     """
 
+    _config: ModeSystemConfig
+    transition_index: TransitionIndex
+
     def __init__(self, config: ModeSystemConfig):
         """
         Initialize the mode manager.
@@ -111,14 +115,15 @@ class ModeManager:
 
         self._create_runtime_config_file()
 
-    def _get_runtime_config_path(self) -> str:
+    def _get_memory_folder_path(self) -> str:
         """
-        Get the path to the runtime config file.
+        Get the folder of the runtime config and mode state files, creating it
+        if needed.
 
         Returns
         -------
         str
-            The absolute path to the runtime config file
+            The absolute path to the memory folder
         """
         memory_folder_path = os.path.join(
             os.path.dirname(__file__), "../../../config", "memory"
@@ -126,7 +131,18 @@ class ModeManager:
         if not os.path.exists(memory_folder_path):
             os.makedirs(memory_folder_path, mode=0o755, exist_ok=True)
 
-        return os.path.join(memory_folder_path, ".runtime.json5")
+        return memory_folder_path
+
+    def _get_runtime_config_path(self) -> str:
+        """
+        Get the path to the runtime config file.
+
+        Returns
+        -------
+        str
+            The absolute path to the runtime config file
+        """
+        return os.path.join(self._get_memory_folder_path(), ".runtime.json5")
 
     def _create_runtime_config_file(self):
         """
@@ -170,6 +186,32 @@ class ModeManager:
         """
         self._main_event_loop = loop
 
+    @property
+    def config(self) -> ModeSystemConfig:
+        """
+        Get the mode system configuration.
+
+        Returns
+        -------
+        ModeSystemConfig
+            The mode system configuration
+        """
+        return self._config
+
+    @config.setter
+    def config(self, config: ModeSystemConfig):
+        """
+        Set the mode system configuration, e.g. on hot reload, and rebuild the
+        index of its input-triggered transitions.
+
+        Parameters
+        ----------
+        config : ModeSystemConfig
+            The new mode system configuration
+        """
+        self._config = config
+        self.transition_index = TransitionIndex(config.transition_rules, config.modes)
+
     @property
     def current_mode_config(self) -> ModeConfig:
         """
@@ -298,31 +340,14 @@ class ModeManager:
         if not input_text:
             return None
 
-        input_lower = input_text.lower()
-
-        # Find matching transition rules sorted by priority (higher priority first)
-        matching_rules = []
-        for rule in self.config.transition_rules:
-            if (
-                rule.from_mode == self.state.current_mode or rule.from_mode == "*"
-            ) and rule.transition_type == TransitionType.INPUT_TRIGGERED:
-
-                # Check if any trigger keywords are present
-                for keyword in rule.trigger_keywords:
-                    if keyword.lower() in input_lower:
-                        if self._can_transition(rule):
-                            matching_rules.append(rule)
-                        break
-
-        if matching_rules:
-            # Sort by priority (higher first) and select the best match
-            matching_rules.sort(key=lambda r: r.priority, reverse=True)
-            best_rule = matching_rules[0]
-            logging.info(
-                f"Input-triggered transition: {self.state.current_mode} -> {best_rule.to_mode}"
-            )
-            logging.info(f"Triggered by keywords: {best_rule.trigger_keywords}")
-            return best_rule.to_mode
+        # Matching transition rules, sorted by priority (higher priority first)
+        for rule in self.transition_index.match(self.state.current_mode, input_text):
+            if self._can_transition(rule):
+                logging.info(
+                    f"Input-triggered transition: {self.state.current_mode} -> {rule.to_mode}"
+                )
+                logging.info(f"Triggered by keywords: {rule.trigger_keywords}")
+                return rule.to_mode
 
         return None
 
@@ -431,6 +456,10 @@ class ModeManager:
             from_config = self.config.modes.get(from_mode)
             to_config = self.config.modes[target_mode]
 
+            deadline = None
+            if self.config.transition_deadline_seconds:
+                deadline = time.monotonic() + self.config.transition_deadline_seconds
+
             transition_context = {
                 "from_mode": from_mode,
                 "to_mode": target_mode,
@@ -443,14 +472,14 @@ class ModeManager:
             if from_config:
                 logging.debug(f"Executing exit hooks for mode: {from_mode}")
                 exit_success = await from_config.execute_lifecycle_hooks(
-                    LifecycleHookType.ON_EXIT, transition_context.copy()
+                    LifecycleHookType.ON_EXIT, transition_context.copy(), deadline
                 )
                 if not exit_success:
                     logging.warning(f"Some exit hooks failed for mode: {from_mode}")
 
             # Execute global exit hooks
             global_exit_success = await self.config.execute_global_lifecycle_hooks(
-                LifecycleHookType.ON_EXIT, transition_context.copy()
+                LifecycleHookType.ON_EXIT, transition_context.copy(), deadline
             )
             if not global_exit_success:
                 logging.warning("Some global exit hooks failed")
@@ -472,14 +501,14 @@ class ModeManager:
             # Execute entry hooks for the new mode
             logging.debug(f"Executing entry hooks for mode: {target_mode}")
             entry_success = await to_config.execute_lifecycle_hooks(
-                LifecycleHookType.ON_ENTRY, transition_context.copy()
+                LifecycleHookType.ON_ENTRY, transition_context.copy(), deadline
             )
             if not entry_success:
                 logging.warning(f"Some entry hooks failed for mode: {target_mode}")
 
             # Execute global entry hooks
             global_entry_success = await self.config.execute_global_lifecycle_hooks(
-                LifecycleHookType.ON_ENTRY, transition_context.copy()
+                LifecycleHookType.ON_ENTRY, transition_context.copy(), deadline
             )
             if not global_entry_success:
                 logging.warning("Some global entry hooks failed")
@@ -690,11 +719,7 @@ class ModeManager:
         str
             The absolute path to the state file
         """
-        memory_folder_path = os.path.join(
-            os.path.dirname(__file__), "../../../config", "memory"
-        )
-        if not os.path.exists(memory_folder_path):
-            os.makedirs(memory_folder_path, mode=0o755, exist_ok=True)
+        memory_folder_path = self._get_memory_folder_path()
 
         config_name = getattr(self.config, "config_name", "default")
         state_filename = (
@@ -0,0 +1,219 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Set
+
+from runtime.multi_mode.config import TransitionRule, TransitionType
+
+# Below this many keywords, one substring search per keyword is faster than
+# the compiled matcher
+COMPILE_MIN_KEYWORDS = 64
+
+
+def compile_keywords(keywords: Iterable[str]) -> Pattern[str]:
+    """
+    Compile keywords into a regular expression shaped like their prefix
+    tree, so that matching does not slow down with the number of keywords.
+
+    Parameters
+    ----------
+    keywords : Iterable[str]
+        The keywords, at least one and none empty.
+
+    Returns
+    -------
+    Pattern[str]
+        An expression matching, at each position of a text, the longest
+        keyword starting there, captured in group 1.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def expression(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + expression(node[char]) for char in node if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Optional and greedy, so that the longest keyword wins
+        return "(?:" + body + ")?" if "" in node else body
+
+    return re.compile("(?=(" + expression(trie) + "))")
+
+
+@dataclass
+class ModeTransitionTable:
+    """
+    Input-triggered rules applying in one mode, with their keyword matcher.
+
+    Parameters
+    ----------
+    rules : List[TransitionRule]
+        The rules from the mode and from "*", by decreasing priority then
+        configuration order.
+    keywords : Dict[str, Set[int]]
+        Positions in rules of the rules triggered by each lowercase keyword.
+        With a compiled pattern, they include the rules of the keywords it
+        contains.
+    always : Set[int]
+        Positions of the rules with an empty keyword, triggered by any input.
+    pattern : Optional[Pattern[str]]
+        The compiled keywords, None when there are too few to be worth it.
+    """
+
+    rules: List[TransitionRule]
+    keywords: Dict[str, Set[int]]
+    always: Set[int]
+    pattern: Optional[Pattern[str]] = None
+
+    def match(self, text: str) -> List[TransitionRule]:
+        """
+        Get the rules triggered by a text.
+
+        Parameters
+        ----------
+        text : str
+            The input text, matched case-insensitively.
+
+        Returns
+        -------
+        List[TransitionRule]
+            The triggered rules, by decreasing priority.
+        """
+        text = text.lower()
+        found = set(self.always)
+        if self.pattern is not None:
+            for match in self.pattern.finditer(text):
+                found |= self.keywords[match.group(1)]
+        else:
+            for keyword, positions in self.keywords.items():
+                if keyword in text:
+                    found |= positions
+        return [rule for position, rule in enumerate(self.rules) if position in found]
+
+
+class TransitionIndex:
+    """
+    Index of the input-triggered transition rules of a mode system.
+
+    Rules are tabled per source mode, sorted by decreasing priority, with
+    "*" rules merged into every mode. The trigger keywords of each table are
+    compiled into one regular expression, so the rules triggered by an input
+    are found in a single pass over the text instead of one substring search
+    per keyword.
+
+    The expression finds, at each position, the longest keyword starting
+    there. Each keyword stands for itself and every keyword it contains, so
+    the shorter overlapping keywords are matched too.
+
+    Parameters
+    ----------
+    rules : List[TransitionRule]
+        The transition rules, in configuration order.
+    mode_names : Iterable[str]
+        The modes to build tables for now. Tables of other modes are built on
+        first use.
+    """
+
+    def __init__(self, rules: List[TransitionRule], mode_names: Iterable[str] = ()):
+        """
+        Build the rule tables and compile the keyword matchers.
+        """
+        self.rules = [
+            rule
+            for rule in rules
+            if rule.transition_type == TransitionType.INPUT_TRIGGERED
+        ]
+        self._tables: Dict[str, ModeTransitionTable] = {}
+        for mode_name in mode_names:
+            self.table(mode_name)
+
+    def table(self, mode_name: str) -> ModeTransitionTable:
+        """
+        Get the table of the rules applying in a mode.
+
+        Parameters
+        ----------
+        mode_name : str
+            The source mode.
+
+        Returns
+        -------
+        ModeTransitionTable
+            The rules from the mode and from "*", with their matcher.
+        """
+        table = self._tables.get(mode_name)
+        if table is None:
+            table = self._build_table(mode_name)
+            self._tables[mode_name] = table
+        return table
+
+    def match(self, mode_name: str, text: str) -> List[TransitionRule]:
+        """
+        Get the rules of a mode triggered by a text.
+
+        Parameters
+        ----------
+        mode_name : str
+            The current mode.
+        text : str
+            The input text.
+
+        Returns
+        -------
+        List[TransitionRule]
+            The triggered rules, by decreasing priority.
+        """
+        table = self.table(mode_name)
+        if not table.rules:
+            return []
+        return table.match(text)
+
+    def _build_table(self, mode_name: str) -> ModeTransitionTable:
+        """
+        Build the table of a mode.
+
+        Parameters
+        ----------
+        mode_name : str
+            The source mode.
+
+        Returns
+        -------
+        ModeTransitionTable
+            The table.
+        """
+        # Stable, so rules of equal priority keep their configuration order
+        rules = sorted(
+            (rule for rule in self.rules if rule.from_mode in (mode_name, "*")),
+            key=lambda rule: rule.priority,
+            reverse=True,
+        )
+
+        keywords: Dict[str, Set[int]] = {}
+        always: Set[int] = set()
+        for position, rule in enumerate(rules):
+            for keyword in rule.trigger_keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    keywords.setdefault(keyword, set()).add(position)
+                else:
+                    always.add(position)
+
+        if len(keywords) < COMPILE_MIN_KEYWORDS:
+            return ModeTransitionTable(rules, keywords, always)
+
+        # A keyword found in the text implies the keywords it contains
+        closed = {
+            keyword: set().union(
+                *(
+                    positions
+                    for other, positions in keywords.items()
+                    if other in keyword
+                )
+            )
+            for keyword in keywords
+        }
+        return ModeTransitionTable(rules, closed, always, compile_keywords(keywords))
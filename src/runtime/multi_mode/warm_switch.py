@@ -0,0 +1,358 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from runtime.multi_mode.component_pool import ComponentPool
+from runtime.multi_mode.config import (
+    COMPONENT_KINDS,
+    ModeConfig,
+    ModeSystemConfig,
+    _load_mode_components,
+)
+
+# Components created ahead of a switch. Action connectors can command the
+# robot when created, e.g. the Unitree movement connectors, simulators and
+# backgrounds start servers and threads, and the LLM is created with the
+# actions, so they are only created when their mode is activated.
+PRELOAD_KINDS = frozenset({"input"})
+
+
+def stop_component(component: Any) -> None:
+    """
+    Stop a component dropped from the pool, e.g. its threads and sessions.
+
+    Parameters
+    ----------
+    component : Any
+        The component: an input, simulator, background, LLM, or an action
+        whose connector is stopped.
+    """
+    target = getattr(component, "connector", component)
+    stop = getattr(target, "stop", None)
+    response_cache = getattr(target, "response_cache", None)
+    try:
+        if callable(stop):
+            stop()
+        if response_cache is not None:
+            response_cache.close()
+    except Exception as e:
+        logging.warning(f"Error stopping {type(target).__name__}: {e}")
+
+
+class WarmModeSwitcher:
+    """
+    Keeps the inputs of the modes likely to follow the current mode loaded,
+    so that a mode switch does not wait for them to connect.
+
+    The likely targets of a mode are the targets of its transition rules,
+    and of the rules from any mode, by decreasing priority. Their inputs are
+    preloaded in a worker thread after each switch, and the modes no longer
+    reachable are unloaded, stopping the components no other mode holds.
+    The other components of a mode are created when it is activated, and
+    kept while it stays reachable. Components are taken from a
+    ComponentPool, so inputs identical in several modes are created once.
+
+    Parameters
+    ----------
+    system_config : ModeSystemConfig
+        The mode system configuration.
+    """
+
+    def __init__(self, system_config: ModeSystemConfig):
+        """
+        Initialize the switcher with no mode loaded.
+        """
+        self.system_config = system_config
+        self.pool = ComponentPool()
+        # Modes with all their components, and modes with their inputs only
+        self.loaded: Set[str] = set()
+        self.preloaded: Set[str] = set()
+        self.failed: Set[str] = set()
+        # The mode being activated or active, never unloaded
+        self.active: Optional[str] = None
+
+        self._lock = threading.Lock()
+        # Held while loading or unloading a mode, so that a switch only waits
+        # for a preload of its own target
+        self._mode_locks: Dict[str, threading.Lock] = {
+            mode_name: threading.Lock() for mode_name in system_config.modes
+        }
+        self._preload_generation = 0
+        self._preload_task: Optional[asyncio.Task] = None
+
+    def likely_targets(self, mode_name: str) -> List[str]:
+        """
+        Get the modes reachable from a mode through a transition rule.
+
+        Parameters
+        ----------
+        mode_name : str
+            The current mode.
+
+        Returns
+        -------
+        List[str]
+            The target modes, by decreasing rule priority.
+        """
+        rules = sorted(
+            (
+                rule
+                for rule in self.system_config.transition_rules
+                if rule.from_mode in (mode_name, "*")
+            ),
+            key=lambda rule: rule.priority,
+            reverse=True,
+        )
+
+        targets: List[str] = []
+        for rule in rules:
+            if (
+                rule.to_mode != mode_name
+                and rule.to_mode in self.system_config.modes
+                and rule.to_mode not in targets
+            ):
+                targets.append(rule.to_mode)
+        return targets
+
+    def is_loaded(self, mode_name: str) -> bool:
+        """
+        Check whether the inputs of a mode are loaded.
+
+        Parameters
+        ----------
+        mode_name : str
+            The mode.
+
+        Returns
+        -------
+        bool
+            True if the mode can be activated without creating its inputs.
+        """
+        with self._lock:
+            return mode_name in self.loaded or mode_name in self.preloaded
+
+    def load(self, mode_name: str, preload: bool = False) -> ModeConfig:
+        """
+        Load the components of a mode, unless they are loaded already.
+
+        Parameters
+        ----------
+        mode_name : str
+            The mode to load.
+        preload : bool
+            Only load the components of PRELOAD_KINDS.
+
+        Returns
+        -------
+        ModeConfig
+            The mode configuration, with its components set.
+        """
+        mode_config = self.system_config.modes[mode_name]
+        with self._mode_locks[mode_name]:
+            with self._lock:
+                if mode_name in self.loaded or (
+                    preload and mode_name in self.preloaded
+                ):
+                    return mode_config
+                if preload:
+                    kinds = PRELOAD_KINDS
+                elif mode_name in self.preloaded:
+                    kinds = COMPONENT_KINDS - PRELOAD_KINDS
+                else:
+                    kinds = COMPONENT_KINDS
+
+            logging.info(
+                f"{'Preloading' if preload else 'Loading'} components for mode: "
+                f"{mode_name}"
+            )
+            try:
+                _load_mode_components(mode_config, self.system_config, self.pool, kinds)
+            except Exception:
+                with self._lock:
+                    self.preloaded.discard(mode_name)
+                self._release(mode_name)
+                raise
+
+            with self._lock:
+                if preload:
+                    self.preloaded.add(mode_name)
+                else:
+                    self.preloaded.discard(mode_name)
+                    self.loaded.add(mode_name)
+                self.failed.discard(mode_name)
+        return mode_config
+
+    def activate(self, mode_name: str) -> ModeConfig:
+        """
+        Load all the components of the mode being switched to, and keep it
+        from being unloaded by preloads.
+
+        Parameters
+        ----------
+        mode_name : str
+            The mode to activate.
+
+        Returns
+        -------
+        ModeConfig
+            The mode configuration, with its components set.
+        """
+        with self._lock:
+            self.active = mode_name
+        return self.load(mode_name)
+
+    def unload(self, mode_name: str) -> None:
+        """
+        Release the components of a mode, stopping those no other mode holds.
+
+        Parameters
+        ----------
+        mode_name : str
+            The mode to unload. The active mode is kept.
+        """
+        with self._mode_locks[mode_name]:
+            with self._lock:
+                if mode_name == self.active or not (
+                    mode_name in self.loaded or mode_name in self.preloaded
+                ):
+                    return
+                self.loaded.discard(mode_name)
+                self.preloaded.discard(mode_name)
+
+            dropped = self._release(mode_name)
+
+        logging.info(
+            f"Unloaded mode {mode_name}, stopped {len(dropped)} unshared components"
+        )
+
+    def preload(self, mode_name: str) -> List[str]:
+        """
+        Load the inputs of the likely targets of a mode and unload the other
+        modes, until cancel_preload is called.
+
+        Modes that failed to load are not retried until they are loaded by a
+        switch.
+
+        Parameters
+        ----------
+        mode_name : str
+            The current mode.
+
+        Returns
+        -------
+        List[str]
+            The targets loaded.
+        """
+        with self._lock:
+            generation = self._preload_generation
+            keep = {mode_name, *self.likely_targets(mode_name)}
+            unreachable = (self.loaded | self.preloaded) - keep
+
+        def cancelled() -> bool:
+            if self._preload_generation == generation:
+                return False
+            logging.debug(f"Preload of the modes reachable from {mode_name} cancelled")
+            return True
+
+        for other in unreachable:
+            if cancelled():
+                return []
+            self.unload(other)
+
+        loaded = []
+        for target in self.likely_targets(mode_name):
+            if target in self.failed:
+                continue
+            if cancelled():
+                break
+            try:
+                self.load(target, preload=True)
+                loaded.append(target)
+            except Exception as e:
+                logging.warning(f"Failed to preload mode {target}: {e}")
+                self.failed.add(target)
+        return loaded
+
+    def cancel_preload(self) -> None:
+        """
+        Stop the scheduled preloads, e.g. so that a switch loads its target
+        without waiting for them. A load already running completes.
+        """
+        with self._lock:
+            self._preload_generation += 1
+        if self._preload_task is not None and not self._preload_task.done():
+            self._preload_task.cancel()
+
+    def schedule_preload(self, mode_name: str) -> asyncio.Task:
+        """
+        Preload the likely targets of a mode in a worker thread, after any
+        preload already scheduled.
+
+        Parameters
+        ----------
+        mode_name : str
+            The current mode.
+
+        Returns
+        -------
+        asyncio.Task
+            The preload task.
+        """
+        previous = self._preload_task
+
+        async def run() -> None:
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+            targets = await asyncio.to_thread(self.preload, mode_name)
+            logging.info(f"Preloaded modes reachable from {mode_name}: {targets}")
+
+        self._preload_task = asyncio.create_task(run())
+        return self._preload_task
+
+    async def wait_for_preload(self) -> None:
+        """
+        Wait until the scheduled preloads are done.
+        """
+        if self._preload_task is not None and not self._preload_task.done():
+            await asyncio.gather(self._preload_task, return_exceptions=True)
+
+    def close(self) -> None:
+        """
+        Unload every mode, including the active one, e.g. when the mode
+        configuration is reloaded. The orchestrators must be stopped first.
+        """
+        with self._lock:
+            self.active = None
+            modes = self.loaded | self.preloaded
+        for mode_name in modes:
+            self.unload(mode_name)
+
+    def _release(self, mode_name: str) -> List[Any]:
+        """
+        Release the components of a mode and stop those no other mode holds.
+        Must be called with the lock of the mode held.
+
+        Parameters
+        ----------
+        mode_name : str
+            The mode to release.
+
+        Returns
+        -------
+        List[Any]
+            The stopped components.
+        """
+        dropped = self.pool.release(mode_name)
+
+        mode_config = self.system_config.modes.get(mode_name)
+        if mode_config is not None:
+            mode_config.agent_inputs = []
+            mode_config.simulators = []
+            mode_config.agent_actions = []
+            mode_config.backgrounds = []
+            mode_config.cortex_llm = None
+
+        for component in dropped:
+            stop_component(component)
+        return dropped
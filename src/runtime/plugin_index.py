@@ -0,0 +1,218 @@
+import json
+import logging
+import os
+import re
+import threading
+import typing as T
+from dataclasses import dataclass
+
+PLUGIN_INDEX_FORMAT = 1
+
+CLASS_PATTERN = re.compile(r"^class\s+(\w+)\s*\(([^)]*)\)\s*:", re.MULTILINE)
+
+
+@dataclass
+class PluginFile:
+    """
+    Index entry for a single plugin file.
+
+    Parameters
+    ----------
+    mtime_ns : int, optional
+        Modification time of the file when it was scanned, None if unknown.
+    classes : List[str]
+        Names of the plugin classes defined in the file.
+    """
+
+    mtime_ns: T.Optional[int]
+    classes: T.List[str]
+
+
+class PluginIndex:
+    """
+    Maps plugin class names to the module that defines them.
+
+    Plugin files are scanned once for class definitions deriving from the base
+    class, and the result is cached in memory and on disk, keyed by file
+    modification times. Later lookups only stat the plugin files and rescan
+    the ones that changed, so no plugin module is read or imported until a
+    loader asks for it.
+
+    Parameters
+    ----------
+    plugins_dir : str
+        The directory containing the plugin files.
+    base_class : str
+        Name of the base class plugin classes must derive from.
+    cache_path : str, optional
+        Where to persist the index. Defaults to a file in the __pycache__
+        directory of the plugins directory.
+    """
+
+    def __init__(
+        self, plugins_dir: str, base_class: str, cache_path: T.Optional[str] = None
+    ):
+        """
+        Initialize the PluginIndex.
+        """
+        self.plugins_dir = plugins_dir
+        self.base_class = base_class
+        self.cache_path = cache_path or os.path.join(
+            plugins_dir, "__pycache__", f"plugin_index.{base_class}.json"
+        )
+
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._files: T.Dict[str, PluginFile] = {}
+        self._modules: T.Dict[str, str] = {}
+
+    def find(self, class_name: str) -> T.Optional[str]:
+        """
+        Find which module file contains the specified class name.
+
+        Parameters
+        ----------
+        class_name : str
+            The class name to search for
+
+        Returns
+        -------
+        str or None
+            The module name (without .py) that contains the class, or None if not found
+        """
+        if not os.path.exists(self.plugins_dir):
+            return None
+
+        with self._lock:
+            self._refresh()
+            return self._modules.get(class_name)
+
+    def clear(self) -> None:
+        """
+        Forget the in-memory index, so the next lookup reloads or rescans it.
+        """
+        with self._lock:
+            self._loaded = False
+            self._files = {}
+            self._modules = {}
+
+    def _refresh(self) -> None:
+        """
+        Bring the index up to date with the plugin files on disk.
+        """
+        if not self._loaded:
+            self._files = self._load()
+            self._loaded = True
+
+        plugin_files = [f for f in os.listdir(self.plugins_dir) if f.endswith(".py")]
+
+        files: T.Dict[str, PluginFile] = {}
+        changed = set(plugin_files) != set(self._files)
+
+        for plugin_file in plugin_files:
+            file_path = os.path.join(self.plugins_dir, plugin_file)
+
+            try:
+                mtime_ns: T.Optional[int] = os.stat(file_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            cached = self._files.get(plugin_file)
+            if mtime_ns is not None and cached and cached.mtime_ns == mtime_ns:
+                files[plugin_file] = cached
+                continue
+
+            classes = self._scan(file_path, plugin_file)
+            if classes is None:
+                continue
+
+            files[plugin_file] = PluginFile(mtime_ns=mtime_ns, classes=classes)
+            changed = True
+
+        self._files = files
+
+        # First file in directory order wins, as with a linear scan
+        self._modules = {}
+        for plugin_file in plugin_files:
+            for class_name in files.get(plugin_file, PluginFile(None, [])).classes:
+                self._modules.setdefault(class_name, plugin_file[:-3])
+
+        if changed:
+            self._save()
+
+    def _scan(self, file_path: str, plugin_file: str) -> T.Optional[T.List[str]]:
+        """
+        Scan a plugin file for classes deriving from the base class.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the plugin file.
+        plugin_file : str
+            The file name of the plugin, used for logging.
+
+        Returns
+        -------
+        List[str] or None
+            The names of the plugin classes, or None if the file could not be read.
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except Exception as e:
+            logging.warning(f"Could not read {plugin_file}: {e}")
+            return None
+
+        return [
+            match.group(1)
+            for match in CLASS_PATTERN.finditer(content)
+            if self.base_class in match.group(2)
+        ]
+
+    def _load(self) -> T.Dict[str, PluginFile]:
+        """
+        Load the persisted index.
+
+        Returns
+        -------
+        Dict[str, PluginFile]
+            The persisted entries keyed by file name, empty if there is no
+            usable index on disk.
+        """
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (
+                data.get("format") != PLUGIN_INDEX_FORMAT
+                or data.get("base_class") != self.base_class
+            ):
+                return {}
+            return {
+                name: PluginFile(mtime_ns=entry["mtime_ns"], classes=entry["classes"])
+                for name, entry in data["files"].items()
+            }
+        except Exception:
+            return {}
+
+    def _save(self) -> None:
+        """
+        Persist the index, skipping files whose modification time is unknown.
+        """
+        data = {
+            "format": PLUGIN_INDEX_FORMAT,
+            "base_class": self.base_class,
+            "files": {
+                name: {"mtime_ns": entry.mtime_ns, "classes": entry.classes}
+                for name, entry in self._files.items()
+                if entry.mtime_ns is not None
+            },
+        }
+
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logging.debug(f"Could not save plugin index {self.cache_path}: {e}")
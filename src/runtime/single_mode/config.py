@@ -48,6 +48,23 @@ class RuntimeConfig:
     # Optional mode information for multi-mode runtime configurations
     mode: Optional[str] = None
 
+    # Optional event-driven scheduling: tick when an input changes instead of
+    # at a fixed rate. The minimum interval defaults to 1 / hertz.
+    event_driven: bool = False
+    event_debounce_seconds: float = 0.05
+    event_min_interval_seconds: Optional[float] = None
+    event_max_idle_seconds: float = 10.0
+
+    # Optional dedupe of ticks whose fused inputs did not change: skip the LLM
+    # call, or reuse its previous output, within the TTL of the last call
+    dedupe_ticks: bool = False
+    dedupe_ttl_seconds: float = 30.0
+    dedupe_reuse_output: bool = False
+
+    # Maximum number of concurrent LLM requests; above 1, ticks do not wait
+    # for the LLM and stale responses are dropped
+    llm_max_in_flight: int = 1
+
     @classmethod
     def load(cls, config_name: str) -> "RuntimeConfig":
         """Load a runtime configuration from a file."""
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+from functools import partial
 from typing import List, Optional, Union
 
 import json5
@@ -9,9 +10,13 @@ from actions.orchestrator import ActionOrchestrator
 from backgrounds.orchestrator import BackgroundOrchestrator
 from fuser import Fuser
 from inputs.orchestrator import InputOrchestrator
+from llm.output_model import Action, CortexOutputModel
 from providers.io_provider import IOProvider
 from providers.sleep_ticker_provider import SleepTickerProvider
+from runtime.action_stream import ActionStream
+from runtime.llm_pipeline import LLMRequestPipeline
 from runtime.single_mode.config import RuntimeConfig, load_config
+from runtime.tick_dedupe import TickDeduplicator
 from simulators.orchestrator import SimulatorOrchestrator
 
 
@@ -37,6 +42,8 @@ class CortexRuntime:
     background_orchestrator: BackgroundOrchestrator
     sleep_ticker_provider: SleepTickerProvider
     io_provider: IOProvider
+    tick_deduplicator: TickDeduplicator
+    llm_pipeline: LLMRequestPipeline
 
     def __init__(
         self,
@@ -70,6 +77,8 @@ class CortexRuntime:
         self.background_orchestrator = BackgroundOrchestrator(config)
         self.sleep_ticker_provider = SleepTickerProvider()
         self.io_provider = IOProvider()
+        self.tick_deduplicator = self._create_tick_deduplicator(config)
+        self.llm_pipeline = LLMRequestPipeline(config.llm_max_in_flight)
 
         self.last_modified: float = 0.0
         self.config_watcher_task: Optional[asyncio.Task] = None
@@ -88,6 +97,26 @@ class CortexRuntime:
                 f"Hot-reload enabled for runtime config: {self.config_path} (check interval: {check_interval}s)"
             )
 
+    def _create_tick_deduplicator(self, config: RuntimeConfig) -> TickDeduplicator:
+        """
+        Create the tick deduplicator for a configuration.
+
+        Parameters
+        ----------
+        config : RuntimeConfig
+            The runtime configuration.
+
+        Returns
+        -------
+        TickDeduplicator
+            The tick deduplicator, disabled unless dedupe_ticks is set.
+        """
+        return TickDeduplicator(
+            enabled=config.dedupe_ticks,
+            ttl_seconds=config.dedupe_ttl_seconds,
+            reuse_output=config.dedupe_reuse_output,
+        )
+
     def _get_runtime_config_path(self) -> str:
         """
         Get the path to the runtime config file.
@@ -264,6 +293,8 @@ class CortexRuntime:
             self.action_orchestrator = ActionOrchestrator(new_config)
             self.simulator_orchestrator = SimulatorOrchestrator(new_config)
             self.background_orchestrator = BackgroundOrchestrator(new_config)
+            self.tick_deduplicator = self._create_tick_deduplicator(new_config)
+            self.llm_pipeline = LLMRequestPipeline(new_config.llm_max_in_flight)
 
             await self._start_orchestrators()
 
@@ -284,6 +315,7 @@ class CortexRuntime:
         logging.debug("Stopping current orchestrators...")
 
         self.sleep_ticker_provider.skip_sleep = True
+        self.llm_pipeline.cancel_all()
 
         tasks_to_cancel = {}
 
@@ -451,7 +483,7 @@ class CortexRuntime:
         try:
             while True:
                 if not self.sleep_ticker_provider.skip_sleep:
-                    await self.sleep_ticker_provider.sleep(1 / self.config.hertz)
+                    await self._wait_for_next_tick()
 
                 # Helper to yield control to event loop
                 await asyncio.sleep(0)
@@ -465,6 +497,32 @@ class CortexRuntime:
             logging.error(f"Unexpected error in cortex loop: {e}")
             raise
 
+    async def _wait_for_next_tick(self) -> None:
+        """
+        Wait until the next tick is due.
+
+        In the default fixed-rate mode, sleeps 1 / hertz. In event-driven mode,
+        waits until an input changes, bounded by the configured minimum
+        interval and maximum idle heartbeat.
+
+        Returns
+        -------
+        None
+        """
+        if not self.config.event_driven:
+            await self.sleep_ticker_provider.sleep(1 / self.config.hertz)
+            return
+
+        min_interval = self.config.event_min_interval_seconds
+        if min_interval is None:
+            min_interval = 1 / self.config.hertz
+
+        await self.sleep_ticker_provider.wait_for_input_change(
+            min_interval=min_interval,
+            max_idle=self.config.event_max_idle_seconds,
+            debounce=self.config.event_debounce_seconds,
+        )
+
     async def _tick(self) -> None:
         """
         Execute a single tick of the cortex processing cycle.
@@ -490,16 +548,53 @@ class CortexRuntime:
                 logging.debug("No prompt to fuse")
                 return
 
-            # if there is a prompt, send to the AIs
-            output = await self.config.cortex_llm.ask(prompt)
-            if output is None:
-                logging.debug("No output from LLM")
-                return
-
-            # Trigger the simulators
-            await self.simulator_orchestrator.promise(output.actions)
-
-            # Trigger the actions
-            await self.action_orchestrator.promise(output.actions)
+            # if there is a prompt with new inputs, send to the AIs
+            llm = self.config.cortex_llm
+            stream = ActionStream(self._dispatch_actions)
+            await self.llm_pipeline.submit(
+                partial(
+                    self.tick_deduplicator.ask,
+                    llm,
+                    prompt,
+                    self.io_provider.fuser_inputs,
+                    on_action=stream.on_action if llm.streams_actions else None,
+                ),
+                partial(self._dispatch_output, stream),
+                stream,
+            )
         except Exception as error:
             logging.error(f"Error in cortex tick: {error}")
+
+    async def _dispatch_output(
+        self, stream: ActionStream, output: CortexOutputModel
+    ) -> None:
+        """
+        Trigger the simulators and actions for an LLM output.
+
+        Parameters
+        ----------
+        stream : ActionStream
+            The actions of the request dispatched so far.
+        output : CortexOutputModel
+            The LLM output.
+        """
+        await stream.finish(output)
+
+    async def _dispatch_actions(self, actions: List[Action]) -> None:
+        """
+        Trigger the simulators and actions for some actions of an LLM output.
+
+        Parameters
+        ----------
+        actions : List[Action]
+            The actions, all of an output or those streamed so far.
+        """
+        if self._is_reloading:
+            logging.debug("Dropping LLM output during config reload")
+            return
+
+        # Trigger the simulators
+        await self.simulator_orchestrator.promise(actions)
+
+        # Trigger the actions
+        await self.action_orchestrator.promise(actions)
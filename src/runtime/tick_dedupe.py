@@ -0,0 +1,143 @@
+import hashlib
+import logging
+import time
+from typing import Optional
+
+from llm import LLM
+from llm.output_model import CortexOutputModel
+from llm.streaming import ActionCallback
+from providers.io_provider import IOProvider
+
+
+class TickDeduplicator:
+    """
+    Skips LLM calls for ticks whose fused inputs did not change.
+
+    The dynamic section of the fused prompt (the AVAILABLE INPUTS block) is
+    hashed on every tick. If it matches the inputs of the last LLM call made
+    less than ttl_seconds ago, the tick is a duplicate: the LLM call is
+    skipped and either nothing or the previous output is returned.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether duplicate ticks are detected at all. When False, every tick
+        calls the LLM.
+    ttl_seconds : float
+        Maximum age in seconds of the last LLM call for a tick to count as a
+        duplicate. After that, the LLM is called again even if the inputs are
+        unchanged.
+    reuse_output : bool
+        If True, duplicate ticks return the previous LLM output so its actions
+        are dispatched again. Otherwise they return None.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        ttl_seconds: float = 30.0,
+        reuse_output: bool = False,
+    ):
+        """
+        Initialize the TickDeduplicator.
+        """
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.reuse_output = reuse_output
+        self.io_provider = IOProvider()
+
+        self._last_digest: Optional[str] = None
+        self._last_call_time: float = 0.0
+        self._last_output: Optional[CortexOutputModel] = None
+
+    def reset(self) -> None:
+        """
+        Forget the last LLM call, so the next tick always calls the LLM.
+        """
+        self._last_digest = None
+        self._last_call_time = 0.0
+        self._last_output = None
+
+    def is_duplicate(self, dynamic_prompt: Optional[str]) -> bool:
+        """
+        Check whether the dynamic section of a prompt repeats the last LLM call.
+
+        Parameters
+        ----------
+        dynamic_prompt : Optional[str]
+            The dynamic section of the fused prompt.
+
+        Returns
+        -------
+        bool
+            True if the same inputs were sent to the LLM less than ttl_seconds ago.
+        """
+        if not self.enabled or self._last_digest is None:
+            return False
+
+        if time.monotonic() - self._last_call_time >= self.ttl_seconds:
+            return False
+
+        return self._digest(dynamic_prompt) == self._last_digest
+
+    async def ask(
+        self,
+        llm: LLM,
+        prompt: str,
+        dynamic_prompt: Optional[str],
+        on_action: Optional[ActionCallback] = None,
+    ) -> Optional[CortexOutputModel]:
+        """
+        Send a prompt to the LLM, unless the tick is a duplicate.
+
+        Parameters
+        ----------
+        llm : LLM
+            The cortex LLM.
+        prompt : str
+            The full fused prompt.
+        dynamic_prompt : Optional[str]
+            The dynamic section of the fused prompt, used as the dedupe key.
+        on_action : ActionCallback, optional
+            Passed to a streaming LLM, to dispatch each action as soon as it
+            is complete.
+
+        Returns
+        -------
+        Optional[CortexOutputModel]
+            The LLM output, the previous output for a duplicate tick when
+            reuse_output is set, or None for a skipped tick.
+        """
+        if self.is_duplicate(dynamic_prompt):
+            self.io_provider.record_skipped_tick()
+            logging.debug("Fused inputs unchanged, skipping LLM call")
+            return self._last_output if self.reuse_output else None
+
+        if on_action is None:
+            output = await llm.ask(prompt)
+        else:
+            output = await llm.ask(prompt, on_action=on_action)
+
+        if self.enabled:
+            self._last_digest = self._digest(dynamic_prompt)
+            self._last_call_time = time.monotonic()
+            self._last_output = output
+
+        return output
+
+    @staticmethod
+    def _digest(dynamic_prompt: Optional[str]) -> str:
+        """
+        Hash the dynamic section of a prompt.
+
+        Parameters
+        ----------
+        dynamic_prompt : Optional[str]
+            The dynamic section of the fused prompt.
+
+        Returns
+        -------
+        str
+            The hex digest of the dynamic section.
+        """
+        return hashlib.sha256((dynamic_prompt or "").encode("utf-8")).hexdigest()
@@ -2,11 +2,15 @@ import importlib
 import inspect
 import logging
 import os
-import re
 import typing as T
 
+from runtime.plugin_index import PluginIndex
 from simulators.base import Simulator
 
+_plugin_index = PluginIndex(
+    os.path.join(os.path.dirname(__file__), "plugins"), "Simulator"
+)
+
 
 def find_module_with_class(class_name: str) -> T.Optional[str]:
     """
@@ -22,30 +26,7 @@ def find_module_with_class(class_name: str) -> T.Optional[str]:
     str or None
         The module name (without .py) that contains the class, or None if not found
     """
-    plugins_dir = os.path.join(os.path.dirname(__file__), "plugins")
-
-    if not os.path.exists(plugins_dir):
-        return None
-
-    plugin_files = [f for f in os.listdir(plugins_dir) if f.endswith(".py")]
-
-    for plugin_file in plugin_files:
-        file_path = os.path.join(plugins_dir, plugin_file)
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            pattern = rf"^class\s+{re.escape(class_name)}\s*\([^)]*Simulator[^)]*\)\s*:"
-
-            if re.search(pattern, content, re.MULTILINE):
-                return plugin_file[:-3]
-
-        except Exception as e:
-            logging.warning(f"Could not read {plugin_file}: {e}")
-            continue
-
-    return None
+    return _plugin_index.find(class_name)
 
 
 def load_simulator(class_name: str) -> T.Type[Simulator]:
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import os
 import threading
@@ -14,6 +13,7 @@ from fastapi.staticfiles import StaticFiles
 from llm.output_model import Action
 from providers.io_provider import Input, IOProvider
 from simulators.base import Simulator, SimulatorConfig
+from simulators.state_broadcaster import StateBroadcaster
 
 
 @dataclass
@@ -74,7 +74,11 @@ class WebSim(Simulator):
         if not os.path.exists(logo_path):
             logging.warning(f"Logo not found at {logo_path}")
 
-        self.active_connections: List[WebSocket] = []
+        # Clients receive merge patches of the state, at most broadcast_hz per second
+        self.broadcaster = StateBroadcaster(
+            max_rate_hz=getattr(config, "broadcast_hz", 10.0)
+        )
+        self.broadcaster.publish(self.state.to_dict())
 
         # Setup routes
         @self.app.get("/")
@@ -214,6 +218,21 @@ class WebSim(Simulator):
                 <body class="bg-gray-50">
                     <div id="root"></div>
                     <script type="text/babel">
+                        function applyMergePatch(target, patch) {
+                            if (patch === null || typeof patch !== 'object' || Array.isArray(patch)) {
+                                return patch;
+                            }
+                            const result = (target && typeof target === 'object' && !Array.isArray(target)) ? { ...target } : {};
+                            Object.entries(patch).forEach(([key, value]) => {
+                                if (value === null) {
+                                    delete result[key];
+                                } else {
+                                    result[key] = applyMergePatch(result[key], value);
+                                }
+                            });
+                            return result;
+                        }
+
                         function App() {
                             const [state, setState] = React.useState({
                                 inputs: {},
@@ -267,7 +286,11 @@ class WebSim(Simulator):
 
                                 ws.onmessage = (event) => {
                                     const data = JSON.parse(event.data);
-                                    setState(data);
+                                    if (data.type === 'patch') {
+                                        setState(prev => applyMergePatch(prev, data.patch));
+                                    } else {
+                                        setState(data.state);
+                                    }
                                 };
 
                                 ws.onerror = (error) => {
@@ -464,15 +487,7 @@ class WebSim(Simulator):
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await websocket.accept()
-            self.active_connections.append(websocket)
-            try:
-                await websocket.send_json(self.state.to_dict())
-                while True:
-                    await websocket.receive_text()
-            except Exception as e:
-                logging.error(f"WebSocket error: {e}")
-            finally:
-                self.active_connections.remove(websocket)
+            await self.broadcaster.serve(websocket)
 
         # Start server thread
         try:
@@ -527,29 +542,11 @@ class WebSim(Simulator):
         server.run()
 
     async def broadcast_state(self):
-        """Broadcast current state to all connected clients"""
-        if not self.active_connections:
-            return
-
-        try:
-
-            # Broadcast to all clients
-            disconnected = []
-            for connection in self.active_connections:
-                try:
-                    await connection.send_json(self.state_dict)
-                except Exception as e:
-                    logging.error(f"Error broadcasting to client: {e}")
-                    disconnected.append(connection)
-
-            for connection in disconnected:
-                try:
-                    self.active_connections.remove(connection)
-                except ValueError:
-                    pass
-
-        except Exception as e:
-            logging.error(f"Error in broadcast_state: {e}")
+        """Publish the current state to all connected clients"""
+        with self._lock:
+            state_dict = self.state_dict
+        if state_dict:
+            self.broadcaster.publish(state_dict)
 
     def get_earliest_time(self, inputs: Dict[str, Input]) -> float:
         """Get earliest timestamp from inputs"""
@@ -566,26 +563,11 @@ class WebSim(Simulator):
         return earliest_time if earliest_time != float("inf") else 0.0
 
     def tick(self) -> None:
-        """Update simulator state"""
-        if self._initialized:
-            try:
-                # Get or create event loop
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                try:
-                    loop.run_until_complete(self.broadcast_state())
-                except Exception:
-                    loop = asyncio.get_event_loop()
-                    loop.create_task(self.broadcast_state())
-
-            except Exception as e:
-                logging.error(f"Error in tick: {e}")
-
-            time.sleep(0.5)
+        """
+        Idle between updates; sim publishes state changes to the clients and
+        the broadcaster sends them from the server event loop.
+        """
+        time.sleep(0.5)
 
     def sim(self, actions: List[Action]) -> None:
         """Handle simulation updates from commands"""
@@ -594,13 +576,13 @@ class WebSim(Simulator):
             return
 
         try:
-            updated = False
             with self._lock:
-                earliest_time = self.get_earliest_time(self.io_provider.inputs)
+                inputs = self.io_provider.input_snapshot.inputs
+                earliest_time = self.get_earliest_time(inputs)
                 logging.debug(f"earliest_time: {earliest_time}")
 
                 input_rezeroed = []
-                for input_type, input_info in self.io_provider.inputs.items():
+                for input_type, input_info in inputs.items():
                     timestamp = 0
                     if (
                         input_type != "GovernanceEthereum"
@@ -637,20 +619,11 @@ class WebSim(Simulator):
 
                 for action in actions:
                     if action.type == "move":
-                        new_action = action.value
-                        if new_action != self.state.current_action:
-                            self.state.current_action = new_action
-                            updated = True
+                        self.state.current_action = action.value
                     elif action.type == "speak":
-                        new_speech = action.value
-                        if new_speech != self.state.last_speech:
-                            self.state.last_speech = new_speech
-                            updated = True
+                        self.state.last_speech = action.value
                     elif action.type == "emotion":
-                        new_emotion = action.value
-                        if new_emotion != self.state.current_emotion:
-                            self.state.current_emotion = new_emotion
-                            updated = True
+                        self.state.current_emotion = action.value
 
                 self.state_dict = {
                     "current_action": self.state.current_action,
@@ -662,9 +635,7 @@ class WebSim(Simulator):
 
                 logging.info(f"Inputs and LLM Outputs: {self.state_dict}")
 
-            if updated:
-                self._last_tick = 0
-                self.tick()
+            self.broadcaster.publish(self.state_dict)
 
         except Exception as e:
             logging.error(f"Error in sim update: {e}")
@@ -674,9 +645,4 @@ class WebSim(Simulator):
         logging.info("Cleaning up WebSim...")
         self._initialized = False
 
-        for connection in self.active_connections[:]:
-            try:
-                await connection.close()
-            except Exception as e:
-                logging.error(f"Error closing connection: {e}")
-        self.active_connections.clear()
+        await self.broadcaster.close()
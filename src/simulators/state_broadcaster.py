@@ -0,0 +1,387 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+
+def diff_state(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute a JSON merge patch (RFC 7386) that turns one state into another.
+
+    Nested dictionaries are diffed recursively, other values, including
+    lists, are replaced as a whole, and removed keys are set to None. As in
+    RFC 7386, None values in the new state cannot be told apart from removals.
+
+    Parameters
+    ----------
+    old : Dict[str, Any]
+        The previous state.
+    new : Dict[str, Any]
+        The current state.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The merge patch, empty if the states are equal.
+    """
+    patch: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+            continue
+
+        previous = old[key]
+        if isinstance(value, dict) and isinstance(previous, dict):
+            nested = diff_state(previous, value)
+            if nested:
+                patch[key] = nested
+        elif value != previous:
+            patch[key] = value
+
+    for key in old:
+        if key not in new:
+            patch[key] = None
+
+    return patch
+
+
+def apply_patch(state: Any, patch: Any) -> Any:
+    """
+    Apply a JSON merge patch (RFC 7386) to a state without modifying it.
+
+    Parameters
+    ----------
+    state : Any
+        The state to patch.
+    patch : Any
+        The merge patch, as produced by diff_state.
+
+    Returns
+    -------
+    Any
+        The patched state.
+    """
+    if not isinstance(patch, dict):
+        return patch
+
+    result = dict(state) if isinstance(state, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_patch(result.get(key), value)
+    return result
+
+
+@dataclass
+class BroadcastStats:
+    """
+    Counters of a StateBroadcaster.
+
+    Parameters
+    ----------
+    published : int
+        Number of state changes published.
+    serialized : int
+        Number of frames serialized.
+    sent : int
+        Number of frames sent to clients.
+    coalesced : int
+        Number of state versions clients skipped because they were rate
+        limited or still sending a previous frame.
+    disconnected : int
+        Number of clients dropped because a send timed out or failed.
+    """
+
+    published: int = 0
+    serialized: int = 0
+    sent: int = 0
+    coalesced: int = 0
+    disconnected: int = 0
+
+
+@dataclass(eq=False)
+class _Client:
+    """
+    A connected client and the state version it last received.
+    """
+
+    websocket: Any
+    loop: asyncio.AbstractEventLoop
+    version: int = 0
+    last_send: float = float("-inf")
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def notify(self) -> None:
+        """
+        Wake up the client sender from any thread.
+        """
+        try:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+        except RuntimeError:
+            # The server loop is closed
+            pass
+
+
+class StateBroadcaster:
+    """
+    Broadcast a JSON state to websocket clients as merge patches.
+
+    publish() may be called from any thread. It records a new state version
+    only when the state changed. Each client has its own sender task on the
+    server event loop that sends at most max_rate_hz frames per second. A
+    frame carries the patch from the version the client last received to the
+    latest version, so updates published while a client waits or is still
+    sending are coalesced into one frame, and a slow client only falls behind
+    instead of stalling the publisher or other clients.
+
+    Frames are serialized once per state version and base version, and
+    shared by every client at the same base version. Clients further behind
+    than history_size versions, and new clients, receive the full state.
+
+    Frames are JSON objects, either
+    {"type": "full", "version": v, "state": {...}} or
+    {"type": "patch", "base": b, "version": v, "patch": {...}}.
+
+    Parameters
+    ----------
+    max_rate_hz : float
+        Maximum number of frames sent to each client per second. 0 disables
+        rate limiting.
+    history_size : int
+        Number of past state versions kept to compute patches from.
+    send_timeout : float
+        Seconds after which a client that does not accept a frame is
+        disconnected.
+    """
+
+    def __init__(
+        self,
+        max_rate_hz: float = 10.0,
+        history_size: int = 8,
+        send_timeout: float = 5.0,
+    ):
+        """
+        Initialize the broadcaster without any state or clients.
+        """
+        self.min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        self.send_timeout = send_timeout
+
+        self._lock = threading.Lock()
+        self._version = 0
+        self._state: Dict[str, Any] = {}
+        self._history: Deque[Tuple[int, Dict[str, Any]]] = deque(
+            maxlen=max(1, history_size)
+        )
+        self._frames: Dict[Optional[int], str] = {}
+        self._clients: Set[_Client] = set()
+        self._stats = BroadcastStats()
+
+    @property
+    def version(self) -> int:
+        """
+        Get the latest state version, 0 if nothing was published.
+        """
+        return self._version
+
+    @property
+    def client_count(self) -> int:
+        """
+        Get the number of connected clients.
+        """
+        return len(self._clients)
+
+    @property
+    def stats(self) -> BroadcastStats:
+        """
+        Get a copy of the broadcaster counters.
+        """
+        with self._lock:
+            return BroadcastStats(**vars(self._stats))
+
+    def publish(self, state: Dict[str, Any]) -> bool:
+        """
+        Publish a new state to the clients.
+
+        The state must not be modified after it was published.
+
+        Parameters
+        ----------
+        state : Dict[str, Any]
+            The JSON serializable state.
+
+        Returns
+        -------
+        bool
+            True if the state changed and a new version was published.
+        """
+        with self._lock:
+            if self._version and not diff_state(self._state, state):
+                return False
+
+            self._version += 1
+            self._state = state
+            self._history.append((self._version, state))
+            self._frames = {}
+            self._stats.published += 1
+            clients = list(self._clients)
+
+        for client in clients:
+            client.notify()
+        return True
+
+    def frame_for(self, base_version: int) -> Optional[Tuple[int, str]]:
+        """
+        Get the serialized frame bringing a client up to date.
+
+        Parameters
+        ----------
+        base_version : int
+            The state version the client last received, 0 if none.
+
+        Returns
+        -------
+        Tuple[int, str] or None
+            The latest version and the frame, or None if the client is up to
+            date.
+        """
+        with self._lock:
+            if base_version >= self._version:
+                return None
+
+            base_state = None
+            for version, state in self._history:
+                if version == base_version:
+                    base_state = state
+                    break
+
+            key = base_version if base_state is not None else None
+            frame = self._frames.get(key)
+            if frame is None:
+                if base_state is not None:
+                    message = {
+                        "type": "patch",
+                        "base": base_version,
+                        "version": self._version,
+                        "patch": diff_state(base_state, self._state),
+                    }
+                else:
+                    message = {
+                        "type": "full",
+                        "version": self._version,
+                        "state": self._state,
+                    }
+                frame = json.dumps(message)
+                self._frames[key] = frame
+                self._stats.serialized += 1
+
+            return self._version, frame
+
+    async def serve(self, websocket: Any) -> None:
+        """
+        Send state updates to an accepted websocket until it disconnects.
+
+        Parameters
+        ----------
+        websocket : Any
+            The websocket, with async send_text, receive_text and close
+            methods.
+        """
+        client = _Client(websocket=websocket, loop=asyncio.get_running_loop())
+        with self._lock:
+            self._clients.add(client)
+        client.wakeup.set()
+
+        sender = asyncio.create_task(self._send_loop(client))
+        receiver = asyncio.create_task(self._receive_loop(websocket))
+        try:
+            await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (sender, receiver):
+                task.cancel()
+            await asyncio.gather(sender, receiver, return_exceptions=True)
+            with self._lock:
+                self._clients.discard(client)
+
+    async def close(self) -> None:
+        """
+        Close the websockets of all connected clients.
+        """
+        with self._lock:
+            clients = list(self._clients)
+            self._clients.clear()
+
+        for client in clients:
+            try:
+                await client.websocket.close()
+            except Exception as e:
+                logging.error(f"Error closing connection: {e}")
+
+    async def _send_loop(self, client: _Client) -> None:
+        """
+        Send the latest state to a client whenever it changes, rate limited.
+
+        Parameters
+        ----------
+        client : _Client
+            The client to send to.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await client.wakeup.wait()
+
+            delay = client.last_send + self.min_interval - loop.time()
+            if delay > 0:
+                # Updates published meanwhile are coalesced into one frame
+                await asyncio.sleep(delay)
+            client.wakeup.clear()
+
+            frame = self.frame_for(client.version)
+            if frame is None:
+                continue
+            version, text = frame
+
+            try:
+                await asyncio.wait_for(
+                    client.websocket.send_text(text), timeout=self.send_timeout
+                )
+            except asyncio.TimeoutError:
+                logging.warning("Websocket client too slow, disconnecting")
+                self._count_disconnect()
+                return
+            except Exception as e:
+                logging.error(f"Error broadcasting to client: {e}")
+                self._count_disconnect()
+                return
+
+            with self._lock:
+                self._stats.sent += 1
+                if client.version:
+                    self._stats.coalesced += version - client.version - 1
+            client.version = version
+            client.last_send = loop.time()
+
+    async def _receive_loop(self, websocket: Any) -> None:
+        """
+        Read and discard client messages until the websocket disconnects.
+
+        Parameters
+        ----------
+        websocket : Any
+            The websocket to read from.
+        """
+        try:
+            while True:
+                await websocket.receive_text()
+        except Exception as e:
+            logging.debug(f"WebSocket closed: {e}")
+
+    def _count_disconnect(self) -> None:
+        """
+        Count a client dropped by its sender.
+        """
+        with self._lock:
+            self._stats.disconnected += 1
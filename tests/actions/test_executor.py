@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from actions.base import ActionPriority
+from actions.executor import ActionExecutor
+
+
+class Recorder:
+    def __init__(self):
+        self.started = []
+        self.finished = []
+
+    def action(self, name, duration=0.0):
+        async def run():
+            self.started.append(name)
+            if duration:
+                await asyncio.sleep(duration)
+            self.finished.append(name)
+            return name
+
+        return run
+
+
+async def settle(tasks):
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_unlimited_lane_runs_concurrently():
+    executor = ActionExecutor()
+    recorder = Recorder()
+
+    tasks = [executor.submit("speak", recorder.action(i, 0.05)) for i in range(3)]
+    await asyncio.sleep(0.01)
+
+    assert recorder.started == [0, 1, 2]
+    assert await settle(tasks) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_queues_by_priority():
+    executor = ActionExecutor()
+    recorder = Recorder()
+
+    tasks = [
+        executor.submit("arm", recorder.action("first", 0.02), max_concurrency=1),
+        executor.submit("arm", recorder.action("low", 0.0), ActionPriority.LOW),
+        executor.submit("arm", recorder.action("normal", 0.0)),
+        executor.submit("arm", recorder.action("high", 0.0), ActionPriority.HIGH),
+    ]
+
+    await settle(tasks)
+
+    # The running action is preempted by the high priority one, then the
+    # queued ones start by priority
+    assert recorder.finished == ["high", "normal", "low"]
+    assert tasks[0].cancelled()
+    assert executor.stats.preempted == 1
+    assert executor.stats.queued == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_keeps_latest_queued_command():
+    executor = ActionExecutor()
+    recorder = Recorder()
+
+    def submit(name):
+        return executor.submit(
+            "move",
+            recorder.action(name, 0.02),
+            max_concurrency=1,
+            coalesce=True,
+        )
+
+    tasks = [submit("forwards"), submit("left"), submit("right"), submit("back")]
+    await settle(tasks)
+
+    assert recorder.finished == ["forwards", "back"]
+    assert [task.cancelled() for task in tasks] == [False, True, True, False]
+    assert executor.stats.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_emergency_preempts_own_and_opted_in_lanes():
+    executor = ActionExecutor()
+    recorder = Recorder()
+
+    move = executor.submit("move", recorder.action("move", 1.0), max_concurrency=1)
+    arm = executor.submit(
+        "arm", recorder.action("arm", 1.0), emergency_preemptible=True
+    )
+    speak = executor.submit("speak", recorder.action("speak", 0.05))
+    alert = executor.submit(
+        "alert", recorder.action("alert", 0.05), ActionPriority.EMERGENCY
+    )
+    await asyncio.sleep(0)
+
+    stop = executor.submit(
+        "move", recorder.action("stand still"), ActionPriority.EMERGENCY
+    )
+    await settle([move, arm, speak, alert, stop])
+
+    assert move.cancelled() and arm.cancelled()
+    assert not speak.cancelled() and not alert.cancelled()
+    assert sorted(recorder.finished) == ["alert", "speak", "stand still"]
+    assert executor.stats.preempted == 2
+
+
+@pytest.mark.asyncio
+async def test_slot_freed_when_action_fails():
+    executor = ActionExecutor()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    async def succeed():
+        return "ok"
+
+    failing = executor.submit("move", fail, max_concurrency=1)
+    queued = executor.submit("move", succeed, max_concurrency=1)
+
+    results = await settle([failing, queued])
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_preemption_latency_of_stand_still():
+    executor = ActionExecutor()
+    recorder = Recorder()
+    loop = asyncio.get_running_loop()
+
+    executor.submit("move", recorder.action("walk", 2.0), max_concurrency=1)
+    await asyncio.sleep(0.01)
+
+    start = loop.time()
+    stop = executor.submit(
+        "move", recorder.action("stand still"), ActionPriority.EMERGENCY
+    )
+    await stop
+
+    assert loop.time() - start < 0.1
+    assert recorder.finished == ["stand still"]
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import time
+import typing as T
+from dataclasses import dataclass
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from actions.base import ActionConfig, ActionConnector, AgentAction, Interface
+from actions.orchestrator import ActionOrchestrator
+from llm.output_model import Action
+
+
+@dataclass
+class EchoInput:
+    action: str
+
+
+@dataclass
+class Echo(Interface[EchoInput, EchoInput]):
+    input: EchoInput
+    output: EchoInput
+
+
+class RecordingConnector(ActionConnector[EchoInput]):
+    def __init__(self, config: ActionConfig):
+        super().__init__(config)
+        self.received: T.List[EchoInput] = []
+
+    async def connect(self, input_protocol: EchoInput) -> None:
+        self.received.append(input_protocol)
+
+
+def make_orchestrator(labels):
+    config = Mock()
+    config.agent_actions = [
+        AgentAction(
+            name=label,
+            llm_label=label,
+            interface=Echo,
+            connector=RecordingConnector(ActionConfig()),
+            exclude_from_prompt=False,
+        )
+        for label in labels
+    ]
+    return ActionOrchestrator(config), config.agent_actions
+
+
+@pytest.mark.asyncio
+async def test_promise_dispatches_by_label():
+    orchestrator, actions = make_orchestrator(["move", "speak"])
+
+    await orchestrator.promise(
+        [Action(type="Speak", value="hello"), Action(type="move", value="sit")]
+    )
+    await asyncio.gather(*orchestrator.promise_queue)
+
+    assert actions[0].connector.received == [EchoInput(action="sit")]
+    assert actions[1].connector.received == [EchoInput(action="hello")]
+
+
+@pytest.mark.asyncio
+async def test_promise_repairs_bare_move_commands():
+    orchestrator, actions = make_orchestrator(["move"])
+    action = Action(type="Turn Left", value="")
+
+    await orchestrator.promise([action])
+    await asyncio.gather(*orchestrator.promise_queue)
+
+    assert (action.type, action.value) == ("move", "turn left")
+    assert actions[0].connector.received == [EchoInput(action="turn left")]
+
+
+@pytest.mark.asyncio
+async def test_promise_skips_unknown_action():
+    orchestrator, _ = make_orchestrator(["move"])
+
+    await orchestrator.promise([Action(type="fly", value="up")])
+
+    assert orchestrator.promise_queue == []
+
+
+@pytest.mark.asyncio
+async def test_first_action_wins_on_duplicate_label():
+    orchestrator, actions = make_orchestrator(["move", "move"])
+
+    await orchestrator.promise([Action(type="move", value="sit")])
+    await asyncio.gather(*orchestrator.promise_queue)
+
+    assert len(actions[0].connector.received) == 1
+    assert actions[1].connector.received == []
+
+
+@pytest.mark.asyncio
+async def test_flush_promises_keeps_pending_in_order():
+    orchestrator, _ = make_orchestrator([])
+    loop = asyncio.get_running_loop()
+    done, pending_a, pending_b = (loop.create_future() for _ in range(3))
+    done.set_result(1)
+    orchestrator.promise_queue = [pending_a, done, pending_b]
+
+    finished, pending = await orchestrator.flush_promises()
+
+    assert finished == [done]
+    assert pending == [pending_a, pending_b]
+    assert orchestrator.promise_queue is pending
+
+
+class SlowMoveConnector(RecordingConnector):
+    max_concurrency = 1
+    coalesce = True
+    urgent_actions = frozenset({"stand still"})
+
+    async def connect(self, input_protocol: EchoInput) -> None:
+        if input_protocol.action != "stand still":
+            await asyncio.sleep(1.0)
+        await super().connect(input_protocol)
+
+
+@pytest.mark.asyncio
+async def test_stand_still_preempts_and_flush_drops_cancelled():
+    orchestrator, actions = make_orchestrator(["move"])
+    actions[0].connector = SlowMoveConnector(ActionConfig())
+    orchestrator = ActionOrchestrator(Mock(agent_actions=actions))
+
+    await orchestrator.promise([Action(type="move", value="move forwards")])
+    await orchestrator.promise([Action(type="move", value="turn left")])
+    await orchestrator.promise([Action(type="move", value="stand still")])
+    await asyncio.sleep(0.05)
+
+    finished, pending = await orchestrator.flush_promises()
+
+    assert actions[0].connector.received == [EchoInput(action="stand still")]
+    assert [promise.result() for promise in finished] == [
+        EchoInput(action="stand still")
+    ]
+    assert pending == []
+    stats = orchestrator.executor_stats()
+    assert stats.coalesced == 1
+    assert stats.preempted == 1
+
+
+@pytest.mark.asyncio
+async def test_stand_still_keeps_speech_of_the_same_output():
+    orchestrator, actions = make_orchestrator(["speak", "move"])
+    actions[1].connector = SlowMoveConnector(ActionConfig())
+    orchestrator = ActionOrchestrator(Mock(agent_actions=actions))
+
+    await orchestrator.promise(
+        [
+            Action(type="speak", value="stopping now"),
+            Action(type="move", value="stand still"),
+        ]
+    )
+    await asyncio.sleep(0.05)
+
+    finished, pending = await orchestrator.flush_promises()
+
+    assert actions[0].connector.received == [EchoInput(action="stopping now")]
+    assert actions[1].connector.received == [EchoInput(action="stand still")]
+    assert len(finished) == 2
+    assert pending == []
+    assert orchestrator.executor_stats().preempted == 0
+
+
+class LegacyOrchestrator(ActionOrchestrator):
+    # Linear label scan, per-dispatch type hint lookup and quadratic flush,
+    # on the same executor
+
+    async def flush_promises(self):
+        done_promises = []
+        for promise in self.promise_queue:
+            if promise.done():
+                await promise
+                done_promises.append(promise)
+        self.promise_queue = [p for p in self.promise_queue if p not in done_promises]
+        return done_promises, self.promise_queue
+
+    async def promise(self, actions):
+        for action in actions:
+            logging.debug(f"Sending command: {action}")
+            agent_action = next(
+                (
+                    m
+                    for m in self._config.agent_actions
+                    if m.llm_label == action.type.lower()
+                ),
+                None,
+            )
+            self.promise_queue.append(
+                self._executor.submit(
+                    agent_action.llm_label,
+                    partial(self._legacy_promise_action, agent_action, action),
+                )
+            )
+
+    async def _legacy_promise_action(self, agent_action, action):
+        input_interface = T.get_type_hints(agent_action.interface)["input"](
+            **{"action": action.value}
+        )
+        await agent_action.connector.connect(input_interface)
+        return input_interface
+
+
+async def time_bursts(orchestrator, burst, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        await orchestrator.promise(burst)
+        await asyncio.sleep(0)
+        await orchestrator.flush_promises()
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_promise_burst_benchmark():
+    labels = [f"action_{i}" for i in range(200)]
+    orchestrator, actions = make_orchestrator(labels)
+    legacy_orchestrator = LegacyOrchestrator(Mock(agent_actions=actions))
+    burst = [Action(type=labels[-1 - i % 20], value=str(i)) for i in range(1000)]
+
+    legacy = await time_bursts(legacy_orchestrator, burst, 3)
+    table = await time_bursts(orchestrator, burst, 3)
+
+    assert orchestrator.promise_queue == []
+    assert table < legacy, (
+        f"3 bursts of 1000 actions over 200 labels: legacy {legacy * 1e3:.1f} ms, "
+        f"dispatch table {table * 1e3:.1f} ms"
+    )
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from actions.base import ActionConfig, ActionConnector, AgentAction
+from actions.orchestrator import ActionOrchestrator
+from actions.scheduler import ConnectorScheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = ConnectorScheduler(max_workers=2)
+    yield scheduler
+    scheduler.stop()
+
+
+def test_periodic_ticks(scheduler):
+    calls = []
+    scheduler.add("fast", lambda: calls.append(time.monotonic()), interval=0.02)
+    scheduler.start()
+    time.sleep(0.2)
+    scheduler.stop()
+
+    assert 5 <= len(calls) <= 12
+    stats = scheduler.stats()["fast"]
+    assert stats.interval == 0.02
+    assert stats.ticks == len(calls)
+    assert stats.overruns == 0
+    assert stats.max_jitter < 0.05
+
+
+def test_many_connectors_share_small_pool(scheduler):
+    counts = {f"connector_{i}": 0 for i in range(20)}
+    lock = threading.Lock()
+
+    def make_tick(name):
+        def tick():
+            with lock:
+                counts[name] += 1
+
+        return tick
+
+    for name in counts:
+        scheduler.add(name, make_tick(name), interval=0.02)
+    scheduler.start()
+    time.sleep(0.2)
+    workers = {t.name for t in threading.enumerate() if "connector-tick" in t.name}
+    scheduler.stop()
+
+    # No connector starves even though there are more than workers
+    assert all(count >= 3 for count in counts.values())
+    assert 1 <= len(workers) <= 2
+
+
+def test_overrun_skips_missed_periods(scheduler):
+    calls = []
+
+    def slow():
+        calls.append(time.monotonic())
+        time.sleep(0.05)
+
+    scheduler.add("slow", slow, interval=0.02)
+    scheduler.start()
+    time.sleep(0.25)
+    scheduler.stop()
+
+    stats = scheduler.stats()["slow"]
+    assert stats.overruns == stats.ticks
+    assert stats.skipped >= stats.ticks - 1
+    # Never run concurrently with itself, nor back to back to catch up
+    gaps = [b - a for a, b in zip(calls, calls[1:])]
+    assert all(gap >= 0.05 for gap in gaps)
+
+
+def test_self_paced_tick(scheduler):
+    calls = []
+
+    def tick():
+        calls.append(1)
+        time.sleep(0.01)
+
+    scheduler.add("self_paced", tick, interval=None)
+    scheduler.start()
+    time.sleep(0.1)
+    scheduler.stop()
+
+    assert len(calls) >= 3
+    assert scheduler.stats()["self_paced"].interval is None
+
+
+def test_errors_counted(scheduler):
+    tick = Mock(side_effect=RuntimeError("boom"))
+    scheduler.add("broken", tick, interval=0.02)
+    scheduler.start()
+    time.sleep(0.1)
+    scheduler.stop()
+
+    stats = scheduler.stats()["broken"]
+    assert stats.errors == stats.ticks >= 2
+
+
+def test_invalid_registration(scheduler):
+    scheduler.add("a", lambda: None, interval=1.0)
+
+    with pytest.raises(ValueError):
+        scheduler.add("a", lambda: None, interval=1.0)
+    with pytest.raises(ValueError):
+        scheduler.add("b", lambda: None, interval=0)
+
+
+class IdleConnector(ActionConnector):
+    async def connect(self, input_protocol):
+        pass
+
+
+class PeriodicConnector(IdleConnector):
+    tick_interval = 0.02
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.ticks = 0
+
+    def tick(self):
+        self.ticks += 1
+
+
+def agent_action(label, connector):
+    return AgentAction(
+        name=label,
+        llm_label=label,
+        interface=Mock(),
+        connector=connector,
+        exclude_from_prompt=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_schedules_connectors():
+    periodic = PeriodicConnector(ActionConfig())
+    config = Mock()
+    config.agent_actions = [
+        agent_action("idle", IdleConnector(ActionConfig())),
+        agent_action("periodic", periodic),
+    ]
+
+    orchestrator = ActionOrchestrator(config)
+    orchestrator.start()
+    await asyncio.sleep(0.1)
+    orchestrator.stop()
+
+    stats = orchestrator.connector_stats()
+    assert "idle" not in stats
+    assert stats["periodic"].ticks == periodic.ticks >= 2
@@ -84,3 +84,61 @@ def test_fuser_with_inputs_and_actions(mock_describe):
             io_provider.fuser_available_actions
             == "AVAILABLE ACTIONS:\naction description\n\naction description\n\n\n\nWhat will you do? Actions:"
         )
+
+
+@patch("fuser.describe_action")
+def test_fuser_caches_static_prompt_sections(mock_describe):
+    mock_describe.return_value = "action description"
+    config = MockConfig(agent_actions=[MockAction("action1"), MockAction("action2")])
+    io_provider = IOProvider()
+    hits = io_provider.fuser_prompt_cache_hits
+    misses = io_provider.fuser_prompt_cache_misses
+
+    with patch("fuser.IOProvider", return_value=io_provider):
+        fuser = Fuser(config)
+        first = fuser.fuse([MockSensor()], [])
+        second = fuser.fuse([MockSensor()], [])
+
+        assert first == second
+        assert mock_describe.call_count == 2
+        assert io_provider.fuser_prompt_cache_misses == misses + 1
+        assert io_provider.fuser_prompt_cache_hits == hits + 1
+        assert io_provider.fuser_prompt_build_time is not None
+
+
+@patch("fuser.describe_action")
+def test_fuser_rebuilds_cache_on_new_config(mock_describe):
+    mock_describe.return_value = "action description"
+    io_provider = IOProvider()
+
+    with patch("fuser.IOProvider", return_value=io_provider):
+        fuser = Fuser(MockConfig(agent_actions=[MockAction("action1")]))
+        fuser.fuse([], [])
+
+        fuser.config = MockConfig(system_prompt_base="reloaded prompt")
+        result = fuser.fuse([], [])
+        assert "reloaded prompt" in result
+        assert "action description" not in result
+
+        fuser.invalidate_prompt_cache()
+        fuser.config.system_prompt_base = "edited prompt"
+        assert "edited prompt" in fuser.fuse([], [])
+
+
+def test_fuser_omits_local_laws_when_provided_as_input():
+    @dataclass
+    class LawsSensor(Sensor):
+        def formatted_latest_buffer(self):
+            return "Universal Laws: be kind"
+
+    config = MockConfig()
+    io_provider = IOProvider()
+
+    with patch("fuser.IOProvider", return_value=io_provider):
+        fuser = Fuser(config)
+        with_laws = fuser.fuse([MockSensor()], [])
+        without_laws = fuser.fuse([LawsSensor()], [])
+
+        assert "\nLAWS:\n" + config.system_governance in with_laws
+        assert "\nLAWS:\n" not in without_laws
+        assert "\n\nEXAMPLES:\n" + config.system_prompt_examples in without_laws
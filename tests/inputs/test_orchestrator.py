@@ -1,5 +1,5 @@
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -73,3 +73,57 @@ async def test_input_exception_handling():
     orchestrator = InputOrchestrator([error_input, normal_input])
     with pytest.raises(ValueError):
         await orchestrator.listen()
+
+
+@pytest.mark.asyncio
+async def test_listen_to_input_notifies_input_changes():
+    """Test that the InputOrchestrator signals the IOProvider on new events."""
+    mock_input = MockInput()
+    mock_input.raw_to_text = AsyncMock()
+    orchestrator = InputOrchestrator([mock_input])
+    orchestrator.io_provider = Mock()
+    await asyncio.wait_for(orchestrator._listen_to_input(mock_input), timeout=5.0)
+    assert orchestrator.io_provider.notify_input_changed.call_count == 3
+    orchestrator.io_provider.notify_input_changed.assert_called_with("MockInput")
+
+
+@pytest.mark.asyncio
+async def test_update_inputs_while_listening():
+    """Test that updated inputs are swapped without restarting kept ones."""
+    kept, removed, added = MockInput(), MockInput(), MockInput()
+    for input in (kept, removed, added):
+        input.max_polls = 5
+        input.raw_to_text = AsyncMock()
+    orchestrator = InputOrchestrator([kept, removed])
+
+    listen_task = asyncio.create_task(orchestrator.listen())
+    await asyncio.sleep(0.15)
+    kept_listener = orchestrator._listeners[id(kept)]
+
+    assert orchestrator.update_inputs([kept, added]) == (1, 1)
+    assert orchestrator._listeners[id(kept)] is kept_listener
+    assert id(removed) not in orchestrator._listeners
+
+    await asyncio.wait_for(listen_task, timeout=5.0)
+    assert kept.raw_to_text.call_count == 5
+    assert added.raw_to_text.call_count == 5
+    assert removed.raw_to_text.call_count < 5
+
+
+@pytest.mark.asyncio
+async def test_listen_cancellation_cancels_listeners():
+    """Test that cancelling listen stops the input listeners."""
+    mock_input = MockInput()
+    mock_input.max_polls = 100
+    mock_input.raw_to_text = AsyncMock()
+    orchestrator = InputOrchestrator([mock_input])
+
+    listen_task = asyncio.create_task(orchestrator.listen())
+    await asyncio.sleep(0.05)
+    listener = orchestrator._listeners[id(mock_input)]
+    listen_task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await listen_task
+    await asyncio.sleep(0)
+    assert listener.cancelled()
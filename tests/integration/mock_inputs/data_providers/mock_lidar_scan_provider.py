@@ -5,6 +5,8 @@ from typing import List, Optional
 
 import numpy as np
 
+from providers.sensor_recorder import LidarRecording
+
 
 class MockLidarProvider:
     """
@@ -40,12 +42,13 @@ class MockLidarProvider:
 
     def load_scans_from_json_files(self, file_paths: List[str], base_dir: Path):
         """
-        Load lidar scan data from JSON files.
+        Load lidar scan data from JSON files or columnar lidar recordings.
 
         Parameters
         ----------
         file_paths : List[str]
-            List of file paths to JSON files containing scan data
+            List of file paths to JSON files containing scan data, or to
+            .lidar columnar recordings
         base_dir : Path
             Base directory for resolving relative paths
         """
@@ -61,6 +64,14 @@ class MockLidarProvider:
                 logging.warning(f"Lidar data file not found: {lidar_file_path}")
                 continue
 
+            if lidar_file_path.suffix == ".lidar":
+                log = LidarRecording(str(lidar_file_path))
+                scans.extend(log.sensor_frame(i) for i in range(len(log)))
+                logging.info(
+                    f"MockLidarProvider: Loaded {len(log)} scans from {lidar_file_path}"
+                )
+                continue
+
             try:
                 with open(lidar_file_path, "r") as f:
                     data = json.load(f)
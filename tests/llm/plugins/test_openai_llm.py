@@ -121,3 +121,59 @@ async def test_ask_api_error(llm):
 
         result = await llm.ask("test prompt")
         assert result is None
+
+
+@pytest.mark.asyncio
+async def test_ask_response_cache(config, mock_response_with_tool_calls):
+    """Test repeated prompts are answered from the response cache"""
+    config.response_cache = True
+    config.response_cache_exclude = [r"time: \d+"]
+    llm = OpenAILLM(config, available_actions=None)
+    create = AsyncMock(return_value=mock_response_with_tool_calls)
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(llm._client.chat.completions, "create", create)
+
+        first = await llm.ask("test prompt, time: 1")
+        second = await llm.ask("test  prompt, time: 2")
+        await llm.ask("other prompt")
+
+    assert create.await_count == 2
+    assert second == first
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_ask_streaming(config):
+    """Test streamed tool calls are handed over as soon as they are complete"""
+    config.stream = True
+    llm = OpenAILLM(config, available_actions=None)
+
+    def chunk(index, name, arguments):
+        tool_call = MagicMock(index=index)
+        tool_call.function.name = name
+        tool_call.function.arguments = arguments
+        return MagicMock(choices=[MagicMock(delta=MagicMock(tool_calls=[tool_call]))])
+
+    async def stream():
+        yield chunk(0, "speak", '{"text": ')
+        yield chunk(0, None, '"hi"}')
+        yield chunk(1, "move", '{"action": "sit"}')
+
+    streamed = []
+
+    async def on_action(action):
+        streamed.append(action)
+
+    create = AsyncMock(return_value=stream())
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(llm._client.chat.completions, "create", create)
+
+        result = await llm.ask("test prompt", on_action=on_action)
+
+    assert create.call_args.kwargs["stream"] is True
+    assert streamed == [
+        Action(type="speak", value="hi"),
+        Action(type="move", value="sit"),
+    ]
+    assert result == CortexOutputModel(actions=streamed)
@@ -0,0 +1,164 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from llm import LLMConfig
+from llm.output_model import Action, CortexOutputModel
+from llm.response_cache import LLMResponseCache
+
+
+def output(value="hello"):
+    return CortexOutputModel(actions=[Action(type="speak", value=value)])
+
+
+def test_key_normalizes_prompt():
+    cache = LLMResponseCache(exclude=[r"\d+\.\d+ seconds ago"])
+
+    key = cache.key("model", "You see a cat,  1.5 seconds ago\n")
+
+    assert key == cache.key("model", "You see a cat, 12.25 seconds ago")
+    assert key != cache.key("model", "You see a dog, 1.5 seconds ago")
+    assert key != cache.key("other", "You see a cat, 1.5 seconds ago")
+
+
+def test_key_includes_history():
+    cache = LLMResponseCache()
+    history = [{"role": "user", "content": "Iris sensed a cat"}]
+
+    assert cache.key("model", "prompt", history) != cache.key("model", "prompt")
+    assert cache.key("model", "prompt", history) == cache.key(
+        "model", "prompt", [{"role": "user", "content": "Iris  sensed a cat "}]
+    )
+
+
+def test_get_returns_copies():
+    cache = LLMResponseCache()
+    cache.put("key", output())
+
+    first = cache.get("key")
+    first.actions.clear()
+
+    assert cache.get("key") == output()
+    assert cache.get("missing") is None
+
+
+def test_ttl():
+    cache = LLMResponseCache(ttl_seconds=10.0)
+    with patch("llm.response_cache.time.time", return_value=1000.0):
+        cache.put("key", output())
+    with patch("llm.response_cache.time.time", return_value=1009.0):
+        assert cache.get("key") == output()
+    with patch("llm.response_cache.time.time", return_value=1010.0):
+        assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = LLMResponseCache(max_entries=2)
+    cache.put("a", output("a"))
+    cache.put("b", output("b"))
+    cache.get("a")
+    cache.put("c", output("c"))
+
+    assert cache.get("a") == output("a")
+    assert cache.get("b") is None
+    assert cache.get("c") == output("c")
+
+
+def test_persistent(tmp_path):
+    path = str(tmp_path / "cache" / "llm.sqlite")
+    cache = LLMResponseCache(path=path)
+    cache.put("key", output())
+    cache.close()
+
+    restored = LLMResponseCache(path=path)
+
+    assert restored.get("key") == output()
+    assert len(restored) == 1
+
+
+def test_persistent_eviction(tmp_path):
+    path = str(tmp_path / "llm.sqlite")
+    cache = LLMResponseCache(max_entries=2, path=path)
+    for value in "abc":
+        cache.put(value, output(value))
+        time.sleep(0.001)
+    cache.close()
+
+    restored = LLMResponseCache(path=path)
+
+    assert restored.get("a") is None
+    assert restored.get("c") == output("c")
+
+
+def test_invalidate(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite"))
+    cache.put("a", output("a"))
+    cache.put("b", output("b"))
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == output("b")
+
+    cache.invalidate()
+    assert cache.get("b") is None
+
+
+def test_from_config():
+    assert LLMResponseCache.from_config(LLMConfig()) is None
+
+    cache = LLMResponseCache.from_config(
+        LLMConfig(
+            response_cache=True,
+            response_cache_ttl_seconds=5.0,
+            response_cache_max_entries=8,
+            response_cache_exclude=["[0-9]+"],
+        )
+    )
+
+    assert cache.ttl_seconds == 5.0
+    assert cache.max_entries == 8
+    assert cache.path is None
+    assert cache.key(None, "t=1") == cache.key(None, "t=2")
+
+
+class FakeLLM:
+    def __init__(self, cache):
+        from providers.io_provider import IOProvider
+
+        self._config = LLMConfig(model="model")
+        self.io_provider = IOProvider()
+        self.response_cache = cache
+        self.calls = 0
+
+    @LLMResponseCache.cached()
+    async def ask(self, prompt, messages=[]):
+        self.calls += 1
+        return output(prompt) if prompt != "none" else None
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_records_metrics():
+    llm = FakeLLM(LLMResponseCache())
+    hits = llm.io_provider.llm_response_cache_hits
+    misses = llm.io_provider.llm_response_cache_misses
+
+    assert await llm.ask("a") == output("a")
+    assert await llm.ask("a") == output("a")
+    assert await llm.ask("none") is None
+    assert await llm.ask("none") is None
+
+    assert llm.calls == 3
+    assert llm.io_provider.llm_response_cache_hits == hits + 1
+    assert llm.io_provider.llm_response_cache_misses == misses + 3
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_disabled():
+    llm = FakeLLM(None)
+
+    await llm.ask("a")
+    await llm.ask("a")
+
+    assert llm.calls == 2
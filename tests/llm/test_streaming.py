@@ -0,0 +1,117 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from llm.output_model import Action
+from llm.streaming import ToolCallStreamParser, stream_actions
+
+
+def fragment(index, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index, function=SimpleNamespace(name=name, arguments=arguments)
+    )
+
+
+def chunk(*tool_calls):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=SimpleNamespace(tool_calls=list(tool_calls)))]
+    )
+
+
+def tool_call_chunks(index, name, arguments, size=4):
+    text = json.dumps(arguments)
+    yield chunk(fragment(index, name=name, arguments=""))
+    for start in range(0, len(text), size):
+        yield chunk(fragment(index, arguments=text[start : start + size]))
+
+
+async def as_stream(chunks):
+    for item in chunks:
+        yield item
+
+
+def test_parser_completes_call_when_arguments_close():
+    parser = ToolCallStreamParser()
+    chunks = list(tool_call_chunks(0, "speak", {"text": "hello {there}"}))
+
+    completed = [parser.feed(c.choices[0].delta.tool_calls) for c in chunks]
+
+    assert all(not calls for calls in completed[:-1])
+    assert completed[-1] == [
+        {"function": {"name": "speak", "arguments": '{"text": "hello {there}"}'}}
+    ]
+    assert parser.finish() == []
+
+
+def test_parser_completes_call_when_next_starts():
+    parser = ToolCallStreamParser()
+    parser.feed([fragment(0, name="move", arguments='{"action": "sit"')])
+
+    completed = parser.feed([fragment(1, name="speak", arguments="")])
+
+    assert completed == [
+        {"function": {"name": "move", "arguments": '{"action": "sit"'}}
+    ]
+    assert parser.finish() == [{"function": {"name": "speak", "arguments": ""}}]
+
+
+def test_parser_ignores_fragments_of_completed_calls():
+    parser = ToolCallStreamParser()
+    parser.feed([fragment(0, name="move", arguments='{"action": "sit"}')])
+
+    assert parser.feed([fragment(0, arguments=" ")]) == []
+    assert parser.finish() == []
+
+
+@pytest.mark.asyncio
+async def test_stream_actions_dispatches_as_calls_complete():
+    chunks = [
+        *tool_call_chunks(0, "speak", {"text": "hi"}),
+        *tool_call_chunks(1, "move", {"action": "sit"}),
+        SimpleNamespace(choices=[SimpleNamespace(delta=None)]),
+    ]
+    dispatched = []
+    consumed = 0
+
+    async def stream():
+        nonlocal consumed
+        for item in chunks:
+            consumed += 1
+            yield item
+
+    async def on_action(action):
+        dispatched.append((action, consumed))
+
+    actions = await stream_actions(stream(), on_action)
+
+    assert actions == [
+        Action(type="speak", value="hi"),
+        Action(type="move", value="sit"),
+    ]
+    assert [action for action, _ in dispatched] == actions
+    # The first action is handed over before the second call starts
+    assert (
+        dispatched[0][1] < len(list(tool_call_chunks(0, "speak", {"text": "hi"}))) + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_actions_survives_callback_errors():
+    async def on_action(action):
+        raise RuntimeError("boom")
+
+    actions = await stream_actions(
+        as_stream(tool_call_chunks(0, "speak", {"text": "hi"})), on_action
+    )
+
+    assert actions == [Action(type="speak", value="hi")]
+
+
+@pytest.mark.asyncio
+async def test_stream_actions_without_tool_calls():
+    text_chunk = SimpleNamespace(
+        choices=[SimpleNamespace(delta=SimpleNamespace(tool_calls=None))]
+    )
+
+    assert await stream_actions(as_stream([text_chunk])) == []
@@ -0,0 +1,51 @@
+import os
+import pty
+import time
+import tty
+from typing import Callable
+
+
+class FakeSerialDevice:
+    """
+    Pseudo-terminal standing in for a serial device.
+
+    The port is the pty's device path, which pyserial opens like a real
+    serial port; bytes written to the device are read from the port. Usable
+    as a context manager.
+    """
+
+    def __init__(self):
+        self._master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+
+    def write(self, data: bytes) -> None:
+        os.write(self._master, data)
+
+    def write_lines(self, *lines: str) -> None:
+        self.write("".join(f"{line}\r\n" for line in lines).encode())
+
+    def close(self) -> None:
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "FakeSerialDevice":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 2.0) -> bool:
+    """
+    Wait until a condition holds, for at most timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
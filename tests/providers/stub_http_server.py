@@ -0,0 +1,125 @@
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class StubRoute:
+    status: int = 200
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+
+@dataclass
+class StubRequest:
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: bytes
+    client_port: int
+
+
+class StubHTTPServer:
+    """
+    Local HTTP/1.1 server with canned responses, running on a background thread.
+
+    Routes answer 304 when the request's If-None-Match matches their ETag.
+    Usable as a context manager.
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], StubRoute] = {}
+        self.requests: List[StubRequest] = []
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length", 0) or 0)
+                body = self.rfile.read(length) if length else b""
+                with stub._lock:
+                    stub.requests.append(
+                        StubRequest(
+                            method=self.command,
+                            path=self.path,
+                            headers=dict(self.headers),
+                            body=body,
+                            client_port=self.client_address[1],
+                        )
+                    )
+                    route = stub.routes.get((self.command, self.path))
+
+                if route is None:
+                    route = StubRoute(status=404)
+                if route.delay:
+                    time.sleep(route.delay)
+
+                etag = route.headers.get("ETag")
+                if etag is not None and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(route.status)
+                for name, value in route.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(route.body)))
+                self.end_headers()
+                self.wfile.write(route.body)
+
+            do_GET = _handle
+            do_POST = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(
+        self,
+        method: str,
+        path: str,
+        status: int = 200,
+        body: object = b"",
+        headers: Optional[Dict[str, str]] = None,
+        delay: float = 0.0,
+    ) -> None:
+        """
+        Set the response of a route. Non-bytes bodies are sent as JSON.
+        """
+        headers = dict(headers or {})
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+        with self._lock:
+            self.routes[(method, path)] = StubRoute(status, body, headers, delay)
+
+    def start(self) -> "StubHTTPServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubHTTPServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
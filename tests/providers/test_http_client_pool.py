@@ -0,0 +1,145 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import pytest
+
+from providers.http_client_pool import HTTPClientPool, HTTPStatusError
+from providers.singleton import singleton
+from tests.providers.stub_http_server import StubHTTPServer
+
+
+@pytest.fixture
+def server():
+    with StubHTTPServer() as server:
+        yield server
+
+
+@pytest.fixture
+def pool():
+    singleton.instances = {}
+    pool = HTTPClientPool(timeout=2.0)
+    yield pool
+    pool.close()
+    singleton.instances = {}
+
+
+@pytest.mark.asyncio
+async def test_get_json(pool, server):
+    server.route("GET", "/status", body={"ok": True})
+
+    response = await pool.get(f"{server.url}/status")
+
+    assert response.ok
+    assert response.json() == {"ok": True}
+    assert response.headers["content-type"] == "application/json"
+    assert not response.not_modified
+
+
+@pytest.mark.asyncio
+async def test_post_json_body(pool, server):
+    server.route("POST", "/rpc", body={"result": "0x1"})
+
+    response = await pool.post(f"{server.url}/rpc", json={"method": "eth_call"})
+
+    assert response.json() == {"result": "0x1"}
+    request = server.requests[0]
+    assert json.loads(request.body) == {"method": "eth_call"}
+    assert request.headers["Content-Type"] == "application/json"
+
+
+def test_request_sync(pool, server):
+    server.route("GET", "/status", status=503, body=b"down")
+
+    response = pool.request_sync("GET", f"{server.url}/status")
+
+    assert response.status == 503
+    assert response.text() == "down"
+    with pytest.raises(HTTPStatusError):
+        response.raise_for_status()
+
+
+def test_keep_alive(pool, server):
+    server.route("GET", "/status", body={})
+
+    for _ in range(3):
+        pool.request_sync("GET", f"{server.url}/status")
+
+    assert len({request.client_port for request in server.requests}) == 1
+
+
+def test_conditional_get(pool, server):
+    server.route("GET", "/locations", body={"a": 1}, headers={"ETag": '"v1"'})
+    url = f"{server.url}/locations"
+
+    first = pool.request_sync("GET", url)
+    second = pool.request_sync("GET", url)
+
+    assert not first.not_modified
+    assert second.not_modified
+    assert second.json() == {"a": 1}
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert pool.stats.not_modified == 1
+
+    server.route("GET", "/locations", body={"a": 2}, headers={"ETag": '"v2"'})
+    third = pool.request_sync("GET", url)
+
+    assert not third.not_modified
+    assert third.json() == {"a": 2}
+
+
+def test_conditional_disabled_for_post(pool, server):
+    server.route("POST", "/who", body={}, headers={"ETag": '"v1"'})
+
+    pool.request_sync("POST", f"{server.url}/who", json={})
+    pool.request_sync("POST", f"{server.url}/who", json={})
+
+    assert "If-None-Match" not in server.requests[1].headers
+
+
+@pytest.mark.asyncio
+async def test_coalesces_identical_requests(pool, server):
+    server.route("GET", "/slow", body={"n": 1}, delay=0.2)
+    url = f"{server.url}/slow"
+
+    responses = await asyncio.gather(*(pool.get(url) for _ in range(5)))
+
+    assert all(response.json() == {"n": 1} for response in responses)
+    assert len(server.requests) == 1
+    assert pool.stats.coalesced == 4
+
+
+def test_coalesces_across_threads(pool, server):
+    server.route("POST", "/rpc", body={"result": 1}, delay=0.2)
+    url = f"{server.url}/rpc"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(
+                pool.request_sync, "POST", url, json={"id": 1}, coalesce=True
+            )
+            for _ in range(4)
+        ]
+        results = [future.result() for future in futures]
+
+    assert all(result.json() == {"result": 1} for result in results)
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout(pool, server):
+    server.route("GET", "/slow", body={}, delay=0.5)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.get(f"{server.url}/slow", timeout=0.1)
+    assert pool.stats.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_connection_error(pool, server):
+    url = server.url
+    server.stop()
+
+    with pytest.raises(aiohttp.ClientError):
+        await pool.get(f"{url}/status")
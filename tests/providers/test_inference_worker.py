@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from providers.inference_worker import InferenceWorker
+from providers.singleton import singleton
+
+
+@pytest.fixture
+def worker():
+    singleton.instances = {}
+    worker = InferenceWorker()
+    yield worker
+    worker.stop()
+    singleton.instances = {}
+
+
+def double(frames):
+    return [frame * 2 for frame in frames]
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_unknown_model(worker):
+    with pytest.raises(ValueError):
+        worker.add_source("camera", "missing")
+
+
+def test_submit_and_latest(worker):
+    worker.register_model("double", double)
+    worker.add_source("camera", "double")
+
+    assert worker.latest("camera") is None
+    assert worker.submit("camera", 21) == 1
+
+    assert wait_for(lambda: worker.latest("camera") is not None)
+    result = worker.latest("camera")
+    assert result.value == 42
+    assert result.sequence == 1
+    assert result.error is None
+    assert result.latency >= 0
+
+    stats = worker.stats()["double"]
+    assert stats.submitted == 1
+    assert stats.inferred == 1
+    assert worker.latency_summary()["double"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_infer_does_not_block_loop(worker):
+    def slow(frames):
+        time.sleep(0.2)
+        return frames
+
+    worker.register_model("slow", slow)
+    worker.add_source("camera", "slow")
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    result = await worker.infer("camera", "frame", timeout=2)
+    task.cancel()
+
+    assert result.value == "frame"
+    assert ticks >= 5
+
+
+def test_drops_stale_frames(worker):
+    release = threading.Event()
+    seen = []
+
+    def blocked(frames):
+        release.wait(2)
+        seen.extend(frames)
+        return frames
+
+    worker.register_model("blocked", blocked)
+    worker.add_source("camera", "blocked")
+
+    worker.submit("camera", 0)
+    # The model thread picks up frame 0 and blocks on it
+    time.sleep(0.05)
+    for frame in range(1, 5):
+        worker.submit("camera", frame)
+    release.set()
+
+    assert wait_for(lambda: worker.stats()["blocked"].inferred == 2)
+    assert seen == [0, 4]
+    assert worker.stats()["blocked"].dropped == 3
+    assert worker.latest("camera").sequence == 5
+
+
+def test_batches_across_sources(worker):
+    release = threading.Event()
+    batches = []
+
+    def record(frames):
+        release.wait(2)
+        batches.append(list(frames))
+        return frames
+
+    worker.register_model("record", record, max_batch_size=4)
+    for camera in ("a", "b", "c"):
+        worker.add_source(camera, "record")
+
+    worker.submit("a", "a0")
+    time.sleep(0.05)
+    worker.submit("b", "b1")
+    worker.submit("c", "c1")
+    release.set()
+
+    assert wait_for(lambda: worker.stats()["record"].inferred == 3)
+    assert batches == [["a0"], ["b1", "c1"]]
+    assert worker.latest("b").value == "b1"
+    assert worker.latest("c").value == "c1"
+
+
+def test_capture_thread(worker):
+    frames = iter(range(100))
+
+    worker.register_model("double", double)
+    worker.add_source("camera", "double", capture=lambda: next(frames), interval=0.01)
+
+    assert wait_for(lambda: worker.latest("camera") is not None)
+    worker.remove_source("camera")
+
+    assert worker.latest("camera") is None
+
+
+def test_inference_error(worker):
+    def broken(frames):
+        raise RuntimeError("no GPU")
+
+    worker.register_model("broken", broken)
+    worker.add_source("camera", "broken")
+    worker.submit("camera", 1)
+
+    assert wait_for(lambda: worker.latest("camera") is not None)
+    result = worker.latest("camera")
+    assert result.value is None
+    assert result.error == "no GPU"
+    assert worker.stats()["broken"].failed == 1
+
+
+@pytest.mark.asyncio
+async def test_next_result_timeout(worker):
+    worker.register_model("double", double)
+    worker.add_source("camera", "double")
+
+    assert await worker.next_result("camera", timeout=0.05) is None
+    assert await worker.next_result("missing", timeout=0.05) is None
@@ -3,15 +3,14 @@ from typing import Optional
 
 import pytest
 
-from providers.io_provider import Input, IOProvider
+from providers.io_provider import Input, InputSnapshot, IOProvider
 
 
 @pytest.fixture
 def io_provider():
     provider = IOProvider()
     yield provider
-    provider._inputs.clear()
-    provider._input_timestamps.clear()
+    provider._input_snapshot = InputSnapshot()
     provider._fuser_start_time = None
     provider._fuser_end_time = None
     provider._llm_prompt = None
@@ -97,3 +96,106 @@ def test_thread_safety(io_provider):
         t.join()
 
     assert len(io_provider.inputs) == 10
+
+
+def test_fuser_prompt_cache_metrics(io_provider):
+    hits = io_provider.fuser_prompt_cache_hits
+    misses = io_provider.fuser_prompt_cache_misses
+
+    io_provider.record_fuser_prompt_cache_miss(0.25)
+    io_provider.record_fuser_prompt_cache_hit()
+    io_provider.record_fuser_prompt_cache_hit()
+
+    assert io_provider.fuser_prompt_cache_misses == misses + 1
+    assert io_provider.fuser_prompt_cache_hits == hits + 2
+    assert io_provider.fuser_prompt_build_time == 0.25
+
+
+def test_notify_input_changed(io_provider):
+    received = []
+
+    def callback(key: str):
+        received.append(key)
+
+    version = io_provider.input_version
+    io_provider.register_input_change_callback(callback)
+    io_provider.register_input_change_callback(callback)
+    io_provider.notify_input_changed("key1")
+
+    assert io_provider.input_version == version + 1
+    assert received == ["key1"]
+
+    io_provider.unregister_input_change_callback(callback)
+    io_provider.notify_input_changed("key2")
+
+    assert io_provider.input_version == version + 2
+    assert received == ["key1"]
+
+
+def test_notify_input_changed_callback_error(io_provider):
+    received = []
+
+    def failing_callback(key: str):
+        raise RuntimeError("callback failed")
+
+    io_provider.register_input_change_callback(failing_callback)
+    io_provider.register_input_change_callback(received.append)
+    try:
+        io_provider.notify_input_changed("key1")
+    finally:
+        io_provider.unregister_input_change_callback(failing_callback)
+        io_provider.unregister_input_change_callback(received.append)
+
+    assert received == ["key1"]
+
+
+def test_input_snapshot_is_immutable(io_provider):
+    io_provider.add_input("key1", "value1", 1.0)
+    snapshot = io_provider.input_snapshot
+
+    io_provider.add_input("key1", "value2", 2.0)
+    io_provider.add_input("key2", "value3", 3.0)
+
+    assert snapshot.inputs == {"key1": Input(input="value1", timestamp=1.0)}
+    assert io_provider.input_snapshot.version == snapshot.version + 2
+    with pytest.raises(TypeError):
+        snapshot.inputs["key3"] = Input(input="value4")
+
+
+def test_changed_since(io_provider):
+    io_provider.add_input("key1", "value1", 1.0)
+    io_provider.add_input("key2", "value2", 2.0)
+    version = io_provider.input_snapshot.version
+
+    assert io_provider.changed_since(version) == {}
+
+    io_provider.add_input("key2", "value3", 3.0)
+    io_provider.remove_input("key1")
+
+    assert io_provider.changed_since(version) == {
+        "key1": None,
+        "key2": Input(input="value3", timestamp=3.0),
+    }
+    assert io_provider.changed_since(0).keys() == {"key1", "key2"}
+
+
+def test_remove_unknown_input_keeps_version(io_provider):
+    version = io_provider.input_snapshot.version
+    io_provider.remove_input("nonexistent")
+    io_provider.add_input_timestamp("nonexistent", 1.0)
+    assert io_provider.input_snapshot.version == version
+
+
+def test_llm_response_cache_metrics(io_provider):
+    io_provider._llm_response_cache_hits = 0
+    io_provider._llm_response_cache_misses = 0
+    assert io_provider.llm_response_cache_hit_rate is None
+
+    io_provider.record_llm_response_cache_miss()
+    io_provider.record_llm_response_cache_hit()
+    io_provider.record_llm_response_cache_hit()
+    io_provider.record_llm_response_cache_hit()
+
+    assert io_provider.llm_response_cache_hits == 3
+    assert io_provider.llm_response_cache_misses == 1
+    assert io_provider.llm_response_cache_hit_rate == 0.75
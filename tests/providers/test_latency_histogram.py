@@ -0,0 +1,18 @@
+import pytest
+
+from providers.latency_histogram import LatencyHistogram
+
+
+def test_latency_histogram_buckets():
+    histogram = LatencyHistogram(buckets=(0.1, 1.0))
+
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(2.0)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.mean_seconds == pytest.approx(2.65 / 4)
+    assert histogram.max_seconds == 2.0
+    assert histogram.to_dict()["buckets"] == {"<=0.1": 2, "<=1.0": 1, ">1.0": 1}
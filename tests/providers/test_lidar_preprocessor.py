@@ -0,0 +1,184 @@
+import math
+import time
+
+import numpy as np
+import pytest
+
+from providers.lidar_preprocessor import LidarPreprocessor
+
+
+def legacy_points(data, mounting=180.0, blanked=(), d_min=0.08, d_max=1.1):
+    """
+    Reference per-point conversion, with blanked angles dropped.
+    """
+    complexes = []
+    for angle, d_m in data:
+        angle = angle + mounting
+        if angle >= 360.0:
+            angle = angle - 360.0
+        elif angle < 0.0:
+            angle = 360.0 + angle
+
+        if d_m > d_max or d_m < d_min:
+            continue
+
+        angle = angle - 180.0
+        if any(b[0] <= angle <= b[1] for b in blanked):
+            continue
+
+        a_rad = (angle + 180.0) * math.pi / 180.0
+        complexes.append([-d_m * math.sin(a_rad), -d_m * math.cos(a_rad), angle, d_m])
+
+    array = np.array(complexes).reshape(-1, 4)
+    return array[array[:, 2].argsort(kind="stable")]
+
+
+def random_scan(rng, num_points=360):
+    angles = rng.permutation(np.linspace(0.0, 360.0, num_points, endpoint=False))
+    distances = rng.uniform(0.0, 1.5, num_points)
+    return np.column_stack((angles, distances))
+
+
+@pytest.fixture
+def preprocessor():
+    return LidarPreprocessor(
+        sensor_mounting_angle=180.0,
+        angles_blanked=[],
+        relevant_distance_min=0.08,
+        relevant_distance_max=1.1,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_per_point_conversion(preprocessor, seed):
+    data = random_scan(np.random.default_rng(seed))
+
+    result = preprocessor.process(data[:, 0], data[:, 1])
+
+    np.testing.assert_allclose(result, legacy_points(data), atol=1e-12)
+
+
+def test_blanked_angles_dropped():
+    preprocessor = LidarPreprocessor(180.0, [[-10.0, 10.0], [170.0, 180.0]], 0.08, 1.1)
+    data = random_scan(np.random.default_rng(0))
+
+    result = preprocessor.process(data[:, 0], data[:, 1])
+
+    blanked = [[-10.0, 10.0], [170.0, 180.0]]
+    np.testing.assert_allclose(result, legacy_points(data, blanked=blanked))
+    assert not np.any((result[:, 2] >= -10.0) & (result[:, 2] <= 10.0))
+
+
+def test_invalid_distances(preprocessor):
+    angles = np.array([0.0, 90.0, 180.0, 270.0])
+    distances = np.array([np.inf, 0.01, 2.0, 0.5])
+
+    result = preprocessor.process(angles, distances)
+
+    assert result[:, 3].tolist() == [0.5]
+
+
+def test_obstacles_merged_by_angle(preprocessor):
+    angles = np.array([0.0, 90.0])
+    distances = np.array([0.5, 0.5])
+    obstacles = np.array([[0.1, 0.2, 45.0, 0.3], [0.1, 0.2, -45.0, 0.3]])
+
+    result = preprocessor.process(angles, distances, obstacles)
+
+    assert result[:, 2].tolist() == [-45.0, 0.0, 45.0, 90.0]
+
+
+def test_geometry_cached(preprocessor):
+    data = random_scan(np.random.default_rng(0))
+
+    first = preprocessor.geometry(data[:, 0])
+    second = preprocessor.geometry(data[:, 0].copy())
+    other = preprocessor.geometry(data[::-1, 0])
+
+    assert first is second
+    assert other is not first
+    assert preprocessor.geometry(data[:, 0]) is first
+
+
+def test_geometry_cache_bounded():
+    preprocessor = LidarPreprocessor(0.0, [], 0.0, 10.0, cache_size=2)
+    for offset in range(5):
+        preprocessor.geometry(np.arange(10.0) + offset)
+
+    assert len(preprocessor._geometries) == 2
+
+
+def test_geometry_cache_ignores_angle_noise(preprocessor):
+    data = random_scan(np.random.default_rng(0))
+    first = preprocessor.geometry(data[:, 0])
+
+    assert preprocessor.geometry(data[:, 0] + 1e-4) is first
+    assert preprocessor.geometry(data[:, 0] + 0.02) is not first
+
+
+def test_uncached_geometry_leaves_cache(preprocessor):
+    data = random_scan(np.random.default_rng(0))
+    cached = preprocessor.geometry(data[:, 0])
+
+    for offset in range(1, 6):
+        angles = data[:, 0] + offset / 64.0
+        result = preprocessor.process(angles, data[:, 1], cache=False)
+        np.testing.assert_allclose(
+            result, preprocessor.process(angles, data[:, 1]), atol=1e-12
+        )
+        np.testing.assert_array_equal(
+            preprocessor.raw_frame(angles, data[:, 1], cache=False),
+            preprocessor.raw_frame(angles, data[:, 1]),
+        )
+        preprocessor._geometries.pop(0)
+
+    assert preprocessor._geometries == [cached]
+
+
+def test_laser_scan_angles_cached(preprocessor):
+    angles = preprocessor.laser_scan_angles(-math.pi, math.pi, math.pi / 180, 360)
+
+    assert angles is preprocessor.laser_scan_angles(
+        -math.pi, math.pi, math.pi / 180, 360
+    )
+    assert len(angles) == 360
+    assert angles[0] == pytest.approx(359.0)
+    assert angles[-1] == pytest.approx(0.0)
+    assert not angles.flags.writeable
+
+
+def test_results_do_not_share_buffers(preprocessor):
+    data = random_scan(np.random.default_rng(0))
+
+    first = preprocessor.process(data[:, 0], data[:, 1]).copy()
+    result = preprocessor.process(data[:, 0], data[:, 1])
+    preprocessor.process(data[:, 0], data[:, 1] * 0.5)
+
+    np.testing.assert_array_equal(result, first)
+
+
+def test_raw_frame(preprocessor):
+    frame = preprocessor.raw_frame(np.array([0.0, 190.123]), np.array([1.0, 2.0]))
+
+    np.testing.assert_allclose(frame, [[180.0, 1.0], [10.12, 2.0]])
+
+
+def test_preprocessing_benchmark(preprocessor):
+    rng = np.random.default_rng(42)
+    angles = np.linspace(360.0, 0.0, 720, endpoint=False)
+    scans = [np.column_stack((angles, rng.uniform(0.0, 1.5, 720))) for _ in range(20)]
+
+    start = time.perf_counter()
+    for data in scans:
+        legacy_points(data)
+    legacy_per_scan = (time.perf_counter() - start) / len(scans)
+
+    start = time.perf_counter()
+    for data in scans:
+        preprocessor.process(angles, data[:, 1])
+    table_per_scan = (time.perf_counter() - start) / len(scans)
+
+    assert table_per_scan < legacy_per_scan, (
+        f"720-point scan: per point {legacy_per_scan * 1e3:.3f} ms, "
+        f"lookup tables {table_per_scan * 1e3:.3f} ms"
+    )
@@ -0,0 +1,95 @@
+import time
+
+import numpy as np
+import pytest
+
+from providers.lidar_replay_provider import LidarReplayProvider
+from providers.sensor_recorder import LidarColumnarFormat, SensorRecorder
+
+
+def record(base, count, interval=0.05, mounting=180.0):
+    recorder = SensorRecorder(
+        base, record_format=LidarColumnarFormat(sensor_mounting_angle=mounting)
+    )
+    for i in range(count):
+        recorder.record(
+            {
+                "timestamp": 1000.0 + i * interval,
+                "frame": [[(190.0 + i) % 360.0, 1.0 + i]],
+            }
+        )
+    recorder.stop()
+    return recorder.filename_current
+
+
+@pytest.fixture
+def scan_log(tmp_path):
+    return record(str(tmp_path / "lidar"), 5)
+
+
+def test_replay_as_fast_as_possible(scan_log):
+    frames = []
+    replay = LidarReplayProvider(scan_log, frames.append, speed=0)
+
+    replay.replay()
+
+    assert len(frames) == 5
+    # The mounting angle is removed, as _path_processor applies it again
+    np.testing.assert_allclose(frames[2], [[12.0, 3.0]])
+    assert replay.stats.replayed == 5
+
+
+def test_replay_real_time_and_accelerated(scan_log):
+    replay = LidarReplayProvider(scan_log, lambda frame: None, speed=1.0)
+    start = time.monotonic()
+    replay.replay()
+    real_time = time.monotonic() - start
+
+    replay = LidarReplayProvider(scan_log, lambda frame: None, speed=4.0)
+    start = time.monotonic()
+    replay.replay()
+    accelerated = time.monotonic() - start
+
+    assert 0.19 <= real_time < 0.4
+    assert accelerated < 0.1
+
+
+def test_replay_multiple_logs_in_background(tmp_path):
+    first = record(str(tmp_path / "a"), 3, interval=0.01)
+    second = record(str(tmp_path / "b"), 2, interval=0.01)
+    frames = []
+
+    replay = LidarReplayProvider([first, second], frames.append, speed=0, loop=True)
+    replay.start()
+    time.sleep(0.05)
+    replay.stop()
+
+    assert replay.scan_count == 5
+    assert len(frames) >= 10
+    assert not replay.running
+
+
+def test_consumer_errors_counted(scan_log):
+    def fail(frame):
+        raise RuntimeError("boom")
+
+    replay = LidarReplayProvider(scan_log, fail, speed=0)
+    replay.replay()
+
+    assert replay.stats.failed == 5
+
+
+def test_feeds_path_processor(scan_log):
+    processed = []
+
+    class Processor:
+        sensor_mounting_angle = 180.0
+
+        def _path_processor(self, data):
+            # Same orientation step as RPLidarProvider._path_processor
+            processed.append((data[0][0] + self.sensor_mounting_angle) % 360.0)
+
+    replay = LidarReplayProvider(scan_log, Processor()._path_processor, speed=0)
+    replay.replay()
+
+    assert processed == pytest.approx([190.0, 191.0, 192.0, 193.0, 194.0])
@@ -3,7 +3,13 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from providers.llm_history_manager import ChatMessage, LLMHistoryManager
+from providers.llm_history_manager import (
+    MESSAGE_TOKEN_OVERHEAD,
+    TRUNCATION_MARKER,
+    ChatMessage,
+    LLMHistoryManager,
+    TokenCounter,
+)
 
 
 @pytest.fixture
@@ -11,6 +17,7 @@ def llm_config():
     config = MagicMock()
     config.model = "gpt-4o"
     config.history_length = 5
+    config.history_token_budget = None
     config.agent_name = "Test Robot"
     return config
 
@@ -125,3 +132,159 @@ async def test_start_summary_task_error_handling(history_manager):
     await asyncio.sleep(0.1)
 
     assert len(messages) == 0
+
+
+@pytest.fixture
+def budget_manager(llm_config, openai_client):
+    llm_config.history_length = 100
+    llm_config.history_token_budget = 100
+    return LLMHistoryManager(llm_config, openai_client)
+
+
+def test_token_counter_estimate():
+    counter = TokenCounter()
+    counter._encoding = None
+    message = ChatMessage(role="user", content="x" * 35)
+
+    assert counter.count("x" * 35) == 10
+    assert counter.count_message(message) == 10 + MESSAGE_TOKEN_OVERHEAD
+    assert message.tokens == 10 + MESSAGE_TOKEN_OVERHEAD
+    assert counter.truncate("short", 10) == "short"
+    truncated = counter.truncate("x" * 350, 10)
+    assert truncated.endswith(TRUNCATION_MARKER)
+    assert counter.count(truncated) <= 10
+
+
+def test_get_messages_unlimited_without_budget(history_manager):
+    history_manager.history = [
+        ChatMessage(role="user", content="x" * 1000) for _ in range(3)
+    ]
+
+    assert len(history_manager.get_messages()) == 3
+
+
+def test_get_messages_keeps_newest_within_budget(budget_manager):
+    budget_manager.token_counter._encoding = None
+    budget_manager.history = [
+        ChatMessage(role="user", content=f"{i}" * 70) for i in range(5)
+    ]
+
+    messages = budget_manager.get_messages()
+
+    # 24 tokens per message, so the 4 newest fit in 100 tokens
+    assert [m["content"][0] for m in messages] == ["1", "2", "3", "4"]
+    assert budget_manager.truncated_messages == 1
+
+
+def test_get_messages_keeps_summary(budget_manager):
+    budget_manager.token_counter._encoding = None
+    budget_manager.history = [
+        ChatMessage(role="assistant", content="Previously, " + "s" * 500),
+        *[ChatMessage(role="user", content=f"{i}" * 70) for i in range(5)],
+    ]
+
+    messages = budget_manager.get_messages()
+
+    assert messages[0]["role"] == "assistant"
+    assert messages[0]["content"].endswith(TRUNCATION_MARKER)
+    assert [m["content"][0] for m in messages[1:]] == ["3", "4"]
+    counter = budget_manager.token_counter
+    total = sum(counter.count(m["content"]) + MESSAGE_TOKEN_OVERHEAD for m in messages)
+    assert total <= 100
+    # The history itself is left untouched
+    assert len(budget_manager.history[0].content) == len("Previously, ") + 500
+
+
+def test_get_messages_truncates_oversized_newest(budget_manager):
+    budget_manager.token_counter._encoding = None
+    budget_manager.history = [ChatMessage(role="user", content="x" * 1000)]
+
+    messages = budget_manager.get_messages()
+
+    assert len(messages) == 1
+    assert messages[0]["content"].endswith(TRUNCATION_MARKER)
+
+
+def test_compaction_by_tokens(budget_manager):
+    budget_manager.token_counter._encoding = None
+    budget_manager.history = [
+        ChatMessage(role="user", content=f"{i}" * 70) for i in range(5)
+    ]
+
+    assert budget_manager.needs_compaction()
+    # Fold the oldest messages until the rest fits in half the budget
+    assert budget_manager.compaction_count() == 3
+
+
+def test_compaction_by_length(history_manager):
+    history_manager.history = [ChatMessage(role="user", content="x")] * 6
+
+    assert history_manager.needs_compaction()
+    assert history_manager.compaction_count() == 6
+
+
+def test_compaction_fits_summary_prompt(budget_manager):
+    budget_manager.token_counter._encoding = None
+    budget_manager.history = [
+        ChatMessage(role="user", content=f"{i}" * 70) for i in range(6)
+    ]
+
+    assert budget_manager.needs_compaction()
+    # 24 tokens per message, so 4 fit in a summary prompt of 100 tokens
+    assert budget_manager.compaction_count() == 4
+
+
+def test_compaction_keeps_oversized_oldest(budget_manager):
+    budget_manager.token_counter._encoding = None
+    budget_manager.history = [
+        ChatMessage(role="user", content="x" * 1000),
+        ChatMessage(role="user", content="y" * 70),
+    ]
+
+    assert budget_manager.compaction_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_summarize_four_messages_without_summary(history_manager, openai_client):
+    messages = [ChatMessage(role="user", content=f"Message {i}") for i in range(4)]
+
+    await history_manager.summarize_messages(messages)
+
+    prompt = openai_client.chat.completions.create.call_args.kwargs["messages"][1]
+    for i in range(4):
+        assert f"Message {i}" in prompt["content"]
+
+
+@pytest.mark.asyncio
+async def test_summary_task_keeps_newer_messages(history_manager):
+    messages = [
+        ChatMessage(role="user", content="Old input"),
+        ChatMessage(role="user", content="Old action"),
+        ChatMessage(role="user", content="New input"),
+    ]
+    release = asyncio.Event()
+
+    async def summarize(to_summarize):
+        assert [m.content for m in to_summarize] == ["Old input", "Old action"]
+        await release.wait()
+        return ChatMessage(role="assistant", content="Summary")
+
+    history_manager.summarize_messages = summarize
+    await history_manager.start_summary_task(messages, 2)
+    messages.append(ChatMessage(role="user", content="Newest input"))
+    release.set()
+    await asyncio.sleep(0.05)
+
+    assert [m.content for m in messages] == ["Summary", "New input", "Newest input"]
+
+
+@pytest.mark.asyncio
+async def test_summaries_cached(history_manager, openai_client):
+    messages = [ChatMessage(role="user", content="Same input")]
+
+    first = await history_manager.summarize_messages(messages)
+    second = await history_manager.summarize_messages(list(messages))
+
+    assert first == second
+    assert openai_client.chat.completions.create.await_count == 1
+    assert history_manager.summary_cache_hits == 1
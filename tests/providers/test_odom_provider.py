@@ -0,0 +1,128 @@
+import math
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from providers.odom_provider import OdomProvider, RobotState
+from providers.singleton import singleton
+
+
+@pytest.fixture
+def odom():
+    singleton.instances = {}
+    # Without a channel, the provider does not start its reader process
+    provider = OdomProvider(channel="", use_zenoh=False)
+    yield provider
+    # Stop a processor thread from reading the ring once it is closed
+    provider._pose_ring_failed.set()
+    with provider._pose_ring_ready:
+        provider._pose_ring_ready.notify_all()
+    if provider.pose_ring is not None:
+        provider.pose_ring.close()
+    singleton.instances = {}
+
+
+def yaw_quaternion(yaw_deg):
+    half = math.radians(yaw_deg) / 2
+    return 0.0, 0.0, math.sin(half), math.cos(half)
+
+
+def test_position_reads_drained_ring_sample(odom):
+    assert odom.pose_ring is not None
+
+    odom.pose_ring.write(12.5, 1.0, 2.0, 0.3, *yaw_quaternion(90.0))
+
+    # Reading the position does not drain the ring
+    assert odom.position["odom_x"] == 0.0
+    assert odom._drain_pose_ring() is True
+
+    position = odom.position
+
+    assert position["odom_x"] == 1.0
+    assert position["odom_y"] == 2.0
+    assert position["odom_yaw_m180_p180"] == pytest.approx(90.0, abs=1e-3)
+    assert position["odom_yaw_0_360"] == pytest.approx(270.0, abs=1e-3)
+    assert position["odom_rockchip_ts"] == 12.5
+    assert position["moving"] is True
+
+
+def test_ring_samples_processed_in_order(odom):
+    for i in range(5):
+        odom.pose_ring.write(float(i), 0.1 * i, 0.0, 0.0, *yaw_quaternion(0.0))
+
+    assert odom._drain_pose_ring() is True
+    assert odom.position["odom_x"] == 0.4
+    assert odom._pose_ring_sequence == 5
+
+    # No new samples: the state is left as is
+    assert odom._drain_pose_ring() is False
+    assert odom.position["odom_x"] == 0.4
+
+
+def test_body_attitude_from_ring(odom):
+    odom.channel = "eth0"
+
+    odom.pose_ring.write(0.0, 0.0, 0.0, 0.3, *yaw_quaternion(0.0))
+    odom._drain_pose_ring()
+
+    assert odom.position["body_attitude"] is RobotState.STANDING
+
+
+def test_queue_fallback_without_ring():
+    singleton.instances = {}
+    provider = OdomProvider(channel="", use_zenoh=False, pose_ring_capacity=0)
+    try:
+        assert provider.pose_ring is None
+        assert provider._drain_pose_ring() is False
+        assert provider.position["odom_x"] == 0.0
+    finally:
+        singleton.instances = {}
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def start_processor(odom):
+    thread = threading.Thread(target=odom.process_odom, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_processor_wakes_on_ring_write(odom):
+    start_processor(odom)
+
+    # As written by the odom processor
+    with odom._pose_ring_ready:
+        odom.pose_ring.write(1.0, 3.0, 0.0, 0.0, *yaw_quaternion(0.0))
+        odom._pose_ring_ready.notify_all()
+
+    assert wait_for(lambda: odom.position["odom_x"] == 3.0)
+
+
+def test_processor_reads_queue_when_ring_attach_fails(odom):
+    start_processor(odom)
+
+    odom._pose_ring_failed.set()
+    with odom._pose_ring_ready:
+        odom._pose_ring_ready.notify_all()
+
+    qx, qy, qz, qw = yaw_quaternion(0.0)
+    odom.data_queue.put(
+        SimpleNamespace(
+            header=SimpleNamespace(stamp=SimpleNamespace(sec=2, nanosec=0)),
+            pose=SimpleNamespace(
+                position=SimpleNamespace(x=4.0, y=0.0, z=0.0),
+                orientation=SimpleNamespace(x=qx, y=qy, z=qz, w=qw),
+            ),
+        )
+    )
+
+    assert wait_for(lambda: odom.position["odom_x"] == 4.0)
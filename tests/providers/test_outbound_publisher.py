@@ -0,0 +1,157 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from providers.outbound_publisher import (
+    DeliveryPolicy,
+    OutboundPublisher,
+    ZenohPublisherCache,
+    encode_json,
+)
+from providers.zenoh_publisher_provider import ZenohPublisherProvider
+
+
+class BlockingSend:
+    """Records sent messages, blocking until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = threading.Event()
+        self.entered = threading.Event()
+
+    def __call__(self, key, payload):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        self.sent.append((key, payload))
+
+
+@pytest.fixture
+def send():
+    send = BlockingSend()
+    yield send
+    send.release.set()
+
+
+@pytest.fixture
+def outbound(send):
+    outbound = OutboundPublisher(send, max_pending=3)
+    yield outbound
+    outbound.stop()
+
+
+def block_worker(outbound, send):
+    """Start the worker and hold it inside the send of a first message."""
+    outbound.start()
+    outbound.publish("blocker", 0)
+    assert send.entered.wait(timeout=5)
+
+
+def test_ordered_key_publishes_every_message(outbound, send):
+    block_worker(outbound, send)
+    for i in range(3):
+        outbound.publish("speech", i)
+
+    assert outbound.queue_depth == 3
+    send.release.set()
+
+    assert outbound.flush(timeout=5)
+    assert send.sent == [("blocker", 0), ("speech", 0), ("speech", 1), ("speech", 2)]
+    assert outbound.stats.batches == 2
+    assert outbound.stats.max_queue_depth == 3
+
+
+def test_latest_key_coalesces(outbound, send):
+    encode = Mock(side_effect=lambda message: f"v{message}")
+    outbound.configure("cmd_vel", DeliveryPolicy.LATEST, encode=encode)
+    block_worker(outbound, send)
+    for i in range(5):
+        outbound.publish("cmd_vel", i)
+    outbound.publish("speech", "hi")
+
+    assert outbound.queue_depth == 2
+    send.release.set()
+
+    assert outbound.flush(timeout=5)
+    assert send.sent[1:] == [("cmd_vel", "v4"), ("speech", "hi")]
+    assert encode.call_count == 1
+    assert outbound.stats.coalesced == 4
+    assert outbound.stats.published == 3
+
+
+def test_ordered_key_drops_oldest_beyond_limit(outbound, send):
+    block_worker(outbound, send)
+    for i in range(5):
+        outbound.publish("speech", i)
+    send.release.set()
+
+    assert outbound.flush(timeout=5)
+    assert [payload for key, payload in send.sent if key == "speech"] == [2, 3, 4]
+    assert outbound.stats.dropped == 2
+
+
+def test_failed_send_counted_and_skipped(outbound):
+    outbound.send = Mock(side_effect=[RuntimeError("down"), None])
+    outbound.start()
+    outbound.publish("speech", 1)
+    outbound.publish("speech", 2)
+
+    assert outbound.flush(timeout=5)
+    assert outbound.stats.failed == 1
+    assert outbound.stats.published == 1
+    assert outbound.stats.latency.count == outbound.stats.published
+
+
+def test_stop_publishes_pending_messages(send):
+    send.release.set()
+    outbound = OutboundPublisher(send)
+    outbound.publish("speech", 1)
+    outbound.start()
+    outbound.stop()
+
+    assert send.sent == [("speech", 1)]
+    assert not outbound.running
+
+
+def test_publisher_cache_declares_once():
+    session = Mock()
+    cache = ZenohPublisherCache(session)
+
+    cache.put("a", b"1")
+    cache.put("a", b"2")
+    cache.put("b", b"3")
+
+    assert session.declare_publisher.call_count == 2
+    assert session.declare_publisher.return_value.put.call_count == 3
+
+    cache.close()
+    assert session.declare_publisher.return_value.undeclare.call_count == 2
+
+
+def test_encode_json():
+    assert encode_json({"message": "hi"}) == '{"message": "hi"}'
+
+
+def test_zenoh_publisher_provider_batches_through_declared_publisher():
+    session = Mock()
+    with patch(
+        "providers.zenoh_publisher_provider.open_zenoh_session", return_value=session
+    ):
+        provider = ZenohPublisherProvider("speech")
+
+    provider.start()
+    provider.add_pending_message("hello")
+    provider.add_pending_message("world")
+
+    assert provider.flush(timeout=5)
+    provider.stop()
+
+    session.declare_publisher.assert_called_once_with("speech")
+    payloads = [
+        call.args[0].to_string()
+        for call in session.declare_publisher.return_value.put.call_args_list
+    ]
+    assert '"message": "hello"' in payloads[0]
+    assert '"message": "world"' in payloads[1]
+    assert provider.stats.published == 2
+    session.close.assert_called_once()
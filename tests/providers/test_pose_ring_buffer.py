@@ -0,0 +1,83 @@
+import multiprocessing as mp
+
+import pytest
+
+from providers.pose_ring_buffer import PoseRingBuffer, PoseSample
+
+
+@pytest.fixture
+def ring():
+    ring = PoseRingBuffer(capacity=4)
+    yield ring
+    ring.close()
+
+
+def write_pose(ring, value):
+    return ring.write(value, value, value + 1, value + 2, 0.0, 0.0, 0.0, 1.0)
+
+
+def write_poses(name, count):
+    ring = PoseRingBuffer(name=name)
+    for i in range(count):
+        write_pose(ring, float(i))
+    ring.close()
+
+
+def test_empty(ring):
+    assert ring.sequence == 0
+    assert ring.latest() is None
+    assert ring.read_since(0) == []
+
+
+def test_write_and_latest(ring):
+    assert write_pose(ring, 1.0) == 1
+    assert write_pose(ring, 2.0) == 2
+
+    assert ring.sequence == 2
+    assert ring.latest() == PoseSample(2, 2.0, 2.0, 3.0, 4.0, 0.0, 0.0, 0.0, 1.0)
+
+
+def test_read_since(ring):
+    for i in range(3):
+        write_pose(ring, float(i))
+
+    assert [sample.sequence for sample in ring.read_since(0)] == [1, 2, 3]
+    assert [sample.sequence for sample in ring.read_since(2)] == [3]
+    assert ring.read_since(3) == []
+
+
+def test_read_since_skips_overwritten(ring):
+    for i in range(10):
+        write_pose(ring, float(i))
+
+    samples = ring.read_since(0)
+
+    assert [sample.sequence for sample in samples] == [7, 8, 9, 10]
+    assert samples[-1].timestamp == 9.0
+
+
+def test_torn_slot_skipped(ring):
+    write_pose(ring, 1.0)
+    ring._slot_sequences[0] = -1
+
+    assert ring.read_since(0) == []
+
+
+def test_attach_uses_existing_capacity(ring):
+    attached = PoseRingBuffer(capacity=128, name=ring.name)
+    try:
+        assert attached.capacity == 4
+        write_pose(ring, 5.0)
+        assert attached.latest().timestamp == 5.0
+    finally:
+        attached.close()
+
+
+def test_write_from_other_process(ring):
+    process = mp.Process(target=write_poses, args=(ring.name, 6))
+    process.start()
+    process.join(timeout=10)
+
+    assert process.exitcode == 0
+    assert ring.sequence == 6
+    assert ring.latest().timestamp == 5.0
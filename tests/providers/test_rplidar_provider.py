@@ -0,0 +1,217 @@
+import math
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from providers.rplidar_provider import RPLidarProvider
+from providers.singleton import singleton
+
+
+@pytest.fixture
+def rplidar():
+    singleton.instances = {}
+    with (
+        patch("providers.rplidar_provider.OdomProvider"),
+        patch("providers.rplidar_provider.D435Provider") as mock_d435,
+    ):
+        mock_d435.return_value = MagicMock(running=False, obstacle=[])
+        yield RPLidarProvider()
+    singleton.instances = {}
+
+
+def legacy_possible_paths(provider, X, Y, possible_paths):
+    """
+    Reference implementation of the per-point, per-path collision loop.
+    """
+    for x, y in zip(X, Y):
+        for apath in possible_paths:
+            path_points = provider.paths[apath]
+            start_x, start_y = path_points[0][0], path_points[1][0]
+            end_x, end_y = path_points[0][-1], path_points[1][-1]
+
+            if apath == 9 and y >= 0:
+                continue
+
+            dist_to_line = provider.distance_point_to_line_segment(
+                x, y, start_x, start_y, end_x, end_y
+            )
+            if dist_to_line < provider.half_width_robot:
+                possible_paths = np.setdiff1d(possible_paths, np.array([apath]))
+                break
+
+    return possible_paths
+
+
+def random_scan(rng, num_points=360, max_distance=1.5):
+    angles = np.sort(rng.uniform(-180.0, 180.0, num_points))
+    distances = rng.uniform(0.0, max_distance, num_points)
+    a_rad = np.radians(angles + 180.0)
+    X = -1 * distances * np.sin(a_rad)
+    Y = -1 * distances * np.cos(a_rad)
+    return X, Y
+
+
+def test_distance_points_to_line_segments_matches_scalar(rplidar):
+    rng = np.random.default_rng(0)
+    px = rng.uniform(-2.0, 2.0, 50)
+    py = rng.uniform(-2.0, 2.0, 50)
+    starts = np.vstack([rplidar._path_starts, [[0.5, 0.5]]])
+    ends = np.vstack([rplidar._path_ends, [[0.5, 0.5]]])
+
+    distances = rplidar.distance_points_to_line_segments(px, py, starts, ends)
+
+    assert distances.shape == (50, len(starts))
+    for i in range(len(px)):
+        for j in range(len(starts)):
+            expected = rplidar.distance_point_to_line_segment(
+                px[i], py[i], starts[j][0], starts[j][1], ends[j][0], ends[j][1]
+            )
+            assert distances[i, j] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_filter_blocked_paths_matches_legacy(rplidar, seed):
+    rng = np.random.default_rng(seed)
+    X, Y = random_scan(rng, num_points=int(rng.integers(1, 60)), max_distance=2.0)
+    possible_paths = np.arange(10)
+
+    expected = legacy_possible_paths(rplidar, X, Y, possible_paths)
+    result = rplidar._filter_blocked_paths(X, Y, possible_paths)
+
+    assert result.tolist() == expected.tolist()
+
+
+def test_filter_blocked_paths_one_path_per_return(rplidar):
+    # A single return ahead removes only the first path it blocks
+    result = rplidar._filter_blocked_paths(
+        np.array([0.0]), np.array([0.5]), np.arange(10)
+    )
+    assert result.tolist() == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+    result = rplidar._filter_blocked_paths(
+        np.array([0.0, 0.0, 0.0]), np.array([0.5, 0.6, 0.7]), np.arange(10)
+    )
+    assert result.tolist() == [0, 1, 2, 6, 7, 8, 9]
+
+
+def test_filter_blocked_paths_retreat_only_blocked_from_behind(rplidar):
+    # Directly ahead: never blocks the retreat path
+    result = rplidar._filter_blocked_paths(
+        np.array([0.0]), np.array([0.5]), np.array([9])
+    )
+    assert result.tolist() == [9]
+
+    # Directly behind: blocks the retreat path
+    result = rplidar._filter_blocked_paths(
+        np.array([0.0]), np.array([-0.5]), np.arange(10)
+    )
+    assert result.tolist() == [0, 1, 2, 3, 4, 5, 6, 7, 8]
+
+
+def test_filter_blocked_paths_simple_paths(rplidar):
+    result = rplidar._filter_blocked_paths(
+        np.array([0.0]), np.array([0.5]), np.array([4])
+    )
+    assert result.tolist() == []
+
+
+def test_path_processor_movement_options(rplidar):
+    # With the default 180 deg mounting, a sensor angle of 0 is straight ahead
+    rplidar._path_processor(np.array([[0.0, 0.5], [0.0, 0.6], [0.0, 0.7]]))
+
+    assert rplidar.valid_paths == [0, 1, 2, 6, 7, 8, 9]
+    assert rplidar.movement_options["advance"] == []
+    assert rplidar.movement_options["retreat"] is True
+
+
+def test_filter_blocked_paths_matches_legacy_near_obstacles(rplidar):
+    rng = np.random.default_rng(42)
+    scans = [random_scan(rng, max_distance=1.1) for _ in range(20)]
+
+    for X, Y in scans:
+        expected = legacy_possible_paths(rplidar, X, Y, np.arange(10))
+        result = rplidar._filter_blocked_paths(X, Y, np.arange(10))
+        assert result.tolist() == expected.tolist()
+
+
+def test_filter_blocked_paths_benchmark(rplidar):
+    rng = np.random.default_rng(42)
+    scans = [random_scan(rng, max_distance=1.1) for _ in range(20)]
+
+    start = time.perf_counter()
+    for X, Y in scans:
+        legacy_possible_paths(rplidar, X, Y, np.arange(10))
+    legacy_per_scan = (time.perf_counter() - start) / len(scans)
+
+    start = time.perf_counter()
+    for X, Y in scans:
+        rplidar._filter_blocked_paths(X, Y, np.arange(10))
+    batched_per_scan = (time.perf_counter() - start) / len(scans)
+
+    # The batched filter is several times faster, keep a margin for noisy runs
+    assert batched_per_scan * 2 < legacy_per_scan, (
+        f"360-point scan: legacy {legacy_per_scan * 1e3:.3f} ms, "
+        f"batched {batched_per_scan * 1e3:.3f} ms"
+    )
+
+
+def test_path_processor_blanked_angles(rplidar):
+    # A return straight ahead, blanked as a robot reflection
+    rplidar._preprocessor.angles_blanked = [(-5.0, 5.0)]
+    rplidar._preprocessor._geometries = []
+
+    rplidar._path_processor(np.array([[0.0, 0.5], [0.0, 0.6], [0.0, 0.7]]))
+
+    assert rplidar.valid_paths == list(range(10))
+
+
+def test_path_processor_merges_d435_obstacles(rplidar):
+    obstacles = np.array([[0.0, 0.5, 0.0, 0.5]] * 60)
+    rplidar.d435_provider.running = True
+    rplidar.d435_provider.obstacle = [{}] * 60
+    rplidar.d435_provider.obstacle_array = obstacles
+
+    rplidar._path_processor(np.empty((0, 2)))
+
+    assert len(rplidar.raw_scan) == 60
+    assert 3 not in rplidar.valid_paths
+
+
+def test_serial_processor_bypasses_geometry_cache(rplidar):
+    geometries = list(rplidar._preprocessor._geometries)
+
+    def stop_after_scan():
+        rplidar.running = False
+
+    # The driver sends (angle in degrees, distance in mm) readings
+    rplidar.data_queue = MagicMock()
+    rplidar.data_queue.get_nowait.return_value = [(0.0, 500.0), (0.4, 600.0)]
+    type(rplidar.odom).position = property(lambda _: stop_after_scan())
+    rplidar.running = True
+
+    rplidar._serial_processor()
+
+    assert rplidar._preprocessor._geometries == geometries
+    assert rplidar.valid_paths != list(range(10))
+
+
+def test_zenoh_processor_reuses_geometry(rplidar):
+    ranges = [5.0] * 360
+    ranges[180] = 0.5
+    scan = SimpleNamespace(
+        angle_min=-math.pi,
+        angle_max=math.pi,
+        angle_increment=math.pi / 180,
+        ranges=ranges,
+    )
+
+    rplidar._zenoh_processor(scan)
+    geometry = rplidar._preprocessor._geometries[0]
+    rplidar._zenoh_processor(scan)
+
+    assert rplidar._preprocessor._geometries == [geometry]
+    assert len(rplidar.raw_scan) == 1
+    assert rplidar.valid_paths != list(range(10))
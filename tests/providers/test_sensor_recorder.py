@@ -0,0 +1,283 @@
+import glob
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from providers.sensor_recorder import (
+    JsonLinesFormat,
+    LidarColumnarFormat,
+    LidarRecording,
+    SensorRecorder,
+    convert_jsonl_to_lidar,
+    read_recording,
+)
+
+
+@pytest.fixture
+def base(tmp_path):
+    return str(tmp_path / "dump" / "sensor")
+
+
+def recordings(base):
+    return sorted(glob.glob(f"{base}_*"))
+
+
+def lidar_scan(i, points=3):
+    return {
+        "timestamp": 1000.0 + 0.1 * i,
+        "odom_rockchip_ts": 100.0 + i,
+        "odom_subscriber_ts": 200.0 + i,
+        "odom_x": 0.5 * i,
+        "odom_y": -0.5 * i,
+        "odom_yaw_m180_p180": 10.0,
+        "odom_yaw_0_360": 350.0,
+        "frame": [[float(a), 1.0 + i] for a in range(points)],
+    }
+
+
+def test_json_lines(base):
+    recorder = SensorRecorder(base)
+    recorder.record({"a": 1})
+    recorder.record('{"b": 2}')
+    assert recorder.flush(timeout=5)
+    recorder.stop()
+
+    (path,) = recordings(base)
+    assert path.endswith(".jsonl")
+    lines = read_recording(path).decode("utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"a": 1}, {"b": 2}]
+
+    stats = recorder.stats
+    assert stats.enqueued == 2
+    assert stats.written == 2
+    assert stats.dropped == 0
+    assert stats.rotations == 1
+
+
+def test_gzip_compression(base):
+    recorder = SensorRecorder(base, compression="gzip")
+    for i in range(10):
+        recorder.record({"i": i})
+    recorder.stop()
+
+    (path,) = recordings(base)
+    assert path.endswith(".jsonl.gz")
+    lines = read_recording(path).decode("utf-8").splitlines()
+    assert [json.loads(line)["i"] for line in lines] == list(range(10))
+
+
+def test_gzip_readable_before_stop(base):
+    recorder = SensorRecorder(base, compression="gzip")
+    recorder.record({"i": 1})
+    assert recorder.flush(timeout=5)
+
+    (path,) = recordings(base)
+    assert json.loads(read_recording(path)) == {"i": 1}
+    recorder.stop()
+
+
+def test_unknown_compression(base):
+    with pytest.raises(ValueError):
+        SensorRecorder(base, compression="lz4")
+
+
+def test_size_rotation(base):
+    recorder = SensorRecorder(base, max_file_size_bytes=100, batch_size=1)
+    for i in range(10):
+        recorder.record({"value": "x" * 40, "i": i})
+        # Distinct timestamps in the file names
+        assert recorder.flush(timeout=5)
+        time.sleep(0.001)
+    recorder.stop()
+
+    paths = recordings(base)
+    assert len(paths) > 1
+    assert recorder.stats.rotations == len(paths)
+
+    lines = [
+        json.loads(line)
+        for path in paths
+        for line in read_recording(path).decode("utf-8").splitlines()
+    ]
+    assert sorted(line["i"] for line in lines) == list(range(10))
+
+
+def test_time_rotation(base):
+    recorder = SensorRecorder(base, max_file_age_seconds=0.05, flush_interval=0.01)
+    recorder.record({"i": 1})
+    assert recorder.flush(timeout=5)
+    time.sleep(0.1)
+    recorder.record({"i": 2})
+    recorder.stop()
+
+    assert len(recordings(base)) == 2
+
+
+def test_drops_when_queue_full(base, monkeypatch):
+    gate = threading.Event()
+    recorder = SensorRecorder(base, max_queue_size=2, batch_size=1)
+    original = recorder._write_batch
+
+    def blocked_write(batch):
+        gate.wait(5)
+        original(batch)
+
+    monkeypatch.setattr(recorder, "_write_batch", blocked_write)
+
+    results = [recorder.record({"i": i}) for i in range(10)]
+    gate.set()
+    recorder.stop()
+
+    stats = recorder.stats
+    assert results.count(False) == stats.dropped > 0
+    assert stats.written + stats.dropped == 10
+    assert stats.max_queue_depth <= 2
+
+
+def test_lidar_columnar_roundtrip():
+    scans = [lidar_scan(i, points=i + 1) for i in range(3)]
+    data = LidarColumnarFormat().encode_batch(scans)
+    data += LidarColumnarFormat().encode_batch([lidar_scan(3)])
+
+    decoded = LidarColumnarFormat.decode(data)
+
+    assert len(decoded) == 4
+    for scan, record in zip(scans + [lidar_scan(3)], decoded):
+        for field in LidarColumnarFormat.SCALAR_FIELDS:
+            assert record[field] == scan[field]
+        np.testing.assert_allclose(record["frame"], scan["frame"])
+
+
+def test_lidar_columnar_smaller_than_json():
+    scan = lidar_scan(0, points=360)
+    columnar = LidarColumnarFormat().encode_batch([scan] * 10)
+    json_lines = JsonLinesFormat().encode_batch([scan] * 10)
+    assert len(columnar) < len(json_lines)
+
+
+def test_lidar_columnar_invalid_block():
+    with pytest.raises(ValueError):
+        LidarColumnarFormat.decode(b"XXXX" + bytes(20))
+
+
+def test_lidar_columnar_recording(base):
+    recorder = SensorRecorder(
+        base, record_format=LidarColumnarFormat(), compression="gzip"
+    )
+    for i in range(5):
+        recorder.record(lidar_scan(i))
+    recorder.stop()
+
+    (path,) = recordings(base)
+    assert path.endswith(".lidar.gz")
+    decoded = LidarColumnarFormat.decode(read_recording(path))
+    assert [record["odom_x"] for record in decoded] == [0.5 * i for i in range(5)]
+    assert os.path.getsize(path) > 0
+
+
+def record_lidar(base, scans, compression=None, **kwargs):
+    recorder = SensorRecorder(
+        base, record_format=LidarColumnarFormat(**kwargs), compression=compression
+    )
+    for scan in scans:
+        recorder.record(scan)
+    recorder.stop()
+    return recorder.filename_current
+
+
+def test_lidar_recording_memory_mapped(base):
+    scans = [lidar_scan(i, points=i * 10) for i in range(5)]
+    path = record_lidar(base, scans, sensor_mounting_angle=180.0)
+
+    recording = LidarRecording(path)
+
+    assert isinstance(recording.data, np.memmap)
+    assert len(recording) == 5
+    assert recording.sensor_mounting_angle == 180.0
+    assert recording.frame(0).shape == (0, 2)
+    restored = recording.record(3)
+    assert restored["timestamp"] == scans[3]["timestamp"]
+    assert restored["odom_x"] == 1.5
+    np.testing.assert_allclose(restored["frame"], scans[3]["frame"])
+
+
+def test_lidar_recording_spans_blocks(base):
+    recorder = SensorRecorder(base, record_format=LidarColumnarFormat(), batch_size=2)
+    for i in range(7):
+        recorder.record(lidar_scan(i, points=i + 1))
+        assert recorder.flush(timeout=5)
+    recorder.stop()
+
+    recording = LidarRecording(recorder.filename_current)
+
+    assert len(recording._blocks) == 7
+    assert [len(recording.frame(i)) for i in range(7)] == list(range(1, 8))
+    assert [record["odom_y"] for record in recording] == [-0.5 * i for i in range(7)]
+
+
+def test_lidar_recording_index_at(base):
+    recording = LidarRecording(record_lidar(base, [lidar_scan(i) for i in range(10)]))
+
+    assert recording.index_at(0.0) == 0
+    assert recording.index_at(1000.35) == 3
+    assert recording.index_at(1000.4) == 4
+    assert recording.index_at(2000.0) == 9
+
+
+def test_lidar_recording_sensor_frame(base):
+    scan = lidar_scan(0)
+    scan["frame"] = [[10.0, 1.0], [200.0, 2.0]]
+    path = record_lidar(base, [scan], sensor_mounting_angle=180.0)
+
+    frame = LidarRecording(path).sensor_frame(0)
+
+    np.testing.assert_allclose(frame, [[190.0, 1.0], [20.0, 2.0]])
+
+
+def test_lidar_recording_ignores_partial_block(base):
+    path = record_lidar(base, [lidar_scan(i) for i in range(3)])
+    partial = LidarColumnarFormat().encode_batch([lidar_scan(3)])
+    with open(path, "ab") as f:
+        f.write(partial[: len(partial) // 2])
+
+    assert len(LidarRecording(path)) == 3
+
+
+def test_lidar_recording_compressed(base):
+    path = record_lidar(base, [lidar_scan(i) for i in range(3)], compression="gzip")
+
+    recording = LidarRecording(path)
+
+    assert len(recording) == 3
+    assert recording.record(2)["odom_y"] == -1.0
+
+
+def test_lidar_recording_rejects_other_files(tmp_path):
+    path = tmp_path / "lidar.jsonl"
+    path.write_text('{"frame": []}\n' * 4)
+
+    with pytest.raises(ValueError):
+        LidarRecording(str(path))
+
+
+def test_convert_jsonl_to_lidar(tmp_path, base):
+    scans = [lidar_scan(i, points=360) for i in range(4)]
+    del scans[0]["timestamp"]
+    source = tmp_path / "lidar_1.jsonl"
+    source.write_text("\n".join(json.dumps(scan) for scan in scans) + "\nnot json\n")
+
+    path = convert_jsonl_to_lidar(str(source), base, sensor_mounting_angle=90.0)
+
+    recording = LidarRecording(path)
+    assert recordings(base) == [path]
+    assert path.endswith(".lidar")
+    assert len(recording) == 4
+    assert recording.sensor_mounting_angle == 90.0
+    # Falls back to the odometry timestamp
+    assert recording.timestamps[0] == 200.0
+    np.testing.assert_allclose(recording.frame(2), scans[2]["frame"])
+    assert os.path.getsize(path) < source.stat().st_size
@@ -0,0 +1,197 @@
+import threading
+
+import pytest
+import serial
+
+from providers.gps_provider import GpsProvider
+from providers.serial_reactor import (
+    LineFramer,
+    SerialReactor,
+    nmea_checksum_valid,
+    parse_line,
+)
+from providers.singleton import singleton
+from tests.providers.fake_serial_device import FakeSerialDevice, wait_for
+
+GGA = "$GNGGA,231225.30,3723.2475,N,12158.3416,W,1,08,0.9,545.4,M,46.9,M,,*62"
+
+
+def with_checksum(body):
+    checksum = 0
+    for char in body.encode():
+        checksum ^= char
+    return f"${body}*{checksum:02X}"
+
+
+@pytest.fixture
+def reactor():
+    singleton.instances = {}
+    reactor = SerialReactor()
+    yield reactor
+    reactor.stop()
+    singleton.instances = {}
+
+
+@pytest.fixture
+def device():
+    with FakeSerialDevice() as device:
+        yield device
+
+
+class Collector:
+    def __init__(self):
+        self.records = []
+        self.lock = threading.Lock()
+
+    def __call__(self, record):
+        with self.lock:
+            self.records.append(record)
+
+    @property
+    def lines(self):
+        with self.lock:
+            return [record.line for record in self.records]
+
+
+def test_framer_reassembles_split_lines():
+    framer = LineFramer()
+
+    assert framer.feed(b"HDG:1") == []
+    assert framer.feed(b"2.5\r\nGPS:") == [b"HDG:12.5"]
+    assert framer.feed(b"1\nYPR:1,2,3\r\n") == [b"GPS:1", b"YPR:1,2,3"]
+    assert len(framer) == 0
+
+
+def test_framer_reuses_buffer_and_drops_overflow():
+    framer = LineFramer(max_line_length=8)
+    buffer = framer._buffer
+
+    framer.feed(b"0123456789")
+    assert len(framer) == 0
+    assert framer.feed(b"abc\n") == [b"abc"]
+    assert framer._buffer is buffer
+
+
+def test_nmea_checksum():
+    assert nmea_checksum_valid(GGA)
+    assert not nmea_checksum_valid(GGA.replace("545.4", "545.5"))
+    assert not nmea_checksum_valid("$GNGGA,231225.30")
+    assert not nmea_checksum_valid("$GNGGA,1*ZZ")
+
+
+def test_parse_line_kinds():
+    assert parse_line("p", GGA.encode(), 1.0).kind == "GNGGA"
+    assert parse_line("p", b"HDG:12.5", 1.0).kind == "HDG"
+    assert parse_line("p", b"Pulse: Elevated", 1.0).kind == ""
+    assert parse_line("p", b"$GNGGA,1*00", 1.0) is None
+    assert parse_line("p", b"  \r", 1.0) is None
+
+
+def test_dispatches_records_by_kind(reactor, device):
+    headings = Collector()
+    everything = Collector()
+    reactor.subscribe(device.port, headings, kinds=["HDG"])
+    reactor.subscribe(device.port, everything)
+
+    device.write_lines("HDG:90.0", GGA, "Pulse: Normal")
+
+    assert wait_for(lambda: len(everything.records) == 3)
+    assert headings.lines == ["HDG:90.0"]
+    assert everything.lines == ["HDG:90.0", GGA, "Pulse: Normal"]
+    assert reactor.ports == [device.port]
+
+
+def test_burst_delivered_in_order(reactor, device):
+    collector = Collector()
+    reactor.subscribe(device.port, collector)
+
+    lines = [with_checksum(f"GNGSA,{i}") for i in range(500)]
+    device.write_lines(*lines)
+
+    assert wait_for(lambda: len(collector.records) == len(lines))
+    assert collector.lines == lines
+
+
+def test_failing_callback_does_not_stop_dispatch(reactor, device):
+    collector = Collector()
+
+    def fail(record):
+        raise ValueError("bad record")
+
+    reactor.subscribe(device.port, fail)
+    reactor.subscribe(device.port, collector)
+    device.write_lines("HDG:1", "HDG:2")
+
+    assert wait_for(lambda: collector.lines == ["HDG:1", "HDG:2"])
+
+
+def test_port_closed_with_last_subscription(reactor, device):
+    first = reactor.subscribe(device.port, Collector())
+    second = reactor.subscribe(device.port, Collector())
+
+    reactor.unsubscribe(first)
+    assert reactor.ports == [device.port]
+
+    reactor.unsubscribe(second)
+    assert reactor.ports == []
+
+
+def test_disconnected_port_closed(reactor, device):
+    reactor.subscribe(device.port, Collector())
+
+    device.close()
+
+    assert wait_for(lambda: reactor.ports == [])
+
+
+def test_disconnection_ends_subscriptions(reactor, device):
+    closed = []
+    subscription = reactor.subscribe(device.port, Collector(), on_close=closed.append)
+    other = reactor.subscribe(device.port, Collector(), on_close=closed.append)
+    reactor.unsubscribe(other)
+
+    device.close()
+
+    assert wait_for(lambda: closed == [subscription])
+
+
+def test_missing_port_raises(reactor):
+    with pytest.raises(serial.SerialException):
+        reactor.subscribe("/dev/does-not-exist", Collector())
+
+
+def test_gps_provider_reads_records(reactor, device):
+    gps = GpsProvider(serial_port=device.port)
+    assert gps.running
+
+    device.write_lines(
+        "HDG:91.0",
+        "GPS:3723.2475N,12158.3416W,SPD:0,HDG:12,ALT:10.5,SAT:9,TIME:25:01:02:03:04:05:600,QUA:2",
+    )
+
+    assert wait_for(lambda: gps.data is not None and gps.data["gps_sat"] == 9)
+    assert gps.data["yaw_mag_cardinal"] == "East"
+    assert gps.data["gps_alt"] == 10.5
+    assert gps.data["gps_qua"] == 2
+
+    gps.stop()
+    assert not gps.running
+    assert reactor.ports == []
+
+
+def test_gps_provider_resubscribes_after_disconnection(reactor):
+    with FakeSerialDevice() as device:
+        gps = GpsProvider(serial_port=device.port)
+        assert gps.running
+
+    assert wait_for(lambda: not gps.running)
+
+    with FakeSerialDevice() as device:
+        gps.serial_port = device.port
+        gps.start()
+        assert gps.running
+
+        device.write_lines("HDG:91.0")
+        assert wait_for(lambda: gps.data is not None)
+
+        gps.stop()
@@ -58,3 +58,96 @@ async def test_skip_sleep_property(sleep_ticker):
     assert sleep_ticker.skip_sleep is False
     sleep_ticker.skip_sleep = True
     assert sleep_ticker.skip_sleep is True
+
+
+@pytest.mark.asyncio
+async def test_wait_for_input_change_wakes_on_change(sleep_ticker):
+    sleep_ticker._input_changed = False
+    sleep_ticker._last_wake_time = None
+
+    async def change_input():
+        await asyncio.sleep(0.05)
+        sleep_ticker.notify_input_changed("test_input")
+
+    asyncio.create_task(change_input())
+    start_time = time.time()
+    changed = await sleep_ticker.wait_for_input_change(
+        min_interval=0.0, max_idle=2.0, debounce=0.01
+    )
+    duration = time.time() - start_time
+
+    assert changed is True
+    assert duration < 1.0
+    assert sleep_ticker._input_changed is False
+
+
+@pytest.mark.asyncio
+async def test_wait_for_input_change_from_thread(sleep_ticker):
+    import threading
+
+    sleep_ticker._input_changed = False
+    sleep_ticker._last_wake_time = None
+
+    # Bind the event loop with a first, short heartbeat wait
+    await sleep_ticker.wait_for_input_change(min_interval=0.0, max_idle=0.01)
+
+    timer = threading.Timer(0.05, sleep_ticker.notify_input_changed)
+    timer.start()
+    changed = await sleep_ticker.wait_for_input_change(min_interval=0.0, max_idle=2.0)
+    timer.join()
+
+    assert changed is True
+
+
+@pytest.mark.asyncio
+async def test_wait_for_input_change_heartbeat(sleep_ticker):
+    sleep_ticker._input_changed = False
+    sleep_ticker._last_wake_time = None
+
+    start_time = time.time()
+    changed = await sleep_ticker.wait_for_input_change(min_interval=0.0, max_idle=0.1)
+    duration = time.time() - start_time
+
+    assert changed is False
+    assert duration >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_wait_for_input_change_min_interval(sleep_ticker):
+    sleep_ticker._input_changed = False
+    sleep_ticker._last_wake_time = time.monotonic()
+
+    sleep_ticker.notify_input_changed("test_input")
+    start_time = time.time()
+    changed = await sleep_ticker.wait_for_input_change(min_interval=0.2, max_idle=2.0)
+    duration = time.time() - start_time
+
+    assert changed is True
+    assert duration >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_wait_for_input_change_skip_sleep(sleep_ticker):
+    sleep_ticker._input_changed = False
+    sleep_ticker._last_wake_time = None
+
+    async def cancel_wait():
+        await asyncio.sleep(0.05)
+        sleep_ticker.skip_sleep = True
+
+    asyncio.create_task(cancel_wait())
+    start_time = time.time()
+    changed = await sleep_ticker.wait_for_input_change(min_interval=0.0, max_idle=2.0)
+    duration = time.time() - start_time
+
+    assert changed is False
+    assert duration < 1.0
+    assert sleep_ticker._current_sleep_task is None
+
+
+def test_io_provider_notifies_sleep_ticker(sleep_ticker):
+    from providers.io_provider import IOProvider
+
+    sleep_ticker._input_changed = False
+    IOProvider().notify_input_changed("test_input")
+    assert sleep_ticker._input_changed is True
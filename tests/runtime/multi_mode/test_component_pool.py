@@ -0,0 +1,99 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from runtime.multi_mode.component_pool import ComponentPool
+
+
+@pytest.fixture
+def pool():
+    return ComponentPool()
+
+
+def test_shared_kind_reused_across_modes(pool):
+    factory = Mock(side_effect=lambda: object())
+
+    first = pool.acquire("input", "ASR", {"rate": 1, "mode": "a"}, factory, "a")
+    second = pool.acquire("input", "ASR", {"rate": 1, "mode": "b"}, factory, "b")
+
+    assert first is second
+    assert factory.call_count == 1
+    assert pool.refcount(first) == 2
+
+
+def test_other_kinds_scoped_to_mode(pool):
+    first = pool.acquire("action", "move", {}, object, "a")
+    second = pool.acquire("action", "move", {}, object, "b")
+
+    assert first is not second
+    assert pool.refcount(first) == 1
+
+
+def test_different_config_not_shared(pool):
+    first = pool.acquire("input", "ASR", {"rate": 1}, object, "a")
+    second = pool.acquire("input", "ASR", {"rate": 2}, object, "b")
+
+    assert first is not second
+
+
+def test_identical_entries_of_one_mode_distinct(pool):
+    first = pool.acquire("input", "ASR", {}, object, "a")
+    second = pool.acquire("input", "ASR", {}, object, "a")
+    shared = pool.acquire("input", "ASR", {}, object, "b")
+
+    assert first is not second
+    assert shared is first
+    assert len(pool) == 2
+
+
+def test_release_keeps_shared_components(pool):
+    shared = pool.acquire("input", "ASR", {}, object, "a")
+    pool.acquire("input", "ASR", {}, object, "b")
+    own = pool.acquire("input", "Camera", {}, object, "a")
+
+    dropped = pool.release("a")
+
+    assert dropped == [own]
+    assert pool.refcount(shared) == 1
+    assert pool.refcount(own) == 0
+    assert pool.release("b") == [shared]
+    assert len(pool) == 0
+
+
+def test_failed_factory_not_held(pool):
+    with pytest.raises(RuntimeError):
+        pool.acquire("input", "ASR", {}, Mock(side_effect=RuntimeError), "a")
+
+    assert pool.release("a") == []
+    component = pool.acquire("input", "ASR", {}, object, "b")
+    assert pool.refcount(component) == 1
+
+
+def test_concurrent_acquire_creates_once(pool):
+    entered = threading.Event()
+    release = threading.Event()
+
+    def create():
+        entered.set()
+        assert release.wait(timeout=5)
+        return Mock()
+
+    factory = Mock(side_effect=create)
+    results = {}
+
+    def acquire(owner):
+        results[owner] = pool.acquire("input", "ASR", {}, factory, owner)
+
+    first = threading.Thread(target=acquire, args=("a",))
+    first.start()
+    assert entered.wait(timeout=5)
+    second = threading.Thread(target=acquire, args=("b",))
+    second.start()
+    release.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+
+    assert factory.call_count == 1
+    assert results["a"] is results["b"]
+    assert pool.refcount(results["a"]) == 2
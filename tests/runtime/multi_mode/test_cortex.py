@@ -39,6 +39,7 @@ def mock_system_config(mock_mode_config):
     config = Mock(spec=ModeSystemConfig)
     config.name = "test_system"
     config.default_mode = "default"
+    config.warm_mode_switching = False
     config.modes = {
         "default": mock_mode_config,
         "advanced": mock_mode_config,
@@ -200,6 +201,109 @@ class TestModeCortexRuntime:
             mock_init.assert_called_once_with("to_mode")
             mock_start.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_on_mode_transition_records_latency(self, cortex_runtime):
+        """Test that transition latencies are recorded per pair of modes."""
+        runtime, mocks = cortex_runtime
+
+        with (
+            patch.object(runtime, "_stop_current_orchestrators"),
+            patch.object(runtime, "_initialize_mode"),
+            patch.object(runtime, "_start_orchestrators"),
+        ):
+            await runtime._on_mode_transition("from_mode", "to_mode")
+            await runtime._on_mode_transition("from_mode", "to_mode")
+            await runtime._on_mode_transition("to_mode", "from_mode")
+
+        summary = runtime.transition_latency_summary()
+        assert summary["from_mode->to_mode (cold)"]["count"] == 2
+        assert summary["to_mode->from_mode (cold)"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_transition_keeps_input_listener(self, cortex_runtime):
+        """Test that a warm transition swaps inputs on the running listener."""
+        runtime, mocks = cortex_runtime
+
+        warm_switcher = Mock()
+        warm_switcher.is_loaded.return_value = True
+        runtime.warm_switcher = warm_switcher
+
+        input_orchestrator = Mock()
+        input_orchestrator.update_inputs.return_value = (1, 1)
+        input_listener_task = asyncio.create_task(asyncio.sleep(10))
+        runtime.input_orchestrator = input_orchestrator
+        runtime.input_listener_task = input_listener_task
+
+        new_inputs = [Mock()]
+
+        async def initialize_mode(mode_name):
+            runtime.current_config = Mock(agent_inputs=new_inputs)
+
+        try:
+            with (
+                patch.object(runtime, "_stop_current_orchestrators") as mock_stop,
+                patch.object(
+                    runtime, "_initialize_mode", side_effect=initialize_mode
+                ) as mock_init,
+                patch.object(runtime, "_start_orchestrators") as mock_start,
+            ):
+                await runtime._on_mode_transition("from_mode", "to_mode")
+
+            mock_stop.assert_called_once()
+            mock_init.assert_called_once_with("to_mode")
+            mock_start.assert_called_once_with(start_inputs=False)
+            input_orchestrator.update_inputs.assert_called_once_with(new_inputs)
+            assert runtime.input_listener_task is input_listener_task
+            assert not input_listener_task.cancelled()
+            warm_switcher.cancel_preload.assert_called_once()
+            warm_switcher.load.assert_not_called()
+            warm_switcher.schedule_preload.assert_called_once_with("to_mode")
+            assert "from_mode->to_mode (preloaded)" in (
+                runtime.transition_latency_summary()
+            )
+        finally:
+            input_listener_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_warm_transition_loads_target_on_demand(self, cortex_runtime):
+        """Test that a warm transition loads a target that was not preloaded."""
+        runtime, mocks = cortex_runtime
+
+        warm_switcher = Mock()
+        warm_switcher.is_loaded.return_value = False
+        runtime.warm_switcher = warm_switcher
+
+        with (
+            patch.object(runtime, "_stop_current_orchestrators"),
+            patch.object(runtime, "_initialize_mode"),
+            patch.object(runtime, "_start_orchestrators"),
+        ):
+            await runtime._on_mode_transition("from_mode", "to_mode")
+
+        warm_switcher.cancel_preload.assert_called_once()
+        warm_switcher.wait_for_preload.assert_not_called()
+        warm_switcher.load.assert_called_once_with("to_mode", True)
+        summary = runtime.transition_latency_summary()
+        assert summary["from_mode->to_mode (on demand)"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_initialize_mode_warm(self, cortex_runtime, mock_mode_config):
+        """Test that a warm runtime takes the mode components from the switcher."""
+        runtime, mocks = cortex_runtime
+        runtime.warm_switcher = Mock()
+        runtime.mode_config.modes = {"test_mode": mock_mode_config}
+
+        with (
+            patch("runtime.multi_mode.cortex.Fuser"),
+            patch("runtime.multi_mode.cortex.ActionOrchestrator"),
+            patch("runtime.multi_mode.cortex.SimulatorOrchestrator"),
+            patch("runtime.multi_mode.cortex.BackgroundOrchestrator"),
+        ):
+            await runtime._initialize_mode("test_mode")
+
+        runtime.warm_switcher.activate.assert_called_once_with("test_mode")
+        mock_mode_config.load_components.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_on_mode_transition_no_announcement(self, cortex_runtime):
         """Test mode transition without announcement."""
@@ -562,6 +666,7 @@ class TestModeCortexRuntimeHotReload:
             mock_manager_class.return_value = mock_manager
 
             new_mock_config = Mock(spec=ModeSystemConfig)
+            new_mock_config.warm_mode_switching = False
             new_mock_config.default_mode = "test_mode"
             new_mock_config.modes = {"test_mode": Mock()}
             mock_load_config.return_value = new_mock_config
@@ -608,6 +713,7 @@ class TestModeCortexRuntimeHotReload:
             mock_manager_class.return_value = mock_manager
 
             new_mock_config = Mock(spec=ModeSystemConfig)
+            new_mock_config.warm_mode_switching = False
             new_mock_config.default_mode = "default_mode"
             new_mock_config.modes = {"default_mode": Mock()}
             mock_load_config.return_value = new_mock_config
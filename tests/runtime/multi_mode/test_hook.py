@@ -1,4 +1,5 @@
 import asyncio
+import time
 from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import pytest
@@ -1160,3 +1161,185 @@ class TestExecuteLifecycleHooks:
         ):
             result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
             assert result is False  # Overall result is False due to one failure
+
+
+def make_hook(name, group="startup", depends_on=(), **kwargs):
+    return LifecycleHook(
+        hook_type=LifecycleHookType.ON_ENTRY,
+        handler_type="function",
+        handler_config={"delay": kwargs.pop("delay", 0.1)},
+        name=name,
+        group=group,
+        depends_on=list(depends_on),
+        **kwargs,
+    )
+
+
+def timed_handlers(events, results=None):
+    """Create handlers sleeping for their configured delay."""
+    results = results or {}
+
+    def create(hook):
+        handler = Mock()
+
+        async def execute(context):
+            events.append(("start", hook.name))
+            await asyncio.sleep(hook.handler_config["delay"])
+            events.append(("end", hook.name))
+            return results.get(hook.name, True)
+
+        handler.execute = execute
+        return handler
+
+    return create
+
+
+class TestConcurrentLifecycleHooks:
+    """Test cases for grouped and dependent lifecycle hooks."""
+
+    def test_parse_group_and_dependencies(self):
+        """Test parsing hook names, groups and dependencies."""
+        hooks = parse_lifecycle_hooks(
+            [
+                {
+                    "hook_type": "on_entry",
+                    "handler_type": "command",
+                    "handler_config": {"command": "echo slam"},
+                    "name": "slam",
+                    "group": "navigation",
+                    "depends_on": "nav2",
+                }
+            ]
+        )
+
+        assert hooks[0].name == "slam"
+        assert hooks[0].group == "navigation"
+        assert hooks[0].depends_on == ["nav2"]
+        assert hooks[0].last_duration_seconds is None
+
+    @pytest.mark.asyncio
+    async def test_group_runs_concurrently(self):
+        """Test that a group costs its slowest hook, not the sum."""
+        hooks = [make_hook(name) for name in ("nav2", "slam", "tts", "shell")]
+        events = []
+
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler",
+            side_effect=timed_handlers(events),
+        ):
+            start = asyncio.get_running_loop().time()
+            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+            elapsed = asyncio.get_running_loop().time() - start
+
+        assert result is True
+        assert elapsed < 0.3
+        assert [event for event, _ in events[:4]] == ["start"] * 4
+        for hook in hooks:
+            assert hook.last_success is True
+            assert hook.last_duration_seconds >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_dependencies_ordered(self):
+        """Test that a hook starts after the hooks it depends on."""
+        hooks = [
+            make_hook("slam", depends_on=["nav2"]),
+            make_hook("nav2"),
+            make_hook("tts", delay=0.05),
+        ]
+        events = []
+
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler",
+            side_effect=timed_handlers(events),
+        ):
+            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+
+        assert result is True
+        assert events.index(("end", "nav2")) < events.index(("start", "slam"))
+        assert events.index(("start", "tts")) < events.index(("end", "nav2"))
+
+    @pytest.mark.asyncio
+    async def test_failed_dependency_skips_dependents(self):
+        """Test that hooks depending on a failed hook are skipped."""
+        hooks = [make_hook("nav2"), make_hook("slam", depends_on=["nav2"])]
+        events = []
+
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler",
+            side_effect=timed_handlers(events, {"nav2": False}),
+        ):
+            result = await execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY)
+
+        assert result is False
+        assert ("start", "slam") not in events
+        assert hooks[1].last_success is False
+
+    @pytest.mark.asyncio
+    async def test_dependency_cycle_fails(self):
+        """Test that hooks in a dependency cycle fail without deadlocking."""
+        hooks = [
+            make_hook("a", depends_on=["b"]),
+            make_hook("b", depends_on=["a"]),
+            make_hook("c"),
+        ]
+        events = []
+
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler",
+            side_effect=timed_handlers(events),
+        ):
+            result = await asyncio.wait_for(
+                execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY), 2.0
+            )
+
+        assert result is False
+        assert events == [("start", "c"), ("end", "c")]
+
+    @pytest.mark.asyncio
+    async def test_abort_cancels_group(self):
+        """Test that an aborting hook cancels its group and later hooks."""
+        hooks = [
+            make_hook("fast", delay=0.01, on_failure="abort"),
+            make_hook("slow", delay=1.0),
+            make_hook("later", group=None, priority=-1),
+        ]
+        events = []
+
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler",
+            side_effect=timed_handlers(events, {"fast": False}),
+        ):
+            result = await asyncio.wait_for(
+                execute_lifecycle_hooks(hooks, LifecycleHookType.ON_ENTRY), 0.5
+            )
+
+        assert result is False
+        assert ("end", "slow") not in events
+        assert ("start", "later") not in events
+
+    @pytest.mark.asyncio
+    async def test_deadline(self):
+        """Test that the deadline bounds running hooks and skips the others."""
+        hooks = [
+            make_hook("first", group=None, delay=1.0, priority=1),
+            make_hook("second", group=None),
+        ]
+        events = []
+        loop = asyncio.get_running_loop()
+
+        with patch(
+            "runtime.multi_mode.hook.create_hook_handler",
+            side_effect=timed_handlers(events),
+        ):
+            start = loop.time()
+            result = await execute_lifecycle_hooks(
+                hooks,
+                LifecycleHookType.ON_ENTRY,
+                deadline=time.monotonic() + 0.1,
+            )
+            elapsed = loop.time() - start
+
+        assert result is False
+        assert elapsed < 0.5
+        assert ("start", "second") not in events
+        assert hooks[0].last_success is False
@@ -14,6 +14,15 @@ from runtime.multi_mode.config import (
 from runtime.multi_mode.manager import ModeManager, ModeState
 
 
+@pytest.fixture(autouse=True)
+def memory_folder(tmp_path):
+    """Write the runtime config and mode state files to a temporary folder."""
+    folder = tmp_path / "memory"
+    folder.mkdir()
+    with patch.object(ModeManager, "_get_memory_folder_path", return_value=str(folder)):
+        yield folder
+
+
 @pytest.fixture
 def sample_mode_configs():
     """Sample mode configurations for testing."""
@@ -258,6 +267,23 @@ class TestModeManager:
         result = mode_manager.check_input_triggered_transitions("emergency help needed")
         assert result == "emergency"
 
+    def test_check_input_triggered_transitions_after_config_reload(
+        self, mode_manager, sample_system_config
+    ):
+        """Test that replacing the configuration rebuilds the transition index."""
+        sample_system_config.transition_rules = [
+            TransitionRule(
+                from_mode="default",
+                to_mode="advanced",
+                transition_type=TransitionType.INPUT_TRIGGERED,
+                trigger_keywords=["upgrade"],
+            )
+        ]
+        mode_manager.config = sample_system_config
+
+        assert mode_manager.check_input_triggered_transitions("advanced") is None
+        assert mode_manager.check_input_triggered_transitions("upgrade") == "advanced"
+
     def test_can_transition_success(self, mode_manager, sample_transition_rules):
         """Test successful transition validation."""
         rule = sample_transition_rules[0]
@@ -347,6 +373,27 @@ class TestModeManager:
             callback.assert_called_once_with("default", "advanced")
             mock_save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_transition_deadline(self, mode_manager):
+        """Test that all hooks of a transition share the transition deadline."""
+        mode_manager.config.transition_deadline_seconds = 2.0
+
+        with (
+            patch.object(mode_manager, "_save_mode_state"),
+            patch(
+                "runtime.multi_mode.config.execute_lifecycle_hooks",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as mock_execute,
+        ):
+            before = time.monotonic()
+            await mode_manager._execute_transition("advanced", "test")
+
+        deadlines = {call.args[3] for call in mock_execute.call_args_list}
+        assert len(mock_execute.call_args_list) == 4
+        assert len(deadlines) == 1
+        assert before + 2.0 <= deadlines.pop() <= time.monotonic() + 2.0
+
     @pytest.mark.asyncio
     async def test_execute_transition_history_limit(self, mode_manager):
         """Test that transition history is limited to prevent excessive growth."""
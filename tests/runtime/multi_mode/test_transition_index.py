@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from runtime.multi_mode.config import TransitionRule, TransitionType
+from runtime.multi_mode.transition_index import (
+    COMPILE_MIN_KEYWORDS,
+    TransitionIndex,
+    compile_keywords,
+)
+
+
+def make_rule(from_mode, to_mode, keywords, priority=1, transition_type=None):
+    return TransitionRule(
+        from_mode=from_mode,
+        to_mode=to_mode,
+        transition_type=transition_type or TransitionType.INPUT_TRIGGERED,
+        trigger_keywords=keywords,
+        priority=priority,
+    )
+
+
+def reference_match(rules, mode_name, text):
+    """Linear scan matching the rules one keyword at a time."""
+    text = text.lower()
+    matching = [
+        rule
+        for rule in rules
+        if rule.from_mode in (mode_name, "*")
+        and rule.transition_type == TransitionType.INPUT_TRIGGERED
+        and any(keyword.lower() in text for keyword in rule.trigger_keywords)
+    ]
+    return sorted(matching, key=lambda rule: rule.priority, reverse=True)
+
+
+def random_word(rng):
+    return "".join(rng.choice("abcde") for _ in range(rng.randint(1, 4)))
+
+
+def random_rules(rng, keyword_count):
+    rules = []
+    while sum(len(rule.trigger_keywords) for rule in rules) < keyword_count:
+        rules.append(
+            make_rule(
+                rng.choice(["a", "b", "*"]),
+                rng.choice(["a", "b", "c"]),
+                [random_word(rng) for _ in range(rng.randint(1, 5))],
+                priority=rng.randint(0, 3),
+            )
+        )
+    return rules
+
+
+def test_compile_keywords_longest_match():
+    pattern = compile_keywords(["help", "he", "hello"])
+
+    assert [m.group(1) for m in pattern.finditer("hello")] == ["hello"]
+    assert [m.group(1) for m in pattern.finditer("oh help")] == ["help"]
+    assert [m.group(1) for m in pattern.finditer("the")] == ["he"]
+
+
+def test_compile_keywords_escapes():
+    pattern = compile_keywords(["c++", "a.b"])
+
+    assert [m.group(1) for m in pattern.finditer("c++ axb a.b")] == ["c++", "a.b"]
+
+
+@pytest.mark.parametrize("keyword_count", [10, COMPILE_MIN_KEYWORDS * 4])
+def test_matches_linear_scan(keyword_count):
+    rng = random.Random(keyword_count)
+    rules = random_rules(rng, keyword_count)
+    index = TransitionIndex(rules, ["a", "b"])
+
+    compiled = keyword_count >= COMPILE_MIN_KEYWORDS
+    assert (index.table("a").pattern is not None) == compiled
+
+    for _ in range(200):
+        text = " ".join(random_word(rng) for _ in range(rng.randint(0, 6)))
+        for mode_name in ("a", "b", "c"):
+            assert index.match(mode_name, text) == reference_match(
+                rules, mode_name, text
+            )
+
+
+def test_overlapping_keywords_compiled():
+    rules = [make_rule("a", "b", [f"filler{i}"]) for i in range(COMPILE_MIN_KEYWORDS)]
+    rules += [
+        make_rule("a", "help", ["help"], priority=5),
+        make_rule("a", "lp", ["lp"], priority=4),
+        make_rule("a", "helper", ["helper"], priority=3),
+    ]
+    index = TransitionIndex(rules, ["a"])
+
+    matched = index.match("a", "HELPER")
+
+    assert [rule.to_mode for rule in matched] == ["help", "lp", "helper"]
+
+
+def test_wildcard_rules_and_priority_ties():
+    first = make_rule("*", "x", ["go"], priority=2)
+    second = make_rule("a", "y", ["go"], priority=2)
+    third = make_rule("a", "z", ["go"], priority=7)
+    index = TransitionIndex([first, second, third])
+
+    assert index.match("a", "go now") == [third, first, second]
+    assert index.match("b", "go now") == [first]
+
+
+def test_other_transition_types_ignored():
+    rule = make_rule("a", "b", ["go"], transition_type=TransitionType.MANUAL)
+
+    assert TransitionIndex([rule]).match("a", "go") == []
+
+
+def test_empty_keyword_matches_any_input():
+    rule = make_rule("a", "b", [""])
+    index = TransitionIndex([rule, make_rule("a", "c", ["stop"])])
+
+    assert index.match("a", "anything") == [rule]
+
+
+def test_tables_built_on_first_use():
+    index = TransitionIndex([make_rule("*", "b", ["go"])], ["a"])
+
+    assert set(index._tables) == {"a"}
+    assert [rule.to_mode for rule in index.match("unknown", "go")] == ["b"]
+    assert set(index._tables) == {"a", "unknown"}
@@ -0,0 +1,208 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from runtime.multi_mode.config import (
+    ModeConfig,
+    ModeSystemConfig,
+    TransitionRule,
+    TransitionType,
+)
+from runtime.multi_mode.warm_switch import WarmModeSwitcher
+
+
+def make_mode(name, inputs):
+    return ModeConfig(
+        name=name,
+        display_name=name,
+        description="",
+        system_prompt_base="",
+        _raw_inputs=[{"type": input_type, "config": {}} for input_type in inputs],
+        _raw_actions=[{"type": "speak", "config": {}}],
+        _raw_llm={"type": "test_llm", "config": {}},
+    )
+
+
+def make_rule(from_mode, to_mode, priority=1):
+    return TransitionRule(
+        from_mode=from_mode,
+        to_mode=to_mode,
+        transition_type=TransitionType.INPUT_TRIGGERED,
+        priority=priority,
+    )
+
+
+@pytest.fixture
+def system_config():
+    config = ModeSystemConfig(name="test", default_mode="conversation")
+    config.modes = {
+        "conversation": make_mode("conversation", ["ASR", "Camera"]),
+        "guard": make_mode("guard", ["ASR", "Lidar"]),
+        "sleep": make_mode("sleep", []),
+    }
+    config.transition_rules = [
+        make_rule("conversation", "guard"),
+        make_rule("*", "sleep", priority=5),
+        make_rule("guard", "conversation"),
+    ]
+    return config
+
+
+@pytest.fixture
+def loaders():
+    with (
+        patch("runtime.multi_mode.config.load_input") as load_input,
+        patch("runtime.multi_mode.config.load_action") as load_action,
+        patch("runtime.multi_mode.config.load_llm") as load_llm,
+    ):
+        load_input.side_effect = lambda input_type: Mock(
+            side_effect=lambda config: Mock(name=input_type)
+        )
+        load_action.side_effect = lambda action: Mock(name=action["type"])
+        load_llm.return_value = lambda config, available_actions: Mock()
+        yield Mock(input=load_input, action=load_action, llm=load_llm)
+
+
+def test_likely_targets(system_config):
+    switcher = WarmModeSwitcher(system_config)
+
+    assert switcher.likely_targets("conversation") == ["sleep", "guard"]
+    assert switcher.likely_targets("sleep") == []
+
+
+def test_shared_inputs(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+
+    conversation = switcher.load("conversation")
+    guard = switcher.load("guard")
+
+    assert conversation.agent_inputs[0] is guard.agent_inputs[0]
+    assert conversation.agent_inputs[1] is not guard.agent_inputs[1]
+    assert conversation.agent_actions[0] is not guard.agent_actions[0]
+    assert conversation.cortex_llm is not guard.cortex_llm
+    assert switcher.pool.refcount(guard.agent_inputs[0]) == 2
+
+
+def test_load_is_idempotent(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+
+    inputs = switcher.load("conversation").agent_inputs
+    switcher.load("conversation")
+
+    assert system_config.modes["conversation"].agent_inputs is inputs
+
+
+def test_preload_unloads_unreachable_modes(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+    switcher.load("conversation")
+
+    assert switcher.preload("conversation") == ["sleep", "guard"]
+    shared = system_config.modes["guard"].agent_inputs[0]
+
+    switcher.load("sleep")
+    switcher.preload("sleep")
+
+    assert switcher.loaded == {"sleep"}
+    assert switcher.preloaded == set()
+    assert system_config.modes["guard"].agent_inputs == []
+    assert system_config.modes["conversation"].cortex_llm is None
+    assert switcher.pool.refcount(shared) == 0
+
+
+def test_preload_skips_failed_modes(system_config, loaders):
+    system_config.modes["guard"]._raw_inputs.append({"type": "Broken", "config": {}})
+    loaders.input.side_effect = lambda input_type: Mock(
+        side_effect=ValueError(input_type) if input_type == "Broken" else Mock
+    )
+    switcher = WarmModeSwitcher(system_config)
+
+    assert switcher.preload("conversation") == ["sleep"]
+    assert switcher.failed == {"guard"}
+    assert switcher.preload("conversation") == ["sleep"]
+    assert not switcher.is_loaded("guard")
+    assert switcher.pool.release("guard") == []
+
+
+@pytest.mark.asyncio
+async def test_schedule_preload(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+    switcher.load("conversation")
+
+    switcher.schedule_preload("conversation")
+    await asyncio.wait_for(switcher.wait_for_preload(), timeout=5.0)
+
+    assert switcher.loaded == {"conversation"}
+    assert switcher.preloaded == {"guard", "sleep"}
+
+
+def test_preload_creates_inputs_only(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+    switcher.activate("conversation")
+    loaders.action.reset_mock()
+    loaders.llm.reset_mock()
+
+    switcher.preload("conversation")
+
+    guard = system_config.modes["guard"]
+    assert len(guard.agent_inputs) == 2
+    assert guard.agent_actions == []
+    assert guard.cortex_llm is None
+    loaders.action.assert_not_called()
+    loaders.llm.assert_not_called()
+
+    inputs = guard.agent_inputs
+    switcher.activate("guard")
+
+    assert guard.agent_inputs is inputs
+    assert len(guard.agent_actions) == 1
+    assert guard.cortex_llm is not None
+    assert switcher.loaded == {"conversation", "guard"}
+
+
+def test_unload_stops_dropped_components(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+    conversation = switcher.load("conversation")
+    guard = switcher.load("guard")
+    shared, camera = conversation.agent_inputs
+    action = conversation.agent_actions[0]
+    llm = conversation.cortex_llm
+
+    switcher.unload("conversation")
+
+    camera.connector.stop.assert_called_once()
+    action.connector.stop.assert_called_once()
+    llm.connector.stop.assert_called_once()
+    shared.connector.stop.assert_not_called()
+    assert switcher.pool.refcount(guard.agent_inputs[0]) == 1
+
+
+def test_unload_keeps_active_mode(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+    switcher.activate("conversation")
+
+    switcher.unload("conversation")
+    switcher.preload("sleep")
+
+    assert "conversation" in switcher.loaded
+    assert system_config.modes["conversation"].cortex_llm is not None
+
+    switcher.close()
+
+    assert switcher.loaded == set()
+    assert switcher.preloaded == set()
+
+
+def test_cancel_preload(system_config, loaders):
+    switcher = WarmModeSwitcher(system_config)
+    switcher.activate("conversation")
+    load = switcher.load
+
+    def cancel_after_first(mode_name, preload=False):
+        switcher.cancel_preload()
+        return load(mode_name, preload)
+
+    with patch.object(switcher, "load", side_effect=cancel_after_first):
+        assert switcher.preload("conversation") == ["sleep"]
+
+    assert switcher.preloaded == {"sleep"}
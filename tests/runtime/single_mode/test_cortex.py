@@ -6,15 +6,23 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from llm.output_model import Action
+from runtime.llm_pipeline import LLMRequestPipeline
 from runtime.single_mode.config import RuntimeConfig
 from runtime.single_mode.cortex import CortexRuntime
+from runtime.tick_dedupe import TickDeduplicator
 
 
 @pytest.fixture
 def mock_config():
-    config = Mock(spec=RuntimeConfig, hertz=10.0)
+    config = Mock(
+        spec=RuntimeConfig,
+        hertz=10.0,
+        event_driven=False,
+        dedupe_ticks=False,
+        llm_max_in_flight=1,
+    )
     config.name = "test_config"
-    config.cortex_llm = Mock()
+    config.cortex_llm = Mock(streams_actions=False)
     config.agent_inputs = []
     return config
 
@@ -122,6 +130,97 @@ async def test_tick_no_llm_output(runtime):
     mocks["background_orchestrator"].promise.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_tick_dedupe_skips_unchanged_inputs(runtime):
+    cortex_runtime, mocks = runtime
+
+    cortex_runtime.tick_deduplicator = TickDeduplicator(enabled=True, ttl_seconds=30.0)
+    mocks["action_orchestrator"].flush_promises = AsyncMock(return_value=([], None))
+    mocks["fuser"].fuse.return_value = "test prompt"
+    cortex_runtime.io_provider.fuser_inputs = "unchanged inputs"
+
+    mock_output = Mock()
+    mock_output.actions = [Action(type="action1", value="val1")]
+    cortex_runtime.config.cortex_llm.ask = AsyncMock(return_value=mock_output)
+    mocks["simulator_orchestrator"].promise = AsyncMock()
+    mocks["action_orchestrator"].promise = AsyncMock()
+
+    await cortex_runtime._tick()
+    await cortex_runtime._tick()
+
+    cortex_runtime.config.cortex_llm.ask.assert_called_once_with("test prompt")
+    mocks["action_orchestrator"].promise.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_tick_streaming_dispatches_actions_once(runtime):
+    cortex_runtime, mocks = runtime
+
+    mocks["action_orchestrator"].flush_promises = AsyncMock(return_value=([], None))
+    mocks["fuser"].fuse.return_value = "test prompt"
+
+    speak = Action(type="speak", value="hello")
+    move = Action(type="move", value="sit")
+
+    async def ask(prompt, on_action):
+        await on_action(speak)
+        # The first action is dispatched before the response is complete
+        mocks["action_orchestrator"].promise.assert_called_once_with([speak])
+        return Mock(actions=[speak, move])
+
+    cortex_runtime.config.cortex_llm.streams_actions = True
+    cortex_runtime.config.cortex_llm.ask = ask
+    mocks["simulator_orchestrator"].promise = AsyncMock()
+    mocks["action_orchestrator"].promise = AsyncMock()
+
+    await cortex_runtime._tick()
+
+    assert mocks["action_orchestrator"].promise.call_args_list == [
+        (([speak],),),
+        (([move],),),
+    ]
+    assert mocks["simulator_orchestrator"].promise.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tick_pipelined_drops_superseded_request(runtime):
+    cortex_runtime, mocks = runtime
+
+    cortex_runtime.llm_pipeline = LLMRequestPipeline(max_in_flight=2)
+    mocks["action_orchestrator"].flush_promises = AsyncMock(return_value=([], None))
+    mocks["fuser"].fuse.side_effect = ["slow prompt", "fast prompt"]
+
+    slow_output = Mock(actions=[Action(type="action1", value="slow")])
+    fast_output = Mock(actions=[Action(type="action1", value="fast")])
+    release_slow = asyncio.Event()
+
+    async def ask(prompt):
+        if prompt == "slow prompt":
+            await release_slow.wait()
+            return slow_output
+        return fast_output
+
+    cortex_runtime.config.cortex_llm.ask = ask
+    mocks["simulator_orchestrator"].promise = AsyncMock()
+    mocks["action_orchestrator"].promise = AsyncMock()
+
+    # Neither tick waits for its LLM response
+    await cortex_runtime._tick()
+    await cortex_runtime._tick()
+    assert cortex_runtime.llm_pipeline.in_flight == 2
+
+    # The fast response is dispatched and supersedes the slow request
+    for _ in range(5):
+        await asyncio.sleep(0)
+    release_slow.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    mocks["action_orchestrator"].promise.assert_called_once_with(fast_output.actions)
+    assert cortex_runtime.llm_pipeline.in_flight == 0
+    assert cortex_runtime.llm_pipeline.cancelled_requests == 1
+
+
 @pytest.mark.asyncio
 async def test_run_cortex_loop(runtime):
     cortex_runtime, mocks = runtime
@@ -145,6 +244,36 @@ async def test_run_cortex_loop(runtime):
     assert mocks["sleep_ticker_provider"].sleep.call_count == 3
 
 
+@pytest.mark.asyncio
+async def test_run_cortex_loop_event_driven(runtime):
+    cortex_runtime, mocks = runtime
+
+    cortex_runtime.config.event_driven = True
+    cortex_runtime.config.event_debounce_seconds = 0.05
+    cortex_runtime.config.event_min_interval_seconds = None
+    cortex_runtime.config.event_max_idle_seconds = 10.0
+
+    cortex_runtime._tick = AsyncMock()
+    mocks["sleep_ticker_provider"].skip_sleep = False
+    mocks["sleep_ticker_provider"].sleep = AsyncMock()
+    mocks["sleep_ticker_provider"].wait_for_input_change = AsyncMock()
+
+    async def side_effect(*args):
+        if cortex_runtime._tick.call_count >= 2:
+            raise Exception("Stop loop")
+
+    cortex_runtime._tick.side_effect = side_effect
+
+    with pytest.raises(Exception, match="Stop loop"):
+        await cortex_runtime._run_cortex_loop()
+
+    mocks["sleep_ticker_provider"].sleep.assert_not_called()
+    assert mocks["sleep_ticker_provider"].wait_for_input_change.call_count == 2
+    mocks["sleep_ticker_provider"].wait_for_input_change.assert_called_with(
+        min_interval=0.1, max_idle=10.0, debounce=0.05
+    )
+
+
 @pytest.mark.asyncio
 async def test_start_input_listeners(runtime):
     cortex_runtime, mocks = runtime
@@ -436,7 +565,7 @@ class TestCortexRuntimeHotReload:
             ),
             patch("runtime.single_mode.cortex.load_config") as mock_load_config,
         ):
-            new_mock_config = Mock(spec=RuntimeConfig)
+            new_mock_config = Mock(spec=RuntimeConfig, llm_max_in_flight=1)
             new_mock_config.hertz = 20.0
             mock_load_config.return_value = new_mock_config
 
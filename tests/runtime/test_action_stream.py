@@ -0,0 +1,73 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from llm.output_model import Action, CortexOutputModel
+from providers.io_provider import IOProvider
+from runtime.action_stream import ActionStream
+
+
+@pytest.mark.asyncio
+async def test_finish_dispatches_all_actions():
+    dispatch = AsyncMock()
+    stream = ActionStream(dispatch)
+    actions = [Action(type="speak", value="hi"), Action(type="move", value="sit")]
+
+    await stream.finish(CortexOutputModel(actions=actions))
+
+    dispatch.assert_awaited_once_with(actions)
+    assert stream.dispatched == 2
+
+
+@pytest.mark.asyncio
+async def test_streamed_actions_not_dispatched_again():
+    dispatch = AsyncMock()
+    stream = ActionStream(dispatch)
+    speak = Action(type="speak", value="hi")
+    move = Action(type="move", value="sit")
+
+    await stream.on_action(speak)
+    await stream.finish(CortexOutputModel(actions=[speak, move]))
+
+    assert dispatch.await_args_list == [(([speak],),), (([move],),)]
+
+
+@pytest.mark.asyncio
+async def test_equal_actions_are_distinct():
+    dispatch = AsyncMock()
+    stream = ActionStream(dispatch)
+    first = Action(type="speak", value="hi")
+    second = Action(type="speak", value="hi")
+
+    await stream.on_action(first)
+    await stream.finish(CortexOutputModel(actions=[first, second]))
+
+    assert dispatch.await_count == 2
+    assert dispatch.await_args_list[1].args[0][0] is second
+
+
+@pytest.mark.asyncio
+async def test_nothing_left_to_dispatch():
+    dispatch = AsyncMock()
+    stream = ActionStream(dispatch)
+    speak = Action(type="speak", value="hi")
+
+    await stream.on_action(speak)
+    await stream.finish(CortexOutputModel(actions=[speak]))
+
+    dispatch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_records_time_to_first_action():
+    io_provider = IOProvider()
+    io_provider.llm_start_time = 1000.0
+    stream = ActionStream(AsyncMock())
+
+    await stream.on_action(Action(type="speak", value="hi"))
+    first_action_time = io_provider.llm_first_action_time
+    await stream.on_action(Action(type="move", value="sit"))
+
+    assert io_provider.llm_first_action_time == first_action_time
+    assert io_provider.llm_time_to_first_action == first_action_time - 1000.0
+    io_provider.llm_start_time = None
@@ -0,0 +1,226 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from llm.output_model import Action, CortexOutputModel
+from runtime.action_stream import ActionStream
+from runtime.llm_pipeline import LLMRequestPipeline
+
+
+def make_output(value: str) -> CortexOutputModel:
+    return CortexOutputModel(actions=[Action(type="speak", value=value)])
+
+
+def make_request(output, release: asyncio.Event = None):
+    async def request():
+        if release is not None:
+            await release.wait()
+        return output
+
+    return request
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_serial_awaits_and_dispatches():
+    pipeline = LLMRequestPipeline()
+    dispatch = AsyncMock()
+    output = make_output("hi")
+
+    await pipeline.submit(make_request(output), dispatch)
+
+    dispatch.assert_awaited_once_with(output)
+    assert pipeline.in_flight == 0
+    assert pipeline.latency_histograms["dispatched"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_serial_empty_output_not_dispatched():
+    pipeline = LLMRequestPipeline()
+    dispatch = AsyncMock()
+
+    await pipeline.submit(make_request(None), dispatch)
+
+    dispatch.assert_not_called()
+    assert pipeline.latency_histograms["empty"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_serial_propagates_errors():
+    pipeline = LLMRequestPipeline()
+
+    async def request():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await pipeline.submit(request, AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_does_not_wait():
+    pipeline = LLMRequestPipeline(max_in_flight=2)
+    dispatch = AsyncMock()
+    release = asyncio.Event()
+    output = make_output("hi")
+
+    await pipeline.submit(make_request(output, release), dispatch)
+    assert pipeline.in_flight == 1
+    dispatch.assert_not_called()
+
+    release.set()
+    await settle()
+
+    dispatch.assert_awaited_once_with(output)
+    assert pipeline.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_newer_response_cancels_older_request():
+    pipeline = LLMRequestPipeline(max_in_flight=3)
+    dispatch = AsyncMock()
+    release_old = asyncio.Event()
+    new_output = make_output("new")
+
+    await pipeline.submit(make_request(make_output("old"), release_old), dispatch)
+    await pipeline.submit(make_request(new_output), dispatch)
+    await settle()
+
+    dispatch.assert_awaited_once_with(new_output)
+    assert pipeline.in_flight == 0
+    assert pipeline.cancelled_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_response_dropped():
+    pipeline = LLMRequestPipeline(max_in_flight=3)
+    dispatch = AsyncMock()
+    old_output = make_output("old")
+    new_output = make_output("new")
+
+    # The old request ignores cancellation and still completes
+    async def stubborn_request():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            pass
+        return old_output
+
+    await pipeline.submit(stubborn_request, dispatch)
+    await pipeline.submit(make_request(new_output), dispatch)
+    await settle()
+
+    dispatch.assert_awaited_once_with(new_output)
+    assert pipeline.latency_histograms["stale"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_cancels_oldest():
+    pipeline = LLMRequestPipeline(max_in_flight=2)
+    dispatch = AsyncMock()
+    release = asyncio.Event()
+
+    for i in range(3):
+        await pipeline.submit(make_request(make_output(str(i)), release), dispatch)
+
+    assert pipeline.in_flight == 2
+    assert pipeline.cancelled_requests == 1
+
+    release.set()
+    await settle()
+
+    # Request 1 completes first and is dispatched, request 2 supersedes it
+    assert dispatch.await_count >= 1
+    assert dispatch.await_args.args[0].actions[0].value == "2"
+
+
+@pytest.mark.asyncio
+async def test_failed_request_recorded():
+    pipeline = LLMRequestPipeline(max_in_flight=2)
+    dispatch = AsyncMock()
+
+    async def request():
+        raise RuntimeError("boom")
+
+    await pipeline.submit(request, dispatch)
+    await settle()
+
+    dispatch.assert_not_called()
+    assert pipeline.latency_histograms["failed"].count == 1
+    assert pipeline.latency_summary()["failed"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_all():
+    pipeline = LLMRequestPipeline(max_in_flight=2)
+    dispatch = AsyncMock()
+    release = asyncio.Event()
+
+    await pipeline.submit(make_request(make_output("a"), release), dispatch)
+    await pipeline.submit(make_request(make_output("b"), release), dispatch)
+
+    pipeline.cancel_all()
+    release.set()
+    await settle()
+
+    dispatch.assert_not_called()
+    assert pipeline.in_flight == 0
+    assert pipeline.cancelled_requests == 2
+
+
+@pytest.mark.asyncio
+async def test_streamed_actions_of_stale_request_dropped():
+    pipeline = LLMRequestPipeline(max_in_flight=2)
+    streamed = []
+
+    async def record(actions):
+        streamed.extend(action.value for action in actions)
+
+    older, newer = ActionStream(record), ActionStream(record)
+    release = asyncio.Event()
+    dispatch = AsyncMock()
+    await pipeline.submit(make_request(make_output("old"), release), dispatch, older)
+    await pipeline.submit(make_request(make_output("new"), release), dispatch, newer)
+    await settle()
+
+    await newer.on_action(Action(type="speak", value="new"))
+    await older.on_action(Action(type="speak", value="old"))
+
+    # The newer streamed action cancels the older request
+    assert streamed == ["new"]
+    assert pipeline.in_flight == 1
+    assert pipeline.cancelled_requests == 1
+
+    release.set()
+    await settle()
+    dispatch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_response_stale_after_newer_streamed_action():
+    pipeline = LLMRequestPipeline(max_in_flight=2)
+    older, newer = ActionStream(AsyncMock()), ActionStream(AsyncMock())
+    release = asyncio.Event()
+    dispatch = AsyncMock()
+
+    async def uncancellable_request():
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            pass
+        return make_output("old")
+
+    await pipeline.submit(uncancellable_request, dispatch, older)
+    await pipeline.submit(make_request(make_output("new"), release), dispatch, newer)
+    await settle()
+    await newer.on_action(Action(type="speak", value="new"))
+
+    release.set()
+    await settle()
+
+    dispatch.assert_awaited_once()
+    assert pipeline.latency_histograms["stale"].count == 1
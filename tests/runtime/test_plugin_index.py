@@ -0,0 +1,147 @@
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+import inputs
+import llm
+from runtime.plugin_index import PluginIndex
+from runtime.single_mode.config import load_config
+
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    directory = tmp_path / "plugins"
+    directory.mkdir()
+    (directory / "alpha.py").write_text(
+        "class Helper:\n    pass\n\n\nclass AlphaInput(FuserInput[str]):\n    pass\n"
+    )
+    (directory / "beta.py").write_text("class BetaInput(FuserInput[str]):\n    pass\n")
+    (directory / "notes.txt").write_text("class NotAPlugin(FuserInput):\n")
+    return directory
+
+
+def make_index(plugins_dir):
+    return PluginIndex(
+        str(plugins_dir), "FuserInput", str(plugins_dir.parent / "index.json")
+    )
+
+
+def test_find(plugins_dir):
+    index = make_index(plugins_dir)
+
+    assert index.find("AlphaInput") == "alpha"
+    assert index.find("BetaInput") == "beta"
+    assert index.find("Helper") is None
+    assert index.find("NotAPlugin") is None
+
+
+def test_missing_plugins_dir(tmp_path):
+    index = PluginIndex(str(tmp_path / "missing"), "FuserInput")
+    assert index.find("AlphaInput") is None
+
+
+def test_unchanged_files_not_rescanned(plugins_dir):
+    index = make_index(plugins_dir)
+    index.find("AlphaInput")
+
+    with patch.object(index, "_scan", wraps=index._scan) as scan:
+        assert index.find("BetaInput") == "beta"
+        scan.assert_not_called()
+
+
+def test_modified_file_rescanned(plugins_dir):
+    index = make_index(plugins_dir)
+    assert index.find("BetaInput") == "beta"
+
+    beta = plugins_dir / "beta.py"
+    beta.write_text("class GammaInput(FuserInput[str]):\n    pass\n")
+    mtime_ns = os.stat(beta).st_mtime_ns + 1_000_000
+    os.utime(beta, ns=(mtime_ns, mtime_ns))
+
+    assert index.find("BetaInput") is None
+    assert index.find("GammaInput") == "beta"
+
+
+def test_added_and_removed_files(plugins_dir):
+    index = make_index(plugins_dir)
+    assert index.find("AlphaInput") == "alpha"
+
+    (plugins_dir / "alpha.py").unlink()
+    (plugins_dir / "delta.py").write_text(
+        "class DeltaInput(FuserInput[str]):\n    pass\n"
+    )
+
+    assert index.find("AlphaInput") is None
+    assert index.find("DeltaInput") == "delta"
+
+
+def test_persisted_index_reused(plugins_dir):
+    make_index(plugins_dir).find("AlphaInput")
+    assert (plugins_dir.parent / "index.json").exists()
+
+    index = make_index(plugins_dir)
+    with patch.object(index, "_scan", wraps=index._scan) as scan:
+        assert index.find("AlphaInput") == "alpha"
+        scan.assert_not_called()
+
+
+def test_corrupt_persisted_index_ignored(plugins_dir):
+    (plugins_dir.parent / "index.json").write_text("not json")
+
+    assert make_index(plugins_dir).find("AlphaInput") == "alpha"
+
+
+def test_load_config_startup_benchmark(tmp_path):
+    config_path = tmp_path / "bench.json5"
+    config_path.write_text("""{
+  hertz: 1,
+  name: "bench",
+  api_key: "test_api_key",
+  URID: "bench",
+  system_prompt_base: "base",
+  system_governance: "governance",
+  system_prompt_examples: "examples",
+  agent_inputs: [],
+  cortex_llm: { type: "OpenAILLM" },
+  agent_actions: [],
+}""")
+    input_classes = ["DummyVLMLocal", "GovernanceEthereum", "SimplePaths"]
+
+    def startup():
+        load_config("bench", config_source_path=str(config_path))
+        for class_name in input_classes:
+            assert inputs.find_module_with_class(class_name) is not None
+
+    # Drop entries indexed while other tests patched open, then warm up
+    # imports so only the plugin lookups differ between runs
+    inputs._plugin_index.clear()
+    llm._plugin_index.clear()
+    startup()
+
+    rounds = 5
+    start = time.perf_counter()
+    for _ in range(rounds):
+        with (
+            patch.object(inputs._plugin_index, "_load", return_value={}),
+            patch.object(llm._plugin_index, "_load", return_value={}),
+        ):
+            inputs._plugin_index.clear()
+            llm._plugin_index.clear()
+            startup()
+    cold = (time.perf_counter() - start) / rounds
+
+    with (
+        patch.object(inputs._plugin_index, "_scan") as inputs_scan,
+        patch.object(llm._plugin_index, "_scan") as llm_scan,
+    ):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            startup()
+        warm = (time.perf_counter() - start) / rounds
+
+    # Timings are dominated by load_config itself; a warm index reads no plugin file
+    assert (
+        not inputs_scan.called and not llm_scan.called
+    ), f"load_config: cold plugin index {cold * 1e3:.2f} ms, warm {warm * 1e3:.2f} ms"
@@ -0,0 +1,97 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from llm.output_model import Action, CortexOutputModel
+from providers.io_provider import IOProvider
+from runtime.tick_dedupe import TickDeduplicator
+
+
+@pytest.fixture
+def llm():
+    llm = Mock()
+    llm.ask = AsyncMock(
+        return_value=CortexOutputModel(actions=[Action(type="speak", value="hi")])
+    )
+    return llm
+
+
+@pytest.mark.asyncio
+async def test_disabled_always_calls_llm(llm):
+    deduplicator = TickDeduplicator()
+
+    await deduplicator.ask(llm, "prompt", "inputs")
+    await deduplicator.ask(llm, "prompt", "inputs")
+
+    assert llm.ask.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_duplicate_tick_skips_llm(llm):
+    deduplicator = TickDeduplicator(enabled=True, ttl_seconds=30.0)
+    skipped = IOProvider().skipped_ticks
+
+    first = await deduplicator.ask(llm, "prompt", "inputs")
+    second = await deduplicator.ask(llm, "prompt", "inputs")
+
+    assert first is not None
+    assert second is None
+    assert llm.ask.call_count == 1
+    assert IOProvider().skipped_ticks == skipped + 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_tick_reuses_output(llm):
+    deduplicator = TickDeduplicator(enabled=True, ttl_seconds=30.0, reuse_output=True)
+
+    first = await deduplicator.ask(llm, "prompt", "inputs")
+    second = await deduplicator.ask(llm, "prompt", "inputs")
+
+    assert second is first
+    assert llm.ask.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_inputs_call_llm(llm):
+    deduplicator = TickDeduplicator(enabled=True, ttl_seconds=30.0)
+
+    await deduplicator.ask(llm, "prompt", "inputs")
+    await deduplicator.ask(llm, "prompt", "new inputs")
+    await deduplicator.ask(llm, "prompt", "inputs")
+
+    assert llm.ask.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_expired_ttl_calls_llm(llm):
+    deduplicator = TickDeduplicator(enabled=True, ttl_seconds=5.0)
+
+    with patch("runtime.tick_dedupe.time.monotonic", return_value=100.0):
+        await deduplicator.ask(llm, "prompt", "inputs")
+    with patch("runtime.tick_dedupe.time.monotonic", return_value=104.0):
+        await deduplicator.ask(llm, "prompt", "inputs")
+    with patch("runtime.tick_dedupe.time.monotonic", return_value=106.0):
+        await deduplicator.ask(llm, "prompt", "inputs")
+
+    assert llm.ask.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reset_forgets_last_call(llm):
+    deduplicator = TickDeduplicator(enabled=True, ttl_seconds=30.0)
+
+    await deduplicator.ask(llm, "prompt", "inputs")
+    deduplicator.reset()
+    await deduplicator.ask(llm, "prompt", "inputs")
+
+    assert llm.ask.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_on_action_passed_to_llm(llm):
+    deduplicator = TickDeduplicator()
+    on_action = AsyncMock()
+
+    await deduplicator.ask(llm, "prompt", "inputs", on_action=on_action)
+
+    llm.ask.assert_called_once_with("prompt", on_action=on_action)
@@ -0,0 +1,178 @@
+import asyncio
+import json
+
+import pytest
+
+from simulators.state_broadcaster import StateBroadcaster, apply_patch, diff_state
+
+
+class FakeWebSocket:
+    def __init__(self, send_delay=0.0):
+        self.send_delay = send_delay
+        self.frames = []
+        self.closed = asyncio.Event()
+
+    async def send_text(self, text):
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.frames.append(json.loads(text))
+
+    async def receive_text(self):
+        await self.closed.wait()
+        raise RuntimeError("disconnected")
+
+    async def close(self):
+        self.closed.set()
+
+    def state(self):
+        state = None
+        for frame in self.frames:
+            if frame["type"] == "full":
+                state = frame["state"]
+            else:
+                state = apply_patch(state, frame["patch"])
+        return state
+
+
+async def settle(seconds=0.05):
+    await asyncio.sleep(seconds)
+
+
+def test_diff_state():
+    old = {"a": 1, "b": {"c": 2, "d": 3}, "e": [1], "f": "x"}
+    new = {"a": 1, "b": {"c": 2, "d": 4}, "e": [1, 2], "g": True}
+
+    patch = diff_state(old, new)
+
+    assert patch == {"b": {"d": 4}, "e": [1, 2], "f": None, "g": True}
+    assert apply_patch(old, patch) == new
+    assert old["f"] == "x"
+    assert diff_state(new, new) == {}
+
+
+def test_publish_only_changes():
+    broadcaster = StateBroadcaster()
+
+    assert broadcaster.publish({"a": 1})
+    assert not broadcaster.publish({"a": 1})
+    assert broadcaster.publish({"a": 2})
+
+    assert broadcaster.version == 2
+    assert broadcaster.stats.published == 2
+
+
+def test_frames_serialized_once_per_base_version():
+    broadcaster = StateBroadcaster()
+    broadcaster.publish({"a": 1, "b": 1})
+    broadcaster.publish({"a": 1, "b": 2})
+
+    version, patch = broadcaster.frame_for(1)
+    assert version == 2
+    assert json.loads(patch) == {
+        "type": "patch",
+        "base": 1,
+        "version": 2,
+        "patch": {"b": 2},
+    }
+    assert broadcaster.frame_for(1)[1] is patch
+
+    _, full = broadcaster.frame_for(0)
+    assert json.loads(full)["state"] == {"a": 1, "b": 2}
+    assert broadcaster.frame_for(2) is None
+    assert broadcaster.stats.serialized == 2
+
+
+def test_full_frame_beyond_history():
+    broadcaster = StateBroadcaster(history_size=2)
+    for i in range(4):
+        broadcaster.publish({"a": i})
+
+    assert json.loads(broadcaster.frame_for(1)[1])["type"] == "full"
+    assert json.loads(broadcaster.frame_for(3)[1])["type"] == "patch"
+
+
+@pytest.mark.asyncio
+async def test_serve_sends_full_state_then_patches():
+    broadcaster = StateBroadcaster(max_rate_hz=0)
+    broadcaster.publish({"a": 1, "nested": {"b": 1}})
+    websocket = FakeWebSocket()
+
+    task = asyncio.create_task(broadcaster.serve(websocket))
+    await settle()
+    broadcaster.publish({"a": 1, "nested": {"b": 2}})
+    await settle()
+
+    assert websocket.frames[0]["type"] == "full"
+    assert websocket.frames[1] == {
+        "type": "patch",
+        "base": 1,
+        "version": 2,
+        "patch": {"nested": {"b": 2}},
+    }
+    assert websocket.state() == {"a": 1, "nested": {"b": 2}}
+    assert broadcaster.client_count == 1
+
+    await broadcaster.close()
+    await asyncio.wait_for(task, 1)
+    assert broadcaster.client_count == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_coalesces_updates():
+    broadcaster = StateBroadcaster(max_rate_hz=5)
+    broadcaster.publish({"i": 0})
+    websocket = FakeWebSocket()
+
+    task = asyncio.create_task(broadcaster.serve(websocket))
+    await settle()
+    for i in range(1, 10):
+        broadcaster.publish({"i": i})
+        await asyncio.sleep(0.001)
+    await settle(0.3)
+
+    assert len(websocket.frames) == 2
+    assert websocket.state() == {"i": 9}
+    assert broadcaster.stats.coalesced == 8
+
+    await broadcaster.close()
+    await asyncio.wait_for(task, 1)
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_stall_others():
+    broadcaster = StateBroadcaster(max_rate_hz=0)
+    broadcaster.publish({"i": 0})
+    slow = FakeWebSocket(send_delay=0.2)
+    fast = FakeWebSocket()
+
+    tasks = [
+        asyncio.create_task(broadcaster.serve(slow)),
+        asyncio.create_task(broadcaster.serve(fast)),
+    ]
+    await settle()
+    for i in range(1, 4):
+        broadcaster.publish({"i": i})
+        await settle(0.02)
+
+    assert fast.state() == {"i": 3}
+    assert len(fast.frames) == 4
+    assert slow.frames == []
+
+    await settle(0.5)
+    assert slow.state() == {"i": 3}
+    assert len(slow.frames) == 2
+
+    await broadcaster.close()
+    await asyncio.wait_for(asyncio.gather(*tasks), 1)
+
+
+@pytest.mark.asyncio
+async def test_stuck_client_disconnected():
+    broadcaster = StateBroadcaster(max_rate_hz=0, send_timeout=0.05)
+    broadcaster.publish({"i": 0})
+    websocket = FakeWebSocket(send_delay=1.0)
+
+    await asyncio.wait_for(broadcaster.serve(websocket), 1)
+
+    assert broadcaster.client_count == 0
+    assert broadcaster.stats.disconnected == 1